@@ -108,6 +108,48 @@ class ForecastRepository:
         aggregation: str = "daily",
     ) -> List[Dict[str, Any]]:
         """Get historical sales data for model training"""
+        query, entity_column = self._build_historical_sales_query(
+            entity_type, days_back, aggregation
+        )
+
+        if entity_id:
+            query = query.where(entity_column == entity_id)
+
+        result = await self.db.execute(query)
+        return [self._historical_row_to_dict(row) for row in result.all()]
+
+    async def get_historical_sales_data_bulk(
+        self,
+        entity_type: str,
+        entity_ids: List[uuid.UUID],
+        days_back: int = 365,
+        aggregation: str = "daily",
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get historical sales data for many entities with one grouped query.
+
+        Returns a mapping of entity id (as string) to its ordered series, in the
+        same row format as get_historical_sales_data.
+        """
+        if not entity_ids:
+            return {}
+
+        query, entity_column = self._build_historical_sales_query(
+            entity_type, days_back, aggregation
+        )
+        query = query.where(entity_column.in_(entity_ids))
+
+        result = await self.db.execute(query)
+
+        historical_data: Dict[str, List[Dict[str, Any]]] = {}
+        for row in result.all():
+            row_dict = self._historical_row_to_dict(row)
+            historical_data.setdefault(row_dict["entity_id"], []).append(row_dict)
+
+        return historical_data
+
+    def _build_historical_sales_query(self, entity_type: str, days_back: int, aggregation: str):
+        """Build the per-period sales aggregation query and return it with its entity column"""
         end_date = date.today()
         start_date = end_date - timedelta(days=days_back)
 
@@ -124,106 +166,55 @@ class ForecastRepository:
         else:
             raise ValueError(f"Invalid aggregation: {aggregation}")
 
-        # Build aggregation query based on entity type (Gibson Schema v2.4)
+        # Order → InventoryItem (→ Product) (Gibson multi-schema architecture)
         if entity_type == "product":
-            # Order → InventoryItem → Product (Gibson multi-schema architecture)
-            query = (
-                select(
-                    func.to_char(date_trunc, date_format).label("period"),
-                    date_trunc.label("period_date"),
-                    InventoryItem.product_id.label("entity_id"),
-                    func.count(Order.id).label("units_sold"),
-                    func.sum(Order.net_proceeds).label("total_revenue"),
-                    func.avg(Order.net_proceeds).label("avg_price"),
-                )
-                .select_from(Order)
-                .join(InventoryItem, Order.inventory_item_id == InventoryItem.id)
-                .where(
-                    Order.sold_at.between(start_date, end_date),
-                    Order.status == "completed",
-                )
-                .group_by(date_trunc, InventoryItem.product_id)
-                .order_by(date_trunc.asc())
-            )
-
-            if entity_id:
-                query = query.where(InventoryItem.product_id == entity_id)
-
+            entity_column = InventoryItem.product_id
         elif entity_type == "brand":
-            # Order → InventoryItem → Product → Brand (Gibson multi-schema)
-            query = (
-                select(
-                    func.to_char(date_trunc, date_format).label("period"),
-                    date_trunc.label("period_date"),
-                    Product.brand_id.label("entity_id"),
-                    func.count(Order.id).label("units_sold"),
-                    func.sum(Order.net_proceeds).label("total_revenue"),
-                    func.avg(Order.net_proceeds).label("avg_price"),
-                )
-                .select_from(Order)
-                .join(InventoryItem, Order.inventory_item_id == InventoryItem.id)
-                .join(Product, InventoryItem.product_id == Product.id)
-                .where(
-                    Order.sold_at.between(start_date, end_date),
-                    Order.status == "completed",
-                )
-                .group_by(date_trunc, Product.brand_id)
-                .order_by(date_trunc.asc())
-            )
-
-            if entity_id:
-                query = query.where(Product.brand_id == entity_id)
-
+            entity_column = Product.brand_id
         elif entity_type == "category":
-            # Order → InventoryItem → Product → Category (Gibson multi-schema)
-            query = (
-                select(
-                    func.to_char(date_trunc, date_format).label("period"),
-                    date_trunc.label("period_date"),
-                    Product.category_id.label("entity_id"),
-                    func.count(Order.id).label("units_sold"),
-                    func.sum(Order.net_proceeds).label("total_revenue"),
-                    func.avg(Order.net_proceeds).label("avg_price"),
-                )
-                .select_from(Order)
-                .join(InventoryItem, Order.inventory_item_id == InventoryItem.id)
-                .join(Product, InventoryItem.product_id == Product.id)
-                .where(
-                    Order.sold_at.between(start_date, end_date),
-                    Order.status == "completed",
-                )
-                .group_by(date_trunc, Product.category_id)
-                .order_by(date_trunc.asc())
-            )
-
-            if entity_id:
-                query = query.where(Product.category_id == entity_id)
-
+            entity_column = Product.category_id
         else:
             raise ValueError(f"Invalid entity type: {entity_type}")
 
-        result = await self.db.execute(query)
-        rows = result.all()
+        query = (
+            select(
+                func.to_char(date_trunc, date_format).label("period"),
+                date_trunc.label("period_date"),
+                entity_column.label("entity_id"),
+                func.count(Order.id).label("units_sold"),
+                func.sum(Order.net_proceeds).label("total_revenue"),
+                func.avg(Order.net_proceeds).label("avg_price"),
+            )
+            .select_from(Order)
+            .join(InventoryItem, Order.inventory_item_id == InventoryItem.id)
+        )
 
-        # Convert to list of dictionaries
-        historical_data = []
-        for row in rows:
-            historical_data.append(
-                {
-                    "period": row.period,
-                    "period_date": (
-                        row.period_date.date()
-                        if hasattr(row.period_date, "date")
-                        else row.period_date
-                    ),
-                    "entity_id": str(row.entity_id) if row.entity_id else None,
-                    "units_sold": int(row.units_sold) if row.units_sold else 0,
-                    "total_revenue": float(row.total_revenue) if row.total_revenue else 0.0,
-                    "avg_price": float(row.avg_price) if row.avg_price else 0.0,
-                }
+        if entity_type != "product":
+            query = query.join(Product, InventoryItem.product_id == Product.id)
+
+        query = (
+            query.where(
+                Order.sold_at.between(start_date, end_date),
+                Order.status == "completed",
             )
+            .group_by(date_trunc, entity_column)
+            .order_by(date_trunc.asc())
+        )
 
-        return historical_data
+        return query, entity_column
+
+    @staticmethod
+    def _historical_row_to_dict(row) -> Dict[str, Any]:
+        return {
+            "period": row.period,
+            "period_date": (
+                row.period_date.date() if hasattr(row.period_date, "date") else row.period_date
+            ),
+            "entity_id": str(row.entity_id) if row.entity_id else None,
+            "units_sold": int(row.units_sold) if row.units_sold else 0,
+            "total_revenue": float(row.total_revenue) if row.total_revenue else 0.0,
+            "avg_price": float(row.avg_price) if row.avg_price else 0.0,
+        }
 
     async def get_external_features(
         self,
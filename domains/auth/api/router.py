@@ -9,9 +9,10 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.api.responses import create_success_response
-from shared.auth.jwt_handler import JWTHandler
+from shared.auth.jwt_handler import get_jwt_handler
 from shared.auth.models import AuthToken, LoginRequest, User, UserCreate, UserResponse
 from shared.auth.password_hasher import PasswordHasher
+from shared.auth.principal_cache import get_principal_cache
 from shared.database.connection import get_db_session
 from shared.repositories.base_repository import BaseRepository
 
@@ -67,7 +68,7 @@ async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_db_sess
         await user_repo.update(user.id, last_login=datetime.now(timezone.utc))
 
         # Create access token
-        jwt_handler = JWTHandler()
+        jwt_handler = get_jwt_handler()
         access_token = jwt_handler.create_access_token(
             user_id=user.id, username=user.username, role=user.role
         )
@@ -227,6 +228,10 @@ async def activate_user(
         if not updated_user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
+        # Invalidate only once the change is committed, or a concurrent request could
+        # re-cache the old row under the new generation
+        await db.commit()
+        get_principal_cache().invalidate_user(user_id)
         logger.info("User activated", user_id=user_id)
 
         return create_success_response(
@@ -265,6 +270,10 @@ async def deactivate_user(
         if not updated_user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
+        # Invalidate only once the change is committed, or a concurrent request could
+        # re-cache the old row under the new generation
+        await db.commit()
+        get_principal_cache().invalidate_user(user_id)
         logger.info("User deactivated", user_id=user_id)
 
         return create_success_response(
@@ -0,0 +1,13 @@
+"""
+Dashboard Services
+==================
+
+Business logic for dashboard metrics.
+
+Services:
+- rollup_service: Pre-aggregated dashboard rollups and their backfill
+"""
+
+from domains.dashboard.services import rollup_service
+
+__all__ = ["rollup_service"]
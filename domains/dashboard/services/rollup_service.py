@@ -0,0 +1,224 @@
+"""
+Dashboard Rollup Service
+Reads pre-aggregated dashboard metrics and rebuilds the rollup tables.
+
+The analytics.dashboard_* tables are maintained incrementally by triggers on
+sales.order and inventory.stock, so dashboard reads touch one row per day, brand
+or stock status instead of the full order history. Backfills rebuild them from
+the source tables, e.g. after the migration or after bulk loads that bypassed
+the triggers (TRUNCATE, COPY into a trigger-disabled table, product re-branding).
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = structlog.get_logger(__name__)
+
+
+# ===== READ QUERIES =====
+
+SALES_SUMMARY_SQL = """
+    SELECT
+        COALESCE(SUM(order_count), 0) AS total_orders,
+        COALESCE(SUM(total_revenue), 0) AS total_revenue,
+        COALESCE(SUM(total_profit), 0) AS total_profit,
+        COUNT(*) FILTER (WHERE order_count > 0) AS active_days
+    FROM analytics.dashboard_sales_daily
+"""
+
+TOP_BRANDS_SQL = """
+    SELECT
+        b.name AS brand_name,
+        SUM(r.order_count) AS order_count,
+        SUM(r.total_revenue) AS total_revenue
+    FROM analytics.dashboard_brand_sales r
+    JOIN catalog.brand b ON b.id = r.brand_id
+    WHERE r.order_count > 0
+    GROUP BY b.name
+    ORDER BY SUM(r.total_revenue) DESC
+    LIMIT :limit
+"""
+
+# Served by the sales.order (sold_at DESC) index, so only the newest rows are joined
+RECENT_ACTIVITY_SQL = """
+    SELECT
+        o.sold_at AS order_date,
+        o.gross_sale AS sale_price,
+        o.net_profit,
+        p.name AS product_name,
+        b.name AS brand_name
+    FROM sales.order o
+    JOIN inventory.stock i ON o.inventory_item_id = i.id
+    JOIN catalog.product p ON i.product_id = p.id
+    LEFT JOIN catalog.brand b ON p.brand_id = b.id
+    WHERE o.sold_at IS NOT NULL
+    ORDER BY o.sold_at DESC
+    LIMIT :limit
+"""
+
+INVENTORY_STATUS_SQL = """
+    SELECT status, item_count
+    FROM analytics.dashboard_inventory_status
+    WHERE item_count > 0
+"""
+
+
+# ===== BACKFILL QUERIES =====
+
+BACKFILL_SQL: Dict[str, List[str]] = {
+    "sales_daily": [
+        "DELETE FROM analytics.dashboard_sales_daily",
+        """
+        INSERT INTO analytics.dashboard_sales_daily
+            (sale_date, order_count, total_revenue, total_profit)
+        SELECT
+            DATE_TRUNC('day', sold_at)::date,
+            COUNT(*),
+            SUM(gross_sale),
+            COALESCE(SUM(net_profit), 0)
+        FROM sales.order
+        WHERE gross_sale IS NOT NULL AND sold_at IS NOT NULL
+        GROUP BY 1
+        """,
+    ],
+    "brand_sales": [
+        "DELETE FROM analytics.dashboard_brand_sales",
+        """
+        INSERT INTO analytics.dashboard_brand_sales (brand_id, order_count, total_revenue)
+        SELECT p.brand_id, COUNT(*), SUM(o.gross_sale)
+        FROM sales.order o
+        JOIN inventory.stock i ON o.inventory_item_id = i.id
+        JOIN catalog.product p ON i.product_id = p.id
+        WHERE o.gross_sale IS NOT NULL AND p.brand_id IS NOT NULL
+        GROUP BY p.brand_id
+        """,
+    ],
+    "inventory_status": [
+        "DELETE FROM analytics.dashboard_inventory_status",
+        """
+        INSERT INTO analytics.dashboard_inventory_status (status, item_count)
+        SELECT COALESCE(status::text, 'unknown'), COUNT(*)
+        FROM inventory.stock
+        GROUP BY 1
+        """,
+    ],
+}
+
+ROLLUP_NAMES = tuple(BACKFILL_SQL)
+
+# Source tables whose writes must pause while a rollup is rebuilt, otherwise trigger
+# deltas for rows committed mid-backfill would be lost or double counted
+_BACKFILL_SOURCES = {
+    "sales_daily": ("sales.order",),
+    "brand_sales": ("sales.order", "inventory.stock", "catalog.product"),
+    "inventory_status": ("inventory.stock",),
+}
+
+
+class DashboardRollupService:
+    """Service for reading and rebuilding the dashboard rollup tables"""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def get_snapshot(self, top_brands: int = 5, recent_activity: int = 10) -> Dict[str, Any]:
+        """Get all dashboard aggregates from the rollup tables"""
+        return {
+            "sales": await self.get_sales_summary(),
+            "top_brands": await self.get_top_brands(top_brands),
+            "recent_activity": await self.get_recent_activity(recent_activity),
+            "inventory": await self.get_inventory_counts(),
+        }
+
+    async def get_sales_summary(self) -> Dict[str, Any]:
+        """Get lifetime sales totals summed over the daily rollup"""
+        row = (await self.db_session.execute(text(SALES_SUMMARY_SQL))).one()
+
+        total_orders = int(row.total_orders or 0)
+        total_revenue = float(row.total_revenue or 0)
+        return {
+            "total_orders": total_orders,
+            "total_revenue": total_revenue,
+            "total_profit": float(row.total_profit or 0),
+            "avg_sale_price": total_revenue / total_orders if total_orders else 0.0,
+            "active_days": int(row.active_days or 0),
+        }
+
+    async def get_top_brands(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Get the brands with the highest revenue"""
+        result = await self.db_session.execute(text(TOP_BRANDS_SQL), {"limit": limit})
+
+        top_brands = []
+        for row in result.fetchall():
+            order_count = int(row.order_count or 0)
+            total_revenue = float(row.total_revenue or 0)
+            top_brands.append(
+                {
+                    "name": row.brand_name,
+                    "order_count": order_count,
+                    "total_revenue": total_revenue,
+                    "avg_price": total_revenue / order_count if order_count else 0.0,
+                }
+            )
+        return top_brands
+
+    async def get_recent_activity(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get the most recent sales"""
+        result = await self.db_session.execute(text(RECENT_ACTIVITY_SQL), {"limit": limit})
+
+        return [
+            {
+                "date": row.order_date.isoformat() if row.order_date else None,
+                "sale_price": float(row.sale_price or 0),
+                "net_profit": float(row.net_profit or 0),
+                "product_name": row.product_name,
+                "brand_name": row.brand_name,
+            }
+            for row in result.fetchall()
+        ]
+
+    async def get_inventory_counts(self) -> Dict[str, int]:
+        """Get inventory item counts by status"""
+        result = await self.db_session.execute(text(INVENTORY_STATUS_SQL))
+        by_status = {row.status: int(row.item_count) for row in result.fetchall()}
+
+        return {
+            "total_items": sum(by_status.values()),
+            "in_stock": by_status.get("in_stock", 0),
+            "sold": by_status.get("sold", 0),
+            "listed": by_status.get("listed_stockx", 0),
+        }
+
+    async def backfill(self, rollups: Optional[Sequence[str]] = None) -> Dict[str, int]:
+        """
+        Rebuild rollup tables from their source tables.
+
+        Runs in the caller's transaction and takes SHARE locks on the source tables,
+        so concurrent writes wait until the session commits while reads continue.
+
+        Args:
+            rollups: Rollups to rebuild (default: all of ROLLUP_NAMES)
+
+        Returns:
+            Rows written per rollup
+        """
+        rollups = list(rollups or ROLLUP_NAMES)
+        unknown = [name for name in rollups if name not in BACKFILL_SQL]
+        if unknown:
+            raise ValueError(f"Unknown dashboard rollups: {', '.join(unknown)}")
+
+        sources = sorted({table for name in rollups for table in _BACKFILL_SOURCES[name]})
+        await self.db_session.execute(text(f"LOCK TABLE {', '.join(sources)} IN SHARE MODE"))
+
+        written = {}
+        for name in rollups:
+            delete_sql, insert_sql = BACKFILL_SQL[name]
+            await self.db_session.execute(text(delete_sql))
+            result = await self.db_session.execute(text(insert_sql))
+            written[name] = result.rowcount
+            logger.info("Dashboard rollup rebuilt", rollup=name, rows=result.rowcount)
+
+        return written
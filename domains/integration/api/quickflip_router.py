@@ -7,7 +7,7 @@ from decimal import Decimal
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -74,9 +74,14 @@ class ImportStatsResponse(BaseModel):
     "/opportunities",
     response_model=List[QuickFlipOpportunityResponse],
     summary="Find QuickFlip opportunities",
-    description="Discover profitable arbitrage opportunities by comparing market prices with StockX data",
+    description=(
+        "Discover profitable arbitrage opportunities by comparing market prices with StockX data. "
+        "Results are ordered by profit margin; when more results exist the X-Next-Cursor "
+        "response header carries the cursor for the next page."
+    ),
 )
 async def get_quickflip_opportunities(
+    response: Response,
     min_profit_margin: float = Query(
         default=10.0, ge=0, le=1000, description="Minimum profit margin percentage"
     ),
@@ -90,6 +95,9 @@ async def get_quickflip_opportunities(
     limit: int = Query(
         default=100, ge=1, le=1000, description="Maximum number of opportunities to return"
     ),
+    cursor: Optional[str] = Query(
+        default=None, description="Pagination cursor from a previous X-Next-Cursor header"
+    ),
     db: AsyncSession = Depends(get_db_session),
 ):
     """Get QuickFlip opportunities with customizable filters"""
@@ -102,17 +110,23 @@ async def get_quickflip_opportunities(
         sources_list = [s.strip() for s in sources.split(",") if s.strip()]
 
     try:
-        opportunities = await detection_service.find_opportunities(
+        opportunities, next_cursor = await detection_service.find_opportunities_page(
             min_profit_margin=min_profit_margin,
             min_gross_profit=Decimal(str(min_gross_profit)),
             max_buy_price=Decimal(str(max_buy_price)) if max_buy_price else None,
             sources=sources_list,
             limit=limit,
+            cursor=cursor,
         )
 
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+
         # Convert to response models
         return [QuickFlipOpportunityResponse(**opp.to_dict()) for opp in opportunities]
 
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
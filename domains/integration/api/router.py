@@ -12,8 +12,11 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domains.integration.services.awin_feed_service import AwinFeedImportService
-from domains.integration.services.awin_stockx_enrichment_service import AwinStockXEnrichmentService
-from shared.database.connection import get_db_session
+from domains.integration.services.awin_stockx_enrichment_service import (
+    DEFAULT_CONCURRENCY,
+    AwinStockXEnrichmentService,
+)
+from shared.database.connection import db_manager, get_db_session
 
 logger = structlog.get_logger(__name__)
 
@@ -536,6 +539,17 @@ async def match_awin_products(
 # ==============================================================================
 
 
+async def _run_enrichment(
+    job_id: UUID, limit: Optional[int], rate_limit: int, concurrency: int = DEFAULT_CONCURRENCY
+):
+    """Run an enrichment job in its own session (background task)"""
+    async with db_manager.get_session() as bg_session:
+        bg_service = AwinStockXEnrichmentService(
+            bg_session, rate_limit_requests_per_minute=rate_limit, concurrency=concurrency
+        )
+        await bg_service.enrich_all_products(job_id=job_id, limit=limit)
+
+
 @router.post(
     "/awin/enrichment/start",
     summary="Start Enrichment Job",
@@ -548,6 +562,9 @@ async def start_enrichment_job(
         None, ge=1, le=10000, description="Limit for testing (default: process all)"
     ),
     rate_limit: int = Query(60, ge=10, le=120, description="Requests per minute (default: 60)"),
+    concurrency: int = Query(
+        DEFAULT_CONCURRENCY, ge=1, le=32, description="StockX lookups in flight at once"
+    ),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -605,14 +622,7 @@ async def start_enrichment_job(
         estimated_minutes = (total_products * (60.0 / rate_limit)) / 60.0
 
         # Start enrichment in background
-        async def run_enrichment():
-            async with get_db_session() as bg_session:
-                bg_service = AwinStockXEnrichmentService(
-                    bg_session, rate_limit_requests_per_minute=rate_limit
-                )
-                await bg_service.enrich_all_products(job_id=job_id, limit=limit)
-
-        background_tasks.add_task(run_enrichment)
+        background_tasks.add_task(_run_enrichment, job_id, limit, rate_limit, concurrency)
 
         return {
             "success": True,
@@ -629,6 +639,71 @@ async def start_enrichment_job(
         raise HTTPException(status_code=500, detail=f"Failed to start enrichment: {str(e)}")
 
 
+@router.post(
+    "/awin/enrichment/resume/{job_id}",
+    summary="Resume Enrichment Job",
+    description="Continue an interrupted or failed enrichment job after its last committed checkpoint.",
+    response_model=Dict[str, Any],
+)
+async def resume_enrichment_job(
+    job_id: UUID,
+    background_tasks: BackgroundTasks,
+    rate_limit: int = Query(60, ge=10, le=120, description="Requests per minute (default: 60)"),
+    concurrency: int = Query(
+        DEFAULT_CONCURRENCY, ge=1, le=32, description="StockX lookups in flight at once"
+    ),
+    force: bool = Query(
+        False,
+        description="Resume a job still marked running whose worker has died "
+        "(its updated_at heartbeat has stopped advancing)",
+    ),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Resume an enrichment job
+
+    Products committed before the interruption are not searched again; counters
+    continue from the checkpoint. A job still marked running is only resumed with
+    ``force``, since two workers on one checkpoint would process the same products.
+    """
+    logger.info("Resuming enrichment job", job_id=str(job_id))
+
+    result = await db.execute(
+        text(
+            """
+            SELECT status, processed_products, total_products, updated_at
+            FROM integration.awin_enrichment_jobs
+            WHERE id = :job_id
+        """
+        ),
+        {"job_id": str(job_id)},
+    )
+    job = result.fetchone()
+
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if job.status == "completed":
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is already completed")
+    if job.status == "running" and not force:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job {job_id} is still running (last update: {job.updated_at}); "
+            "pass force=true only if its worker has stopped",
+        )
+
+    background_tasks.add_task(_run_enrichment, job_id, None, rate_limit, concurrency)
+
+    return {
+        "success": True,
+        "job_id": str(job_id),
+        "message": "Enrichment job resumed",
+        "processed_products": job.processed_products,
+        "total_products": job.total_products,
+        "rate_limit_per_minute": rate_limit,
+        "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+    }
+
+
 @router.get(
     "/awin/enrichment/status/{job_id}",
     summary="Get Job Status",
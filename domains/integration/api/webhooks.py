@@ -19,6 +19,7 @@ from shared.database.models import SystemConfig
 
 from ..repositories.import_repository import ImportRepository
 from ..services.import_processor import ImportProcessor, ImportStatus, SourceType
+from ..services.stockx_http_client import get_stockx_client_state
 from ..services.stockx_service import StockXService
 
 logger = structlog.get_logger(__name__)
@@ -263,3 +264,11 @@ async def update_stockx_credentials_timestamps(db: AsyncSession = Depends(get_db
             for config in updated_configs
         ],
     }
+
+
+@router.get("/stockx/client/metrics", tags=["StockX Integration"])
+async def get_stockx_client_metrics():
+    """
+    Connection pool, token cache and request latency metrics for the shared StockX client.
+    """
+    return get_stockx_client_state().stats()
@@ -146,10 +146,13 @@ async def sync_all_views() -> Dict[str, RefreshJobStatus]:
 @router.post("/sync/on-order-event")
 async def sync_on_order_event() -> List[RefreshJobStatus]:
     """
-    Sync views affected by order data changes.
+    Schedule a refresh of the views affected by order data changes.
+
+    The views are refreshed when the scheduler's debounce window closes, together
+    with any other views changed within it.
 
     Returns:
-        List of RefreshJobStatus for affected views
+        Pending RefreshJobStatus for each affected view
     """
     sync_service = MetabaseSyncService()
     return await sync_service.sync_on_order_event()
@@ -158,10 +161,13 @@ async def sync_on_order_event() -> List[RefreshJobStatus]:
 @router.post("/sync/on-inventory-event")
 async def sync_on_inventory_event() -> List[RefreshJobStatus]:
     """
-    Sync views affected by inventory data changes.
+    Schedule a refresh of the views affected by inventory data changes.
+
+    The views are refreshed when the scheduler's debounce window closes, together
+    with any other views changed within it.
 
     Returns:
-        List of RefreshJobStatus for affected views
+        Pending RefreshJobStatus for each affected view
     """
     sync_service = MetabaseSyncService()
     return await sync_service.sync_on_inventory_event()
@@ -9,6 +9,7 @@ Architecture:
 - Materialized views for expensive aggregations
 - Automatic refresh via pg_cron (hourly/daily/weekly)
 - Indexed for optimal Metabase query performance
+- Base table dependencies drive event-driven refreshes
 - Multi-platform support (StockX, eBay, GOAT, etc.)
 
 Version: v2.2.3
@@ -35,6 +36,10 @@ class MetabaseViewConfig:
     EXECUTIVE_METRICS = {
         "name": "metabase_executive_metrics",
         "refresh": RefreshStrategy.HOURLY,
+        "depends_on": [
+            "transactions.orders",
+            "core.platforms",
+        ],
         "description": "Real-time executive KPIs: revenue, profit, ROI, orders",
         "sql": """
             SELECT
@@ -87,6 +92,13 @@ class MetabaseViewConfig:
     PRODUCT_PERFORMANCE = {
         "name": "metabase_product_performance",
         "refresh": RefreshStrategy.DAILY,
+        "depends_on": [
+            "transactions.orders",
+            "inventory.stock",
+            "catalog.product",
+            "catalog.brand",
+            "products.categories",
+        ],
         "description": "Product-level sales performance with brand and category breakdowns",
         "sql": """
             SELECT
@@ -148,6 +160,12 @@ class MetabaseViewConfig:
     BRAND_ANALYTICS = {
         "name": "metabase_brand_analytics",
         "refresh": RefreshStrategy.DAILY,
+        "depends_on": [
+            "transactions.orders",
+            "inventory.stock",
+            "catalog.product",
+            "catalog.brand",
+        ],
         "description": "Brand-level performance with market share and positioning",
         "sql": """
             WITH brand_sales AS (
@@ -215,6 +233,10 @@ class MetabaseViewConfig:
     PLATFORM_PERFORMANCE = {
         "name": "metabase_platform_performance",
         "refresh": RefreshStrategy.HOURLY,
+        "depends_on": [
+            "transactions.orders",
+            "core.platforms",
+        ],
         "description": "Multi-platform comparison: fees, shipping, payout times",
         "sql": """
             SELECT
@@ -273,6 +295,14 @@ class MetabaseViewConfig:
     INVENTORY_STATUS = {
         "name": "metabase_inventory_status",
         "refresh": RefreshStrategy.HOURLY,
+        "depends_on": [
+            "inventory.stock",
+            "transactions.orders",
+            "catalog.product",
+            "catalog.brand",
+            "products.categories",
+            "core.suppliers",
+        ],
         "description": "Current inventory status: stock levels, aging, valuation",
         "sql": """
             WITH inventory_sales AS (
@@ -351,6 +381,13 @@ class MetabaseViewConfig:
     CUSTOMER_GEOGRAPHY = {
         "name": "metabase_customer_geography",
         "refresh": RefreshStrategy.DAILY,
+        "depends_on": [
+            "transactions.orders",
+            "core.platforms",
+            "inventory.stock",
+            "catalog.product",
+            "catalog.brand",
+        ],
         "description": "Sales by country and city for market expansion insights",
         "sql": """
             SELECT
@@ -404,6 +441,13 @@ class MetabaseViewConfig:
     SUPPLIER_PERFORMANCE = {
         "name": "metabase_supplier_performance",
         "refresh": RefreshStrategy.WEEKLY,
+        "depends_on": [
+            "core.suppliers",
+            "inventory.stock",
+            "catalog.product",
+            "catalog.brand",
+            "transactions.orders",
+        ],
         "description": "Supplier reliability, product quality, and profitability",
         "sql": """
             SELECT
@@ -481,3 +525,8 @@ class MetabaseViewConfig:
     def get_views_by_refresh_strategy(cls, strategy: RefreshStrategy) -> List[Dict]:
         """Get views by refresh strategy"""
         return [v for v in cls.get_all_views() if v["refresh"] == strategy]
+
+    @classmethod
+    def get_views_depending_on(cls, table: str) -> List[Dict]:
+        """Get views reading a base table (schema-qualified, e.g. 'transactions.orders')"""
+        return [v for v in cls.get_all_views() if table in v["depends_on"]]
@@ -1,7 +1,19 @@
 """Metabase services module"""
 
 from .dashboard_service import MetabaseDashboardService
+from .refresh_scheduler import (
+    ViewRefreshScheduler,
+    get_refresh_scheduler,
+    shutdown_refresh_scheduler,
+)
 from .sync_service import MetabaseSyncService
 from .view_manager import MetabaseViewManager
 
-__all__ = ["MetabaseViewManager", "MetabaseDashboardService", "MetabaseSyncService"]
+__all__ = [
+    "MetabaseViewManager",
+    "MetabaseDashboardService",
+    "MetabaseSyncService",
+    "ViewRefreshScheduler",
+    "get_refresh_scheduler",
+    "shutdown_refresh_scheduler",
+]
@@ -0,0 +1,330 @@
+"""
+Metabase View Refresh Scheduler
+===============================
+
+Dependency-aware, debounced refresh of Metabase materialized views.
+
+Change notifications name the base tables that changed. Every view reading one
+of them (directly or through another materialized view) is marked dirty, and
+all notifications arriving within one debounce window are coalesced so each
+dirty view is refreshed once per window. Views that do not depend on each
+other refresh in parallel, each on its own pooled connection.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
+
+from shared.monitoring.metrics import get_metrics_collector
+
+from ..config.materialized_views import MetabaseViewConfig
+from ..schemas.metabase_models import RefreshJobStatus
+from .view_manager import MetabaseViewManager
+
+logger = logging.getLogger(__name__)
+
+# Seconds change notifications are coalesced before the dirty views refresh
+DEFAULT_DEBOUNCE_SECONDS = 5.0
+
+# Views refreshed at the same time, each holding one pooled connection
+DEFAULT_MAX_PARALLEL = 3
+
+VIEW_SCHEMA = "analytics"
+
+
+class ViewRefreshMetrics:
+    """Per-view refresh duration and staleness"""
+
+    def __init__(self, duration_window: int = 100):
+        self.notifications = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.refreshes: Dict[str, int] = {}
+        self.failures: Dict[str, int] = {}
+        self.last_duration_seconds: Dict[str, float] = {}
+        self.last_staleness_seconds: Dict[str, float] = {}
+        self._durations: Dict[str, Deque[float]] = {}
+        self._duration_window = duration_window
+
+    def record_notification(self, already_dirty: int) -> None:
+        self.notifications += 1
+        self.coalesced += already_dirty
+
+    def record_refresh(
+        self, view_name: str, succeeded: bool, duration_seconds: float, staleness_seconds: float
+    ) -> None:
+        self.refreshes[view_name] = self.refreshes.get(view_name, 0) + 1
+        if not succeeded:
+            self.failures[view_name] = self.failures.get(view_name, 0) + 1
+            return
+
+        self.last_duration_seconds[view_name] = duration_seconds
+        self.last_staleness_seconds[view_name] = staleness_seconds
+        self._durations.setdefault(view_name, deque(maxlen=self._duration_window)).append(
+            duration_seconds
+        )
+
+        collector = get_metrics_collector()
+        labels = {"view": view_name}
+        collector.record_histogram(
+            "metabase_view_refresh_duration_ms", duration_seconds * 1000, labels
+        )
+        collector.set_gauge("metabase_view_staleness_seconds", staleness_seconds, labels)
+
+    def snapshot(self) -> Dict[str, Any]:
+        views = set(self.refreshes) | set(self.failures)
+        return {
+            "notifications": self.notifications,
+            "coalesced": self.coalesced,
+            "flushes": self.flushes,
+            "views": {
+                view_name: {
+                    "refreshes": self.refreshes.get(view_name, 0),
+                    "failures": self.failures.get(view_name, 0),
+                    "last_duration_seconds": self.last_duration_seconds.get(view_name),
+                    "avg_duration_seconds": self._average(view_name),
+                    "last_staleness_seconds": self.last_staleness_seconds.get(view_name),
+                }
+                for view_name in sorted(views)
+            },
+        }
+
+    def _average(self, view_name: str) -> Optional[float]:
+        durations = self._durations.get(view_name)
+        if not durations:
+            return None
+        return round(sum(durations) / len(durations), 3)
+
+
+class ViewRefreshScheduler:
+    """
+    Coalesces change notifications and refreshes the affected views.
+
+    The first notification after a refresh opens a debounce window; views dirtied
+    within it are refreshed together when it closes, so a steady stream of
+    changes cannot postpone a refresh by more than one window. A view changed
+    while it is being refreshed is refreshed again in the next window, and a
+    view whose refresh failed stays dirty until the next one.
+    """
+
+    def __init__(
+        self,
+        view_manager: Optional[MetabaseViewManager] = None,
+        views: Optional[List[Dict]] = None,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+    ):
+        self.view_manager = view_manager or MetabaseViewManager()
+        self.debounce_seconds = debounce_seconds
+        self.max_parallel = max_parallel
+        self.metrics = ViewRefreshMetrics()
+
+        views = views if views is not None else MetabaseViewConfig.get_all_views()
+        self.view_names = [view["name"] for view in views]
+        self._readers = self._build_readers(views)
+        self._upstream = self._build_upstream(views)
+        self._check_acyclic()
+
+        # Dirty view -> monotonic time of its first unrefreshed change
+        self._dirty: Dict[str, float] = {}
+        self._window: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._flush_lock = asyncio.Lock()
+
+    # ===== Dependency graph =====
+
+    @staticmethod
+    def _build_readers(views: List[Dict]) -> Dict[str, Set[str]]:
+        """Table or view -> views reading it directly"""
+        readers: Dict[str, Set[str]] = {}
+        for view in views:
+            for table in view.get("depends_on", []):
+                readers.setdefault(table, set()).add(view["name"])
+        return readers
+
+    @staticmethod
+    def _build_upstream(views: List[Dict]) -> Dict[str, Set[str]]:
+        """View -> configured views it reads"""
+        qualified = {f"{VIEW_SCHEMA}.{view['name']}": view["name"] for view in views}
+        return {
+            view["name"]: {
+                qualified[table] for table in view.get("depends_on", []) if table in qualified
+            }
+            for view in views
+        }
+
+    def _check_acyclic(self) -> None:
+        ordered = sum(len(wave) for wave in self._refresh_waves(self.view_names))
+        if ordered != len(self.view_names):
+            raise ValueError("Materialized view dependencies contain a cycle")
+
+    def views_for_tables(self, tables: Iterable[str]) -> Set[str]:
+        """Views reading any of the tables, directly or through other views"""
+        affected: Set[str] = set()
+        pending = list(tables)
+        while pending:
+            for view_name in self._readers.get(pending.pop(), ()):
+                if view_name not in affected:
+                    affected.add(view_name)
+                    pending.append(f"{VIEW_SCHEMA}.{view_name}")
+        return affected
+
+    def _refresh_waves(self, view_names: Iterable[str]) -> List[List[str]]:
+        """Order views so each refreshes after the views it reads"""
+        remaining = set(view_names)
+        waves = []
+        while remaining:
+            wave = sorted(
+                view_name
+                for view_name in remaining
+                if not (self._upstream.get(view_name, set()) & remaining)
+            )
+            if not wave:
+                break  # cycle; reported by _check_acyclic
+            waves.append(wave)
+            remaining -= set(wave)
+        return waves
+
+    # ===== Notifications =====
+
+    @property
+    def dirty_views(self) -> List[str]:
+        return sorted(self._dirty)
+
+    def notify(self, *tables: str) -> List[RefreshJobStatus]:
+        """
+        Record that base tables changed and schedule their views for refresh.
+
+        Args:
+            tables: Schema-qualified table names, e.g. 'transactions.orders'
+
+        Returns:
+            Pending RefreshJobStatus for every view scheduled by this notification
+        """
+        return self.mark_dirty(self.views_for_tables(tables))
+
+    def mark_dirty(self, view_names: Iterable[str]) -> List[RefreshJobStatus]:
+        """Schedule views for refresh when the current debounce window closes"""
+        view_names = sorted(set(view_names))
+        now = time.monotonic()
+
+        already_dirty = 0
+        for view_name in view_names:
+            if view_name in self._dirty:
+                already_dirty += 1
+            else:
+                self._dirty[view_name] = now
+        self.metrics.record_notification(already_dirty)
+
+        if view_names and self._window is None:
+            self._window = asyncio.get_running_loop().create_task(self._flush_after_window())
+            self._tasks.add(self._window)
+            self._window.add_done_callback(self._tasks.discard)
+
+        return [
+            RefreshJobStatus(view_name=view_name, status="pending", started_at=None)
+            for view_name in view_names
+        ]
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self.debounce_seconds)
+        # Changes from here on open the next window
+        self._window = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Scheduled view refresh failed: {e}")
+
+    # ===== Refreshing =====
+
+    async def flush(self) -> List[RefreshJobStatus]:
+        """Refresh all dirty views now"""
+        async with self._flush_lock:
+            dirty, self._dirty = self._dirty, {}
+            if not dirty:
+                return []
+
+            self.metrics.flushes += 1
+            results = await self._refresh(dirty)
+
+            # Failed views stay dirty for the next window
+            for status in results:
+                if status.status != "completed":
+                    self._dirty.setdefault(status.view_name, dirty[status.view_name])
+            return results
+
+    async def refresh_now(self, view_names: Iterable[str]) -> List[RefreshJobStatus]:
+        """Refresh views immediately, in dependency order and in parallel"""
+        now = time.monotonic()
+        async with self._flush_lock:
+            requested = {view_name: self._dirty.pop(view_name, now) for view_name in view_names}
+            return await self._refresh(requested)
+
+    async def _refresh(self, changed_at: Dict[str, float]) -> List[RefreshJobStatus]:
+        semaphore = asyncio.Semaphore(self.max_parallel)
+
+        async def refresh(view_name: str) -> RefreshJobStatus:
+            async with semaphore:
+                started = time.monotonic()
+                status = await self.view_manager.refresh_view(view_name)
+                finished = time.monotonic()
+
+            self.metrics.record_refresh(
+                view_name,
+                succeeded=status.status == "completed",
+                duration_seconds=finished - started,
+                staleness_seconds=finished - changed_at[view_name],
+            )
+            return status
+
+        results = []
+        for wave in self._refresh_waves(changed_at):
+            results.extend(await asyncio.gather(*(refresh(view_name) for view_name in wave)))
+
+        completed = sum(1 for status in results if status.status == "completed")
+        logger.info(f"Refreshed {completed}/{len(results)} dirty Metabase views")
+        return results
+
+    def get_status(self) -> Dict[str, Any]:
+        """Dirty views with their current staleness, plus refresh metrics"""
+        now = time.monotonic()
+        return {
+            "debounce_seconds": self.debounce_seconds,
+            "max_parallel": self.max_parallel,
+            "dirty_views": {
+                view_name: round(now - changed_at, 3)
+                for view_name, changed_at in sorted(self._dirty.items())
+            },
+            **self.metrics.snapshot(),
+        }
+
+    async def shutdown(self, flush: bool = True) -> None:
+        """Cancel the open window, optionally refreshing what is dirty"""
+        if self._window is not None:
+            self._window.cancel()
+            self._window = None
+        # Let refreshes already in progress finish
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        if flush:
+            await self.flush()
+
+
+# Global scheduler instance
+_refresh_scheduler: Optional[ViewRefreshScheduler] = None
+
+
+def get_refresh_scheduler() -> ViewRefreshScheduler:
+    """Get the process-wide view refresh scheduler"""
+    global _refresh_scheduler
+    if _refresh_scheduler is None:
+        _refresh_scheduler = ViewRefreshScheduler()
+    return _refresh_scheduler
+
+
+async def shutdown_refresh_scheduler() -> None:
+    """Refresh views still waiting in an open window on application shutdown"""
+    if _refresh_scheduler is not None:
+        await _refresh_scheduler.shutdown()
@@ -7,14 +7,19 @@ Synchronizes SoleFlipper database changes with Metabase materialized views.
 
 import logging
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from ..config.materialized_views import RefreshStrategy
 from ..schemas.metabase_models import RefreshJobStatus
+from .refresh_scheduler import ViewRefreshScheduler, get_refresh_scheduler
 from .view_manager import MetabaseViewManager
 
 logger = logging.getLogger(__name__)
 
+# Base tables whose changes the event hooks report
+ORDERS_TABLE = "transactions.orders"
+INVENTORY_TABLE = "inventory.stock"
+
 
 class MetabaseSyncService:
     """
@@ -22,13 +27,14 @@ class MetabaseSyncService:
 
     Features:
     - Scheduled refresh of materialized views
-    - Event-driven refresh on data changes
+    - Event-driven, debounced refresh of the views reading changed tables
     - Performance monitoring
     - Error handling and retry logic
     """
 
-    def __init__(self):
+    def __init__(self, scheduler: Optional[ViewRefreshScheduler] = None):
         self.view_manager = MetabaseViewManager()
+        self.scheduler = scheduler or get_refresh_scheduler()
 
     async def sync_all(self) -> Dict[str, RefreshJobStatus]:
         """
@@ -39,11 +45,8 @@ class MetabaseSyncService:
         """
         logger.info("Starting full sync of all Metabase views")
 
-        results = {}
-        for view_config in self.view_manager.config.get_all_views():
-            view_name = view_config["name"]
-            status = await self.view_manager.refresh_view(view_name)
-            results[view_name] = status
+        statuses = await self.scheduler.refresh_now(self.scheduler.view_names)
+        results = {status.view_name: status for status in statuses}
 
         success_count = sum(1 for s in results.values() if s.status == "completed")
         logger.info(f"Sync completed: {success_count}/{len(results)} views refreshed successfully")
@@ -61,55 +64,33 @@ class MetabaseSyncService:
             List of RefreshJobStatus
         """
         logger.info(f"Syncing {strategy.value} views")
-        return await self.view_manager.refresh_by_strategy(strategy)
+        views = self.view_manager.config.get_views_by_refresh_strategy(strategy)
+        return await self.scheduler.refresh_now(view["name"] for view in views)
 
     async def sync_on_order_event(self) -> List[RefreshJobStatus]:
         """
-        Sync views when order data changes.
+        Schedule the views reading order data for refresh.
         Should be called when orders are created/updated.
 
+        Events within one debounce window are coalesced, so a burst of orders
+        refreshes each affected view once.
+
         Returns:
-            List of RefreshJobStatus for affected views
+            Pending RefreshJobStatus for affected views
         """
-        logger.info("Syncing views after order event")
-
-        # Refresh views that depend on orders table
-        affected_views = [
-            "metabase_executive_metrics",
-            "metabase_platform_performance",
-            "metabase_product_performance",
-        ]
-
-        results = []
-        for view_name in affected_views:
-            status = await self.view_manager.refresh_view(view_name)
-            results.append(status)
-
-        return results
+        logger.info("Scheduling view refresh after order event")
+        return self.scheduler.notify(ORDERS_TABLE)
 
     async def sync_on_inventory_event(self) -> List[RefreshJobStatus]:
         """
-        Sync views when inventory data changes.
+        Schedule the views reading inventory data for refresh.
         Should be called when inventory is added/updated.
 
         Returns:
-            List of RefreshJobStatus for affected views
+            Pending RefreshJobStatus for affected views
         """
-        logger.info("Syncing views after inventory event")
-
-        # Refresh views that depend on inventory table
-        affected_views = [
-            "metabase_inventory_status",
-            "metabase_product_performance",
-            "metabase_supplier_performance",
-        ]
-
-        results = []
-        for view_name in affected_views:
-            status = await self.view_manager.refresh_view(view_name)
-            results.append(status)
-
-        return results
+        logger.info("Scheduling view refresh after inventory event")
+        return self.scheduler.notify(INVENTORY_TABLE)
 
     async def get_sync_status(self) -> Dict[str, any]:
         """
@@ -130,6 +111,7 @@ class MetabaseSyncService:
             "missing_views": total_views - existing_views,
             "total_rows": total_rows,
             "last_check": datetime.utcnow(),
+            "refresh_scheduler": self.scheduler.get_status(),
             "views": [
                 {
                     "name": v.view_name,
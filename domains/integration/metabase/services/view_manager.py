@@ -12,7 +12,7 @@ from typing import Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.database.connection import DatabaseManager
+from shared.database.connection import db_manager
 
 from ..config.materialized_views import MetabaseViewConfig, RefreshStrategy
 from ..schemas.metabase_models import MaterializedViewStatus, RefreshJobStatus
@@ -32,7 +32,8 @@ class MetabaseViewManager:
     """
 
     def __init__(self):
-        self.db = DatabaseManager()
+        # Shared, initialized pool; parallel refreshes each check out a connection
+        self.db = db_manager
         self.config = MetabaseViewConfig()
 
     async def create_all_views(self, drop_existing: bool = False) -> Dict[str, bool]:
@@ -6,6 +6,8 @@ Business logic for external platform integrations and data import processing.
 
 Services:
 - stockx_service: StockX API integration (OAuth, orders, products)
+- stockx_http_client: Shared StockX connection pool, token cache and request metrics
+- stockx_rate_limiter: Token-bucket scheduler with priority lanes for StockX calls
 - stockx_catalog_service: StockX catalog operations and bulk imports
 - awin_feed_service: AWIN partner feed processing
 - awin_connector: AWIN API connector
@@ -16,6 +18,7 @@ Services:
 - import_processor: Import batch processing
 - quickflip_detection_service: QuickFlip opportunity detection
 - validators: Data validation for imports
+- normalizers: Memoized, format-sniffing date and currency normalization
 - transformers: Data transformation utilities
 - parsers: Data parsing utilities
 """
@@ -27,9 +30,12 @@ from domains.integration.services import (
     import_processor,
     large_retailer_service,
     market_price_import_service,
+    normalizers,
     parsers,
     quickflip_detection_service,
     stockx_catalog_service,
+    stockx_http_client,
+    stockx_rate_limiter,
     stockx_service,
     transformers,
     unified_price_import_service,
@@ -38,6 +44,8 @@ from domains.integration.services import (
 
 __all__ = [
     "stockx_service",
+    "stockx_http_client",
+    "stockx_rate_limiter",
     "stockx_catalog_service",
     "awin_feed_service",
     "awin_connector",
@@ -48,6 +56,7 @@ __all__ = [
     "import_processor",
     "quickflip_detection_service",
     "validators",
+    "normalizers",
     "transformers",
     "parsers",
 ]
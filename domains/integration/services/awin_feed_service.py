@@ -3,17 +3,168 @@ Awin Product Feed Import Service
 Handles downloading, parsing, and importing product data from Awin affiliate feeds
 """
 
+import asyncio
 import csv
 import gzip
+import json
 import os
-from typing import Dict, List, Optional
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import httpx
+import psutil
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.database.connection import db_manager
 
+# Columns written to the staging table, in COPY order
+STAGING_TABLE = "awin_products_staging"
+STAGING_COLUMNS = [
+    "row_number",
+    "awin_product_id",
+    "merchant_product_id",
+    "merchant_id",
+    "merchant_name",
+    "data_feed_id",
+    "product_name",
+    "brand_name",
+    "brand_id",
+    "ean",
+    "product_gtin",
+    "mpn",
+    "product_model",
+    "retail_price_cents",
+    "store_price_cents",
+    "rrp_price_cents",
+    "currency",
+    "description",
+    "short_description",
+    "colour",
+    "size",
+    "material",
+    "in_stock",
+    "stock_quantity",
+    "delivery_time",
+    "image_url",
+    "thumbnail_url",
+    "alternate_images",
+    "affiliate_link",
+    "merchant_link",
+    "last_updated",
+]
+
+# Loosely typed so COPY never fails on formatting; values are cast on merge
+CREATE_STAGING_TABLE_SQL = f"""
+    CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+        row_number integer,
+        awin_product_id text,
+        merchant_product_id text,
+        merchant_id integer,
+        merchant_name text,
+        data_feed_id integer,
+        product_name text,
+        brand_name text,
+        brand_id integer,
+        ean text,
+        product_gtin text,
+        mpn text,
+        product_model text,
+        retail_price_cents integer,
+        store_price_cents integer,
+        rrp_price_cents integer,
+        currency text,
+        description text,
+        short_description text,
+        colour text,
+        size text,
+        material text,
+        in_stock boolean,
+        stock_quantity integer,
+        delivery_time text,
+        image_url text,
+        thumbnail_url text,
+        alternate_images text,
+        affiliate_link text,
+        merchant_link text,
+        last_updated text
+    ) ON COMMIT DROP
+"""
+
+INSERT_STAGING_SQL = f"""
+    INSERT INTO {STAGING_TABLE} ({", ".join(STAGING_COLUMNS)})
+    VALUES ({", ".join(f":{column}" for column in STAGING_COLUMNS)})
+"""
+
+# Set-based upsert; DISTINCT ON keeps the last occurrence of a product in the chunk,
+# matching the row-by-row import where later rows overwrite earlier ones
+MERGE_STAGING_SQL = f"""
+    INSERT INTO integration.awin_products (
+        awin_product_id, merchant_product_id, merchant_id,
+        merchant_name, data_feed_id, product_name, brand_name, brand_id,
+        ean, product_gtin, mpn, product_model,
+        retail_price_cents, store_price_cents, rrp_price_cents, currency,
+        description, short_description, colour, size, material,
+        in_stock, stock_quantity, delivery_time,
+        image_url, thumbnail_url, alternate_images,
+        affiliate_link, merchant_link,
+        last_updated, updated_at
+    )
+    SELECT DISTINCT ON (awin_product_id)
+        awin_product_id, merchant_product_id, merchant_id,
+        merchant_name, data_feed_id, product_name, brand_name, brand_id,
+        ean, product_gtin, mpn, product_model,
+        retail_price_cents, store_price_cents, rrp_price_cents, currency,
+        description, short_description, colour, size, material,
+        in_stock, stock_quantity, delivery_time,
+        image_url, thumbnail_url, CAST(alternate_images AS jsonb),
+        affiliate_link, merchant_link,
+        CAST(last_updated AS timestamptz), NOW()
+    FROM {STAGING_TABLE}
+    ORDER BY awin_product_id, row_number DESC
+    ON CONFLICT (awin_product_id)
+    DO UPDATE SET
+        retail_price_cents = EXCLUDED.retail_price_cents,
+        store_price_cents = EXCLUDED.store_price_cents,
+        in_stock = EXCLUDED.in_stock,
+        stock_quantity = EXCLUDED.stock_quantity,
+        last_updated = EXCLUDED.last_updated,
+        updated_at = NOW()
+"""
+
+
+def _parse_price(value: Optional[str]) -> Optional[int]:
+    """Parse a decimal price string into cents"""
+    if not value or value.strip() == "":
+        return None
+    try:
+        return int(float(value) * 100)  # Convert to cents
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    if not value or value.strip() == "":
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_bool(value: Optional[str]) -> bool:
+    """Parse bool from '0'/'1'"""
+    return value == "1" if value else False
+
+
+ALTERNATE_IMAGE_FIELDS = (
+    "large_image",
+    "alternate_image",
+    "alternate_image_two",
+    "alternate_image_three",
+    "alternate_image_four",
+)
+
 
 class AwinFeedImportService:
     """Service for importing product data from Awin affiliate network"""
@@ -211,59 +362,26 @@ class AwinFeedImportService:
         Returns:
             Transformed product dictionary
         """
-
-        # Parse price safely
-        def parse_price(value: str) -> Optional[int]:
-            if not value or value.strip() == "":
-                return None
-            try:
-                return int(float(value) * 100)  # Convert to cents
-            except (ValueError, TypeError):
-                return None
-
-        # Parse int safely
-        def parse_int(value: str) -> Optional[int]:
-            if not value or value.strip() == "":
-                return None
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return None
-
-        # Parse bool from '0'/'1'
-        def parse_bool(value: str) -> bool:
-            return value == "1" if value else False
-
-        # Collect alternate images
-        alternate_images = []
-        for img_field in [
-            "large_image",
-            "alternate_image",
-            "alternate_image_two",
-            "alternate_image_three",
-            "alternate_image_four",
-        ]:
-            if row.get(img_field):
-                alternate_images.append(row[img_field])
+        alternate_images = [row[field] for field in ALTERNATE_IMAGE_FIELDS if row.get(field)]
 
         return {
             "awin_product_id": row.get("aw_product_id", ""),
             "merchant_product_id": row.get("merchant_product_id"),
-            "merchant_id": parse_int(row.get("merchant_id")) or 0,
+            "merchant_id": _parse_int(row.get("merchant_id")) or 0,
             "merchant_name": row.get("merchant_name"),
-            "data_feed_id": parse_int(row.get("data_feed_id")),
+            "data_feed_id": _parse_int(row.get("data_feed_id")),
             # Product info
             "product_name": row.get("product_name", ""),
             "brand_name": row.get("brand_name"),
-            "brand_id": parse_int(row.get("brand_id")),
+            "brand_id": _parse_int(row.get("brand_id")),
             "ean": row.get("ean"),
             "product_gtin": row.get("product_GTIN"),
             "mpn": row.get("mpn"),
             "product_model": row.get("product_model"),
             # Pricing
-            "retail_price_cents": parse_price(row.get("search_price")),
-            "store_price_cents": parse_price(row.get("store_price")),
-            "rrp_price_cents": parse_price(row.get("rrp_price")),
+            "retail_price_cents": _parse_price(row.get("search_price")),
+            "store_price_cents": _parse_price(row.get("store_price")),
+            "rrp_price_cents": _parse_price(row.get("rrp_price")),
             "currency": row.get("currency", "EUR"),
             # Details
             "description": row.get("description"),
@@ -272,8 +390,8 @@ class AwinFeedImportService:
             "size": row.get("Fashion:size"),
             "material": row.get("Fashion:material"),
             # Stock
-            "in_stock": parse_bool(row.get("in_stock")),
-            "stock_quantity": parse_int(row.get("stock_quantity")) or 0,
+            "in_stock": _parse_bool(row.get("in_stock")),
+            "stock_quantity": _parse_int(row.get("stock_quantity")) or 0,
             "delivery_time": row.get("delivery_time"),
             # Images
             "image_url": row.get("merchant_image_url"),
@@ -328,14 +446,135 @@ class AwinFeedImportService:
         print(f"[OK] Imported {imported_count} products")
         return imported_count
 
+    # =====================================================
+    # STREAMING IMPORT
+    # =====================================================
+
+    async def import_feed_streaming(
+        self, csv_file_path: str, chunk_size: int = 5000
+    ) -> Dict[str, Any]:
+        """
+        Stream a gzip CSV feed into the database in chunks
+
+        Rows are read incrementally and transformed per chunk. Each chunk goes into
+        a temporary staging table (PostgreSQL COPY on asyncpg, multi-row executemany
+        otherwise) and is merged into integration.awin_products with one set-based
+        upsert. Memory stays bounded by the chunk size instead of the feed size.
+
+        Args:
+            csv_file_path: Path to gzip compressed CSV file
+            chunk_size: Number of rows per staging/merge round trip
+
+        Returns:
+            Import statistics including rows/sec and peak RSS
+        """
+        print(f"[*] Streaming feed import: {csv_file_path} (chunk size {chunk_size})")
+
+        process = psutil.Process()
+        peak_rss = process.memory_info().rss
+        started = time.perf_counter()
+        stats = {"rows_read": 0, "rows_invalid": 0, "rows_imported": 0, "chunks": 0}
+
+        chunks = self._iter_feed_chunks(csv_file_path, chunk_size)
+        while True:
+            # Decompression and CSV parsing run off the event loop
+            next_chunk = await asyncio.to_thread(next, chunks, None)
+            if next_chunk is None:
+                break
+
+            products, invalid_rows = next_chunk
+            stats["rows_read"] += len(products) + invalid_rows
+            stats["rows_invalid"] += invalid_rows
+            stats["chunks"] += 1
+
+            if products:
+                stats["rows_imported"] += await self._load_chunk(products)
+
+            peak_rss = max(peak_rss, process.memory_info().rss)
+            print(
+                f"    Imported {stats['rows_imported']} products ({stats['rows_read']} rows read)"
+            )
+
+        duration = time.perf_counter() - started
+        stats["duration_seconds"] = round(duration, 2)
+        stats["rows_per_second"] = round(stats["rows_read"] / duration, 1) if duration else 0.0
+        stats["peak_rss_mb"] = round(peak_rss / (1024 * 1024), 1)
+
+        print(
+            f"[OK] Imported {stats['rows_imported']} products in {stats['duration_seconds']}s "
+            f"({stats['rows_per_second']} rows/sec, peak RSS {stats['peak_rss_mb']} MB)"
+        )
+        return stats
+
+    def _iter_feed_chunks(
+        self, csv_file_path: str, chunk_size: int
+    ) -> Iterator[Tuple[List[Dict], int]]:
+        """Yield (products, invalid row count) chunks from a gzip CSV feed"""
+        with gzip.open(csv_file_path, "rt", encoding="utf-8", newline="") as f:
+            products: List[Dict] = []
+            invalid_rows = 0
+
+            for i, row in enumerate(csv.DictReader(f), 1):
+                try:
+                    products.append(self._transform_row(row))
+                except Exception as e:
+                    print(f"[WARN] Error parsing row {i}: {e}")
+                    invalid_rows += 1
+                    continue
+
+                if len(products) >= chunk_size:
+                    yield products, invalid_rows
+                    products, invalid_rows = [], 0
+
+            if products or invalid_rows:
+                yield products, invalid_rows
+
+    async def _load_chunk(self, products: List[Dict]) -> int:
+        """
+        Stage and merge one chunk; falls back to row-by-row upserts if the
+        set-based merge fails so a single bad row does not drop the whole chunk
+        """
+        try:
+            connection = await self.session.connection()
+            await self.session.execute(text(CREATE_STAGING_TABLE_SQL))
+
+            records = [self._staging_record(i, product) for i, product in enumerate(products)]
+            if connection.dialect.driver == "asyncpg":
+                raw_connection = await connection.get_raw_connection()
+                await raw_connection.driver_connection.copy_records_to_table(
+                    STAGING_TABLE,
+                    records=[
+                        tuple(record[column] for column in STAGING_COLUMNS) for record in records
+                    ],
+                    columns=STAGING_COLUMNS,
+                )
+            else:
+                await self.session.execute(text(INSERT_STAGING_SQL), records)
+
+            result = await self.session.execute(text(MERGE_STAGING_SQL))
+            await self.session.commit()
+            return result.rowcount
+
+        except Exception as e:
+            print(f"[WARN] Bulk merge failed, retrying chunk row by row: {str(e)[:200]}")
+            await self.session.rollback()
+            return await self.import_products(products)
+
+    @staticmethod
+    def _staging_record(row_number: int, product: Dict) -> Dict[str, Any]:
+        """Map a transformed product to a staging table row"""
+        record = {column: product.get(column) for column in STAGING_COLUMNS}
+        record["row_number"] = row_number
+        if product.get("alternate_images"):
+            record["alternate_images"] = json.dumps(product["alternate_images"])
+        return record
+
     async def _upsert_product(self, product_data: Dict):
         """Insert or update product (ON CONFLICT DO UPDATE)"""
 
         # Convert alternate_images list to JSON string
         alternate_images_json = None
         if product_data.get("alternate_images"):
-            import json
-
             alternate_images_json = json.dumps(product_data["alternate_images"])
 
         await self.session.execute(
@@ -524,11 +763,9 @@ async def sync_awin_feed(merchant_ids: List[int] = [10597]):
         # Download feed
         feed_path = await service.download_feed(merchant_ids)
 
-        # Parse feed
-        products = await service.parse_feed(feed_path)
-
-        # Import to database
-        imported_count = await service.import_products(products)
+        # Stream feed into the database
+        import_stats = await service.import_feed_streaming(feed_path)
+        imported_count = import_stats["rows_imported"]
 
         # Match products by EAN
         matched_count = await service.match_products_by_ean()
@@ -540,6 +777,10 @@ async def sync_awin_feed(merchant_ids: List[int] = [10597]):
         print("AWIN FEED SYNC COMPLETE")
         print("=" * 80)
         print(f"Imported: {imported_count} products")
+        print(
+            f"Throughput: {import_stats['rows_per_second']} rows/sec "
+            f"(peak RSS {import_stats['peak_rss_mb']} MB)"
+        )
         print(f"Matched: {matched_count} products by EAN")
         print("\nStatistics:")
         print(f"  Total Products: {stats['total_products']}")
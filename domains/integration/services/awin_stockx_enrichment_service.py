@@ -5,8 +5,9 @@ Built for reproducibility and scalability with Budibase integration
 """
 
 import asyncio
-from datetime import datetime
-from typing import Any, Dict, Optional
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID, uuid4
 
 import structlog
@@ -14,19 +15,112 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domains.integration.services.stockx_catalog_service import StockXCatalogService
+from domains.integration.services.stockx_rate_limiter import (
+    RequestPriority,
+    TokenBucketScheduler,
+)
 from domains.integration.services.stockx_service import StockXService
 
 logger = structlog.get_logger(__name__)
 
+# StockX searches in flight at once per job
+DEFAULT_CONCURRENCY = 8
+
+# How long resolved lookups are reused; misses are retried sooner
+MATCH_CACHE_TTL = timedelta(days=30)
+MISS_CACHE_TTL = timedelta(days=7)
+
+# Sort key standing in for a missing retail price (sorts last)
+NULL_PRICE_SORT_KEY = 2**31 - 1
+
+
+class StockXLookupCache:
+    """
+    Persistent EAN / style ID -> StockX catalog product cache
+
+    Backed by integration.stockx_lookup_cache. Lookups that found nothing are
+    cached too (as NULL), so an unknown EAN listed by many merchants is searched
+    once per TTL instead of once per listing.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        match_ttl: timedelta = MATCH_CACHE_TTL,
+        miss_ttl: timedelta = MISS_CACHE_TTL,
+    ):
+        self.session = session
+        self.match_ttl = match_ttl
+        self.miss_ttl = miss_ttl
+
+    async def get_many(self, lookup_keys: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get unexpired entries; keys without one are absent from the result"""
+        keys = list(lookup_keys)
+        if not keys:
+            return {}
+
+        query = text(
+            """
+            SELECT lookup_key, stockx_product
+            FROM integration.stockx_lookup_cache
+            WHERE lookup_key = ANY(CAST(:lookup_keys AS text[]))
+              AND expires_at > NOW()
+        """
+        )
+
+        result = await self.session.execute(query, {"lookup_keys": keys})
+        return {
+            row.lookup_key: (
+                json.loads(row.stockx_product)
+                if isinstance(row.stockx_product, str)
+                else row.stockx_product
+            )
+            for row in result.fetchall()
+        }
+
+    async def put_many(self, results: Dict[str, Optional[Dict[str, Any]]]):
+        """Store lookup results (None for a miss) in one statement"""
+        if not results:
+            return
+
+        upsert_query = text(
+            """
+            INSERT INTO integration.stockx_lookup_cache
+                (lookup_key, stockx_product, resolved_at, expires_at)
+            VALUES
+                (:lookup_key, CAST(:stockx_product AS jsonb), NOW(),
+                 NOW() + make_interval(secs => :ttl_seconds))
+            ON CONFLICT (lookup_key) DO UPDATE SET
+                stockx_product = EXCLUDED.stockx_product,
+                resolved_at = EXCLUDED.resolved_at,
+                expires_at = EXCLUDED.expires_at
+        """
+        )
+
+        await self.session.execute(
+            upsert_query,
+            [
+                {
+                    "lookup_key": key,
+                    "stockx_product": json.dumps(product) if product is not None else None,
+                    "ttl_seconds": (
+                        self.match_ttl if product is not None else self.miss_ttl
+                    ).total_seconds(),
+                }
+                for key, product in results.items()
+            ],
+        )
+
 
 class AwinStockXEnrichmentService:
     """
     Service for enriching Awin products with StockX market data
 
     Features:
-    - EAN-based matching
-    - Rate limiting (configurable)
-    - Progress tracking
+    - EAN-based matching, style ID fallback
+    - Concurrent lookups under a shared rate budget (configurable)
+    - Persistent lookup cache, each EAN / style ID searched once per TTL
+    - Progress tracking with resumable checkpoints
     - Batch processing
     - Reproducible and scalable
     """
@@ -36,21 +130,33 @@ class AwinStockXEnrichmentService:
         session: AsyncSession,
         rate_limit_requests_per_minute: int = 60,  # Conservative default
         batch_size: int = 50,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ):
         self.session = session
         self.stockx_service = StockXService(session)
-        self.catalog_service = StockXCatalogService(self.stockx_service)
+        self.catalog_service = StockXCatalogService(
+            self.stockx_service, priority=RequestPriority.CATALOG_ENRICHMENT
+        )
 
         # Rate limiting configuration
         self.rate_limit = rate_limit_requests_per_minute
         self.request_interval = 60.0 / rate_limit_requests_per_minute  # seconds between requests
         self.batch_size = batch_size
+        self.concurrency = concurrency
+
+        # Budget shared by all in-flight lookups of this job; requests additionally
+        # pass the process-wide StockX scheduler
+        self.rate_budget = TokenBucketScheduler(
+            rate=rate_limit_requests_per_minute / 60.0, burst=concurrency
+        )
+        self.lookup_cache = StockXLookupCache(session)
 
         logger.info(
             "Enrichment service initialized",
             rate_limit=rate_limit_requests_per_minute,
             request_interval=f"{self.request_interval:.2f}s",
             batch_size=batch_size,
+            concurrency=concurrency,
         )
 
     async def create_enrichment_job(self, job_type: str = "stockx_match") -> UUID:
@@ -90,14 +196,22 @@ class AwinStockXEnrichmentService:
         logger.info("Enrichment job created", job_id=str(job_id), total_products=total_products)
         return job_id
 
-    async def update_job_progress(self, job_id: UUID, processed: int, matched: int, failed: int):
-        """Update job progress"""
+    async def update_job_progress(
+        self,
+        job_id: UUID,
+        processed: int,
+        matched: int,
+        failed: int,
+        checkpoint: Optional[Dict[str, Any]] = None,
+    ):
+        """Update job progress, committing the checkpoint together with the page it covers"""
         update_query = text(
             """
             UPDATE integration.awin_enrichment_jobs
             SET processed_products = :processed,
                 matched_products = :matched,
                 failed_products = :failed,
+                checkpoint = COALESCE(CAST(:checkpoint AS jsonb), checkpoint),
                 updated_at = NOW()
             WHERE id = :job_id
         """
@@ -105,7 +219,13 @@ class AwinStockXEnrichmentService:
 
         await self.session.execute(
             update_query,
-            {"job_id": str(job_id), "processed": processed, "matched": matched, "failed": failed},
+            {
+                "job_id": str(job_id),
+                "processed": processed,
+                "matched": matched,
+                "failed": failed,
+                "checkpoint": json.dumps(checkpoint) if checkpoint is not None else None,
+            },
         )
         await self.session.commit()
 
@@ -117,8 +237,6 @@ class AwinStockXEnrichmentService:
         error_log: Optional[str] = None,
     ):
         """Mark job as completed"""
-        import json
-
         update_query = text(
             """
             UPDATE integration.awin_enrichment_jobs
@@ -150,8 +268,15 @@ class AwinStockXEnrichmentService:
         """
         Main enrichment method - matches all Awin products with StockX
 
+        Pending products are processed page by page (``batch_size`` per page). Each
+        page resolves its distinct EANs - and style IDs for EAN misses - through the
+        lookup cache and up to ``concurrency`` concurrent StockX searches, writes
+        all results at once and commits a checkpoint, so a job that was interrupted
+        resumes after its last committed page when started again with its job_id.
+
         Args:
-            job_id: Optional job ID for tracking (creates new if None)
+            job_id: Optional job ID for tracking (creates new if None, resumes if it
+                has a checkpoint)
             limit: Optional limit for testing (processes all if None)
 
         Returns:
@@ -165,102 +290,47 @@ class AwinStockXEnrichmentService:
             "matched": 0,
             "not_found": 0,
             "errors": 0,
+            "lookups": 0,
+            "cache_hits": 0,
             "started_at": datetime.utcnow().isoformat(),
         }
 
         errors_log = []
 
         try:
-            # Get products to enrich (in stock, with EAN, not yet enriched)
-            products_query = text(
-                """
-                SELECT
-                    id,
-                    awin_product_id,
-                    product_name,
-                    brand_name,
-                    size,
-                    ean,
-                    retail_price_cents
-                FROM integration.awin_products
-                WHERE ean IS NOT NULL
-                  AND ean != ''
-                  AND in_stock = true
-                  AND (enrichment_status = 'pending' OR enrichment_status IS NULL OR last_enriched_at IS NULL)
-                ORDER BY retail_price_cents ASC
-                """
-                + (f"LIMIT {limit}" if limit else "")
-            )
-
-            result = await self.session.execute(products_query)
-            products = result.fetchall()
-
-            logger.info(f"Starting enrichment for {len(products)} products", job_id=str(job_id))
-
-            # Process in batches with rate limiting
-            for i, product in enumerate(products, 1):
-                try:
-                    # Rate limiting: wait between requests
-                    if i > 1:
-                        await asyncio.sleep(self.request_interval)
-
-                    # Search StockX by EAN
-                    search_results = await self.catalog_service.search_catalog(
-                        query=product.ean, page_number=1, page_size=1
-                    )
-
-                    if search_results and search_results.get("products"):
-                        # Match found!
-                        stockx_product = search_results["products"][0]
-
-                        # Get product ID and fetch variants for size matching
-                        stockx_product_id = stockx_product.get("productId")
-
-                        # Try to get market data for the specific size
-                        # Note: Size matching might require additional logic
-                        # For now, we store the product match
-
-                        await self._update_product_match(
-                            product.id,
-                            stockx_product_id,
-                            stockx_product.get("urlKey"),
-                            stockx_product.get("styleId"),
-                            stockx_product,
-                            product.retail_price_cents,
-                        )
-
-                        stats["matched"] += 1
-                        logger.debug(
-                            f"Matched product {i}/{len(products)}",
-                            ean=product.ean,
-                            stockx_id=stockx_product_id,
-                        )
-                    else:
-                        # No match found
-                        await self._mark_product_not_found(product.id)
-                        stats["not_found"] += 1
-                        logger.debug(f"No match for product {i}/{len(products)}", ean=product.ean)
-
-                except Exception as e:
-                    stats["errors"] += 1
-                    error_msg = f"Product {product.awin_product_id}: {str(e)}"
-                    errors_log.append(error_msg)
-                    logger.error(
-                        "Product enrichment failed",
-                        product_id=product.awin_product_id,
-                        error=str(e),
-                    )
-
-                    await self._mark_product_error(product.id)
-
-                stats["total_processed"] = i
-
-                # Update job progress every 10 products
-                if i % 10 == 0:
-                    await self.update_job_progress(
-                        job_id, stats["total_processed"], stats["matched"], stats["errors"]
-                    )
-                    logger.info(f"Progress: {i}/{len(products)} processed", **stats)
+            checkpoint = await self._load_checkpoint(job_id)
+            after = None
+            if checkpoint:
+                after = checkpoint.get("after")
+                stats.update(checkpoint.get("stats", {}))
+                if limit is None:
+                    limit = checkpoint.get("limit")
+                await self._mark_job_running(job_id)
+                logger.info("Resuming enrichment job", job_id=str(job_id), **stats)
+
+            while limit is None or stats["total_processed"] < limit:
+                page_size = self.batch_size
+                if limit is not None:
+                    page_size = min(page_size, limit - stats["total_processed"])
+
+                products = await self._fetch_pending_products(after, page_size)
+                if not products:
+                    break
+
+                outcomes = await self._resolve_products(products, stats)
+                await self._write_outcomes(products, outcomes, stats, errors_log)
+
+                stats["total_processed"] += len(products)
+                last = products[-1]
+                after = {"sort_price": last.sort_price, "id": str(last.id)}
+                await self.update_job_progress(
+                    job_id,
+                    stats["total_processed"],
+                    stats["matched"],
+                    stats["errors"],
+                    checkpoint={"after": after, "stats": stats, "limit": limit},
+                )
+                logger.info(f"Progress: {stats['total_processed']} processed", **stats)
 
             # Final stats
             stats["completed_at"] = datetime.utcnow().isoformat()
@@ -283,6 +353,7 @@ class AwinStockXEnrichmentService:
 
         except Exception as e:
             logger.error("Enrichment job failed", job_id=str(job_id), error=str(e), exc_info=True)
+            await self.session.rollback()
             stats["completed_at"] = datetime.utcnow().isoformat()
             stats["fatal_error"] = str(e)
 
@@ -292,16 +363,184 @@ class AwinStockXEnrichmentService:
 
             raise
 
-    async def _update_product_match(
-        self,
-        awin_product_id: UUID,
-        stockx_product_id: str,
-        stockx_url_key: str,
-        stockx_style_id: str,
-        stockx_data: Dict,
-        retail_price_cents: int,
+    # ===== Checkpoints =====
+
+    async def _load_checkpoint(self, job_id: UUID) -> Optional[Dict[str, Any]]:
+        """Get the checkpoint of a job, None if it has not committed a page yet"""
+        result = await self.session.execute(
+            text("SELECT checkpoint FROM integration.awin_enrichment_jobs WHERE id = :job_id"),
+            {"job_id": str(job_id)},
+        )
+        row = result.fetchone()
+        if row is None or row.checkpoint is None:
+            return None
+        return json.loads(row.checkpoint) if isinstance(row.checkpoint, str) else row.checkpoint
+
+    async def _mark_job_running(self, job_id: UUID):
+        """Reopen a resumed job"""
+        await self.session.execute(
+            text(
+                """
+                UPDATE integration.awin_enrichment_jobs
+                SET status = 'running',
+                    completed_at = NULL,
+                    updated_at = NOW()
+                WHERE id = :job_id
+            """
+            ),
+            {"job_id": str(job_id)},
+        )
+        await self.session.commit()
+
+    async def _fetch_pending_products(self, after: Optional[Dict[str, Any]], page_size: int):
+        """Next page of pending products in (retail price, id) order, after the checkpoint"""
+        # NULL prices sort last, like ORDER BY retail_price_cents ASC
+        keyset = ""
+        params: Dict[str, Any] = {"page_size": page_size, "null_price": NULL_PRICE_SORT_KEY}
+        if after:
+            keyset = (
+                "AND (COALESCE(retail_price_cents, :null_price), id)"
+                " > (:after_price, CAST(:after_id AS uuid))"
+            )
+            params.update(after_price=after["sort_price"], after_id=after["id"])
+
+        products_query = text(
+            f"""
+            SELECT
+                id,
+                awin_product_id,
+                product_name,
+                brand_name,
+                size,
+                ean,
+                mpn,
+                retail_price_cents,
+                COALESCE(retail_price_cents, :null_price) AS sort_price
+            FROM integration.awin_products
+            WHERE ean IS NOT NULL
+              AND ean != ''
+              AND in_stock = true
+              AND (enrichment_status = 'pending' OR enrichment_status IS NULL OR last_enriched_at IS NULL)
+              {keyset}
+            ORDER BY COALESCE(retail_price_cents, :null_price), id
+            LIMIT :page_size
+            """
+        )
+
+        result = await self.session.execute(products_query, params)
+        return result.fetchall()
+
+    # ===== Matching =====
+
+    async def _resolve_products(self, products, stats: Dict[str, Any]) -> Dict[Any, Any]:
+        """
+        Match a page of products
+
+        Returns:
+            Product id -> StockX catalog product, None when nothing matched, or the
+            exception raised by the lookup
+        """
+        ean_keys = {product.id: f"ean:{product.ean.strip()}" for product in products}
+        resolved = await self._resolve_lookup_keys(set(ean_keys.values()), stats)
+
+        # Fall back to the manufacturer style ID for EANs StockX does not know
+        style_keys = {
+            product.id: f"style:{product.mpn.strip().upper()}"
+            for product in products
+            if resolved[ean_keys[product.id]] is None and product.mpn and product.mpn.strip()
+        }
+        if style_keys:
+            resolved.update(await self._resolve_lookup_keys(set(style_keys.values()), stats))
+
+        outcomes = {}
+        for product in products:
+            outcome = resolved[ean_keys[product.id]]
+            if outcome is None and product.id in style_keys:
+                outcome = resolved[style_keys[product.id]]
+            outcomes[product.id] = outcome
+        return outcomes
+
+    async def _resolve_lookup_keys(self, keys: Set[str], stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve distinct lookup keys from the cache, searching StockX for the rest"""
+        resolved: Dict[str, Any] = await self.lookup_cache.get_many(keys)
+        stats["cache_hits"] += len(resolved)
+
+        pending = sorted(keys - resolved.keys())
+        if not pending:
+            return resolved
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded_lookup(key: str):
+            async with semaphore:
+                return await self._lookup(key)
+
+        results = await asyncio.gather(
+            *(bounded_lookup(key) for key in pending), return_exceptions=True
+        )
+        stats["lookups"] += len(pending)
+
+        fresh = {}
+        for key, result in zip(pending, results):
+            resolved[key] = result
+            if isinstance(result, BaseException):
+                logger.warning("StockX lookup failed", lookup_key=key, error=str(result))
+            else:
+                fresh[key] = result
+
+        if fresh:
+            await self.lookup_cache.put_many(fresh)
+        return resolved
+
+    async def _lookup(self, lookup_key: str) -> Optional[Dict[str, Any]]:
+        """Search StockX for one lookup key within the job's request budget"""
+        kind, value = lookup_key.split(":", 1)
+        await self.rate_budget.acquire(RequestPriority.CATALOG_ENRICHMENT)
+
+        search_results = await self.catalog_service.search_catalog(
+            query=value, page_number=1, page_size=1 if kind == "ean" else 5
+        )
+        candidates = (search_results or {}).get("products") or []
+
+        if kind == "style":
+            # Free-text search; only accept an exact style ID
+            candidates = [c for c in candidates if (c.get("styleId") or "").upper() == value]
+
+        return candidates[0] if candidates else None
+
+    # ===== Batched writes =====
+
+    async def _write_outcomes(
+        self, products, outcomes: Dict[Any, Any], stats: Dict[str, Any], errors_log: list
     ):
-        """Update Awin product with StockX match data"""
+        """Write the results of a page with one statement per outcome"""
+        matched = []
+        not_found_ids = []
+        error_ids = []
+
+        for product in products:
+            outcome = outcomes[product.id]
+            if isinstance(outcome, BaseException):
+                error_ids.append(str(product.id))
+                errors_log.append(f"Product {product.awin_product_id}: {str(outcome)}")
+            elif outcome:
+                matched.append((product, outcome))
+            else:
+                not_found_ids.append(str(product.id))
+
+        if matched:
+            await self._update_product_matches(matched)
+        if not_found_ids:
+            await self._set_enrichment_status(not_found_ids, "not_found")
+        if error_ids:
+            await self._set_enrichment_status(error_ids, "error")
+
+        stats["matched"] += len(matched)
+        stats["not_found"] += len(not_found_ids)
+        stats["errors"] += len(error_ids)
+
+    async def _update_product_matches(self, matched: List[Tuple[Any, Dict[str, Any]]]):
+        """Update Awin products with StockX match data"""
         # LEGACY: Update awin_products for backwards compatibility
         update_query = text(
             """
@@ -318,56 +557,96 @@ class AwinStockXEnrichmentService:
 
         await self.session.execute(
             update_query,
-            {
-                "awin_product_id": str(awin_product_id),
-                "stockx_product_id": stockx_product_id,
-                "stockx_url_key": stockx_url_key,
-                "stockx_style_id": stockx_style_id,
-            },
+            [
+                {
+                    "awin_product_id": str(product.id),
+                    "stockx_product_id": stockx_product.get("productId"),
+                    "stockx_url_key": stockx_product.get("urlKey"),
+                    "stockx_style_id": stockx_product.get("styleId"),
+                }
+                for product, stockx_product in matched
+            ],
         )
 
         # NEW: Also store in price_sources architecture
-        await self._store_stockx_price_source(awin_product_id, stockx_product_id, stockx_data)
-
-        await self.session.commit()
+        await self._store_stockx_price_sources(matched)
 
-    async def _store_stockx_price_source(
-        self, awin_product_id: UUID, stockx_product_id: str, stockx_data: Dict
-    ):
-        """Store StockX resale price in price_sources table"""
-        import json
-
-        # Get product_id from awin_product via EAN
+    async def _store_stockx_price_sources(self, matched: List[Tuple[Any, Dict[str, Any]]]):
+        """Store StockX resale prices in price_sources table"""
+        # Get product_id for each awin_product via EAN
         product_query = text(
             """
-            SELECT p.id, ap.ean
+            SELECT ap.id AS awin_id, p.id AS product_id
             FROM integration.awin_products ap
             JOIN catalog.product p ON ap.ean = p.ean
-            WHERE ap.id = :awin_product_id
+            WHERE ap.id = ANY(CAST(:awin_product_ids AS uuid[]))
         """
         )
 
         result = await self.session.execute(
-            product_query, {"awin_product_id": str(awin_product_id)}
+            product_query, {"awin_product_ids": [str(product.id) for product, _ in matched]}
         )
-        row = result.fetchone()
-
-        if not row:
-            logger.warning("Could not find product for StockX price", awin_id=str(awin_product_id))
+        product_ids = {}
+        for row in result.fetchall():
+            product_ids.setdefault(str(row.awin_id), row.product_id)
+
+        params = {}
+        for product, stockx_product in matched:
+            product_id = product_ids.get(str(product.id))
+            if product_id is None:
+                logger.warning("Could not find product for StockX price", awin_id=str(product.id))
+                continue
+
+            row = self._price_source_params(product_id, stockx_product)
+            if row:
+                params[(row["product_id"], row["source_product_id"])] = row
+
+        if not params:
             return
 
-        product_id = row[0]
+        # Insert into price_sources
+        insert_query = text(
+            """
+            INSERT INTO integration.price_sources (
+                product_id, source_type, source_product_id, source_name,
+                price_type, price_cents, currency, in_stock,
+                source_url, metadata,
+                last_updated, created_at, updated_at
+            )
+            VALUES (
+                :product_id, 'stockx', :source_product_id, 'StockX',
+                'resale', :price_cents, 'EUR', true,
+                :source_url, CAST(:metadata AS jsonb),
+                NOW(), NOW(), NOW()
+            )
+            ON CONFLICT (product_id, source_type, source_product_id)
+            DO UPDATE SET
+                price_cents = EXCLUDED.price_cents,
+                last_updated = NOW(),
+                updated_at = NOW()
+        """
+        )
+
+        await self.session.execute(insert_query, list(params.values()))
+
+        logger.debug("Stored StockX prices in price_sources", count=len(params))
+
+    def _price_source_params(
+        self, product_id: Any, stockx_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """price_sources row for a StockX match, None without market data"""
+        stockx_product_id = stockx_data.get("productId")
 
         # Extract lowest ask from stockx_data (if available)
         # Note: This may need adjustment based on actual StockX API response structure
-        lowest_ask = stockx_data.get("market", {}).get("lowestAsk")
+        lowest_ask = (stockx_data.get("market") or {}).get("lowestAsk")
         if not lowest_ask:
             # Try alternate field names
             lowest_ask = stockx_data.get("lowestAsk") or stockx_data.get("lowest_ask")
 
         if not lowest_ask:
             logger.debug("No market data available for StockX product", stockx_id=stockx_product_id)
-            return
+            return None
 
         # Convert to cents if it's in euros/dollars
         if isinstance(lowest_ask, float):
@@ -386,77 +665,30 @@ class AwinStockXEnrichmentService:
             f"https://stockx.com/{stockx_data.get('urlKey')}" if stockx_data.get("urlKey") else None
         )
 
-        # Insert into price_sources
-        insert_query = text(
-            """
-            INSERT INTO integration.price_sources (
-                product_id, source_type, source_product_id, source_name,
-                price_type, price_cents, currency, in_stock,
-                source_url, metadata,
-                last_updated, created_at, updated_at
-            )
-            VALUES (
-                :product_id, 'stockx', :source_product_id, 'StockX',
-                'resale', :price_cents, 'EUR', true,
-                :source_url, CAST(:metadata AS jsonb),
-                NOW(), NOW(), NOW()
-            )
-            ON CONFLICT (product_id, source_type, source_product_id)
-            DO UPDATE SET
-                price_cents = EXCLUDED.price_cents,
-                last_updated = NOW(),
-                updated_at = NOW()
-        """
-        )
-
-        await self.session.execute(
-            insert_query,
-            {
-                "product_id": str(product_id),
-                "source_product_id": stockx_product_id,
-                "price_cents": lowest_ask_cents,
-                "source_url": source_url,
-                "metadata": json.dumps(metadata),
-            },
-        )
-
-        logger.debug(
-            "Stored StockX price in price_sources",
-            product_id=str(product_id),
-            stockx_id=stockx_product_id,
-            price_eur=lowest_ask_cents / 100.0,
-        )
+        return {
+            "product_id": str(product_id),
+            "source_product_id": stockx_product_id,
+            "price_cents": lowest_ask_cents,
+            "source_url": source_url,
+            "metadata": json.dumps(metadata),
+        }
 
-    async def _mark_product_not_found(self, awin_product_id: UUID):
-        """Mark product as not found on StockX"""
+    async def _set_enrichment_status(self, awin_product_ids: List[str], status: str):
+        """Mark products as not found on StockX or as failed"""
         update_query = text(
             """
             UPDATE integration.awin_products
-            SET enrichment_status = 'not_found',
+            SET enrichment_status = :status,
                 last_enriched_at = NOW(),
                 updated_at = NOW()
-            WHERE id = :awin_product_id
+            WHERE id = ANY(CAST(:awin_product_ids AS uuid[]))
         """
         )
 
-        await self.session.execute(update_query, {"awin_product_id": str(awin_product_id)})
-        await self.session.commit()
-
-    async def _mark_product_error(self, awin_product_id: UUID):
-        """Mark product as having an error during enrichment"""
-        update_query = text(
-            """
-            UPDATE integration.awin_products
-            SET enrichment_status = 'error',
-                last_enriched_at = NOW(),
-                updated_at = NOW()
-            WHERE id = :awin_product_id
-        """
+        await self.session.execute(
+            update_query, {"status": status, "awin_product_ids": awin_product_ids}
         )
 
-        await self.session.execute(update_query, {"awin_product_id": str(awin_product_id)})
-        await self.session.commit()
-
     async def get_enrichment_stats(self) -> Dict[str, Any]:
         """Get current enrichment statistics"""
         stats_query = text(
@@ -14,7 +14,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.database.models import ImportBatch
 from shared.events import ImportBatchCreatedEvent, publish_event
-from shared.processing.async_pipeline import ProcessingStage, get_async_pipeline
+from shared.processing.async_pipeline import (
+    ExecutionMode,
+    ProcessingStage,
+    StageConfig,
+    get_async_pipeline,
+)
 from shared.processing.stages import (
     RetailerParsingStage,
     RetailerPersistenceStage,
@@ -53,11 +58,23 @@ class LargeRetailerImportService:
     def _setup_pipeline_stages(self):
         """Setup processing stages for retailer imports"""
 
-        # Register processing stages
-        self.pipeline.register_stage(ProcessingStage.PARSING, RetailerParsingStage())
+        # Register processing stages; parsing is pure CPU work and runs in a process pool
+        # while the database-bound stages work on earlier chunks. The stage configs only
+        # apply in staged mode, which each import requests per call: the pipeline is shared,
+        # so its default execution mode is left alone.
+        self.pipeline.register_stage(
+            ProcessingStage.PARSING,
+            RetailerParsingStage(),
+            StageConfig(workers=2, queue_size=2, cpu_bound=True),
+        )
         self.pipeline.register_stage(ProcessingStage.VALIDATION, RetailerValidationStage())
+        # Single worker: brand/category creation relies on the stage's lookup cache
         self.pipeline.register_stage(ProcessingStage.TRANSFORMATION, RetailerTransformationStage())
-        self.pipeline.register_stage(ProcessingStage.PERSISTENCE, RetailerPersistenceStage())
+        self.pipeline.register_stage(
+            ProcessingStage.PERSISTENCE,
+            RetailerPersistenceStage(),
+            StageConfig(workers=2, queue_size=2),
+        )
 
         logger.info("Retailer import pipeline stages configured")
 
@@ -107,6 +124,7 @@ class LargeRetailerImportService:
                 batch_id=batch_id,
                 source_type=f"retailer_{retailer_name.lower()}",
                 encoding=encoding,
+                execution_mode=ExecutionMode.STAGED,
             )
 
             logger.info(
@@ -114,6 +132,7 @@ class LargeRetailerImportService:
                 batch_id=str(batch_id),
                 processed_records=context.processed_records,
                 failed_records=context.failed_records,
+                slot_utilization=round(context.slot_utilization, 3),
                 progress_percentage=context.progress_percentage,
             )
 
@@ -165,6 +184,7 @@ class LargeRetailerImportService:
                 file_path=file_path,
                 batch_id=batch_id,
                 source_type=f"retailer_{retailer_name.lower()}",
+                execution_mode=ExecutionMode.STAGED,
             )
 
             logger.info(
@@ -172,6 +192,7 @@ class LargeRetailerImportService:
                 batch_id=str(batch_id),
                 processed_records=context.processed_records,
                 failed_records=context.failed_records,
+                slot_utilization=round(context.slot_utilization, 3),
             )
 
             return batch_id
@@ -226,6 +247,7 @@ class LargeRetailerImportService:
                 batch_id=batch_id,
                 source_type=f"retailer_{retailer_name.lower()}_api",
                 estimated_records=estimated_records,
+                execution_mode=ExecutionMode.STAGED,
             )
 
             logger.info(
@@ -233,6 +255,7 @@ class LargeRetailerImportService:
                 batch_id=str(batch_id),
                 processed_records=context.processed_records,
                 failed_records=context.failed_records,
+                slot_utilization=round(context.slot_utilization, 3),
             )
 
             return batch_id
@@ -0,0 +1,331 @@
+"""
+Import Value Normalizers
+Memoized date and currency normalization for import columns. A column's date
+format is sniffed from a sample and the remaining values are parsed with it
+directly instead of running every parser on every cell.
+"""
+
+import math
+import re
+from collections import OrderedDict
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import structlog
+
+from shared.utils import ValidationUtils
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_CACHE_SIZE = 10000
+
+# Distinct values a column's date format is sniffed from
+FORMAT_SAMPLE_SIZE = 20
+
+# Formats tried when the shared parser fails and the caller passes none
+DEFAULT_DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%d.%m.%Y",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%d. %B %Y",
+)
+
+# Column formats that can be sniffed. Each entry lists the strptime formats that
+# read a shape the way the shared (dateutil) parser does, in its order: numeric
+# day/month dates are month first unless the first number cannot be a month.
+SNIFFABLE_DATE_FORMATS: Tuple[Tuple[str, ...], ...] = (
+    ("%Y-%m-%d %H:%M:%S %z",),
+    ("%Y-%m-%d %H:%M:%S",),
+    ("%Y-%m-%dT%H:%M:%S%z",),
+    ("%Y-%m-%dT%H:%M:%S.%f%z",),
+    ("%Y-%m-%dT%H:%M:%S",),
+    ("%Y-%m-%d",),
+    ("%m/%d/%Y %H:%M:%S", "%d/%m/%Y %H:%M:%S"),
+    ("%m/%d/%Y", "%d/%m/%Y"),
+    ("%m.%d.%Y", "%d.%m.%Y"),
+    ("%d. %B %Y",),
+)
+
+_GERMAN_MONTHS = {
+    "Januar": "January",
+    "Februar": "February",
+    "März": "March",
+    "April": "April",
+    "Mai": "May",
+    "Juni": "June",
+    "Juli": "July",
+    "August": "August",
+    "September": "September",
+    "Oktober": "October",
+    "November": "November",
+    "Dezember": "December",
+}
+_GERMAN_MONTH_PATTERN = re.compile("|".join(_GERMAN_MONTHS))
+_PLAIN_DECIMAL_PATTERN = re.compile(r"-?\d+(?:\.\d+)?")
+
+_NULL_CURRENCY_VALUES = frozenset(["nan", "inf", "-inf", "null", "none", "n/a"])
+
+# Outcome of normalizing one value: (value, error message)
+Normalized = Tuple[Any, Optional[str]]
+
+
+class _LRUCache:
+    """Bounded memo of normalization outcomes, least recently used evicted first"""
+
+    def __init__(self, cache_size: int):
+        self.cache_size = cache_size
+        self._entries: "OrderedDict[Hashable, Normalized]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Normalized]:
+        outcome = self._entries.get(key)
+        if outcome is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return outcome
+
+    def put(self, key: Hashable, outcome: Normalized) -> None:
+        self._entries[key] = outcome
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.cache_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _unwrap(outcome: Normalized) -> Any:
+    value, error = outcome
+    if error is not None:
+        raise ValueError(error)
+    return value
+
+
+class DateNormalizer:
+    """
+    Normalizes import date values to datetimes
+
+    Values are first read by the shared parser and then by the caller's
+    formats. normalize_many() sniffs which SNIFFABLE_DATE_FORMATS entry reads a
+    column's sample exactly like that, and parses the column with it directly;
+    values it does not fit take the full path. Outcomes are memoized per raw
+    string.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        self._cache = _LRUCache(cache_size)
+        # Sniffed format per caller format list, reused by single-value calls
+        self._detected: Dict[Tuple[str, ...], Optional[Tuple[str, ...]]] = {}
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    def normalize(self, value: Any, formats: Optional[Sequence[str]] = None) -> Optional[datetime]:
+        """Normalize one value; raises ValueError if no format reads it"""
+        if value is None:
+            return None
+        return _unwrap(self._normalize_str(str(value), self._formats_key(formats)))
+
+    def normalize_many(
+        self, values: Iterable[Any], formats: Optional[Sequence[str]] = None
+    ) -> List[Normalized]:
+        """
+        Normalize a column of values at once
+
+        Returns:
+            (datetime or None, error message or None) per value
+        """
+        key = self._formats_key(formats)
+        raw_values = [None if value is None else str(value) for value in values]
+
+        distinct = list(dict.fromkeys(value for value in raw_values if value is not None))
+        self._detected[key] = self.detect_format(distinct[:FORMAT_SAMPLE_SIZE], key)
+
+        outcomes = {value: self._normalize_str(value, key) for value in distinct}
+        return [(None, None) if value is None else outcomes[value] for value in raw_values]
+
+    def detect_format(
+        self, sample: Sequence[str], formats: Tuple[str, ...] = DEFAULT_DATE_FORMATS
+    ) -> Optional[Tuple[str, ...]]:
+        """Sniffable format that reads every sampled value like the full path"""
+        prepared = [self._prepare(value) for value in sample]
+        prepared = [value for value in prepared if value]
+        if not prepared:
+            return None
+
+        expected = [self._parse_slow(value, formats) for value in prepared]
+        for candidate in SNIFFABLE_DATE_FORMATS:
+            if all(
+                self._agrees(self._parse_with(value, candidate), outcome)
+                for value, outcome in zip(prepared, expected)
+            ):
+                logger.debug("Detected date column format", formats=candidate)
+                return candidate
+        return None
+
+    # ===== Parsing =====
+
+    @staticmethod
+    def _formats_key(formats: Optional[Sequence[str]]) -> Tuple[str, ...]:
+        return tuple(formats) if formats else DEFAULT_DATE_FORMATS
+
+    def _normalize_str(self, value: str, formats: Tuple[str, ...]) -> Normalized:
+        cache_key = (formats, value)
+        outcome = self._cache.get(cache_key)
+        if outcome is not None:
+            return outcome
+
+        prepared = self._prepare(value)
+        if not prepared:
+            outcome = (None, None)
+        else:
+            detected = self._detected.get(formats)
+            parsed = self._parse_with(prepared, detected) if detected else None
+            if parsed is not None:
+                outcome = (parsed, None)
+            else:
+                parsed = self._parse_slow(prepared, formats)
+                outcome = (parsed, None) if parsed else (None, f"Invalid date format: {value}")
+
+        self._cache.put(cache_key, outcome)
+        return outcome
+
+    @staticmethod
+    def _prepare(value: str) -> str:
+        """Strip, translate German month names and widen StockX '+00' offsets"""
+        value = value.strip()
+        if not value:
+            return value
+
+        value = _GERMAN_MONTH_PATTERN.sub(lambda m: _GERMAN_MONTHS[m.group(0)], value)
+
+        if " +" in value and value.endswith(" +00"):
+            value = value.replace(" +00", " +0000")
+        return value
+
+    @staticmethod
+    def _parse_with(value: str, candidate: Sequence[str]) -> Optional[datetime]:
+        for fmt in candidate:
+            try:
+                parsed = datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+            # The shared parser returns timezone-aware values, naive ones as UTC
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed
+        return None
+
+    @staticmethod
+    def _parse_slow(value: str, formats: Sequence[str]) -> Optional[datetime]:
+        normalized = ValidationUtils.normalize_date(value)
+        if normalized is not None:
+            return normalized
+
+        for fmt in formats:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+        return None
+
+    @staticmethod
+    def _agrees(parsed: Optional[datetime], expected: Optional[datetime]) -> bool:
+        if parsed is None or expected is None:
+            return False
+        if (expected.tzinfo is None) != (parsed.tzinfo is None):
+            return False
+        return parsed == expected and parsed.utcoffset() == expected.utcoffset()
+
+
+class CurrencyNormalizer:
+    """
+    Normalizes import currency values to Decimal
+
+    Plain decimal strings, the common case for export columns, are converted
+    directly; anything else goes through the shared parser. Outcomes for strings
+    are memoized.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        self._cache = _LRUCache(cache_size)
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    def normalize(self, value: Any) -> Optional[Decimal]:
+        """Normalize one value; raises ValueError for unparseable values"""
+        if value is None:
+            return None
+
+        # Handle special float cases first
+        if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+            return None
+
+        if not isinstance(value, str):
+            return _unwrap(self._parse(value))
+
+        outcome = self._cache.get(value)
+        if outcome is None:
+            outcome = self._parse(value)
+            self._cache.put(value, outcome)
+        return _unwrap(outcome)
+
+    def normalize_many(self, values: Iterable[Any]) -> List[Normalized]:
+        """
+        Normalize a column of values at once
+
+        Returns:
+            (Decimal or None, error message or None) per value
+        """
+        outcomes: Dict[Tuple[type, Any], Normalized] = {}
+        results = []
+        for value in values:
+            key = (value.__class__, value)
+            try:
+                outcome = outcomes.get(key)
+            except TypeError:  # unhashable value
+                outcome = None
+                key = None
+            if outcome is None:
+                try:
+                    outcome = (self.normalize(value), None)
+                except ValueError as e:
+                    outcome = (None, str(e))
+                if key is not None:
+                    outcomes[key] = outcome
+            results.append(outcome)
+        return results
+
+    @staticmethod
+    def _parse(value: Any) -> Normalized:
+        if isinstance(value, str):
+            stripped = value.strip()
+            if _PLAIN_DECIMAL_PATTERN.fullmatch(stripped):
+                return Decimal(stripped), None
+
+        normalized = ValidationUtils.normalize_currency(value)
+        if normalized is None:
+            # Only an error if a value was provided but couldn't be normalized
+            value_str = str(value).strip()
+            if value_str and value_str.lower() not in _NULL_CURRENCY_VALUES:
+                return None, f"Invalid currency format: {value}"
+        return normalized, None
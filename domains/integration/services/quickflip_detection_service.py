@@ -3,21 +3,23 @@ QuickFlip Detection Service
 Identifies arbitrage opportunities by comparing market prices with StockX selling prices
 """
 
+import base64
 from dataclasses import dataclass
-from decimal import Decimal
-from typing import Dict, List, Optional
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 import structlog
-from sqlalchemy import and_, desc, select
+from sqlalchemy import Numeric, and_, case, func, literal, select, tuple_, type_coerce
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from shared.database.models import Product, SourcePrice
+from shared.database.models import Brand, Product, SourcePrice
 from shared.repositories.base_repository import BaseRepository
 
 logger = structlog.get_logger(__name__)
 
+MARGIN_TYPE = Numeric(14, 4)
+
 
 @dataclass
 class QuickFlipOpportunity:
@@ -79,6 +81,59 @@ class QuickFlipDetectionService:
         self.product_repo = BaseRepository(Product, db_session)
         self.logger = logger.bind(service="quickflip_detection")
 
+    # =====================================================
+    # SQL EXPRESSIONS
+    # =====================================================
+
+    @staticmethod
+    def _profit_columns() -> Tuple[Any, Any]:
+        """
+        Gross profit and margin (% of buy price) computed in SQL
+
+        The margin is rounded to a fixed scale so values round-trip exactly through
+        pagination cursors on every dialect.
+        """
+        gross_profit = Product.avg_resale_price - SourcePrice.buy_price
+        profit_margin = case(
+            (SourcePrice.buy_price > 0, gross_profit * 100 / SourcePrice.buy_price),
+            else_=literal(0),
+        )
+        return gross_profit, type_coerce(func.round(profit_margin, 4), MARGIN_TYPE)
+
+    def _opportunity_conditions(
+        self,
+        min_profit_margin: float,
+        min_gross_profit: Decimal,
+        max_buy_price: Optional[Decimal],
+        sources: Optional[List[str]],
+        product_id: Optional[UUID] = None,
+    ) -> List[Any]:
+        gross_profit, profit_margin = self._profit_columns()
+
+        conditions = [
+            # Only products with resale price data
+            Product.avg_resale_price.isnot(None),
+            Product.avg_resale_price > 0,
+            # Profit filters are pushed down so only qualifying rows leave the database
+            profit_margin >= min_profit_margin,
+            gross_profit >= min_gross_profit,
+        ]
+
+        if sources:
+            conditions.append(SourcePrice.source.in_(sources))
+
+        if max_buy_price:
+            conditions.append(SourcePrice.buy_price <= max_buy_price)
+
+        if product_id:
+            conditions.append(SourcePrice.product_id == product_id)
+
+        return conditions
+
+    # =====================================================
+    # OPPORTUNITY SEARCH
+    # =====================================================
+
     async def find_opportunities(
         self,
         min_profit_margin: float = 10.0,  # Minimum 10% profit margin
@@ -86,6 +141,7 @@ class QuickFlipDetectionService:
         max_buy_price: Optional[Decimal] = None,
         sources: Optional[List[str]] = None,
         limit: int = 100,
+        product_id: Optional[UUID] = None,
     ) -> List[QuickFlipOpportunity]:
         """
         Find QuickFlip opportunities based on specified criteria
@@ -96,6 +152,38 @@ class QuickFlipDetectionService:
             max_buy_price: Maximum buy price filter
             sources: Specific sources to consider (e.g., ['awin', 'webgains'])
             limit: Maximum number of opportunities to return
+            product_id: Only consider source prices for this product
+        """
+        opportunities, _ = await self.find_opportunities_page(
+            min_profit_margin=min_profit_margin,
+            min_gross_profit=min_gross_profit,
+            max_buy_price=max_buy_price,
+            sources=sources,
+            limit=limit,
+            product_id=product_id,
+        )
+        return opportunities
+
+    async def find_opportunities_page(
+        self,
+        min_profit_margin: float = 10.0,
+        min_gross_profit: Decimal = Decimal("20.00"),
+        max_buy_price: Optional[Decimal] = None,
+        sources: Optional[List[str]] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        product_id: Optional[UUID] = None,
+    ) -> Tuple[List[QuickFlipOpportunity], Optional[str]]:
+        """
+        Find one page of QuickFlip opportunities, best profit margin first
+
+        Profit, margin and ROI are computed in SQL and ORDER BY/LIMIT are pushed
+        down, so only the top ``limit`` rows are fetched. Pages are keyset-paginated
+        on (profit_margin, source_price_id): pass the returned cursor to get the next
+        page. The cursor is None when there are no further results.
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         self.logger.info(
             "Starting QuickFlip opportunity search",
@@ -104,69 +192,62 @@ class QuickFlipDetectionService:
             max_buy_price=float(max_buy_price) if max_buy_price else None,
             sources=sources,
             limit=limit,
+            paginated=cursor is not None,
         )
 
-        # Build the main query with JOINs
-        query = (
-            select(SourcePrice)
-            .options(selectinload(SourcePrice.product).selectinload(Product.brand))
-            .join(Product, SourcePrice.product_id == Product.id)
+        gross_profit, profit_margin = self._profit_columns()
+        conditions = self._opportunity_conditions(
+            min_profit_margin, min_gross_profit, max_buy_price, sources, product_id
         )
 
-        # Apply filters
-        conditions = []
-
-        # Only products with resale price data
-        conditions.append(Product.avg_resale_price.isnot(None))
-        conditions.append(Product.avg_resale_price > 0)
-
-        # Source filter
-        if sources:
-            conditions.append(SourcePrice.source.in_(sources))
-
-        # Max buy price filter
-        if max_buy_price:
-            conditions.append(SourcePrice.buy_price <= max_buy_price)
-
-        # Apply all conditions
-        if conditions:
-            query = query.where(and_(*conditions))
+        if cursor:
+            cursor_margin, cursor_id = self._decode_cursor(cursor)
+            conditions.append(
+                tuple_(profit_margin, SourcePrice.id)
+                < tuple_(
+                    literal(cursor_margin, profit_margin.type),
+                    literal(cursor_id, SourcePrice.id.type),
+                )
+            )
 
-        # Order by most recent prices first
-        query = query.order_by(desc(SourcePrice.last_updated))
+        # Fetch one extra row to know whether another page exists
+        query = (
+            select(
+                SourcePrice.id,
+                SourcePrice.product_id,
+                SourcePrice.source,
+                SourcePrice.supplier_name,
+                SourcePrice.product_url,
+                SourcePrice.stock_qty,
+                SourcePrice.buy_price,
+                Product.name.label("product_name"),
+                Product.sku.label("product_sku"),
+                Product.avg_resale_price.label("sell_price"),
+                Brand.name.label("brand_name"),
+                gross_profit.label("gross_profit"),
+                profit_margin.label("profit_margin"),
+            )
+            .join(Product, SourcePrice.product_id == Product.id)
+            .outerjoin(Brand, Product.brand_id == Brand.id)
+            .where(and_(*conditions))
+            .order_by(profit_margin.desc(), SourcePrice.id.desc())
+            .limit(limit + 1)
+        )
 
-        # Execute query
         result = await self.db_session.execute(query)
-        market_prices = result.scalars().all()
-
-        opportunities = []
-        for market_price in market_prices:
-            try:
-                opportunity = await self._calculate_opportunity(market_price)
-
-                # Apply profit filters
-                if (
-                    opportunity.profit_margin >= min_profit_margin
-                    and opportunity.gross_profit >= min_gross_profit
-                ):
-                    opportunities.append(opportunity)
-
-            except Exception as e:
-                self.logger.warning(
-                    "Error calculating opportunity",
-                    product_id=str(market_price.product_id),
-                    error=str(e),
-                )
+        rows = result.all()
 
-        # Sort by profit margin (highest first)
-        opportunities.sort(key=lambda x: x.profit_margin, reverse=True)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._encode_cursor(rows[-1].profit_margin, rows[-1].id)
 
-        # Apply limit
-        opportunities = opportunities[:limit]
+        opportunities = [self._row_to_opportunity(row) for row in rows]
 
         self.logger.info(
             "QuickFlip opportunity search completed",
             total_found=len(opportunities),
+            has_more=next_cursor is not None,
             avg_profit_margin=(
                 sum(o.profit_margin for o in opportunities) / len(opportunities)
                 if opportunities
@@ -174,54 +255,56 @@ class QuickFlipDetectionService:
             ),
         )
 
-        return opportunities
-
-    async def _calculate_opportunity(self, market_price: SourcePrice) -> QuickFlipOpportunity:
-        """Calculate opportunity metrics from SourcePrice object"""
-
-        product = market_price.product
-        if not product or not product.avg_resale_price:
-            raise ValueError("Product or resale price not available")
-
-        buy_price = market_price.buy_price
-        sell_price = product.avg_resale_price
-
-        # Basic profit calculations
-        gross_profit = sell_price - buy_price
-        profit_margin = float((gross_profit / buy_price) * 100) if buy_price > 0 else 0
-        roi = float((gross_profit / buy_price) * 100) if buy_price > 0 else 0
+        return opportunities, next_cursor
 
-        # Get brand name
-        brand_name = product.brand.name if product.brand else "Unknown"
+    @staticmethod
+    def _row_to_opportunity(row: Any) -> QuickFlipOpportunity:
+        """Build an opportunity from a projected query row"""
+        profit_margin = float(row.profit_margin)
 
         return QuickFlipOpportunity(
-            product_id=market_price.product_id,
-            product_name=product.name,
-            product_sku=product.sku,
-            brand_name=brand_name,
-            buy_price=buy_price,
-            buy_source=market_price.source,
-            buy_supplier=market_price.supplier_name,
-            buy_url=market_price.product_url,
-            buy_stock_qty=market_price.stock_qty,
-            sell_price=sell_price,
+            product_id=row.product_id,
+            product_name=row.product_name,
+            product_sku=row.product_sku,
+            brand_name=row.brand_name or "Unknown",
+            buy_price=row.buy_price,
+            buy_source=row.source,
+            buy_supplier=row.supplier_name,
+            buy_url=row.product_url,
+            buy_stock_qty=row.stock_qty,
+            sell_price=row.sell_price,
             stockx_listing_id=None,  # TODO: Add StockX listing ID when available
-            gross_profit=gross_profit,
+            gross_profit=row.gross_profit,
             profit_margin=profit_margin,
-            roi=roi,
+            roi=profit_margin,  # Gross profit relative to buy price
             days_since_last_sale=None,  # TODO: Calculate from transaction history
             stockx_demand_score=None,  # TODO: Calculate demand score
         )
 
+    @staticmethod
+    def _encode_cursor(profit_margin: Any, source_price_id: UUID) -> str:
+        # Margin is kept as the exact decimal string so the keyset comparison is stable
+        raw = f"{Decimal(str(profit_margin))}|{source_price_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[Decimal, UUID]:
+        try:
+            margin, source_price_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            return Decimal(margin), UUID(source_price_id)
+        except (ValueError, InvalidOperation, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
     async def get_opportunity_by_product(self, product_id: UUID) -> List[QuickFlipOpportunity]:
         """Get all opportunities for a specific product"""
 
-        opportunities = await self.find_opportunities(
-            min_profit_margin=0, min_gross_profit=Decimal("0"), limit=1000  # No minimum to see all
+        return await self.find_opportunities(
+            min_profit_margin=0,
+            min_gross_profit=Decimal("0"),  # No minimum to see all
+            limit=1000,
+            product_id=product_id,
         )
 
-        return [opp for opp in opportunities if opp.product_id == product_id]
-
     async def get_best_opportunities_by_source(
         self, source: str, limit: int = 20
     ) -> List[QuickFlipOpportunity]:
@@ -232,12 +315,28 @@ class QuickFlipDetectionService:
     async def get_opportunities_summary(self) -> Dict:
         """Get summary statistics about opportunities"""
 
-        # Get all opportunities without filters
-        all_opportunities = await self.find_opportunities(
-            min_profit_margin=0, min_gross_profit=Decimal("0"), limit=10000
+        # Aggregate all opportunities in SQL instead of hydrating them
+        gross_profit, profit_margin = self._profit_columns()
+        conditions = self._opportunity_conditions(0, Decimal("0"), None, None)
+
+        query = (
+            select(
+                SourcePrice.source,
+                func.count().label("count"),
+                func.avg(profit_margin).label("avg_profit_margin"),
+                func.max(profit_margin).label("best_margin"),
+                func.sum(profit_margin).label("sum_profit_margin"),
+                func.sum(gross_profit).label("sum_gross_profit"),
+            )
+            .join(Product, SourcePrice.product_id == Product.id)
+            .where(and_(*conditions))
+            .group_by(SourcePrice.source)
         )
+        result = await self.db_session.execute(query)
+        source_rows = result.all()
 
-        if not all_opportunities:
+        total_opportunities = sum(row.count for row in source_rows)
+        if not total_opportunities:
             return {
                 "total_opportunities": 0,
                 "avg_profit_margin": 0,
@@ -246,35 +345,28 @@ class QuickFlipDetectionService:
                 "sources_breakdown": {},
             }
 
-        # Calculate summary stats
-        profit_margins = [opp.profit_margin for opp in all_opportunities]
-        gross_profits = [float(opp.gross_profit) for opp in all_opportunities]
-
-        # Group by source
-        sources_breakdown = {}
-        for opp in all_opportunities:
-            source = opp.buy_source
-            if source not in sources_breakdown:
-                sources_breakdown[source] = {"count": 0, "avg_profit_margin": 0, "best_margin": 0}
-
-            sources_breakdown[source]["count"] += 1
-            sources_breakdown[source]["best_margin"] = max(
-                sources_breakdown[source]["best_margin"], opp.profit_margin
-            )
+        sources_breakdown = {
+            row.source: {
+                "count": row.count,
+                "avg_profit_margin": round(float(row.avg_profit_margin), 2),
+                "best_margin": float(row.best_margin),
+            }
+            for row in source_rows
+        }
 
-        # Calculate average profit margins by source
-        for source in sources_breakdown:
-            source_opportunities = [opp for opp in all_opportunities if opp.buy_source == source]
-            avg_margin = sum(opp.profit_margin for opp in source_opportunities) / len(
-                source_opportunities
-            )
-            sources_breakdown[source]["avg_profit_margin"] = round(avg_margin, 2)
+        best = await self.find_opportunities(
+            min_profit_margin=0, min_gross_profit=Decimal("0"), limit=1
+        )
 
         return {
-            "total_opportunities": len(all_opportunities),
-            "avg_profit_margin": round(sum(profit_margins) / len(profit_margins), 2),
-            "avg_gross_profit": round(sum(gross_profits) / len(gross_profits), 2),
-            "best_opportunity": all_opportunities[0].to_dict() if all_opportunities else None,
+            "total_opportunities": total_opportunities,
+            "avg_profit_margin": round(
+                float(sum(row.sum_profit_margin for row in source_rows)) / total_opportunities, 2
+            ),
+            "avg_gross_profit": round(
+                float(sum(row.sum_gross_profit for row in source_rows)) / total_opportunities, 2
+            ),
+            "best_opportunity": best[0].to_dict() if best else None,
             "sources_breakdown": sources_breakdown,
         }
 
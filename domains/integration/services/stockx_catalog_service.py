@@ -14,6 +14,10 @@ import structlog
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from domains.integration.services.stockx_rate_limiter import (
+    RequestPriority,
+    stockx_request_priority,
+)
 from domains.integration.services.stockx_service import StockXService
 
 logger = structlog.get_logger(__name__)
@@ -22,10 +26,23 @@ logger = structlog.get_logger(__name__)
 class StockXCatalogService:
     """Service for interacting with StockX Catalog API"""
 
-    def __init__(self, stockx_service: StockXService):
+    def __init__(self, stockx_service: StockXService, priority: Optional[RequestPriority] = None):
+        """
+        Args:
+            stockx_service: Authenticated StockX API service
+            priority: Scheduler lane for catalog calls. None keeps the caller's lane
+                (interactive by default); bulk enrichment jobs pass CATALOG_ENRICHMENT.
+        """
         self.stockx_service = stockx_service
+        self.priority = priority
         self.base_url = "https://api.stockx.com/v2"
 
+    async def _catalog_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        if self.priority is None:
+            return await self.stockx_service._make_get_request(endpoint, params=params)
+        with stockx_request_priority(self.priority):
+            return await self.stockx_service._make_get_request(endpoint, params=params)
+
     async def search_catalog(
         self, query: str, page_number: int = 1, page_size: int = 10
     ) -> Dict[str, Any]:
@@ -53,7 +70,7 @@ class StockXCatalogService:
         }
 
         try:
-            response = await self.stockx_service._make_get_request(endpoint, params=params)
+            response = await self._catalog_get(endpoint, params=params)
             logger.info(
                 "Catalog search successful", query=query, results_count=response.get("count", 0)
             )
@@ -80,7 +97,7 @@ class StockXCatalogService:
         endpoint = f"{self.base_url}/catalog/products/{product_id}"
 
         try:
-            response = await self.stockx_service._make_get_request(endpoint)
+            response = await self._catalog_get(endpoint)
             logger.info("Product details retrieved", product_id=product_id)
             return response
         except Exception as e:
@@ -104,7 +121,7 @@ class StockXCatalogService:
         endpoint = f"{self.base_url}/catalog/products/{product_id}/variants"
 
         try:
-            response = await self.stockx_service._make_get_request(endpoint)
+            response = await self._catalog_get(endpoint)
             logger.info(
                 "Product variants retrieved", product_id=product_id, variant_count=len(response)
             )
@@ -141,7 +158,7 @@ class StockXCatalogService:
         params = {"currencyCode": currency_code}
 
         try:
-            response = await self.stockx_service._make_get_request(endpoint, params=params)
+            response = await self._catalog_get(endpoint, params=params)
             logger.info(
                 "Market data retrieved",
                 product_id=product_id,
@@ -0,0 +1,248 @@
+"""
+StockX HTTP Client
+Process-wide connection pool, credential/token cache and request metrics for the StockX API
+"""
+
+import asyncio
+import importlib.util
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import structlog
+
+from domains.integration.services.stockx_rate_limiter import TokenBucketScheduler
+from shared.monitoring.metrics import get_metrics_collector
+
+logger = structlog.get_logger(__name__)
+
+STOCKX_API_BASE_URL = "https://api.stockx.com/v2"
+
+# HTTP/2 needs the optional ``h2`` package (httpx[http2]); fall back to HTTP/1.1 keep-alive
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_TIMEOUT = 30.0
+POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+
+# Credentials rarely change; re-read them periodically so DB updates are picked up
+CREDENTIALS_TTL_SECONDS = 300
+
+
+class StockXClientMetrics:
+    """Request, latency and token metrics for the shared StockX client"""
+
+    def __init__(self, latency_window: int = 1000):
+        self.requests_total = 0
+        self.errors_total = 0
+        self.status_counts: Dict[int, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.token_refreshes = 0
+        self.token_refresh_waits = 0
+        self.credential_loads = 0
+        self.clients_created = 0
+        self._latencies_ms: deque = deque(maxlen=latency_window)
+
+    def request_started(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def request_finished(self, duration_ms: float, status_code: Optional[int]) -> None:
+        self.in_flight -= 1
+        self.requests_total += 1
+        self._latencies_ms.append(duration_ms)
+
+        if status_code is None or status_code >= 400:
+            self.errors_total += 1
+        if status_code is not None:
+            self.status_counts[status_code] = self.status_counts.get(status_code, 0) + 1
+
+        collector = get_metrics_collector()
+        collector.increment_counter("stockx_requests_total")
+        collector.record_histogram("stockx_request_duration_ms", duration_ms)
+
+    def _percentile(self, percentile: float) -> Optional[float]:
+        if not self._latencies_ms:
+            return None
+        ordered = sorted(self._latencies_ms)
+        index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+        return round(ordered[index], 2)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests_total": self.requests_total,
+            "errors_total": self.errors_total,
+            "status_counts": dict(self.status_counts),
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "latency_ms": {
+                "p50": self._percentile(50),
+                "p95": self._percentile(95),
+                "p99": self._percentile(99),
+                "samples": len(self._latencies_ms),
+            },
+            "token_refreshes": self.token_refreshes,
+            "token_refresh_waits": self.token_refresh_waits,
+            "credential_loads": self.credential_loads,
+            "clients_created": self.clients_created,
+        }
+
+
+class StockXClientState:
+    """
+    Process-wide state shared by all StockXService instances.
+
+    StockXService is created per request, so the connection pool, credentials,
+    access token and request scheduler live here instead of on the service. The client and the
+    refresh lock are bound to the event loop they were created on and are
+    recreated transparently when used from a different loop (e.g. scripts
+    calling ``asyncio.run`` repeatedly).
+    """
+
+    def __init__(self):
+        self.credentials: Optional[Any] = None
+        self.credentials_loaded_at: Optional[float] = None
+        self.access_token: Optional[str] = None
+        self.token_expiry: Optional[datetime] = None
+        self.metrics = StockXClientMetrics()
+        self.scheduler = TokenBucketScheduler()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._locks: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+
+    # ===== Credentials & token =====
+
+    def cached_credentials(self) -> Optional[Any]:
+        if self.credentials is None or self.credentials_loaded_at is None:
+            return None
+        if time.monotonic() - self.credentials_loaded_at > CREDENTIALS_TTL_SECONDS:
+            return None
+        return self.credentials
+
+    def store_credentials(self, credentials: Any) -> None:
+        self.credentials = credentials
+        self.credentials_loaded_at = time.monotonic()
+        self.metrics.credential_loads += 1
+
+    def token_is_valid(self) -> bool:
+        return bool(
+            self.access_token
+            and self.token_expiry
+            and self.token_expiry > datetime.now(timezone.utc)
+        )
+
+    def invalidate_token(self, rejected_token: Optional[str] = None) -> None:
+        """
+        Drop the cached access token. When ``rejected_token`` is given the token is
+        only dropped if it is still the current one, so concurrent 401s caused by
+        the same stale token trigger a single refresh.
+        """
+        if rejected_token is None or rejected_token == self.access_token:
+            self.access_token = None
+            self.token_expiry = None
+
+    def invalidate_credentials(self) -> None:
+        """Forget cached credentials and token, e.g. after credentials were updated"""
+        self.credentials = None
+        self.credentials_loaded_at = None
+        self.invalidate_token()
+
+    def _loop_lock(self, name: str) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        bound = self._locks.get(name)
+        if bound is None or bound[0] is not loop:
+            bound = (loop, asyncio.Lock())
+            self._locks[name] = bound
+        return bound[1]
+
+    @property
+    def token_lock(self) -> asyncio.Lock:
+        """Single-flight lock for access token refreshes"""
+        return self._loop_lock("token")
+
+    @property
+    def credentials_lock(self) -> asyncio.Lock:
+        """Single-flight lock for credential loads"""
+        return self._loop_lock("credentials")
+
+    # ===== Connection pool =====
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client for the running event loop, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                self._discard_client(self._client, self._client_loop)
+            self._client = httpx.AsyncClient(
+                base_url=STOCKX_API_BASE_URL,
+                http2=HTTP2_AVAILABLE,
+                limits=POOL_LIMITS,
+                timeout=DEFAULT_TIMEOUT,
+            )
+            self._client_loop = loop
+            self.metrics.clients_created += 1
+            logger.info("Created pooled StockX HTTP client", http2=HTTP2_AVAILABLE)
+        return self._client
+
+    @staticmethod
+    def _discard_client(
+        client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """Release a client created on another event loop without leaking its pool"""
+        if loop is not None and not loop.is_closed():
+            # Connections belong to that loop, so they have to be closed on it
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            logger.info("Scheduled close of StockX HTTP client on its previous event loop")
+            return
+
+        # aclose() needs the loop its connections were opened on; once that is gone the
+        # pool can only be released, its sockets close when the transports are collected
+        logger.warning(
+            "Dropped StockX HTTP client of a closed event loop without closing its connections"
+        )
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "http2": HTTP2_AVAILABLE,
+            "pool": {
+                "max_connections": POOL_LIMITS.max_connections,
+                "max_keepalive_connections": POOL_LIMITS.max_keepalive_connections,
+                "keepalive_expiry": POOL_LIMITS.keepalive_expiry,
+                "client_open": self._client is not None and not self._client.is_closed,
+            },
+            "token": {
+                "cached": self.token_is_valid(),
+                "expires_at": self.token_expiry.isoformat() if self.token_expiry else None,
+            },
+            "credentials_cached": self.cached_credentials() is not None,
+            "scheduler": self.scheduler.stats(),
+            **self.metrics.snapshot(),
+        }
+
+
+_client_state = StockXClientState()
+
+
+def get_stockx_client_state() -> StockXClientState:
+    """Get the process-wide StockX client state"""
+    return _client_state
+
+
+def reset_stockx_client_state() -> StockXClientState:
+    """Replace the shared state with a fresh one (used by tests)"""
+    global _client_state
+    _client_state = StockXClientState()
+    return _client_state
+
+
+async def close_stockx_http_client() -> None:
+    """Close the pooled StockX HTTP client on application shutdown"""
+    await _client_state.close()
@@ -0,0 +1,246 @@
+"""
+StockX Rate Limiter
+Process-wide token bucket with priority lanes for StockX API calls
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Steady-state allowance and burst; the bucket adapts below this on 429s
+DEFAULT_RATE_PER_SECOND = 2.0
+DEFAULT_BURST = 5
+MIN_RATE_PER_SECOND = 0.2
+
+# AIMD: halve the rate on a 429, recover additively on successful responses
+RATE_DECREASE_FACTOR = 0.5
+RATE_RECOVERY_STEP = 0.05
+
+# Backoff used when a 429 carries no Retry-After header (doubles per consecutive 429)
+DEFAULT_BACKOFF_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 60.0
+
+
+class RequestPriority(IntEnum):
+    """Scheduling lanes, lower value is served first"""
+
+    INTERACTIVE = 0
+    LISTING_SYNC = 1
+    CATALOG_ENRICHMENT = 2
+
+
+_current_priority: ContextVar[RequestPriority] = ContextVar(
+    "stockx_request_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def stockx_request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Run StockX calls made inside the block (including awaited callees) in ``priority``"""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_request_priority() -> RequestPriority:
+    return _current_priority.get()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as delta-seconds or as an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucketScheduler:
+    """
+    Token bucket shared by every StockX caller in the process.
+
+    Requests that find a token and no queue are released immediately. Everything
+    else waits in a priority heap (FIFO within a lane) that is drained by a loop
+    timer as tokens refill, so an interactive request queued behind a bulk sync
+    is served first. A 429 pauses the whole bucket for ``Retry-After`` and halves
+    the rate; successful responses grow it back towards the configured ceiling.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        min_rate: float = MIN_RATE_PER_SECOND,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._consecutive_throttles = 0
+
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.granted: Dict[str, int] = {lane.name.lower(): 0 for lane in RequestPriority}
+        self.wait_seconds: Dict[str, float] = {lane.name.lower(): 0.0 for lane in RequestPriority}
+        self.throttled_total = 0
+
+    # ===== Public API =====
+
+    async def acquire(self, priority: Optional[RequestPriority] = None) -> float:
+        """Wait for a request slot; returns the seconds spent waiting"""
+        priority = current_request_priority() if priority is None else priority
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Waiters and timers from a previous (finished) loop can never fire
+            self._waiters = []
+            self._timer = None
+            self._loop = loop
+
+        self._refill()
+        if not self._waiters and self._can_grant():
+            self._tokens -= 1
+            self._record(priority, 0.0)
+            return 0.0
+
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        self._schedule_dispatch()
+
+        started = self._clock()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just before cancellation; hand it back
+                self._tokens = min(float(self.burst), self._tokens + 1)
+                self._schedule_dispatch()
+            raise
+
+        waited = self._clock() - started
+        self._record(priority, waited)
+        return waited
+
+    def on_response(self, status_code: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Feed a response back into the bucket. Returns the pause in seconds when the
+        response was a 429, otherwise None.
+        """
+        if status_code == 429:
+            self.throttled_total += 1
+            self._consecutive_throttles += 1
+            self.rate = max(self.min_rate, self.rate * RATE_DECREASE_FACTOR)
+
+            delay = parse_retry_after(retry_after)
+            if delay is None:
+                delay = min(
+                    MAX_BACKOFF_SECONDS,
+                    DEFAULT_BACKOFF_SECONDS * 2 ** (self._consecutive_throttles - 1),
+                )
+            self.pause(delay)
+            logger.warning(
+                "StockX rate limit hit, pausing scheduler",
+                pause_seconds=round(delay, 2),
+                rate_per_second=round(self.rate, 3),
+            )
+            return delay
+
+        if status_code < 500:
+            self._consecutive_throttles = 0
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + RATE_RECOVERY_STEP)
+        return None
+
+    def pause(self, seconds: float) -> None:
+        """Stop releasing requests for ``seconds``; one probe request is allowed afterwards"""
+        resume_at = self._clock() + seconds
+        if resume_at > self._paused_until:
+            self._paused_until = resume_at
+            self._tokens = 1.0
+            self._updated = resume_at
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill()
+        return {
+            "rate_per_second": round(self.rate, 3),
+            "max_rate_per_second": self.max_rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "paused_for_seconds": round(max(0.0, self._paused_until - self._clock()), 2),
+            "queue_depth": self.queue_depth,
+            "throttled_total": self.throttled_total,
+            "granted": dict(self.granted),
+            "wait_seconds": {lane: round(total, 3) for lane, total in self.wait_seconds.items()},
+        }
+
+    # ===== Internals =====
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if now > self._updated:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def _can_grant(self) -> bool:
+        return self._clock() >= self._paused_until and self._tokens >= 1
+
+    def _next_delay(self) -> float:
+        now = self._clock()
+        pause = max(0.0, self._paused_until - now)
+        refill = max(0.0, (1 - self._tokens) / self.rate)
+        return max(pause, refill)
+
+    def _schedule_dispatch(self) -> None:
+        if self._timer is None and self._loop is not None:
+            self._timer = self._loop.call_later(self._next_delay(), self._dispatch)
+
+    def _dispatch(self) -> None:
+        self._timer = None
+        self._refill()
+        while self._waiters and self._can_grant():
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue  # cancelled while queued
+            self._tokens -= 1
+            future.set_result(None)
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        if self._waiters:
+            self._schedule_dispatch()
+
+    def _record(self, priority: RequestPriority, waited: float) -> None:
+        lane = RequestPriority(priority).name.lower()
+        self.granted[lane] += 1
+        self.wait_seconds[lane] += waited
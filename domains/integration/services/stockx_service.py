@@ -1,21 +1,41 @@
 import asyncio
+import math
+import time
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 import structlog
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from domains.integration.services.stockx_http_client import (
+    STOCKX_API_BASE_URL,
+    StockXClientState,
+    get_stockx_client_state,
+)
 from shared.database.models import SystemConfig
 from shared.exceptions.domain_exceptions import AuthenticationException
 from shared.utils.helpers import RetryHelper
 
+# STOCKX_API_BASE_URL now lives in stockx_http_client; re-exported for existing importers
+__all__ = [
+    "DEFAULT_PAGE_PREFETCH",
+    "PAGE_SIZE",
+    "STOCKX_API_BASE_URL",
+    "STOCKX_AUTH_URL",
+    "StockXCredentials",
+    "StockXService",
+]
+
 logger = structlog.get_logger(__name__)
 
-STOCKX_API_BASE_URL = "https://api.stockx.com/v2"
 STOCKX_AUTH_URL = "https://accounts.stockx.com/oauth/token"
 
+PAGE_SIZE = 100
+# Pages requested ahead of the consumer; each still waits for a scheduler slot
+DEFAULT_PAGE_PREFETCH = 3
+
 
 class StockXCredentials:
     """A data class for holding all necessary StockX credentials."""
@@ -31,26 +51,68 @@ class StockXService:
     """
     A service to interact with the StockX Public API, handling the OAuth2 refresh token flow.
     Includes intelligent rate limiting to prevent 429 (Too Many Requests) errors.
+
+    The HTTP connection pool, credentials and access token are shared process-wide
+    (see stockx_http_client), so short-lived service instances reuse warm connections
+    and a cached token instead of re-authenticating on every call.
+
+    Every request passes through the shared token-bucket scheduler (see
+    stockx_rate_limiter), so concurrent jobs share one quota. Requests default to
+    the interactive lane; background jobs wrap their calls in
+    ``stockx_request_priority(...)``.
     """
 
+    # Retries for 429 responses; the wait itself comes from the scheduler pause
+    max_rate_limit_retries = 3
+
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
-        self._access_token: Optional[str] = None
-        self._token_expiry: Optional[datetime] = None
-        self._credentials: Optional[StockXCredentials] = None
-        self._lock = asyncio.Lock()
-        # Rate limiting: Track last request time to enforce delays
-        self._last_request_time: Optional[datetime] = None
-        self._min_request_interval = 0.5  # Minimum 500ms between requests
+
+    # ===== Shared credential/token state =====
+
+    @property
+    def _state(self) -> StockXClientState:
+        return get_stockx_client_state()
+
+    @property
+    def _credentials(self) -> Optional[StockXCredentials]:
+        return self._state.cached_credentials()
+
+    @_credentials.setter
+    def _credentials(self, credentials: StockXCredentials) -> None:
+        self._state.store_credentials(credentials)
+
+    @property
+    def _access_token(self) -> Optional[str]:
+        return self._state.access_token
+
+    @_access_token.setter
+    def _access_token(self, token: Optional[str]) -> None:
+        self._state.access_token = token
+
+    @property
+    def _token_expiry(self) -> Optional[datetime]:
+        return self._state.token_expiry
+
+    @_token_expiry.setter
+    def _token_expiry(self, expiry: Optional[datetime]) -> None:
+        self._state.token_expiry = expiry
 
     async def _load_credentials(self) -> StockXCredentials:
         """
-        Fetches StockX API credentials from the database. Caches them in memory.
+        Fetches StockX API credentials from the database. Caches them process-wide;
+        concurrent callers on a cold cache share a single database lookup.
         """
         if self._credentials:
             return self._credentials
 
-        logger.info("Loading StockX credentials from database for current request.")
+        async with self._state.credentials_lock:
+            if self._credentials:
+                return self._credentials
+            return await self._fetch_credentials()
+
+    async def _fetch_credentials(self) -> StockXCredentials:
+        logger.info("Loading StockX credentials from database.")
         keys = [
             "stockx_client_id",
             "stockx_client_secret",
@@ -66,13 +128,14 @@ class StockXService:
             if key not in configs:
                 raise ValueError(f"Missing required StockX credential in system_config: {key}")
 
-        self._credentials = StockXCredentials(
+        credentials = StockXCredentials(
             client_id=configs["stockx_client_id"],
             client_secret=configs["stockx_client_secret"],
             refresh_token=configs["stockx_refresh_token"],
             api_key=configs["stockx_api_key"],
         )
-        return self._credentials
+        self._credentials = credentials
+        return credentials
 
     @RetryHelper.retry_on_exception(
         max_attempts=3,
@@ -80,11 +143,12 @@ class StockXService:
         backoff_factor=2.0,
         exceptions=(httpx.RequestError, httpx.TimeoutException),
     )
-    async def _refresh_access_token(self) -> None:
+    async def _refresh_access_token(self, credentials: Optional[StockXCredentials] = None) -> None:
         """
         Uses the refresh token to get a new access token from StockX Auth service.
+        Credentials passed in are used as-is instead of being loaded.
         """
-        creds = await self._load_credentials()
+        creds = credentials or await self._load_credentials()
         logger.info("Attempting to refresh StockX access token.")
 
         payload = {
@@ -104,6 +168,7 @@ class StockXService:
                 # Set expiry with a 60-second buffer for safety
                 expires_in = token_data.get("expires_in", 3600) - 60
                 self._token_expiry = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+                self._state.metrics.token_refreshes += 1
 
                 logger.info(
                     "Successfully refreshed StockX access token.", expires_at=self._token_expiry
@@ -123,21 +188,26 @@ class StockXService:
                     status_code=e.response.status_code,
                 ) from e
 
-    async def _get_valid_access_token(self) -> str:
+    async def _get_valid_access_token(self, credentials: Optional[StockXCredentials] = None) -> str:
         """
         Ensures a valid, non-expired access token is available, refreshing if necessary.
-        This method is thread-safe using an async lock.
-        """
-        async with self._lock:
-            if (
-                self._access_token
-                and self._token_expiry
-                and self._token_expiry > datetime.now(timezone.utc)
-            ):
+        Refreshes are single-flight: concurrent callers wait for the one in progress
+        instead of each hitting the token endpoint. A refresh uses ``credentials``
+        when given, so it does not need the database session.
+        """
+        if self._state.token_is_valid():
+            return self._access_token
+
+        lock = self._state.token_lock
+        if lock.locked():
+            self._state.metrics.token_refresh_waits += 1
+
+        async with lock:
+            if self._state.token_is_valid():
                 return self._access_token
 
             # If token is missing or expired, refresh it
-            await self._refresh_access_token()
+            await self._refresh_access_token(credentials)
             if not self._access_token:
                 raise AuthenticationException("Failed to obtain a valid access token.")
             return self._access_token
@@ -156,6 +226,35 @@ class StockXService:
         Fetches all historical orders within a given date range, handling authentication,
         pagination, and optional filters.
         """
+        return [
+            order
+            async for page in self.iter_historical_order_pages(
+                from_date,
+                to_date,
+                order_status=order_status,
+                product_id=product_id,
+                variant_id=variant_id,
+                inventory_types=inventory_types,
+                initiated_shipment_display_ids=initiated_shipment_display_ids,
+            )
+            for order in page
+        ]
+
+    async def iter_historical_order_pages(
+        self,
+        from_date: date,
+        to_date: date,
+        order_status: Optional[str] = None,
+        product_id: Optional[str] = None,
+        variant_id: Optional[str] = None,
+        inventory_types: Optional[str] = None,
+        initiated_shipment_display_ids: Optional[str] = None,
+        prefetch: int = DEFAULT_PAGE_PREFETCH,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Streams historical orders page by page while the next ``prefetch`` pages are
+        fetched in the background. Accepts the same filters as get_historical_orders.
+        """
         logger.info(
             "Fetching historical orders from StockX API.",
             from_date=from_date,
@@ -182,83 +281,205 @@ class StockXService:
         # Filter out None values so they aren't sent as query params
         filtered_params = {key: value for key, value in params.items() if value is not None}
 
-        return await self._make_paginated_get_request(
-            "/selling/orders/history", filtered_params, "orders"
-        )
+        async for page in self._iter_pages(
+            "/selling/orders/history", filtered_params, "orders", prefetch=prefetch
+        ):
+            yield page
 
-    async def _make_paginated_get_request(
-        self, endpoint: str, params: Dict[str, Any], data_key: str
-    ) -> List[Dict[str, Any]]:
-        """
-        A generic helper to make paginated GET requests to the StockX API.
-        """
-        access_token = await self._get_valid_access_token()
-        api_key = (await self._load_credentials()).api_key
+    # ===== Pooled request helpers =====
 
-        headers = {
+    @staticmethod
+    def _auth_headers(access_token: str, api_key: str) -> Dict[str, str]:
+        return {
             "x-api-key": api_key,
             "Authorization": f"Bearer {access_token}",
             "User-Agent": "SoleFlipperApp/1.0",
         }
 
-        all_items = []
+    async def _timed_request(
+        self, method: str, endpoint: str, headers: Dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send one request over the shared pooled client once the scheduler grants a
+        slot, recording latency metrics and feeding the status back to the scheduler.
+        """
+        state = self._state
+        await state.scheduler.acquire()
+
+        client = state.get_client()
+        status_code = None
+        started = time.perf_counter()
+        state.metrics.request_started()
+        try:
+            response = await client.request(method, endpoint, headers=headers, **kwargs)
+            status_code = response.status_code
+        finally:
+            state.metrics.request_finished((time.perf_counter() - started) * 1000, status_code)
+
+        state.scheduler.on_response(status_code, response.headers.get("Retry-After"))
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        extra_headers: Optional[Dict[str, str]] = None,
+        credentials: Optional[StockXCredentials] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send an authenticated request to the StockX API. A 401 invalidates the
+        rejected token and the request is retried once with a fresh one. A 429 is
+        retried up to ``max_rate_limit_retries`` times; the scheduler holds the retry
+        (and every other queued request) back for the Retry-After period.
+
+        Requests running concurrently with other users of the database session pass
+        ``credentials`` resolved by their caller; the request, its retries and any
+        token refresh then never load credentials themselves.
+        """
+        credentials = credentials or await self._load_credentials()
+        for attempt in range(self.max_rate_limit_retries + 1):
+            access_token = await self._get_valid_access_token(credentials)
+            headers = {
+                **self._auth_headers(access_token, credentials.api_key),
+                **(extra_headers or {}),
+            }
+
+            response = await self._timed_request(method, endpoint, headers, **kwargs)
+
+            if response.status_code == 401:
+                logger.warning(f"Received 401 on {endpoint}. Retrying after token refresh.")
+                self._state.invalidate_token(access_token)
+                access_token = await self._get_valid_access_token(credentials)
+                headers["Authorization"] = f"Bearer {access_token}"
+                response = await self._timed_request(method, endpoint, headers, **kwargs)
+
+            if response.status_code != 429:
+                return response
+
+            if attempt < self.max_rate_limit_retries:
+                logger.warning(
+                    f"Rate limit hit on {endpoint}. Retry {attempt + 1}/{self.max_rate_limit_retries}",
+                    endpoint=endpoint,
+                    attempt=attempt + 1,
+                    max_retries=self.max_rate_limit_retries,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+            else:
+                logger.error(
+                    f"Rate limit exceeded on {endpoint} after {self.max_rate_limit_retries} retries",
+                    endpoint=endpoint,
+                    max_retries=self.max_rate_limit_retries,
+                )
+
+        return response
+
+    async def _fetch_page(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        page: int,
+        credentials: StockXCredentials,
+    ) -> Dict[str, Any]:
+        request_params = {**params, "pageNumber": page, "pageSize": PAGE_SIZE}
+        try:
+            response = await self._send(
+                "GET", endpoint, credentials=credentials, params=request_params
+            )
+            response.raise_for_status()
+            return response.json()
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"HTTP error on {endpoint}",
+                status_code=e.response.status_code,
+                response=e.response.text,
+            )
+            raise
+        except httpx.RequestError as e:
+            logger.error(f"Request error on {endpoint}", error=str(e))
+            raise
+        except asyncio.TimeoutError:
+            logger.error(f"Request timeout on {endpoint}")
+            raise
+
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        data_key: str,
+        prefetch: int = DEFAULT_PAGE_PREFETCH,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yields the items of each page of a paginated StockX endpoint, in page order.
+
+        The first page is fetched alone; after that up to ``prefetch`` following
+        pages are requested concurrently (bounded by the response ``count`` when
+        present) so the caller can process one page while the next ones are in
+        flight. All requests go through the shared scheduler, so prefetching never
+        exceeds the rate budget. Prefetched pages beyond the end, or left over when
+        the caller stops early, are cancelled.
+        """
+        # Resolved here, in the caller's task: prefetch tasks run alongside the caller's
+        # own use of the (non-concurrent) database session and must never query it
+        credentials = await self._load_credentials()
+
+        pending: Dict[int, asyncio.Task] = {}
+        next_to_schedule = 1
+        last_page: Optional[int] = None
         page = 1
+        total_items = 0
 
-        async with httpx.AsyncClient(base_url=STOCKX_API_BASE_URL) as client:
+        try:
             while True:
-                # Add pagination params to the request
-                request_params = params.copy()
-                request_params["pageNumber"] = page
-                request_params["pageSize"] = 100
-
-                try:
-                    response = await client.get(
-                        endpoint, params=request_params, headers=headers, timeout=30.0
+                horizon = page + prefetch if page > 1 else 1
+                if last_page is not None:
+                    horizon = min(horizon, last_page)
+                while next_to_schedule <= horizon:
+                    pending[next_to_schedule] = asyncio.create_task(
+                        self._fetch_page(endpoint, params, next_to_schedule, credentials)
                     )
+                    next_to_schedule += 1
 
-                    if response.status_code == 401:
-                        logger.warning(f"Received 401 on {endpoint}. Retrying after token refresh.")
-                        access_token = await self._get_valid_access_token()  # Force refresh
-                        headers["Authorization"] = f"Bearer {access_token}"
-                        response = await client.get(
-                            endpoint, params=request_params, headers=headers, timeout=30.0
-                        )
-
-                    response.raise_for_status()
-
-                    data = response.json()
-                    items = data.get(data_key, [])
-                    all_items.extend(items)
-
-                    logger.info(
-                        f"Fetched page from {endpoint}",
-                        page=page,
-                        count=len(items),
-                        data_key=data_key,
-                    )
+                data = await pending.pop(page)
+                items = data.get(data_key, [])
+                total_items += len(items)
+
+                logger.info(
+                    f"Fetched page from {endpoint}",
+                    page=page,
+                    count=len(items),
+                    data_key=data_key,
+                    prefetched=len(pending),
+                )
 
-                    if not data.get("hasNextPage") or not items:
-                        break
+                if items:
+                    yield items
 
-                    page += 1
-                    await asyncio.sleep(0.1)
+                if not data.get("hasNextPage") or not items:
+                    break
 
-                except httpx.HTTPStatusError as e:
-                    logger.error(
-                        f"HTTP error on {endpoint}",
-                        status_code=e.response.status_code,
-                        response=e.response.text,
-                    )
-                    raise
-                except httpx.RequestError as e:
-                    logger.error(f"Request error on {endpoint}", error=str(e))
-                    raise
-                except asyncio.TimeoutError:
-                    logger.error(f"Request timeout on {endpoint}")
-                    raise
+                if last_page is None and data.get("count"):
+                    last_page = math.ceil(data["count"] / PAGE_SIZE)
+                page += 1
+        finally:
+            for task in pending.values():
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending.values(), return_exceptions=True)
 
-        logger.info(f"Finished fetching all items from {endpoint}", total_items=len(all_items))
-        return all_items
+        logger.info(f"Finished fetching all items from {endpoint}", total_items=total_items)
+
+    async def _make_paginated_get_request(
+        self, endpoint: str, params: Dict[str, Any], data_key: str
+    ) -> List[Dict[str, Any]]:
+        """
+        A generic helper to make paginated GET requests to the StockX API.
+        Collects every page; use _iter_pages to process pages as they arrive.
+        """
+        return [
+            item async for page in self._iter_pages(endpoint, params, data_key) for item in page
+        ]
 
     async def get_active_orders(self, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -284,6 +505,21 @@ class StockXService:
 
         return await self._make_paginated_get_request("/selling/listings", params, "listings")
 
+    async def iter_listing_pages(
+        self, prefetch: int = DEFAULT_PAGE_PREFETCH, **kwargs
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Streams the seller's listings page by page while the next ``prefetch`` pages
+        are fetched in the background. Accepts the same query parameters as
+        get_all_listings.
+        """
+        logger.info("Streaming listings from StockX API.", filters=kwargs)
+
+        params = {key: value for key, value in kwargs.items() if value is not None}
+
+        async for page in self._iter_pages("/selling/listings", params, "listings", prefetch):
+            yield page
+
     async def get_order_details(self, order_number: str) -> Optional[Dict[str, Any]]:
         """
         Fetches details for a single order from the StockX API.
@@ -453,89 +689,26 @@ class StockXService:
     ) -> Dict[str, Any]:
         """
         A generic helper to make a single, non-paginated GET request to the StockX API.
-        Includes rate limiting and exponential backoff for 429 errors.
+        Pacing and 429 backoff are handled by the shared scheduler.
         """
-        # Rate limiting: Enforce minimum delay between requests
-        if self._last_request_time:
-            elapsed = (datetime.now(timezone.utc) - self._last_request_time).total_seconds()
-            if elapsed < self._min_request_interval:
-                delay = self._min_request_interval - elapsed
-                logger.debug(f"Rate limiting: waiting {delay:.2f}s before request to {endpoint}")
-                await asyncio.sleep(delay)
-
-        self._last_request_time = datetime.now(timezone.utc)
-
-        access_token = await self._get_valid_access_token()
-        api_key = (await self._load_credentials()).api_key
-
-        headers = {
-            "x-api-key": api_key,
-            "Authorization": f"Bearer {access_token}",
-            "User-Agent": "SoleFlipperApp/1.0",
-        }
-
-        # Exponential backoff for 429 errors
-        max_retries = 3
-        base_delay = 2.0
-
-        async with httpx.AsyncClient(base_url=STOCKX_API_BASE_URL) as client:
-            for attempt in range(max_retries + 1):
-                try:
-                    response = await client.get(
-                        endpoint, params=params, headers=headers, timeout=30.0
-                    )
-
-                    # Handle 401 with token refresh
-                    if response.status_code == 401:
-                        logger.warning(f"Received 401 on {endpoint}. Retrying after token refresh.")
-                        access_token = await self._get_valid_access_token()  # Force refresh
-                        headers["Authorization"] = f"Bearer {access_token}"
-                        response = await client.get(
-                            endpoint, params=params, headers=headers, timeout=30.0
-                        )
-
-                    # Handle 429 with exponential backoff BEFORE raise_for_status()
-                    if response.status_code == 429:
-                        if attempt < max_retries:
-                            delay = base_delay * (2**attempt)  # 2s, 4s, 8s
-                            logger.warning(
-                                f"Rate limit hit on {endpoint}. Retry {attempt + 1}/{max_retries} after {delay}s",
-                                endpoint=endpoint,
-                                attempt=attempt + 1,
-                                max_retries=max_retries,
-                                delay=delay,
-                            )
-                            await asyncio.sleep(delay)
-                            continue  # Retry the request
-                        else:
-                            logger.error(
-                                f"Rate limit exceeded on {endpoint} after {max_retries} retries",
-                                endpoint=endpoint,
-                                max_retries=max_retries,
-                            )
-                            # Fall through to raise_for_status() below
-
-                    # Only raise for non-429 errors or final 429 after retries exhausted
-                    response.raise_for_status()
-                    return response.json()
-
-                except httpx.RequestError as e:
-                    logger.error(f"Request error on {endpoint}", error=str(e))
-                    raise
-                except asyncio.TimeoutError:
-                    logger.error(f"Request timeout on {endpoint}")
-                    raise
-                except httpx.HTTPStatusError as e:
-                    # Only re-raise if it's not a 429 or we've exhausted retries
-                    logger.error(
-                        f"HTTP error on {endpoint}",
-                        status_code=e.response.status_code,
-                        response=e.response.text,
-                    )
-                    raise
+        try:
+            response = await self._send("GET", endpoint, params=params)
+            response.raise_for_status()
+            return response.json()
 
-            # Should not reach here, but for type safety
-            raise Exception(f"Unexpected error in rate-limited request to {endpoint}")
+        except httpx.RequestError as e:
+            logger.error(f"Request error on {endpoint}", error=str(e))
+            raise
+        except asyncio.TimeoutError:
+            logger.error(f"Request timeout on {endpoint}")
+            raise
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"HTTP error on {endpoint}",
+                status_code=e.response.status_code,
+                response=e.response.text,
+            )
+            raise
 
     async def _make_post_request(
         self, endpoint: str, json: Optional[Dict[str, Any]] = None
@@ -543,39 +716,23 @@ class StockXService:
         """
         A generic helper to make a POST request to the StockX API.
         """
-        access_token = await self._get_valid_access_token()
-        api_key = (await self._load_credentials()).api_key
-
-        headers = {
-            "x-api-key": api_key,
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-            "User-Agent": "SoleFlipperApp/1.0",
-        }
-
-        async with httpx.AsyncClient(base_url=STOCKX_API_BASE_URL) as client:
-            try:
-                response = await client.post(endpoint, json=json, headers=headers, timeout=30.0)
-
-                if response.status_code == 401:
-                    logger.warning(f"Received 401 on {endpoint}. Retrying after token refresh.")
-                    access_token = await self._get_valid_access_token()  # Force refresh
-                    headers["Authorization"] = f"Bearer {access_token}"
-                    response = await client.post(endpoint, json=json, headers=headers, timeout=30.0)
-
-                response.raise_for_status()
-                return response.json()
+        try:
+            response = await self._send(
+                "POST", endpoint, extra_headers={"Content-Type": "application/json"}, json=json
+            )
+            response.raise_for_status()
+            return response.json()
 
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP error during POST request to {endpoint}",
-                    status_code=e.response.status_code,
-                    response_body=e.response.text,
-                )
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Request error during POST to {endpoint}: {e}")
-                raise
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"HTTP error during POST request to {endpoint}",
+                status_code=e.response.status_code,
+                response_body=e.response.text,
+            )
+            raise
+        except httpx.RequestError as e:
+            logger.error(f"Request error during POST to {endpoint}: {e}")
+            raise
 
     async def get_shipping_document(self, order_number: str, shipping_id: str) -> Optional[bytes]:
         """
@@ -607,42 +764,25 @@ class StockXService:
         """
         A generic helper to make a single GET request for binary content (e.g., PDF).
         """
-        access_token = await self._get_valid_access_token()
-        api_key = (await self._load_credentials()).api_key
-
-        headers = {
-            "x-api-key": api_key,
-            "Authorization": f"Bearer {access_token}",
-            "User-Agent": "SoleFlipperApp/1.0",
-        }
-
-        async with httpx.AsyncClient(base_url=STOCKX_API_BASE_URL) as client:
-            try:
-                response = await client.get(endpoint, headers=headers, timeout=30.0)
-
-                if response.status_code == 401:
-                    logger.warning(f"Received 401 on {endpoint}. Retrying after token refresh.")
-                    access_token = await self._get_valid_access_token()  # Force refresh
-                    headers["Authorization"] = f"Bearer {access_token}"
-                    response = await client.get(endpoint, headers=headers, timeout=30.0)
-
-                response.raise_for_status()
-                # Instead of .json(), we return the raw bytes
-                return response.content
+        try:
+            response = await self._send("GET", endpoint)
+            response.raise_for_status()
+            # Instead of .json(), we return the raw bytes
+            return response.content
 
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP error on {endpoint}",
-                    status_code=e.response.status_code,
-                    response=e.response.text,
-                )
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Request error on {endpoint}", error=str(e))
-                raise
-            except asyncio.TimeoutError:
-                logger.error(f"Request timeout on {endpoint}")
-                raise
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"HTTP error on {endpoint}",
+                status_code=e.response.status_code,
+                response=e.response.text,
+            )
+            raise
+        except httpx.RequestError as e:
+            logger.error(f"Request error on {endpoint}", error=str(e))
+            raise
+        except asyncio.TimeoutError:
+            logger.error(f"Request timeout on {endpoint}")
+            raise
 
     async def get_sales_history(
         self,
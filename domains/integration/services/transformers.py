@@ -10,8 +10,9 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
+import pandas as pd
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -20,6 +21,11 @@ logger = structlog.get_logger(__name__)
 _CLEANUP_PATTERN = re.compile(r"[,\s]")
 _CURRENCY_CLEANUP_PATTERN = re.compile(r"[^0-9.-]")
 
+# Batches at least this large are converted column by column
+COLUMNAR_MIN_ROWS = 1000
+# Mapping sets compiled by the per-record helpers that are kept per transformer
+MAX_CACHED_MAPPINGS = 32
+
 
 class TransformError(Exception):
     """Custom exception for transformation errors"""
@@ -70,6 +76,203 @@ class FieldMapping:
     description: Optional[str] = None
 
 
+class _CompiledField(NamedTuple):
+    source: str
+    target: str
+    required: bool
+    default: Any
+    convert: Callable[[Any], Any]
+    # Converted values may be shared between rows with the same raw value
+    memoize: bool
+    date_only: Optional[bool]  # None unless the field parses dates
+
+
+# Outcome of converting one cell: (value, error message)
+_Cell = Tuple[Any, Optional[str]]
+_EMPTY_CELL: _Cell = (None, None)
+
+
+def _is_empty(raw_value: Any) -> bool:
+    return raw_value is None or (isinstance(raw_value, str) and raw_value.strip() == "")
+
+
+class CompiledFieldMappings:
+    """
+    Field mappings compiled for one transformer
+
+    Each mapping becomes a converter with its type strategy bound and its
+    validation pattern compiled, so transforming a record runs straight-line code
+    instead of re-dispatching every field. Large batches can be converted a
+    column at a time: every distinct value is converted once and date columns
+    are parsed with vectorized pandas parsing.
+    """
+
+    def __init__(self, transformer: "DataTransformer", field_mappings: Sequence["FieldMapping"]):
+        self.transformer = transformer
+        self.field_mappings = list(field_mappings)
+        self.fields = tuple(self._compile_field(mapping) for mapping in self.field_mappings)
+
+    def _compile_field(self, mapping: "FieldMapping") -> _CompiledField:
+        strategy = self.transformer._type_strategies().get(mapping.field_type)
+        field_type = mapping.field_type
+        transform_func = mapping.transform_func
+        match = re.compile(mapping.validation_pattern).match if mapping.validation_pattern else None
+
+        def convert(value: Any) -> Any:
+            if transform_func:
+                try:
+                    value = transform_func(value)
+                except Exception as e:
+                    raise TransformError(f"Custom transformation failed: {str(e)}")
+
+            if strategy is not None and value is not None:
+                try:
+                    value = strategy(value)
+                except Exception as e:
+                    raise TransformError(
+                        f"Type transformation failed: Cannot convert '{value}' to "
+                        f"{field_type.value}: {str(e)}"
+                    )
+
+            if match and isinstance(value, str) and not match(value):
+                raise TransformError("Value doesn't match validation pattern")
+
+            return value
+
+        date_only = {FieldType.DATE: True, FieldType.DATETIME: False}.get(field_type)
+
+        return _CompiledField(
+            source=mapping.source_field,
+            target=mapping.target_field,
+            required=mapping.required,
+            default=mapping.default_value,
+            convert=convert,
+            # Custom functions may not be pure, so they run for every row
+            memoize=transform_func is None,
+            date_only=date_only if transform_func is None else None,
+        )
+
+    # ===== Row path =====
+
+    def transform_row(self, record: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """Transform one record; returns (transformed fields, error messages)"""
+        transformed = {}
+        errors = []
+
+        for field in self.fields:
+            raw_value = record.get(field.source)
+            if _is_empty(raw_value):
+                value = None
+            else:
+                try:
+                    value = field.convert(raw_value)
+                except Exception as e:
+                    errors.append(f"Field '{field.source}': {str(e)}")
+                    continue
+
+            if value is not None:
+                transformed[field.target] = value
+            elif field.required:
+                errors.append(f"Required field '{field.source}' is missing or empty")
+            elif field.default is not None:
+                transformed[field.target] = field.default
+
+        return transformed, errors
+
+    # ===== Column path =====
+
+    def transform_columns(
+        self, data: Sequence[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], List[str]]]:
+        """Transform all records column by column; same results as transform_row per record"""
+        columns = [self._convert_column(field, data) for field in self.fields]
+
+        results = []
+        for row_idx in range(len(data)):
+            transformed = {}
+            errors = []
+
+            for field, column in zip(self.fields, columns):
+                value, error = column[row_idx]
+                if error is not None:
+                    errors.append(f"Field '{field.source}': {error}")
+                elif value is not None:
+                    transformed[field.target] = value
+                elif field.required:
+                    errors.append(f"Required field '{field.source}' is missing or empty")
+                elif field.default is not None:
+                    transformed[field.target] = field.default
+
+            results.append((transformed, errors))
+
+        return results
+
+    def _convert_column(self, field: _CompiledField, data: Sequence[Dict[str, Any]]) -> List[_Cell]:
+        raw_values = [record.get(field.source) for record in data]
+
+        if not field.memoize:
+            return [self._convert_cell(field, raw_value) for raw_value in raw_values]
+
+        cells: Dict[Any, _Cell] = {}
+        if field.date_only is not None:
+            cells.update(self._parse_date_column(raw_values, field.date_only))
+
+        converted = []
+        for raw_value in raw_values:
+            # Keyed by type as well, so that 1, 1.0 and True stay distinct
+            key = (raw_value.__class__, raw_value)
+            try:
+                cell = cells.get(key)
+            except TypeError:  # unhashable raw value
+                converted.append(self._convert_cell(field, raw_value))
+                continue
+            if cell is None:
+                cell = cells[key] = self._convert_cell(field, raw_value)
+            converted.append(cell)
+        return converted
+
+    @staticmethod
+    def _convert_cell(field: _CompiledField, raw_value: Any) -> _Cell:
+        if _is_empty(raw_value):
+            return _EMPTY_CELL
+        try:
+            return field.convert(raw_value), None
+        except Exception as e:
+            return None, str(e)
+
+    def _parse_date_column(self, raw_values: List[Any], date_only: bool) -> Dict[Any, _Cell]:
+        """
+        Parse the distinct date strings of a column with one vectorized pass per
+        format; values no format matches are left to the scalar parser
+        """
+        distinct = list({value for value in raw_values if type(value) is str})
+        if not distinct:
+            return {}
+
+        pending = pd.Series([value.strip() for value in distinct], index=distinct, dtype=object)
+        cells: Dict[Any, _Cell] = {}
+
+        for pattern in self.transformer.date_patterns:
+            if pending.empty:
+                break
+            if "%z" in pattern:
+                # Mixed offsets do not fit one datetime64 column; parsed per value
+                continue
+
+            parsed = pd.to_datetime(pending, format=pattern, errors="coerce")
+            matched = parsed.notna()
+            if not matched.any():
+                continue
+
+            # Patterns carry no offset; timestamps are UTC like the scalar parser's
+            values = parsed[matched].dt.tz_localize("UTC").array.to_pydatetime()
+            for raw_value, value in zip(pending.index[matched], values):
+                cells[(str, raw_value)] = (value.date() if date_only else value, None)
+            pending = pending[~matched]
+
+        return cells
+
+
 class DataTransformer:
     """Universal data transformer for import processing"""
 
@@ -90,43 +293,104 @@ class DataTransformer:
 
         self.currency_pattern = re.compile(r"[\$€£¥₹]?([0-9,]+\.?[0-9]*)")
 
+        # Compiled mappings keyed by the identity of their FieldMapping objects;
+        # each entry holds its mappings, so the ids stay unique while cached
+        self._compiled_cache: Dict[Tuple[int, ...], CompiledFieldMappings] = {}
+        self._compiled_mappings: Optional[CompiledFieldMappings] = None
+
+    @staticmethod
+    def get_field_mappings() -> List[FieldMapping]:
+        """Standard field mappings of the source (none for the generic transformer)"""
+        return []
+
+    @property
+    def compiled_mappings(self) -> CompiledFieldMappings:
+        """Standard field mappings, compiled on first use"""
+        if self._compiled_mappings is None:
+            self._compiled_mappings = self.compile_mappings(self.get_field_mappings())
+        return self._compiled_mappings
+
+    def compile_mappings(self, field_mappings: Sequence[FieldMapping]) -> CompiledFieldMappings:
+        """Compile field mappings once for repeated transforms"""
+        return CompiledFieldMappings(self, field_mappings)
+
+    def _cached_mappings(self, field_mappings: Sequence[FieldMapping]) -> CompiledFieldMappings:
+        """Compiled mappings for field_mappings, compiled once per set of mapping objects"""
+        key = tuple(map(id, field_mappings))
+        compiled = self._compiled_cache.get(key)
+        if compiled is None:
+            if len(self._compiled_cache) >= MAX_CACHED_MAPPINGS:
+                # Callers building fresh mapping lists must not grow the cache without bound
+                self._compiled_cache.pop(next(iter(self._compiled_cache)))
+            compiled = self._compiled_cache[key] = self.compile_mappings(field_mappings)
+        return compiled
+
     def transform(
         self,
         data: List[Dict[str, Any]],
-        field_mappings: List[FieldMapping],
+        field_mappings: Union[List[FieldMapping], CompiledFieldMappings],
         source_type: str = "unknown",
+        columnar: Optional[bool] = None,
     ) -> TransformResult:
         """
         Transform raw data using field mappings
 
         Args:
             data: Raw data records
-            field_mappings: List of field transformation configurations
+            field_mappings: List of field transformation configurations, or the
+                result of compile_mappings()
             source_type: Source identifier for logging
+            columnar: Convert column by column (default: for COLUMNAR_MIN_ROWS+ records)
 
         Returns:
             TransformResult with transformed data and statistics
         """
+        if not isinstance(field_mappings, CompiledFieldMappings):
+            field_mappings = self.compile_mappings(field_mappings)
+        if columnar is None:
+            columnar = len(data) >= COLUMNAR_MIN_ROWS
+
         logger.info(
             "Starting data transformation",
             records=len(data),
-            mappings=len(field_mappings),
+            mappings=len(field_mappings.fields),
             source=source_type,
+            columnar=columnar,
         )
 
         self.warnings = []
         self.errors = []
         transformed_records = []
+        transformed_at = datetime.now(timezone.utc)
+
+        if columnar:
+            try:
+                rows = field_mappings.transform_columns(data)
+            except Exception as e:
+                # Fall back to the row path, which isolates the failing record
+                logger.warning("Columnar transformation failed", error=str(e))
+                columnar = False
 
         for idx, record in enumerate(data):
             try:
-                transformed_record = self._transform_record(record, field_mappings, idx)
-                if transformed_record:
-                    transformed_records.append(transformed_record)
+                transformed, record_errors = (
+                    rows[idx] if columnar else field_mappings.transform_row(record)
+                )
             except Exception as e:
                 error_msg = f"Row {idx + 1}: {str(e)}"
                 self.errors.append(error_msg)
                 logger.warning("Record transformation failed", row=idx + 1, error=str(e))
+                continue
+
+            # If there are critical errors, skip this record
+            if record_errors:
+                self.errors.extend([f"Row {idx + 1}: {error}" for error in record_errors])
+                continue
+
+            # Add metadata
+            transformed["_source_row"] = idx + 1
+            transformed["_transformed_at"] = transformed_at
+            transformed_records.append(transformed)
 
         result = TransformResult(
             transformed_data=transformed_records,
@@ -150,24 +414,7 @@ class DataTransformer:
         self, record: Dict[str, Any], field_mappings: List[FieldMapping], row_idx: int
     ) -> Optional[Dict[str, Any]]:
         """Transform a single record"""
-        transformed = {}
-        record_errors = []
-
-        for mapping in field_mappings:
-            try:
-                value = self._extract_field_value(record, mapping, row_idx)
-                if value is not None:
-                    transformed[mapping.target_field] = value
-                elif mapping.required:
-                    record_errors.append(
-                        f"Required field '{mapping.source_field}' is missing or empty"
-                    )
-                elif mapping.default_value is not None:
-                    transformed[mapping.target_field] = mapping.default_value
-
-            except Exception as e:
-                error_msg = f"Field '{mapping.source_field}': {str(e)}"
-                record_errors.append(error_msg)
+        transformed, record_errors = self._cached_mappings(field_mappings).transform_row(record)
 
         # If there are critical errors, skip this record
         if record_errors:
@@ -184,40 +431,14 @@ class DataTransformer:
         self, record: Dict[str, Any], mapping: FieldMapping, row_idx: int
     ) -> Any:
         """Extract and transform a single field value"""
-        # Get raw value
         raw_value = record.get(mapping.source_field)
-
-        # Handle empty/null values
-        if raw_value is None or (isinstance(raw_value, str) and raw_value.strip() == ""):
-            return None
-
-        # Apply custom transformation function if provided
-        if mapping.transform_func:
-            try:
-                raw_value = mapping.transform_func(raw_value)
-            except Exception as e:
-                raise TransformError(f"Custom transformation failed: {str(e)}")
-
-        # Type-specific transformations
-        try:
-            transformed_value = self._transform_by_type(raw_value, mapping.field_type)
-        except Exception as e:
-            raise TransformError(f"Type transformation failed: {str(e)}")
-
-        # Validation pattern check
-        if mapping.validation_pattern and isinstance(transformed_value, str):
-            if not re.match(mapping.validation_pattern, transformed_value):
-                raise TransformError("Value doesn't match validation pattern")
-
-        return transformed_value
-
-    def _transform_by_type(self, value: Any, field_type: FieldType) -> Any:
-        """Transform value based on target field type using strategy pattern"""
-        if value is None:
+        if _is_empty(raw_value):
             return None
+        return self._cached_mappings([mapping]).fields[0].convert(raw_value)
 
-        # Strategy pattern: delegate to specific transformation methods
-        transformation_strategies = {
+    def _type_strategies(self) -> Dict[FieldType, Callable[[Any], Any]]:
+        """Type conversion strategy per field type"""
+        return {
             FieldType.STRING: self._transform_string,
             FieldType.INTEGER: self._transform_integer,
             FieldType.DECIMAL: self._transform_decimal,
@@ -230,7 +451,13 @@ class DataTransformer:
             FieldType.CURRENCY: self._transform_currency,
         }
 
-        strategy = transformation_strategies.get(field_type)
+    def _transform_by_type(self, value: Any, field_type: FieldType) -> Any:
+        """Transform value based on target field type using strategy pattern"""
+        if value is None:
+            return None
+
+        # Strategy pattern: delegate to specific transformation methods
+        strategy = self._type_strategies().get(field_type)
         if strategy is None:
             return value
 
@@ -420,8 +647,7 @@ class StockXTransformer(DataTransformer):
         """Transform StockX CSV data with predefined mappings"""
         logger.info("Transforming StockX data", records=len(data))
 
-        field_mappings = self.get_field_mappings()
-        result = self.transform(data, field_mappings, source_type="stockx")
+        result = self.transform(data, self.compiled_mappings, source_type="stockx")
 
         # Add StockX-specific metadata
         for record in result.transformed_data:
@@ -597,8 +823,7 @@ class AliasTransformer(DataTransformer):
         """Transform Alias (GOAT) CSV data with StockX name prioritization"""
         logger.info("Transforming Alias (GOAT) data with StockX prioritization", records=len(data))
 
-        field_mappings = self.get_field_mappings()
-        result = self.transform(data, field_mappings, source_type="alias")
+        result = self.transform(data, self.compiled_mappings, source_type="alias")
 
         # Add Alias (GOAT) specific metadata and StockX prioritization flags
         for record in result.transformed_data:
@@ -7,13 +7,14 @@ import re
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domains.products.services.brand_service import BrandExtractorService
-from shared.utils import ValidationUtils
+
+from .normalizers import CurrencyNormalizer, DateNormalizer, Normalized
 
 # PERFORMANCE OPTIMIZATION: Pre-compiled regex patterns
 _SIZE_NUMBER_PATTERN = re.compile(r"^\d+\.?\d*$")
@@ -34,13 +35,25 @@ class ValidationResult:
 class BaseValidator:
     """Base class for all data validators"""
 
+    # Source column holding the product name brands are extracted from, if any
+    brand_name_field: Optional[str] = None
+
+    # Source columns normalized a whole column at a time before the records are
+    # validated; date columns map to the formats they are normalized with
+    date_columns: Dict[str, Optional[Tuple[str, ...]]] = {}
+    currency_columns: Tuple[str, ...] = ()
+
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
         self.brand_extractor = BrandExtractorService(db_session)
+        self.date_normalizer = DateNormalizer()
+        self.currency_normalizer = CurrencyNormalizer()
         self.required_fields = []
         self.optional_fields = []
         self.field_types = {}
         self.field_patterns = {}
+        # Column normalization outcomes of the batch being validated
+        self._normalized_columns: Dict[Tuple, Dict[str, Normalized]] = {}
 
     async def validate_batch(self, data: List[Dict[str, Any]]) -> ValidationResult:
         """Validate a batch of records"""
@@ -48,6 +61,9 @@ class BaseValidator:
         warnings = []
         normalized_data = []
 
+        await self._prefetch_brands(data)
+        self._normalized_columns = self._normalize_columns(data)
+
         for idx, record in enumerate(data):
             try:
                 normalized_record = await self.validate_record(record, idx)
@@ -60,6 +76,8 @@ class BaseValidator:
                 errors.append(f"Row {idx + 1}: Unexpected validation error: {str(e)}")
                 normalized_data.append({**record, "_validation_error": True})
 
+        self._normalized_columns = {}
+
         return ValidationResult(
             is_valid=len(errors) == 0,
             errors=errors,
@@ -67,6 +85,53 @@ class BaseValidator:
             normalized_data=normalized_data,
         )
 
+    async def _prefetch_brands(self, data: List[Dict[str, Any]]) -> None:
+        """
+        Match the product names of the whole batch in one bulk pass so the
+        per-record brand lookups in normalize_record are cache hits.
+        """
+        if not self.brand_name_field:
+            return
+        names = [
+            str(record.get(self.brand_name_field) or "").strip()
+            for record in data
+            if not record.get("Brand")
+        ]
+        try:
+            await self.brand_extractor.extract_brands_bulk(names)
+        except Exception as e:
+            # Only a cache warm-up; normalize_record still extracts per record
+            logger.warning("Bulk brand prefetch failed", error=str(e))
+
+    def _normalize_columns(self, data: List[Dict[str, Any]]) -> Dict[Tuple, Dict[str, Normalized]]:
+        """
+        Normalize the declared date and currency columns of the whole batch so the
+        per-record normalize_date / normalize_currency calls are lookups.
+        """
+        normalized: Dict[Tuple, Dict[str, Normalized]] = {}
+
+        for column, formats in self.date_columns.items():
+            values = self._column_strings(data, column)
+            outcomes = self.date_normalizer.normalize_many(values, formats)
+            normalized.setdefault(self._date_key(formats), {}).update(zip(values, outcomes))
+
+        currency = normalized.setdefault(("currency",), {})
+        for column in self.currency_columns:
+            values = self._column_strings(data, column)
+            currency.update(zip(values, self.currency_normalizer.normalize_many(values)))
+
+        return normalized
+
+    @staticmethod
+    def _column_strings(data: List[Dict[str, Any]], column: str) -> List[str]:
+        """Distinct string values of a column"""
+        values = (record.get(column) for record in data)
+        return list(dict.fromkeys(value for value in values if isinstance(value, str)))
+
+    @staticmethod
+    def _date_key(formats: Optional[Sequence[str]]) -> Tuple:
+        return ("date", tuple(formats) if formats else None)
+
     async def validate_record(self, record: Dict[str, Any], row_idx: int) -> Dict[str, Any]:
         """Validate and normalize a single record"""
         errors = []
@@ -89,81 +154,41 @@ class BaseValidator:
         return record
 
     def normalize_currency(self, value: Any) -> Optional[Decimal]:
-        """Normalize currency values using shared validation utilities."""
-        if value is None:
-            return None
-
-        # Handle special float cases first
-        if isinstance(value, float):
-            import math
-
-            if math.isnan(value) or math.isinf(value):
-                return None
-
-        # Use shared utility for normalization
-        normalized = ValidationUtils.normalize_currency(value)
-        if normalized is None and value is not None:
-            # Only raise error if value was provided but couldn't be normalized
-            value_str = str(value).strip()
-            if value_str and value_str.lower() not in ["nan", "inf", "-inf", "null", "none", "n/a"]:
-                raise ValidationError([f"Invalid currency format: {value}"])
-        return normalized
-
-    def normalize_date(self, value: Any, formats: List[str] = None) -> Optional[datetime]:
-        """Normalize date values using shared validation utilities with domain-specific handling."""
-        if value is None:
-            return None
-
-        value_str = str(value).strip()
-        if not value_str:
-            return None
+        """Normalize currency values using the memoized currency normalizer."""
+        if isinstance(value, str):
+            outcome = self._normalized_columns.get(("currency",), {}).get(value)
+        else:
+            outcome = None
+        if outcome is not None:
+            return self._unwrap(outcome)
 
-        # Handle domain-specific cases (German months, StockX format)
-        german_months = {
-            "Januar": "January",
-            "Februar": "February",
-            "März": "March",
-            "April": "April",
-            "Mai": "May",
-            "Juni": "June",
-            "Juli": "July",
-            "August": "August",
-            "September": "September",
-            "Oktober": "October",
-            "November": "November",
-            "Dezember": "December",
-        }
-        for de, en in german_months.items():
-            value_str = value_str.replace(de, en)
-
-        # Handle StockX timezone format
-        if " +" in value_str and value_str.endswith(" +00"):
-            value_str = value_str.replace(" +00", " +0000")
-
-        # Try shared utility first
-        normalized = ValidationUtils.normalize_date(value_str)
-        if normalized is not None:
-            return normalized
-
-        # Fallback to custom formats if shared utility fails
-        default_formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%d.%m.%Y",
-            "%d/%m/%Y",
-            "%m/%d/%Y",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%d. %B %Y",
-        ]
+        try:
+            return self.currency_normalizer.normalize(value)
+        except ValueError as e:
+            raise ValidationError([str(e)])
+
+    def normalize_date(
+        self, value: Any, formats: Optional[Sequence[str]] = None
+    ) -> Optional[datetime]:
+        """Normalize date values using the memoized, format-sniffing date normalizer."""
+        if isinstance(value, str):
+            outcome = self._normalized_columns.get(self._date_key(formats), {}).get(value)
+        else:
+            outcome = None
+        if outcome is not None:
+            return self._unwrap(outcome)
 
-        for fmt in formats or default_formats:
-            try:
-                return datetime.strptime(value_str, fmt)
-            except ValueError:
-                continue
+        try:
+            return self.date_normalizer.normalize(value, formats)
+        except ValueError as e:
+            raise ValidationError([str(e)])
 
-        raise ValidationError([f"Invalid date format: {value}"])
+    @staticmethod
+    def _unwrap(outcome: Normalized) -> Any:
+        value, error = outcome
+        if error is not None:
+            raise ValidationError([error])
+        return value
 
 
 class ValidationError(Exception):
@@ -177,6 +202,14 @@ class ValidationError(Exception):
 class AliasValidator(BaseValidator):
     """Validator for Alias export data (Alias = GOAT's selling platform)"""
 
+    brand_name_field = "NAME"
+
+    # Alias uses DD/MM/YY dates
+    date_columns = {
+        "CREDIT_DATE": ("%d/%m/%y", "%d/%m/%Y", "%d.%m.%y", "%d.%m.%Y"),
+        "PURCHASED_DATE": ("%d/%m/%y", "%d/%m/%Y", "%d.%m.%y", "%d.%m.%Y"),
+    }
+
     def __init__(self, db_session: AsyncSession):
         super().__init__(db_session)
         self.required_fields = [
@@ -204,11 +237,11 @@ class AliasValidator(BaseValidator):
 
         # Date normalization - Alias uses DD/MM/YY format
         normalized["sale_date"] = self.normalize_date(
-            record.get("CREDIT_DATE"), ["%d/%m/%y", "%d/%m/%Y", "%d.%m.%y", "%d.%m.%Y"]
+            record.get("CREDIT_DATE"), self.date_columns["CREDIT_DATE"]
         )
 
         normalized["purchase_date"] = self.normalize_date(
-            record.get("PURCHASED_DATE"), ["%d/%m/%y", "%d/%m/%Y", "%d.%m.%y", "%d.%m.%Y"]
+            record.get("PURCHASED_DATE"), self.date_columns["PURCHASED_DATE"]
         )
 
         # Currency normalization - Alias PRODUCT_PRICE_CENTS_SALE_PRICE contains full USD amounts
@@ -279,6 +312,20 @@ class AliasValidator(BaseValidator):
 class StockXValidator(BaseValidator):
     """Validator for StockX export data"""
 
+    brand_name_field = "Item"
+
+    # StockX uses UTC timezone dates
+    date_columns = {
+        "Sale Date": ("%Y-%m-%d %H:%M:%S %z", "%Y-%m-%d %H:%M:%S", "%m/%d/%Y %H:%M:%S", "%m/%d/%Y"),
+    }
+    currency_columns = (
+        "Listing Price",
+        "Seller Fee",
+        "Payment Processing",
+        "Shipping Fee",
+        "Total Payout",
+    )
+
     def __init__(self, db_session: AsyncSession):
         super().__init__(db_session)
         self.required_fields = ["Order Number", "Sale Date", "Item", "Listing Price"]
@@ -314,8 +361,7 @@ class StockXValidator(BaseValidator):
 
         # Date normalization - StockX uses UTC timezone format
         normalized["sale_date"] = self.normalize_date(
-            record.get("Sale Date"),
-            ["%Y-%m-%d %H:%M:%S %z", "%Y-%m-%d %H:%M:%S", "%m/%d/%Y %H:%M:%S", "%m/%d/%Y"],
+            record.get("Sale Date"), self.date_columns["Sale Date"]
         )
 
         # Currency normalization
@@ -467,6 +513,12 @@ class NotionValidator(BaseValidator):
 class SalesValidator(BaseValidator):
     """Validator for manual sales CSV data"""
 
+    brand_name_field = "Product Name"
+
+    # German dates first; values none of them read are retried with the defaults
+    date_columns = {"Sale Date": ("%d. %B %Y", "%d.%m.%Y", "%Y-%m-%d")}
+    currency_columns = ("Gross Buy", "Net Buy", "Gross Sale", "Net Sale")
+
     def __init__(self, db_session: AsyncSession):
         super().__init__(db_session)
         self.required_fields = ["SKU", "Sale Date", "Status"]
@@ -491,7 +543,7 @@ class SalesValidator(BaseValidator):
         # Date - try German format first
         try:
             normalized["sale_date"] = self.normalize_date(
-                record.get("Sale Date"), ["%d. %B %Y", "%d.%m.%Y", "%Y-%m-%d"]
+                record.get("Sale Date"), self.date_columns["Sale Date"]
             )
         except ValidationError:
             # Fallback to standard formats
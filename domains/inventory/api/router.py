@@ -890,8 +890,10 @@ async def export_inventory_stream(
 
     try:
         # Validate format parameter
-        if format.lower() not in ["json", "csv"]:
-            raise HTTPException(status_code=400, detail="Format must be 'json' or 'csv'")
+        if format.lower() not in ["json", "ndjson", "csv", "parquet"]:
+            raise HTTPException(
+                status_code=400, detail="Format must be 'json', 'ndjson', 'csv' or 'parquet'"
+            )
 
         # Validate chunk size (prevent memory issues)
         if chunk_size < 10 or chunk_size > 1000:
@@ -904,6 +906,9 @@ async def export_inventory_stream(
 
     except HTTPException:
         raise
+    except ValueError as e:
+        # e.g. Parquet requested without pyarrow installed
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error("Inventory streaming export failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
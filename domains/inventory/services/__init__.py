@@ -7,11 +7,13 @@ Business logic for inventory management, dead stock analysis, and predictive ins
 Services:
 - inventory_service: Core inventory management (LARGE - 1,720 lines, refactoring candidate)
 - dead_stock_service: Dead stock identification and analysis
+- duplicate_index: Blocking/inverted-index engine for duplicate detection scans
 - predictive_insights_service: Predictive inventory insights
 """
 
 from domains.inventory.services import (
     dead_stock_service,
+    duplicate_index,
     inventory_service,
     predictive_insights_service,
 )
@@ -19,5 +21,6 @@ from domains.inventory.services import (
 __all__ = [
     "inventory_service",
     "dead_stock_service",
+    "duplicate_index",
     "predictive_insights_service",
 ]
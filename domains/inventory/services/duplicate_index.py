@@ -0,0 +1,173 @@
+"""
+Duplicate Detection Index
+Blocking + inverted-index candidate generation for inventory duplicate scans
+"""
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+# Same stop words as InventoryService._calculate_text_similarity
+STOP_WORDS = frozenset(
+    {"the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"}
+)
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.9
+
+
+def tokenize_name(name: str) -> FrozenSet[str]:
+    """Tokenize a (lowercased) product name into a stop-word free token set"""
+    return frozenset(name.lower().split()) - STOP_WORDS
+
+
+def jaccard(tokens1: FrozenSet[str], tokens2: FrozenSet[str]) -> float:
+    """Jaccard similarity of two token sets"""
+    union = len(tokens1 | tokens2)
+    if union == 0:
+        return 0.0
+    return len(tokens1 & tokens2) / union
+
+
+@dataclass
+class DuplicateCandidate:
+    """Lightweight projection of an inventory item used by the duplicate scan"""
+
+    id: Any
+    name: str
+    brand: str
+    size: str
+    status: Optional[str] = None
+    external_ids: Optional[Dict[str, Any]] = None
+    tokens: FrozenSet[str] = field(default=frozenset(), repr=False)
+    position: int = field(default=0, repr=False)
+
+
+class _Block:
+    """All candidates sharing the same (brand, size) blocking key"""
+
+    def __init__(self) -> None:
+        self.members: List[DuplicateCandidate] = []
+        self.by_name: Dict[str, List[DuplicateCandidate]] = defaultdict(list)
+        self.token_postings: Dict[str, List[DuplicateCandidate]] = defaultdict(list)
+        self.prefixes: Dict[int, Tuple[str, ...]] = {}
+
+    def add(self, candidate: DuplicateCandidate) -> None:
+        self.members.append(candidate)
+        self.by_name[candidate.name].append(candidate)
+
+    def build(self, threshold: float) -> None:
+        """
+        Build the prefix-filtered inverted index.
+
+        Tokens are ordered by ascending in-block frequency; two sets with
+        Jaccard >= threshold are guaranteed to share a token within their
+        first ``|x| - ceil(threshold * |x|) + 1`` tokens, so only those are indexed.
+        """
+        frequency: Dict[str, int] = defaultdict(int)
+        for member in self.members:
+            for token in member.tokens:
+                frequency[token] += 1
+
+        for member in self.members:
+            if not member.tokens:
+                continue
+            ordered = sorted(member.tokens, key=lambda t: (frequency[t], t))
+            prefix_len = len(ordered) - math.ceil(threshold * len(ordered)) + 1
+            prefix = tuple(ordered[:prefix_len])
+            self.prefixes[member.position] = prefix
+            for token in prefix:
+                self.token_postings[token].append(member)
+
+
+class DuplicateIndex:
+    """
+    Duplicate index over inventory items.
+
+    Items are blocked by (normalized brand, size) - both must match exactly for
+    two items to be duplicates - and compared only within their block. Inside a
+    block, exact name matches come from a hash map and near matches
+    (Jaccard > threshold) from a prefix-filtered token inverted index, so a full
+    scan costs roughly O(n log n) instead of the O(n²) pairwise comparison.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self._blocks: Dict[Tuple[str, str], _Block] = defaultdict(_Block)
+        self._candidates: List[DuplicateCandidate] = []
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def add(
+        self,
+        item_id: Any,
+        name: Optional[str],
+        brand: Optional[str],
+        size: Optional[str],
+        status: Optional[str] = None,
+        external_ids: Optional[Dict[str, Any]] = None,
+    ) -> DuplicateCandidate:
+        """Register an item; must be called before the index is queried"""
+        normalized_name = name.lower() if name else ""
+        candidate = DuplicateCandidate(
+            id=item_id,
+            name=normalized_name,
+            brand=brand.lower() if brand else "",
+            size=size or "",
+            status=status,
+            external_ids=external_ids,
+            tokens=tokenize_name(normalized_name),
+            position=len(self._candidates),
+        )
+        self._candidates.append(candidate)
+        self._blocks[(candidate.brand, candidate.size)].add(candidate)
+        self._built = False
+        return candidate
+
+    def build(self) -> None:
+        for block in self._blocks.values():
+            block.build(self.threshold)
+        self._built = True
+
+    def find_duplicates(self, candidate: DuplicateCandidate) -> List[DuplicateCandidate]:
+        """Return all duplicates of ``candidate`` in insertion order"""
+        if not self._built:
+            self.build()
+
+        block = self._blocks[(candidate.brand, candidate.size)]
+        matches: Set[int] = {
+            other.position for other in block.by_name[candidate.name] if other is not candidate
+        }
+
+        min_len = self.threshold * len(candidate.tokens)
+        max_len = len(candidate.tokens) / self.threshold if self.threshold else math.inf
+        for token in block.prefixes.get(candidate.position, ()):
+            for other in block.token_postings[token]:
+                if other is candidate or other.position in matches:
+                    continue
+                if not (min_len <= len(other.tokens) <= max_len):
+                    continue
+                if jaccard(candidate.tokens, other.tokens) > self.threshold:
+                    matches.add(other.position)
+
+        return [self._candidates[position] for position in sorted(matches)]
+
+    def iter_groups(self) -> Iterator[Tuple[DuplicateCandidate, List[DuplicateCandidate]]]:
+        """
+        Yield (primary, duplicates) groups in insertion order.
+
+        Mirrors the greedy grouping of the original scan: an item already placed
+        in a group never becomes a primary, but may still appear as a duplicate.
+        """
+        processed: Set[int] = set()
+        for candidate in self._candidates:
+            if candidate.position in processed:
+                continue
+            duplicates = self.find_duplicates(candidate)
+            if not duplicates:
+                continue
+            processed.add(candidate.position)
+            processed.update(dup.position for dup in duplicates)
+            yield candidate, duplicates
@@ -28,6 +28,7 @@ from ..repositories.inventory_repository import (
     InventoryRepository,
 )
 from ..repositories.product_repository import ProductRepository
+from .duplicate_index import DuplicateIndex
 
 logger = structlog.get_logger(__name__)
 
@@ -202,6 +203,11 @@ class InventoryService:
         stats = {"created": 0, "updated": 0, "skipped": 0, "matched": 0}
 
         try:
+            from domains.integration.services.stockx_rate_limiter import (
+                RequestPriority,
+                stockx_request_priority,
+            )
+
             # Get StockX service
             stockx_service = self.stockx_service
             if not stockx_service:
@@ -209,19 +215,6 @@ class InventoryService:
 
                 stockx_service = StockXService(self.db_session)
 
-            # Get all ACTIVE StockX listings only (not history)
-            all_listings = await stockx_service.get_all_listings()
-            # Filter for ACTIVE and PENDING listings only
-            listings = [
-                listing
-                for listing in all_listings
-                if listing.get("status", "").upper() in ["ACTIVE", "PENDING"]
-            ]
-            self.logger.info(
-                f"Found {len(listings)} active StockX listings to sync "
-                f"(filtered from {len(all_listings)} total listings)"
-            )
-
             # Get or create default category and brand
             default_category = await self._get_default_category()
             default_brand = await self._get_default_brand()
@@ -229,40 +222,30 @@ class InventoryService:
             # Get or create StockX platform for marketplace data
             stockx_platform = await self._get_or_create_stockx_platform()
 
-            # Process each listing individually (simple approach)
-            for listing in listings:
-                listing_id = listing.get("listingId")
-                if not listing_id:
-                    stats["skipped"] += 1
-                    continue
-
-                try:
-                    # Simple check: does this listing already exist?
-                    existing_item = await self._simple_listing_check(listing_id)
-                    if existing_item:
-                        stats["matched"] += 1
-                        # Update marketplace data for existing items
-                        await self._create_or_update_marketplace_data(
-                            existing_item, listing, stockx_platform
+            # Stream listings page by page (later pages are prefetched while this one
+            # is processed); queued behind interactive StockX calls
+            total_listings = 0
+            active_listings = 0
+            with stockx_request_priority(RequestPriority.LISTING_SYNC):
+                async for page in stockx_service.iter_listing_pages():
+                    total_listings += len(page)
+                    # Filter for ACTIVE and PENDING listings only
+                    listings = [
+                        listing
+                        for listing in page
+                        if listing.get("status", "").upper() in ["ACTIVE", "PENDING"]
+                    ]
+                    active_listings += len(listings)
+
+                    for listing in listings:
+                        await self._sync_stockx_listing(
+                            listing, default_category, default_brand, stockx_platform, stats
                         )
-                        continue
-
-                    # Create new inventory item
-                    inventory_item = await self._create_simple_inventory_item(
-                        listing, default_category, default_brand
-                    )
-
-                    # Create marketplace data for the new item
-                    await self._create_or_update_marketplace_data(
-                        inventory_item, listing, stockx_platform
-                    )
-
-                    stats["created"] += 1
 
-                except Exception as e:
-                    self.logger.error(f"Failed to process listing {listing_id}: {e}")
-                    stats["skipped"] += 1
-                    continue
+            self.logger.info(
+                f"Synced {active_listings} active StockX listings "
+                f"(filtered from {total_listings} total listings)"
+            )
 
             # Commit all changes
             await self.db_session.commit()
@@ -275,6 +258,40 @@ class InventoryService:
             self.logger.error("Failed to sync StockX listings to inventory", error=str(e))
             return {"error": str(e)}
 
+    async def _sync_stockx_listing(
+        self, listing, default_category, default_brand, stockx_platform, stats: Dict[str, int]
+    ) -> None:
+        """Match or create the inventory item for a single StockX listing"""
+        listing_id = listing.get("listingId")
+        if not listing_id:
+            stats["skipped"] += 1
+            return
+
+        try:
+            # Simple check: does this listing already exist?
+            existing_item = await self._simple_listing_check(listing_id)
+            if existing_item:
+                stats["matched"] += 1
+                # Update marketplace data for existing items
+                await self._create_or_update_marketplace_data(
+                    existing_item, listing, stockx_platform
+                )
+                return
+
+            # Create new inventory item
+            inventory_item = await self._create_simple_inventory_item(
+                listing, default_category, default_brand
+            )
+
+            # Create marketplace data for the new item
+            await self._create_or_update_marketplace_data(inventory_item, listing, stockx_platform)
+
+            stats["created"] += 1
+
+        except Exception as e:
+            self.logger.error(f"Failed to process listing {listing_id}: {e}")
+            stats["skipped"] += 1
+
     async def _get_default_category(self):
         """Get or create default category for StockX items"""
         from shared.database.models import Category
@@ -1617,54 +1634,56 @@ class InventoryService:
         }
 
         try:
-            # Get all inventory items with related data
-            from sqlalchemy.orm import selectinload
-
-            from shared.database.models import InventoryItem, Product
-
-            stmt = select(InventoryItem).options(
-                # Include related objects for comparison
-                selectinload(InventoryItem.product).selectinload(Product.brand),
-                selectinload(InventoryItem.product).selectinload(Product.category),
-                selectinload(InventoryItem.size),
+            # Project only the columns the comparison needs instead of hydrating
+            # full InventoryItem/Product/Brand/Size object graphs
+            stmt = (
+                select(
+                    InventoryItem.id,
+                    InventoryItem.status,
+                    InventoryItem.external_ids,
+                    Product.id.label("product_id"),
+                    Product.name.label("product_name"),
+                    Brand.name.label("brand_name"),
+                    Size.value.label("size_value"),
+                )
+                .select_from(InventoryItem)
+                .join(Product, InventoryItem.product_id == Product.id, isouter=True)
+                .join(Brand, Product.brand_id == Brand.id, isouter=True)
+                .join(Size, InventoryItem.size_id == Size.id, isouter=True)
             )
             result = await self.db_session.execute(stmt)
-            all_items = result.scalars().all()
-
-            scan_results["total_items_scanned"] = len(all_items)
 
-            # Group items by potential duplicate criteria
-            processed_items = set()
-
-            for item in all_items:
-                if item.id in processed_items:
+            index = DuplicateIndex()
+            for row in result:
+                scan_results["total_items_scanned"] += 1
+                if row.product_id is None:
                     continue
+                index.add(
+                    item_id=row.id,
+                    name=row.product_name,
+                    brand=row.brand_name,
+                    size=row.size_value,
+                    status=row.status,
+                    external_ids=row.external_ids,
+                )
 
-                # Find all potential duplicates for this item
-                duplicates = await self._find_all_duplicates_for_item(item, all_items)
-
-                if duplicates:
-                    duplicate_group = {
-                        "primary_item_id": str(item.id),
-                        "duplicates": [
-                            {"item_id": str(dup.id), "confidence": 0.9} for dup in duplicates
-                        ],
-                        "can_auto_merge": self._can_auto_merge_group([item] + duplicates),
-                    }
-
-                    scan_results["duplicate_groups"].append(duplicate_group)
-                    scan_results["duplicate_groups_found"] += 1
-                    scan_results["total_duplicates"] += len(duplicates)
+            for primary, duplicates in index.iter_groups():
+                duplicate_group = {
+                    "primary_item_id": str(primary.id),
+                    "duplicates": [
+                        {"item_id": str(dup.id), "confidence": 0.9} for dup in duplicates
+                    ],
+                    "can_auto_merge": self._can_auto_merge_group([primary] + duplicates),
+                }
 
-                    if duplicate_group["can_auto_merge"]:
-                        scan_results["auto_merged"] += 1
-                    else:
-                        scan_results["require_manual_review"] += 1
+                scan_results["duplicate_groups"].append(duplicate_group)
+                scan_results["duplicate_groups_found"] += 1
+                scan_results["total_duplicates"] += len(duplicates)
 
-                    # Mark all items in this group as processed
-                    processed_items.add(item.id)
-                    for dup in duplicates:
-                        processed_items.add(dup.id)
+                if duplicate_group["can_auto_merge"]:
+                    scan_results["auto_merged"] += 1
+                else:
+                    scan_results["require_manual_review"] += 1
 
             self.logger.info("Duplicate detection scan completed", results=scan_results)
             return scan_results
@@ -1673,37 +1692,6 @@ class InventoryService:
             self.logger.error(f"Failed to run duplicate detection scan: {e}")
             return {"error": str(e)}
 
-    async def _find_all_duplicates_for_item(self, item: Any, all_items: List[Any]) -> List[Any]:
-        """Find all duplicate items for a given inventory item"""
-        duplicates = []
-
-        if not item.product:
-            return duplicates
-
-        item_name = item.product.name.lower() if item.product.name else ""
-        item_size = item.size.value if item.size else ""
-        item_brand = item.product.brand.name.lower() if item.product.brand else ""
-
-        for other_item in all_items:
-            if other_item.id == item.id or not other_item.product:
-                continue
-
-            other_name = other_item.product.name.lower() if other_item.product.name else ""
-            other_size = other_item.size.value if other_item.size else ""
-            other_brand = other_item.product.brand.name.lower() if other_item.product.brand else ""
-
-            # Check for exact matches
-            if item_name == other_name and item_size == other_size and item_brand == other_brand:
-                duplicates.append(other_item)
-                continue
-
-            # Check for high similarity matches
-            name_similarity = self._calculate_text_similarity(item_name, other_name)
-            if name_similarity > 0.9 and item_size == other_size and item_brand == other_brand:
-                duplicates.append(other_item)
-
-        return duplicates
-
     def _can_auto_merge_group(self, items: List[Any]) -> bool:
         """Determine if a group of duplicate items can be automatically merged"""
         try:
@@ -1899,13 +1887,19 @@ class InventoryService:
             stockx_listings = {}
             if not enrich_types or "size" in enrich_types:
                 try:
+                    from domains.integration.services.stockx_rate_limiter import (
+                        RequestPriority,
+                        stockx_request_priority,
+                    )
+
                     stockx_service = self.stockx_service
                     if not stockx_service:
                         from domains.integration.services.stockx_service import StockXService
 
                         stockx_service = StockXService(self.db_session)
 
-                    all_listings = await stockx_service.get_all_listings()
+                    with stockx_request_priority(RequestPriority.LISTING_SYNC):
+                        all_listings = await stockx_service.get_all_listings()
                     # Index by listing_id for fast lookup
                     for listing in all_listings:
                         listing_id = listing.get("listingId")
@@ -16,7 +16,7 @@ from shared.database.connection import get_db_session
 
 from ..repositories.pricing_repository import PricingRepository
 from ..services.pricing_engine import PricingContext, PricingEngine, PricingStrategy
-from ..services.smart_pricing_service import SmartPricingService
+from ..services.smart_pricing_service import REPRICING_STRATEGIES, SmartPricingService
 
 logger = structlog.get_logger(__name__)
 
@@ -800,9 +800,13 @@ async def evaluate_profitability_batch(
 async def optimize_inventory_pricing(
     strategy: str = Query(
         "profit_maximization",
-        description="Repricing strategy: profit_maximization, market_competitive, quick_turnover, premium_positioning",
+        description=f"Repricing strategy: {', '.join(REPRICING_STRATEGIES)}",
     ),
     limit: int = Query(50, description="Maximum items to optimize (1-100)"),
+    bulk: bool = Query(
+        False,
+        description="Price items with stored market data in one batch",
+    ),
     db_session: AsyncSession = Depends(get_db_session),
 ):
     """Optimize pricing for inventory using smart algorithms"""
@@ -811,6 +815,13 @@ async def optimize_inventory_pricing(
     if limit < 1 or limit > 100:
         raise HTTPException(status_code=400, detail="Limit must be between 1 and 100")
 
+    if strategy not in REPRICING_STRATEGIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Strategy '{strategy}' is not supported; "
+            f"supported: {', '.join(REPRICING_STRATEGIES)}",
+        )
+
     try:
         smart_pricing = SmartPricingService(db_session)
 
@@ -820,7 +831,7 @@ async def optimize_inventory_pricing(
 
         # Run optimization
         optimization_result = await smart_pricing.optimize_inventory_pricing(
-            inventory_items=items, repricing_strategy=strategy
+            inventory_items=items, repricing_strategy=strategy, bulk=bulk
         )
 
         return {
@@ -958,6 +969,13 @@ async def get_profit_forecast(
     """Generate profit optimization forecast"""
     logger.info("Generating profit forecast", strategy=strategy, timeframe=timeframe_days)
 
+    if strategy not in REPRICING_STRATEGIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Strategy '{strategy}' is not supported; "
+            f"supported: {', '.join(REPRICING_STRATEGIES)}",
+        )
+
     try:
         smart_pricing = SmartPricingService(db_session)
         inventory_service = InventoryService(db_session)
@@ -274,6 +274,127 @@ class PricingRepository:
 
         return competitive_summary
 
+    # =====================================================
+    # BULK PRICING QUERIES
+    # =====================================================
+
+    async def get_market_price_summaries(
+        self, product_ids: List[uuid.UUID], condition: str = "new", days_back: int = 14
+    ) -> List[Any]:
+        """Aggregate recent market prices per product and size in a single query"""
+        if not product_ids:
+            return []
+
+        start_date = date.today() - timedelta(days=days_back)
+        query = (
+            select(
+                MarketPrice.product_id,
+                MarketPrice.size_value,
+                func.avg(MarketPrice.last_sale).label("avg_last_sale"),
+                func.min(MarketPrice.last_sale).label("min_last_sale"),
+                func.avg(MarketPrice.average_price).label("avg_average_price"),
+                func.min(MarketPrice.lowest_ask).label("lowest_ask"),
+                func.max(MarketPrice.highest_bid).label("highest_bid"),
+                func.sum(MarketPrice.sales_volume).label("sales_volume"),
+                func.count(MarketPrice.id).label("data_points"),
+            )
+            .where(
+                MarketPrice.product_id.in_(product_ids),
+                MarketPrice.condition == condition,
+                MarketPrice.price_date >= start_date,
+            )
+            .group_by(MarketPrice.product_id, MarketPrice.size_value)
+        )
+
+        result = await self.db.execute(query)
+        return result.all()
+
+    async def get_recent_asks_bulk(
+        self, product_ids: List[uuid.UUID], days_back: int = 7, limit: int = 5
+    ) -> List[Any]:
+        """
+        Newest ``limit`` market price rows per product within ``days_back`` days,
+        with their rank (1 = newest) and the product's total row count in the window
+        """
+        if not product_ids:
+            return []
+
+        start_date = date.today() - timedelta(days=days_back)
+        ranked = (
+            select(
+                MarketPrice.product_id,
+                MarketPrice.lowest_ask,
+                func.row_number()
+                .over(
+                    partition_by=MarketPrice.product_id,
+                    order_by=(desc(MarketPrice.price_date), desc(MarketPrice.created_at)),
+                )
+                .label("rank"),
+                func.count().over(partition_by=MarketPrice.product_id).label("observations"),
+            )
+            .where(MarketPrice.product_id.in_(product_ids), MarketPrice.price_date >= start_date)
+            .subquery()
+        )
+        query = select(ranked).where(ranked.c.rank <= limit)
+
+        result = await self.db.execute(query)
+        return result.all()
+
+    async def get_latest_prices_bulk(
+        self,
+        ids: List[uuid.UUID],
+        price_type: str = "purchase",
+        key: str = "product_id",
+    ) -> Dict[uuid.UUID, Any]:
+        """Latest price per product (or per inventory item) for many ids at once"""
+        if not ids:
+            return {}
+
+        key_column = getattr(PriceHistory, key)
+        ranked = (
+            select(
+                key_column.label("key"),
+                PriceHistory.price_amount,
+                func.row_number()
+                .over(
+                    partition_by=key_column,
+                    order_by=(desc(PriceHistory.price_date), desc(PriceHistory.created_at)),
+                )
+                .label("rank"),
+            )
+            .where(key_column.in_(ids), PriceHistory.price_type == price_type)
+            .subquery()
+        )
+        query = select(ranked.c.key, ranked.c.price_amount).where(ranked.c.rank == 1)
+
+        result = await self.db.execute(query)
+        return {row.key: row.price_amount for row in result.all()}
+
+    async def get_brand_multipliers_bulk(
+        self, brand_ids: List[uuid.UUID], effective_date: Optional[date] = None
+    ) -> Dict[uuid.UUID, Any]:
+        """Combined (multiplied) effective brand multiplier for many brands at once"""
+        if not brand_ids:
+            return {}
+        if effective_date is None:
+            effective_date = date.today()
+
+        query = select(BrandMultiplier.brand_id, BrandMultiplier.multiplier_value).where(
+            BrandMultiplier.brand_id.in_(brand_ids),
+            BrandMultiplier.active,
+            BrandMultiplier.effective_from <= effective_date,
+            or_(
+                BrandMultiplier.effective_until.is_(None),
+                BrandMultiplier.effective_until >= effective_date,
+            ),
+        )
+
+        result = await self.db.execute(query)
+        combined: Dict[uuid.UUID, Any] = {}
+        for row in result.all():
+            combined[row.brand_id] = combined.get(row.brand_id, 1) * row.multiplier_value
+        return combined
+
     # =====================================================
     # ANALYTICS QUERIES
     # =====================================================
@@ -8,12 +8,19 @@ Services:
 - smart_pricing_service: Smart pricing engine with condition-based pricing
 - auto_listing_service: Automated product listing service
 - pricing_engine: Core pricing calculation engine
+- bulk_repricing_engine: Set-based, vectorized repricing for whole inventory batches
 """
 
-from domains.pricing.services import auto_listing_service, pricing_engine, smart_pricing_service
+from domains.pricing.services import (
+    auto_listing_service,
+    bulk_repricing_engine,
+    pricing_engine,
+    smart_pricing_service,
+)
 
 __all__ = [
     "smart_pricing_service",
     "auto_listing_service",
     "pricing_engine",
+    "bulk_repricing_engine",
 ]
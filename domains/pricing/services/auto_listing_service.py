@@ -495,11 +495,17 @@ class AutoListingService:
             )
 
             if platform.lower() == "stockx":
-                # Execute StockX listing
-                listing_result = await self._create_stockx_listing(
-                    item, listing_price, expires_in_days
+                from domains.integration.services.stockx_rate_limiter import (
+                    RequestPriority,
+                    stockx_request_priority,
                 )
 
+                # Execute StockX listing in the listing lane of the shared scheduler
+                with stockx_request_priority(RequestPriority.LISTING_SYNC):
+                    listing_result = await self._create_stockx_listing(
+                        item, listing_price, expires_in_days
+                    )
+
                 if listing_result["success"]:
                     # Update item status
                     await self._update_item_status_after_listing(item, "listed_stockx")
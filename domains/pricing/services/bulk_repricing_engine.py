@@ -0,0 +1,357 @@
+"""
+Bulk Repricing Engine - Set-based loading and vectorized price recommendations
+Prices whole inventory batches from stored market data in a handful of queries
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import numpy as np
+import pandas as pd
+import structlog
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.database.models import InventoryItem, Product, Size
+
+from ..models import PriceRule
+from ..repositories.pricing_repository import PricingRepository
+from .smart_pricing_service import MarketCondition
+
+logger = structlog.get_logger(__name__)
+
+REPRICEABLE_STATUSES = ("in_stock", "listed_stockx")
+# Same candidate selection as SmartPricingService._get_repriceable_inventory
+REPRICE_AFTER = timedelta(hours=24)
+MAX_CANDIDATES = 100
+
+# Mirrors PricingEngine defaults
+MARKET_POSITIONING = 0.98  # 2% below market average
+MARKET_MIN_MARGIN = 15.0
+COMPETITIVE_MIN_MARGIN = 10.0
+DEFAULT_BRAND_PREMIUM = 1.1
+DEFAULT_COST = 50.0
+COST_FROM_MARKET_RATIO = 0.65
+DYNAMIC_WEIGHTS = {"market": 0.4, "competitive": 0.35, "value": 0.25}
+STRATEGY_CONFIDENCE = {"market_based": 0.90, "competitive": 0.88, "dynamic": 0.92}
+MIN_PRICE_CHANGE = 1.0
+
+
+@dataclass
+class BulkRepricingResult:
+    """Outcome of a bulk repricing run"""
+
+    items_priced: int = 0
+    updates: List[Dict[str, Any]] = field(default_factory=list)
+    profit_increase: Decimal = Decimal("0.00")
+    needs_fresh_data: List[UUID] = field(default_factory=list)
+    market_conditions: Dict[str, int] = field(default_factory=dict)
+
+
+class BulkRepricingEngine:
+    """
+    Batch pricing from stored market data.
+
+    Market summaries, cost basis, current listing prices, brand multipliers and
+    price rules are loaded for all candidates with set-based queries, then the
+    recommendation is computed as pandas/NumPy column operations. Items without
+    stored market data are returned in ``needs_fresh_data`` so the caller can
+    send only those through the rate-limited StockX path.
+
+    Candidate selection, the market condition rule and the dynamic adjustments
+    follow SmartPricingService.get_dynamic_price_recommendation, but results are
+    not identical to that path:
+
+    - prices come from stored ``MarketPrice`` rows, not a live StockX quote
+    - market activity is the stored ``sales_volume``; stored rows carry no
+      ask/bid counts, which the per-item path sums instead
+    - strategy prices use the PricingEngine defaults inline, without its
+      per-context rule and brand lookups
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+        self.repository = PricingRepository(db_session)
+
+    async def price_inventory(self, item_ids: Optional[List[UUID]] = None) -> BulkRepricingResult:
+        """Load everything needed for the candidates and compute recommendations"""
+        items = await self._load_candidates(item_ids)
+        if items.empty:
+            return BulkRepricingResult()
+
+        product_ids = list(items["product_id"].unique())
+        brand_ids = [b for b in items["brand_id"].unique() if b is not None]
+
+        market = await self.repository.get_market_price_summaries(product_ids)
+        recent_asks = await self.repository.get_recent_asks_bulk(product_ids)
+        purchase_prices = await self.repository.get_latest_prices_bulk(product_ids, "purchase")
+        listing_prices = await self.repository.get_latest_prices_bulk(
+            list(items["item_id"]), "listing", key="inventory_item_id"
+        )
+        brand_multipliers = await self.repository.get_brand_multipliers_bulk(brand_ids)
+        rules = await self.repository.get_active_price_rules()
+
+        return self.compute_recommendations(
+            items,
+            pd.DataFrame([row._asdict() for row in market]),
+            pd.DataFrame([row._asdict() for row in recent_asks]),
+            purchase_prices,
+            listing_prices,
+            brand_multipliers,
+            rules,
+        )
+
+    async def _load_candidates(self, item_ids: Optional[List[UUID]]) -> pd.DataFrame:
+        query = (
+            select(
+                InventoryItem.id.label("item_id"),
+                InventoryItem.product_id,
+                InventoryItem.purchase_price,
+                InventoryItem.created_at,
+                Size.value.label("size_value"),
+                Product.brand_id,
+                Product.category_id,
+            )
+            .join(Product, InventoryItem.product_id == Product.id)
+            .join(Size, InventoryItem.size_id == Size.id, isouter=True)
+        )
+        if item_ids is not None:
+            query = query.where(InventoryItem.id.in_(item_ids))
+        else:
+            query = query.where(
+                InventoryItem.status.in_(REPRICEABLE_STATUSES),
+                or_(
+                    InventoryItem.last_price_update.is_(None),
+                    InventoryItem.last_price_update < datetime.utcnow() - REPRICE_AFTER,
+                ),
+            ).limit(MAX_CANDIDATES)
+
+        result = await self.db_session.execute(query)
+        return pd.DataFrame(
+            [row._asdict() for row in result.all()],
+            columns=[
+                "item_id",
+                "product_id",
+                "purchase_price",
+                "created_at",
+                "size_value",
+                "brand_id",
+                "category_id",
+            ],
+        )
+
+    def compute_recommendations(
+        self,
+        items: pd.DataFrame,
+        market: pd.DataFrame,
+        recent_asks: pd.DataFrame,
+        purchase_prices: Dict[UUID, Any],
+        listing_prices: Dict[UUID, Any],
+        brand_multipliers: Dict[UUID, Any],
+        rules: List[PriceRule],
+    ) -> BulkRepricingResult:
+        """Compute recommendations for all items as column operations"""
+        frame = items.copy()
+        frame["purchase_price"] = _to_float(frame["purchase_price"])
+
+        frame = self._attach_market_data(frame, market)
+        has_market = frame["market_avg"].notna()
+        result = BulkRepricingResult(needs_fresh_data=list(frame.loc[~has_market, "item_id"]))
+        frame = frame[has_market].reset_index(drop=True)
+        if frame.empty:
+            return result
+
+        # Cost basis: item purchase price -> latest purchase history -> share of market
+        frame["cost"] = (
+            frame["purchase_price"]
+            .fillna(_to_float(frame["product_id"].map(purchase_prices)))
+            .fillna(frame["market_avg"] * COST_FROM_MARKET_RATIO)
+            .fillna(DEFAULT_COST)
+        )
+
+        frame["condition"] = self._market_conditions(frame, recent_asks)
+        is_bullish = frame["condition"] == MarketCondition.BULLISH
+        is_bearish = frame["condition"] == MarketCondition.BEARISH
+        is_volatile = frame["condition"] == MarketCondition.VOLATILE
+
+        # Strategy prices
+        market_price = np.maximum(
+            frame["market_avg"] * MARKET_POSITIONING,
+            frame["cost"] / (1 - MARKET_MIN_MARGIN / 100),
+        )
+        competitive_price = np.maximum(
+            (frame["competitor_min"].fillna(frame["market_avg"]) + frame["market_avg"]) / 2,
+            frame["cost"] / (1 - COMPETITIVE_MIN_MARGIN / 100),
+        )
+        brand_premium = _to_float(frame["brand_id"].map(brand_multipliers)).fillna(
+            DEFAULT_BRAND_PREMIUM
+        )
+        value_price = market_price * brand_premium
+        dynamic_price = (
+            DYNAMIC_WEIGHTS["market"] * market_price
+            + DYNAMIC_WEIGHTS["competitive"] * competitive_price
+            + DYNAMIC_WEIGHTS["value"] * value_price
+        )
+
+        # Same strategy preference as SmartPricingService/PricingEngine selection
+        base_price = np.select(
+            [is_volatile, is_bearish], [dynamic_price, competitive_price], market_price
+        )
+        confidence = np.select(
+            [is_volatile, is_bearish],
+            [STRATEGY_CONFIDENCE["dynamic"], STRATEGY_CONFIDENCE["competitive"]],
+            STRATEGY_CONFIDENCE["market_based"],
+        )
+
+        # Rule-based minimum margins, then psychological price points
+        min_margin = self._minimum_margins(frame, rules)
+        base_price = np.maximum(base_price, frame["cost"] / (1 - min_margin / 100))
+        base_price = _psychological_prices(base_price)
+
+        # Dynamic adjustments (percent): inventory age, market activity, market condition
+        now = pd.Timestamp.now(tz=timezone.utc)
+        days_old = (now - pd.to_datetime(frame["created_at"], utc=True)).dt.days.fillna(0)
+        adjustment = np.where(days_old > 30, -np.minimum(days_old * 0.1, 5.0), 0.0)
+        volume = frame["sales_volume"].fillna(0)
+        adjustment += np.select([volume > 100, volume < 10], [2.0, -3.0], 0.0)
+        adjustment += np.select([is_bullish, is_bearish], [3.0, -4.0], 0.0)
+
+        final_price = np.round(base_price * (1 + adjustment / 100), 2)
+        current_price = _to_float(frame["item_id"].map(listing_prices)).fillna(0.0)
+        margin = np.round((final_price - frame["cost"]) / final_price * 100, 2)
+
+        changed = np.abs(final_price - current_price) > MIN_PRICE_CHANGE
+        result.items_priced = len(frame)
+        result.market_conditions = frame["condition"].value_counts().to_dict()
+
+        for idx in np.flatnonzero(changed.to_numpy()):
+            result.updates.append(
+                {
+                    "item_id": str(frame.at[idx, "item_id"]),
+                    "current_price": float(current_price.iat[idx]),
+                    "recommended_price": float(final_price.iat[idx]),
+                    "expected_margin": float(margin.iat[idx]),
+                    "confidence": float(confidence[idx]),
+                    "market_condition": frame.at[idx, "condition"],
+                }
+            )
+
+        result.profit_increase = Decimal(
+            str(round(float((final_price - current_price)[changed].sum()), 2))
+        )
+        return result
+
+    def _attach_market_data(self, frame: pd.DataFrame, market: pd.DataFrame) -> pd.DataFrame:
+        """Join size-level market summaries, falling back to product-level aggregates"""
+        price_columns = ["avg_last_sale", "min_last_sale", "avg_average_price", "lowest_ask"]
+        if market.empty:
+            frame["market_avg"] = np.nan
+            frame["competitor_min"] = np.nan
+            frame["sales_volume"] = np.nan
+            return frame
+
+        market = market.copy()
+        for column in price_columns + ["sales_volume"]:
+            market[column] = _to_float(market[column])
+
+        product_level = market.groupby("product_id", as_index=False).agg(
+            p_avg_last_sale=("avg_last_sale", "mean"),
+            p_min_last_sale=("min_last_sale", "min"),
+            p_avg_average_price=("avg_average_price", "mean"),
+            p_lowest_ask=("lowest_ask", "min"),
+            p_sales_volume=("sales_volume", "sum"),
+        )
+
+        frame = frame.merge(market, on=["product_id", "size_value"], how="left")
+        frame = frame.merge(product_level, on="product_id", how="left")
+
+        frame["market_avg"] = (
+            frame["avg_last_sale"]
+            .fillna(frame["avg_average_price"])
+            .fillna(frame["p_avg_last_sale"])
+            .fillna(frame["p_avg_average_price"])
+        )
+        frame["competitor_min"] = (
+            frame["min_last_sale"]
+            .fillna(frame["lowest_ask"])
+            .fillna(frame["p_min_last_sale"])
+            .fillna(frame["p_lowest_ask"])
+        )
+        frame["sales_volume"] = frame["sales_volume"].fillna(frame["p_sales_volume"])
+        return frame
+
+    def _market_conditions(self, frame: pd.DataFrame, recent_asks: pd.DataFrame) -> pd.Series:
+        """Classify each product's market as in SmartPricingService._analyze_market_condition"""
+        if recent_asks.empty:
+            return pd.Series(MarketCondition.STABLE, index=frame.index)
+
+        asks = recent_asks.copy()
+        asks["lowest_ask"] = _to_float(asks["lowest_ask"])
+        # Missing and zero asks are skipped, as the per-item path does
+        asks = asks[(asks["observations"] >= 3) & (asks["lowest_ask"] > 0)]
+        asks = asks.sort_values(["product_id", "rank"])
+
+        # Change of each ask against the next older one, in percent
+        older = asks.groupby("product_id")["lowest_ask"].shift(-1)
+        asks["change"] = (asks["lowest_ask"] - older) / older * 100
+        asks["abs_change"] = asks["change"].abs()
+
+        trends = asks.groupby("product_id").agg(
+            asks=("lowest_ask", "size"),
+            changes=("change", "count"),
+            avg_change=("change", "mean"),
+            volatility=("abs_change", "mean"),
+        )
+        enough_data = (trends["asks"] >= 3) & (trends["changes"] >= 2)
+
+        trends["condition"] = np.select(
+            [
+                enough_data & (trends["volatility"] > 10),
+                enough_data & (trends["avg_change"] > 3),
+                enough_data & (trends["avg_change"] < -3),
+            ],
+            [MarketCondition.VOLATILE, MarketCondition.BULLISH, MarketCondition.BEARISH],
+            MarketCondition.STABLE,
+        )
+        conditions = frame["product_id"].map(trends["condition"])
+        return conditions.fillna(MarketCondition.STABLE)
+
+    def _minimum_margins(self, frame: pd.DataFrame, rules: List[PriceRule]) -> pd.Series:
+        """Highest applicable rule minimum margin per item (0 when no rule applies)"""
+        margin_rules = [rule for rule in rules if rule.minimum_margin_percent]
+        if not margin_rules:
+            return pd.Series(0.0, index=frame.index)
+
+        def applicable_margin(brand_id: Any, category_id: Any) -> float:
+            margins = [
+                float(rule.minimum_margin_percent)
+                for rule in margin_rules
+                if rule.brand_id in (None, brand_id) and rule.category_id in (None, category_id)
+            ]
+            return max(margins, default=0.0)
+
+        keys = list(zip(frame["brand_id"], frame["category_id"]))
+        lookup = {key: applicable_margin(*key) for key in set(keys)}
+        return pd.Series([lookup[key] for key in keys], index=frame.index)
+
+
+def _to_float(values: pd.Series) -> pd.Series:
+    """Convert a column of Decimal/None values to float64"""
+    return pd.to_numeric(values.astype(object).where(values.notna(), None), errors="coerce")
+
+
+def _psychological_prices(prices: np.ndarray) -> pd.Series:
+    """Vectorized PricingEngine._apply_psychological_pricing"""
+    prices = pd.Series(prices, dtype="float64")
+    rounded = np.round(prices)
+    return pd.Series(
+        np.select(
+            [prices < 20, prices < 100],
+            [np.maximum(rounded - 0.05, 0.95), np.maximum(rounded - 0.01, 0.99)],
+            np.maximum(np.round(prices / 5) * 5, 5.0),
+        ),
+        index=prices.index,
+    )
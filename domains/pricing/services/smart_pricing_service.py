@@ -22,6 +22,10 @@ from ..services.pricing_engine import PricingContext, PricingEngine, PricingStra
 
 logger = structlog.get_logger(__name__)
 
+# Recommendations follow the market condition in both the per-item and the bulk
+# path; no other repricing strategy is implemented by either
+REPRICING_STRATEGIES = ("profit_maximization",)
+
 
 class MarketCondition:
     """Market condition analysis"""
@@ -56,26 +60,34 @@ class SmartPricingService:
         self,
         inventory_items: Optional[List[InventoryItem]] = None,
         repricing_strategy: str = "profit_maximization",
+        bulk: bool = False,
     ) -> Dict[str, Any]:
         """
         Optimize pricing for entire inventory or specific items
 
         Strategies:
         - profit_maximization: Maximize profit margins
-        - market_competitive: Stay competitive with market
-        - quick_turnover: Price for fast sales
-        - premium_positioning: Price as premium option
+
+        Other strategies raise ValueError in either mode.
+
+        With ``bulk=True`` all items with stored market data are priced in one
+        vectorized pass (see BulkRepricingEngine); only items lacking market data
+        go through the rate-limited per-item StockX path.
         """
-        logger.info("Starting inventory pricing optimization", strategy=repricing_strategy)
+        if repricing_strategy not in REPRICING_STRATEGIES:
+            raise ValueError(
+                f"Repricing strategy '{repricing_strategy}' is not supported; "
+                f"supported: {', '.join(REPRICING_STRATEGIES)}"
+            )
 
-        start_time = datetime.utcnow()
+        logger.info(
+            "Starting inventory pricing optimization", strategy=repricing_strategy, bulk=bulk
+        )
 
-        if not inventory_items:
-            # Get all active inventory items that need repricing
-            inventory_items = await self._get_repriceable_inventory()
+        start_time = datetime.utcnow()
 
         optimization_results = {
-            "total_items_processed": len(inventory_items),
+            "total_items_processed": 0,
             "successful_optimizations": 0,
             "pricing_updates": [],
             "potential_profit_increase": Decimal("0.00"),
@@ -83,6 +95,34 @@ class SmartPricingService:
             "processing_time_ms": 0,
         }
 
+        if bulk:
+            from .bulk_repricing_engine import BulkRepricingEngine
+
+            bulk_result = await BulkRepricingEngine(self.db_session).price_inventory(
+                [item.id for item in inventory_items] if inventory_items else None
+            )
+            optimization_results["total_items_processed"] = bulk_result.items_priced
+            optimization_results["successful_optimizations"] = len(bulk_result.updates)
+            optimization_results["pricing_updates"] = bulk_result.updates
+            optimization_results["potential_profit_increase"] = bulk_result.profit_increase
+            optimization_results["market_insights"] = {
+                "market_conditions": bulk_result.market_conditions,
+                "items_needing_fresh_data": len(bulk_result.needs_fresh_data),
+            }
+
+            # Only items without stored market data need the external API
+            inventory_items = []
+            if bulk_result.needs_fresh_data:
+                fresh_query = await self.db_session.execute(
+                    select(InventoryItem).where(InventoryItem.id.in_(bulk_result.needs_fresh_data))
+                )
+                inventory_items = fresh_query.scalars().all()
+        elif not inventory_items:
+            # Get all active inventory items that need repricing
+            inventory_items = await self._get_repriceable_inventory()
+
+        optimization_results["total_items_processed"] += len(inventory_items)
+
         # Process items in batches to avoid API rate limits
         batch_size = 10
         for i in range(0, len(inventory_items), batch_size):
@@ -361,10 +401,10 @@ class SmartPricingService:
             .where(
                 and_(
                     MarketPrice.product_id == product_id,
-                    MarketPrice.recorded_at >= datetime.utcnow() - timedelta(days=7),
+                    MarketPrice.price_date >= datetime.utcnow().date() - timedelta(days=7),
                 )
             )
-            .order_by(MarketPrice.recorded_at.desc())
+            .order_by(MarketPrice.price_date.desc(), MarketPrice.created_at.desc())
         )
         historical_prices = historical_query.scalars().all()
 
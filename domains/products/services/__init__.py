@@ -6,14 +6,21 @@ Business logic for product catalog and brand intelligence.
 
 Services:
 - brand_service: Brand extraction and intelligence
+- brand_matcher: Compiled multi-pattern brand matcher used by brand_service
 - category_service: Category detection and classification
 - product_processor: Product data processing
 """
 
-from domains.products.services import brand_service, category_service, product_processor
+from domains.products.services import (
+    brand_matcher,
+    brand_service,
+    category_service,
+    product_processor,
+)
 
 __all__ = [
     "brand_service",
+    "brand_matcher",
     "category_service",
     "product_processor",
 ]
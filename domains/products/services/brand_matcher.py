@@ -0,0 +1,216 @@
+"""
+Compiled brand matcher
+
+Matches product names against the full BrandPattern set in one pass instead of
+testing every pattern per name. Keyword patterns are folded into an Aho-Corasick
+automaton, regex patterns are pre-compiled and fronted by a single alternation that
+rejects names no regex can match, and results are memoized per case-normalized
+name. The outcome is identical to checking the
+patterns one by one in priority order and returning the first that matches.
+"""
+
+import re
+from collections import OrderedDict, deque
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_CACHE_SIZE = 10_000
+
+# Patterns that cannot be embedded in the alternation (group references would be renumbered)
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+_NO_MATCH = -1
+
+
+class AhoCorasickAutomaton:
+    """Keyword automaton that reports the lowest pattern index found in a text"""
+
+    def __init__(self, keywords: Sequence[Tuple[str, int]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._best: List[Optional[int]] = [None]
+
+        for keyword, index in keywords:
+            node = 0
+            for char in keyword:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._best.append(None)
+                node = next_node
+            if self._best[node] is None or index < self._best[node]:
+                self._best[node] = index
+
+        self._fail = [0] * len(self._goto)
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                # Fold the best match reachable through the failure link into the node
+                inherited = self._best[self._fail[child]]
+                if inherited is not None and (
+                    self._best[child] is None or inherited < self._best[child]
+                ):
+                    self._best[child] = inherited
+
+    def lowest_match(self, text: str) -> Optional[int]:
+        goto, fail, best_at = self._goto, self._fail, self._best
+        best = best_at[0]
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            candidate = best_at[node]
+            if candidate is not None and (best is None or candidate < best):
+                best = candidate
+                if best == 0:
+                    break
+        return best
+
+
+class BrandMatcher:
+    """
+    Compiled form of an ordered BrandPattern list.
+
+    ``match`` returns the index (into the list the matcher was built from) of the
+    first pattern, in priority order, that matches the name, or None.
+    """
+
+    def __init__(
+        self,
+        patterns: Sequence[Tuple[str, str]],
+        version: Hashable = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Args:
+            patterns: (pattern_type, pattern) pairs in priority order
+            version: Identifier of the pattern set the matcher was built from
+            cache_size: Maximum number of memoized names
+        """
+        self.version = version
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        keywords: List[Tuple[str, int]] = []
+        regexes: List[Tuple[int, str]] = []
+        for index, (pattern_type, pattern) in enumerate(patterns):
+            if pattern_type == "keyword":
+                keywords.append((pattern.lower(), index))
+            elif pattern_type == "regex":
+                try:
+                    re.compile(pattern, re.IGNORECASE)
+                except re.error as e:
+                    logger.warning(
+                        "Invalid regex pattern in database", pattern=pattern, error=str(e)
+                    )
+                    continue
+                regexes.append((index, pattern))
+
+        self._keywords = AhoCorasickAutomaton(keywords) if keywords else None
+        self._regexes = [(index, re.compile(p, re.IGNORECASE)) for index, p in regexes]
+        self._prefilter, self._unfiltered = self._compile_prefilter(regexes)
+
+    @staticmethod
+    def _compile_prefilter(
+        regexes: List[Tuple[int, str]],
+    ) -> Tuple[Optional[re.Pattern], List[Tuple[int, re.Pattern]]]:
+        """
+        Fold the regexes, in priority order, into one non-capturing alternation.
+        A single search of it tells whether any regex can match at all, so names
+        without a regex hit never run the per-pattern checks. Patterns that cannot
+        be embedded (backreferences would be renumbered) are always checked.
+        """
+        embeddable = [p for _, p in regexes if not _BACKREFERENCE.search(p)]
+        unfiltered = [
+            (index, re.compile(p, re.IGNORECASE))
+            for index, p in regexes
+            if _BACKREFERENCE.search(p)
+        ]
+        if not embeddable:
+            return None, unfiltered
+
+        try:
+            prefilter = re.compile("|".join(f"(?:{p})" for p in embeddable), re.IGNORECASE)
+        except re.error as e:
+            # e.g. inline global flags or clashing group names; check every regex individually
+            logger.info("Brand regexes not combinable, matching individually", error=str(e))
+            return None, [(index, re.compile(p, re.IGNORECASE)) for index, p in regexes]
+        return prefilter, unfiltered
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return name.lower()
+
+    def match(self, name: str) -> Optional[int]:
+        key = self.normalize(name)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return None if cached == _NO_MATCH else cached
+
+        self.misses += 1
+        result = self._match_uncached(key)
+        self._cache[key] = _NO_MATCH if result is None else result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def _match_uncached(self, text: str) -> Optional[int]:
+        best = self._keywords.lowest_match(text) if self._keywords else None
+
+        if self._prefilter is not None and self._prefilter.search(text):
+            candidates = self._regexes
+        else:
+            candidates = self._unfiltered
+
+        # Only regexes ranked above the best keyword hit can change the result
+        for index, compiled in candidates:
+            if best is not None and index >= best:
+                break
+            if compiled.search(text):
+                return index
+
+        return best
+
+    def stats(self) -> Dict[str, int]:
+        return {"cached_names": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+_shared_matcher: Optional[BrandMatcher] = None
+
+
+def get_brand_matcher(patterns: Sequence[Tuple[str, str]]) -> BrandMatcher:
+    """
+    Return the process-wide matcher for ``patterns``, rebuilding it only when the
+    pattern set (its version) differs from the one currently compiled.
+    """
+    global _shared_matcher
+    version = tuple(patterns)
+    if _shared_matcher is None or _shared_matcher.version != version:
+        _shared_matcher = BrandMatcher(patterns, version=version)
+        logger.info("Compiled brand matcher", patterns=len(version))
+    return _shared_matcher
+
+
+def invalidate_brand_matcher() -> None:
+    """Drop the compiled matcher and its cache, e.g. after brand patterns were edited"""
+    global _shared_matcher
+    _shared_matcher = None
@@ -1,11 +1,16 @@
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import structlog
 from slugify import slugify
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from domains.products.services.brand_matcher import (
+    BrandMatcher,
+    get_brand_matcher,
+    invalidate_brand_matcher,
+)
 from shared.database.models import Brand, BrandPattern
 
 logger = structlog.get_logger(__name__)
@@ -20,6 +25,8 @@ class BrandExtractorService:
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
         self._patterns: List[BrandPattern] = []
+        self._matcher: Optional[BrandMatcher] = None
+        self._matcher_patterns: Optional[List[BrandPattern]] = None
 
     async def load_patterns(self):
         """
@@ -59,30 +66,17 @@ class BrandExtractorService:
         if not product_name:
             return None
 
-        # First try: Pattern matching (DB-driven)
-        for p in self._patterns:
-            try:
-                if p.pattern_type == "regex":
-                    if re.search(p.pattern, product_name, re.IGNORECASE):
-                        logger.debug(
-                            "Found brand match via pattern",
-                            brand=p.brand.name,
-                            pattern=p.pattern,
-                            product=product_name,
-                        )
-                        return p.brand
-                elif p.pattern_type == "keyword":
-                    if p.pattern.lower() in product_name.lower():
-                        logger.debug(
-                            "Found brand match via keyword",
-                            brand=p.brand.name,
-                            pattern=p.pattern,
-                            product=product_name,
-                        )
-                        return p.brand
-            except re.error as e:
-                logger.warning("Invalid regex pattern in database", pattern=p.pattern, error=str(e))
-                continue
+        # First try: Pattern matching (DB-driven, compiled matcher)
+        pattern = self._match_pattern(product_name)
+        if pattern is not None:
+            logger.debug(
+                "Found brand match via pattern",
+                brand=pattern.brand.name,
+                pattern=pattern.pattern,
+                pattern_type=pattern.pattern_type,
+                product=product_name,
+            )
+            return pattern.brand
 
         # Second try: Intelligent fallback
         if create_if_not_found:
@@ -99,6 +93,68 @@ class BrandExtractorService:
         logger.debug("No brand match found for product", product_name=product_name)
         return None
 
+    async def extract_brands_bulk(
+        self, names: Sequence[Optional[str]], create_if_not_found: bool = False
+    ) -> List[Optional[Brand]]:
+        """
+        Extract brands for many product names at once (e.g. a whole import batch).
+
+        Duplicate names are matched once and the compiled matcher's cache is warmed
+        for later per-record calls.
+
+        Args:
+            names: Product names; empty or None entries yield None
+            create_if_not_found: If True, creates brands via intelligent fallback
+
+        Returns:
+            Brand (or None) for each name, in input order
+        """
+        if not self._patterns:
+            await self.load_patterns()
+
+        resolved: Dict[str, Optional[Brand]] = {}
+        for name in names:
+            if not name or name in resolved:
+                continue
+            pattern = self._match_pattern(name)
+            resolved[name] = pattern.brand if pattern is not None else None
+
+        if create_if_not_found:
+            for name, brand in resolved.items():
+                if brand is None:
+                    brand_name = self._intelligent_brand_extraction(name)
+                    if brand_name:
+                        resolved[name] = await self._get_or_create_brand(brand_name)
+
+        logger.debug(
+            "Extracted brands in bulk",
+            names=len(names),
+            unique_names=len(resolved),
+            matched=sum(1 for brand in resolved.values() if brand is not None),
+        )
+        return [resolved.get(name) if name else None for name in names]
+
+    def invalidate_patterns(self) -> None:
+        """
+        Forget loaded patterns and the compiled matcher so the next extraction
+        reloads them. Call after brand patterns are created, edited or deleted.
+        """
+        self._patterns = []
+        self._matcher = None
+        self._matcher_patterns = None
+        invalidate_brand_matcher()
+
+    def _get_matcher(self) -> BrandMatcher:
+        # Rebuild only when the pattern list was (re)loaded or replaced
+        if self._matcher is None or self._matcher_patterns is not self._patterns:
+            self._matcher = get_brand_matcher([(p.pattern_type, p.pattern) for p in self._patterns])
+            self._matcher_patterns = self._patterns
+        return self._matcher
+
+    def _match_pattern(self, product_name: str) -> Optional[BrandPattern]:
+        index = self._get_matcher().match(product_name)
+        return self._patterns[index] if index is not None else None
+
     def _intelligent_brand_extraction(self, product_name: str) -> Optional[str]:
         """
         Intelligently extract brand from product name when no pattern matches.
@@ -0,0 +1,551 @@
+"""
+Bulk Sales Materialization
+Resolves the platforms, products, sizes and inventory items behind a whole import
+batch with set-based queries, so creating sales costs a handful of statements per
+batch instead of several queries per record
+"""
+
+import math
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Union
+from uuid import UUID
+
+import structlog
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.database.models import (
+    Category,
+    ImportRecord,
+    InventoryItem,
+    Platform,
+    Product,
+    Size,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Rows per multi-row INSERT and values per IN (...) list; keeps every statement
+# well below PostgreSQL's 32767 bind parameter limit
+CHUNK_SIZE = 1000
+
+DEFAULT_CATEGORY_NAME = "Footwear"
+DEFAULT_CATEGORY_SLUG = "footwear"
+
+
+def _chunks(items: Sequence[Any], size: int = CHUNK_SIZE) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+@dataclass
+class SaleRecord:
+    """One importable sale and the dimension rows resolved for it"""
+
+    record_id: UUID
+    batch_id: UUID
+    data: Dict[str, Any]
+    platform: str
+    order_number: str
+    external_id: str
+    product_name: str
+    sku: Optional[str]
+    size: str
+    platform_id: Optional[UUID] = None
+    inventory_item_id: Optional[UUID] = None
+
+    @property
+    def lookup_ids(self) -> Set[str]:
+        """External IDs an already imported copy of this sale may be stored under"""
+        return {self.external_id, f"{self.platform}_{self.order_number}"}
+
+
+class SalesBatchMaterializer:
+    """Base for processors that turn processed import records into sales rows"""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+        self._default_category_id: Optional[UUID] = None
+
+    async def _load_batch_records(self, batch_id: str) -> List[ImportRecord]:
+        query = select(ImportRecord).where(
+            ImportRecord.batch_id == batch_id, ImportRecord.status == "processed"
+        )
+        result = await self.db_session.execute(query)
+        return list(result.scalars().all())
+
+    async def _materialize_sales(
+        self, records: Iterable[ImportRecord], sale_model: Any, errors: List[str]
+    ) -> List[SaleRecord]:
+        """
+        Resolve everything a batch of sales needs before it can be inserted
+
+        Args:
+            records: Processed import records
+            sale_model: Model the sales end up in (Order or Transaction)
+            errors: Receives one message per record that could not be read
+
+        Returns:
+            New sales with platform_id and inventory_item_id set; records that are
+            incomplete or already imported are left out
+        """
+        sales = self._parse_sale_records(records, errors)
+        sales = await self._drop_existing_sales(sales, sale_model)
+        if not sales:
+            return []
+
+        platform_ids = await self._resolve_platforms({sale.platform for sale in sales})
+        for sale in sales:
+            sale.platform_id = platform_ids[sale.platform]
+
+        await self._create_inventory_items(sales)
+
+        logger.info("Sales materialized", sales=len(sales), platforms=len(platform_ids))
+        return sales
+
+    async def _insert_sales(
+        self,
+        sale_model: Any,
+        sales: List[SaleRecord],
+        build_row: Callable[[SaleRecord], Dict[str, Any]],
+        inventory_column: str,
+        errors: List[str],
+    ) -> int:
+        """
+        Bulk insert one row per sale, ignoring rows that collide with existing sales
+
+        Placeholder inventory items of sales that were not inserted are removed again.
+
+        Args:
+            sale_model: Model the sales are inserted into
+            sales: Materialized sales
+            build_row: Builds the sale_model row for a sale
+            inventory_column: Column of sale_model referencing the inventory item
+            errors: Receives one message per sale whose row could not be built
+
+        Returns:
+            Number of sales inserted
+        """
+        label = sale_model.__name__.lower()
+        rows = []
+        for sale in sales:
+            try:
+                rows.append(build_row(sale))
+            except Exception as e:
+                errors.append(f"Failed to create {label} for record {sale.record_id}: {str(e)}")
+                logger.error(
+                    f"{sale_model.__name__} creation failed",
+                    record_id=str(sale.record_id),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+        inserted: Set[UUID] = set()
+        for chunk in _chunks(rows):
+            stmt = insert(sale_model).values(list(chunk)).on_conflict_do_nothing()
+            result = await self.db_session.execute(
+                stmt.returning(getattr(sale_model, inventory_column))
+            )
+            inserted.update(result.scalars().all())
+
+        orphaned = [
+            sale.inventory_item_id for sale in sales if sale.inventory_item_id not in inserted
+        ]
+        for chunk in _chunks(orphaned):
+            await self.db_session.execute(
+                delete(InventoryItem).where(InventoryItem.id.in_(list(chunk)))
+            )
+
+        if len(inserted) < len(rows):
+            logger.info("Skipped conflicting sales", count=len(rows) - len(inserted))
+
+        return len(inserted)
+
+    # ===== Record parsing =====
+
+    def _parse_sale_records(
+        self, records: Iterable[ImportRecord], errors: List[str]
+    ) -> List[SaleRecord]:
+        sales = []
+        for record in records:
+            try:
+                sale = self._parse_sale_record(record)
+            except Exception as e:
+                errors.append(f"Failed to read record {record.id}: {str(e)}")
+                logger.error(
+                    "Sale record parsing failed",
+                    record_id=str(record.id),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                continue
+            if sale:
+                sales.append(sale)
+        return sales
+
+    def _parse_sale_record(self, import_record: ImportRecord) -> Optional[SaleRecord]:
+        processed_data = import_record.processed_data
+        if not processed_data:
+            return None
+
+        source_platform = (
+            processed_data.get("source_platform") or processed_data.get("platform") or ""
+        ).lower()
+        order_number = processed_data.get("order_number")
+        product_name = processed_data.get("product_name", processed_data.get("item_name", ""))
+
+        if not order_number or not source_platform or not product_name:
+            return None
+
+        external_transaction_id = processed_data.get("external_transaction_id")
+
+        return SaleRecord(
+            record_id=import_record.id,
+            batch_id=import_record.batch_id,
+            data=processed_data,
+            platform=source_platform,
+            order_number=str(order_number),
+            external_id=str(external_transaction_id or f"{source_platform}_{order_number}"),
+            product_name=product_name,
+            sku=self._normalize_sku(processed_data.get("sku", "")),
+            size=processed_data.get("size") or "Unknown",
+        )
+
+    # ===== Dimension resolution =====
+
+    async def _drop_existing_sales(
+        self, sales: List[SaleRecord], sale_model: Any
+    ) -> List[SaleRecord]:
+        """Drop sales already stored in sale_model and duplicates within the batch"""
+        lookup_ids = sorted({lookup_id for sale in sales for lookup_id in sale.lookup_ids})
+
+        existing: Set[str] = set()
+        for chunk in _chunks(lookup_ids):
+            result = await self.db_session.execute(
+                select(sale_model.external_id).where(sale_model.external_id.in_(list(chunk)))
+            )
+            existing.update(result.scalars().all())
+
+        new_sales = []
+        for sale in sales:
+            if existing.isdisjoint(sale.lookup_ids):
+                new_sales.append(sale)
+                existing.add(sale.external_id)
+        return new_sales
+
+    async def _resolve_platforms(self, platform_names: Set[str]) -> Dict[str, UUID]:
+        """Map platform names to IDs, creating missing platforms in one insert"""
+        platform_ids = await self._find_platforms(platform_names)
+
+        missing = sorted(platform_names - platform_ids.keys())
+        if missing:
+            await self.db_session.execute(
+                insert(Platform)
+                .values(
+                    [
+                        {
+                            "id": uuid.uuid4(),
+                            "name": name.title(),
+                            "slug": name,
+                            "fee_percentage": self._get_default_fee_percentage(name),
+                            "supports_fees": self._platform_supports_fees(name),
+                            "active": True,
+                        }
+                        for name in missing
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+            logger.info("Created new platforms", names=missing)
+            platform_ids.update(await self._find_platforms(set(missing)))
+
+        return platform_ids
+
+    async def _find_platforms(self, platform_names: Set[str]) -> Dict[str, UUID]:
+        names = list(platform_names)
+        result = await self.db_session.execute(
+            select(Platform.id, Platform.name, Platform.slug).where(
+                or_(func.lower(Platform.name).in_(names), Platform.slug.in_(names))
+            )
+        )
+
+        by_name: Dict[str, UUID] = {}
+        by_slug: Dict[str, UUID] = {}
+        for row in result.fetchall():
+            by_name.setdefault(row.name.lower(), row.id)
+            by_slug.setdefault(row.slug, row.id)
+
+        return {
+            name: by_slug.get(name) or by_name[name]
+            for name in platform_names
+            if name in by_slug or name in by_name
+        }
+
+    async def _resolve_products(self, sales: List[SaleRecord]) -> Dict[int, UUID]:
+        """
+        Map each sale (by position) to a product ID
+
+        Products are matched by SKU first and by name second, like a manual lookup
+        would; the rest are created with one multi-row insert.
+        """
+        skus = sorted({sale.sku for sale in sales if sale.sku})
+        by_sku: Dict[str, UUID] = {}
+        for chunk in _chunks(skus):
+            result = await self.db_session.execute(
+                select(Product.id, Product.sku).where(Product.sku.in_(list(chunk)))
+            )
+            by_sku.update({row.sku: row.id for row in result.fetchall()})
+
+        names = sorted({sale.product_name for sale in sales if sale.sku not in by_sku})
+        by_name: Dict[str, UUID] = {}
+        skuless: Set[UUID] = set()
+        for chunk in _chunks(names):
+            result = await self.db_session.execute(
+                select(Product.id, Product.name, Product.sku).where(Product.name.in_(list(chunk)))
+            )
+            for row in result.fetchall():
+                if row.name not in by_name:
+                    by_name[row.name] = row.id
+                    if not row.sku:
+                        skuless.add(row.id)
+
+        product_ids: Dict[int, UUID] = {}
+        sku_backfill: Dict[UUID, str] = {}
+        new_products: Dict[str, Dict[str, Any]] = {}
+        category_id = None
+
+        for index, sale in enumerate(sales):
+            if sale.sku and sale.sku in by_sku:
+                product_ids[index] = by_sku[sale.sku]
+                continue
+
+            if sale.product_name in by_name:
+                product_id = by_name[sale.product_name]
+                # A product matched by name that has no SKU yet takes the imported one
+                if sale.sku and product_id in skuless:
+                    logger.info(
+                        "Updating existing product with new SKU",
+                        product_name=sale.product_name,
+                        new_sku=sale.sku,
+                    )
+                    sku_backfill[product_id] = sale.sku
+                    skuless.discard(product_id)
+                    by_sku[sale.sku] = product_id
+                product_ids[index] = product_id
+                continue
+
+            key = sale.sku or sale.product_name
+            if key not in new_products:
+                if category_id is None:
+                    category_id = await self._get_or_create_default_category()
+                new_products[key] = {
+                    "id": uuid.uuid4(),
+                    "sku": sale.sku or self._generate_sku(sale.product_name),
+                    "name": sale.product_name,
+                    "category_id": category_id,
+                    "description": f"Auto-created from import: {sale.product_name}",
+                }
+            product_ids[index] = new_products[key]["id"]
+
+        if sku_backfill:
+            await self.db_session.execute(
+                update(Product),
+                [{"id": product_id, "sku": sku} for product_id, sku in sku_backfill.items()],
+            )
+
+        if new_products:
+            await self._insert_products(list(new_products.values()), product_ids)
+
+        return product_ids
+
+    async def _insert_products(
+        self, rows: List[Dict[str, Any]], product_ids: Dict[int, UUID]
+    ) -> None:
+        inserted: Set[UUID] = set()
+        for chunk in _chunks(rows):
+            result = await self.db_session.execute(
+                insert(Product).values(list(chunk)).on_conflict_do_nothing().returning(Product.id)
+            )
+            inserted.update(result.scalars().all())
+
+        logger.info("Created new products", count=len(inserted))
+
+        # Rows that lost a SKU race to a concurrent import point at the winner instead
+        lost = {row["sku"]: row["id"] for row in rows if row["id"] not in inserted}
+        if not lost:
+            return
+
+        result = await self.db_session.execute(
+            select(Product.id, Product.sku).where(Product.sku.in_(list(lost)))
+        )
+        replacements = {lost[row.sku]: row.id for row in result.fetchall()}
+        for index, product_id in product_ids.items():
+            product_ids[index] = replacements.get(product_id, product_id)
+
+    async def _resolve_sizes(self, size_values: Set[str]) -> Dict[str, UUID]:
+        """Map size values to IDs, creating missing sizes in one insert"""
+        values = sorted(size_values)
+        size_ids: Dict[str, UUID] = {}
+        for chunk in _chunks(values):
+            result = await self.db_session.execute(
+                select(Size.id, Size.value).where(Size.value.in_(list(chunk)))
+            )
+            for row in result.fetchall():
+                size_ids.setdefault(row.value, row.id)
+
+        missing = [value for value in values if value not in size_ids]
+        if missing:
+            category_id = await self._get_or_create_default_category()
+            rows = [
+                {
+                    "id": uuid.uuid4(),
+                    "category_id": category_id,
+                    "value": value,
+                    "region": "US",  # Default to US sizing
+                }
+                for value in missing
+            ]
+            for chunk in _chunks(rows):
+                await self.db_session.execute(insert(Size).values(list(chunk)))
+            size_ids.update({row["value"]: row["id"] for row in rows})
+
+        return size_ids
+
+    async def _get_or_create_default_category(self) -> UUID:
+        if self._default_category_id is not None:
+            return self._default_category_id
+
+        query = select(Category.id).where(Category.name == DEFAULT_CATEGORY_NAME).limit(1)
+        category_id = (await self.db_session.execute(query)).scalars().first()
+
+        if category_id is None:
+            await self.db_session.execute(
+                insert(Category)
+                .values(id=uuid.uuid4(), name=DEFAULT_CATEGORY_NAME, slug=DEFAULT_CATEGORY_SLUG)
+                .on_conflict_do_nothing()
+            )
+            query = select(Category.id).where(Category.slug == DEFAULT_CATEGORY_SLUG)
+            category_id = (await self.db_session.execute(query)).scalars().first()
+
+        self._default_category_id = category_id
+        return category_id
+
+    async def _create_inventory_items(self, sales: List[SaleRecord]) -> None:
+        """Create one sold placeholder inventory item per sale"""
+        product_ids = await self._resolve_products(sales)
+        size_ids = await self._resolve_sizes({sale.size for sale in sales})
+
+        rows = []
+        for index, sale in enumerate(sales):
+            sale.inventory_item_id = uuid.uuid4()
+            rows.append(
+                {
+                    "id": sale.inventory_item_id,
+                    "product_id": product_ids[index],
+                    "size_id": size_ids[sale.size],
+                    "quantity": 1,
+                    "status": "sold",  # Imported sales are already sold
+                    "purchase_date": self._parse_datetime(sale.data.get("purchase_date")),
+                    "purchase_price": self._extract_decimal(sale.data, "purchase_price"),
+                    "supplier": sale.data.get("supplier", sale.data.get("seller_name", "")),
+                    "notes": f"Auto-created from sales import - Size: {sale.size}",
+                }
+            )
+
+        for chunk in _chunks(rows):
+            await self.db_session.execute(insert(InventoryItem).values(list(chunk)))
+
+    # ===== Value helpers =====
+
+    def _generate_sku(self, product_name: str) -> str:
+        """Placeholder SKU for products imported without one (e.g. StockX N/A)"""
+        safe_name = product_name[:15].upper().replace(" ", "_").replace("-", "_")
+        safe_name = "".join(c for c in safe_name if c.isalnum() or c == "_")
+        return f"AUTO_{safe_name}_{str(uuid.uuid4())[:8]}"
+
+    def _extract_decimal(self, data: Dict[str, Any], key: str) -> Optional[Decimal]:
+        """Safely extract Decimal value from data"""
+        value = data.get(key)
+        if value is None:
+            return None
+
+        try:
+            if isinstance(value, (int, float)):
+                return Decimal(str(value))
+            elif isinstance(value, str):
+                # Clean string and convert
+                cleaned = value.replace(",", "").replace("$", "").replace("€", "").strip()
+                if cleaned:
+                    return Decimal(cleaned)
+        except (ValueError, InvalidOperation):
+            pass
+
+        return None
+
+    def _get_default_fee_percentage(self, platform_name: str) -> Decimal:
+        """Get default fee percentage for platform"""
+        default_fees = {
+            "stockx": Decimal("9.5"),
+            "goat": Decimal("9.5"),
+            "ebay": Decimal("10.0"),
+            "alias": Decimal("0.0"),  # Alias = GOAT platform
+            "manual": Decimal("0.0"),
+        }
+
+        return default_fees.get(platform_name.lower(), Decimal("5.0"))
+
+    def _platform_supports_fees(self, platform_name: str) -> bool:
+        """Check if platform supports explicit fees"""
+        no_fee_platforms = ["alias", "manual"]  # Alias = GOAT (no explicit fees in export)
+        return platform_name.lower() not in no_fee_platforms
+
+    def _parse_datetime(self, date_value: Union[str, datetime, None]) -> Optional[datetime]:
+        """Parse date value to datetime object"""
+        if date_value is None:
+            return None
+
+        if isinstance(date_value, datetime):
+            return date_value
+
+        if isinstance(date_value, str):
+            try:
+                # Try dateutil first (most flexible)
+                from dateutil import parser
+
+                return parser.parse(date_value)
+            except ImportError:
+                # Fallback to manual parsing for common formats
+                try:
+                    if "T" in date_value and "+" in date_value:
+                        # ISO format: 2022-07-08T00:46:09+00:00
+                        return datetime.fromisoformat(date_value.replace("Z", "+00:00"))
+                    else:
+                        # Try standard format
+                        return datetime.strptime(date_value, "%Y-%m-%d %H:M:%S")
+                except Exception:
+                    return None
+            except Exception:
+                return None
+
+        return None
+
+    def _normalize_sku(self, sku_value: Any) -> Optional[str]:
+        """Normalize SKU value, handling 'nan' and invalid values"""
+        if sku_value is None:
+            return None
+
+        # Handle numeric NaN from pandas/numpy
+        if isinstance(sku_value, float) and math.isnan(sku_value):
+            return None
+
+        sku_str = str(sku_value).strip()
+
+        # Handle pandas NaN values and invalid SKUs (including N/A from StockX)
+        if not sku_str or sku_str.lower() in ["nan", "none", "null", "", "n/a", "na"]:
+            return None
+
+        return sku_str
@@ -29,6 +29,8 @@ from domains.integration.api.upload_router import router as upload_router
 from domains.integration.api.webhooks import router as webhook_router
 from domains.integration.budibase.api.budibase_router import router as budibase_router
 from domains.integration.events import get_integration_event_handler
+from domains.integration.metabase.services.refresh_scheduler import shutdown_refresh_scheduler
+from domains.integration.services.stockx_http_client import close_stockx_http_client
 from domains.inventory.api.router import router as inventory_router
 from domains.inventory.events import get_inventory_event_handler
 from domains.orders.api.router import router as orders_router
@@ -48,6 +50,7 @@ from shared.error_handling.exceptions import (
     soleflip_exception_handler,
     validation_exception_handler,
 )
+from shared.events import get_event_bus
 from shared.logging.logger import RequestLoggingMiddleware
 from shared.middleware.compression import setup_compression_middleware
 from shared.middleware.etag import setup_etag_middleware
@@ -62,6 +65,7 @@ from shared.monitoring.prometheus import router as prometheus_router
 from shared.performance import initialize_cache
 from shared.security.api_security import security_middleware
 from shared.security.middleware import add_security_middleware
+from shared.security.rate_limiting import initialize_rate_limiter
 
 # Load environment variables after imports
 load_dotenv()
@@ -139,6 +143,9 @@ async def lifespan(app: FastAPI):
     redis_url = os.getenv("REDIS_URL")  # Optional Redis connection
     await initialize_cache(redis_url)
 
+    # Share rate limit state across workers when Redis is configured
+    await initialize_rate_limiter(redis_url)
+
     # Setup database performance indexes (temporarily disabled)
     # db_optimizer = get_database_optimizer()
     # async with db_manager.get_session() as session:
@@ -153,6 +160,11 @@ async def lifespan(app: FastAPI):
     logger.info("SoleFlipper API shutting down...")
 
     metrics_collector.stop_collection()
+    # Deliver queued events and flush buffered event persistence while the DB is still up
+    await get_event_bus().shutdown()
+    # Run Metabase view refreshes still waiting for their debounce window
+    await shutdown_refresh_scheduler()
+    await close_stockx_http_client()
     await db_manager.close()
     logger.info("Database connections closed, security systems shutdown")
 
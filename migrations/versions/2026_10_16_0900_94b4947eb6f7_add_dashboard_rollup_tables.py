@@ -0,0 +1,350 @@
+"""Add incremental dashboard rollup tables
+
+The dashboard used to aggregate all of sales.order and inventory.stock on every
+cache miss. These tables hold the same aggregates per day, brand and stock status
+and are kept current by statement-level triggers, so dashboard reads stay flat as
+the order history grows. They can be rebuilt with
+scripts/database/backfill_dashboard_rollups.py.
+
+Revision ID: 94b4947eb6f7
+Revises: 826b3e02c30d
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '94b4947eb6f7'
+down_revision = '826b3e02c30d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Create dashboard rollup tables, their maintenance triggers and populate them.
+    """
+
+    op.execute("CREATE SCHEMA IF NOT EXISTS analytics;")
+
+    # ========================================================================
+    # PHASE 1: Rollup tables
+    # ========================================================================
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS analytics.dashboard_sales_daily (
+            sale_date DATE PRIMARY KEY,
+            order_count BIGINT NOT NULL DEFAULT 0,
+            total_revenue NUMERIC(14, 2) NOT NULL DEFAULT 0,
+            total_profit NUMERIC(14, 2) NOT NULL DEFAULT 0
+        );
+    """)
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS analytics.dashboard_brand_sales (
+            brand_id UUID PRIMARY KEY REFERENCES catalog.brand(id) ON DELETE CASCADE,
+            order_count BIGINT NOT NULL DEFAULT 0,
+            total_revenue NUMERIC(14, 2) NOT NULL DEFAULT 0
+        );
+    """)
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS analytics.dashboard_inventory_status (
+            status TEXT PRIMARY KEY,
+            item_count BIGINT NOT NULL DEFAULT 0
+        );
+    """)
+
+    # ========================================================================
+    # PHASE 2: Incremental maintenance
+    # ========================================================================
+
+    # One order row's contribution: sign +1 adds it, -1 removes it
+    op.execute("""
+        CREATE TYPE analytics.order_rollup_change AS (
+            sold_at TIMESTAMPTZ,
+            gross_sale NUMERIC,
+            net_profit NUMERIC,
+            inventory_item_id UUID,
+            sign INTEGER
+        );
+    """)
+
+    # Applies a whole statement's order changes. Deltas are aggregated per key
+    # first and upserted in key order, so concurrent imports touch each rollup row
+    # once per statement and always lock rows in the same order.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION analytics.apply_order_rollup_changes(
+            p_changes analytics.order_rollup_change[]
+        ) RETURNS VOID AS $$
+        BEGIN
+            INSERT INTO analytics.dashboard_sales_daily AS d
+                (sale_date, order_count, total_revenue, total_profit)
+            SELECT sale_date, order_count, total_revenue, total_profit
+            FROM (
+                SELECT
+                    DATE_TRUNC('day', c.sold_at)::date AS sale_date,
+                    SUM(c.sign) AS order_count,
+                    SUM(c.sign * c.gross_sale) AS total_revenue,
+                    SUM(c.sign * COALESCE(c.net_profit, 0)) AS total_profit
+                FROM unnest(p_changes) c
+                WHERE c.gross_sale IS NOT NULL AND c.sold_at IS NOT NULL
+                GROUP BY 1
+            ) delta
+            WHERE order_count <> 0 OR total_revenue <> 0 OR total_profit <> 0
+            ORDER BY sale_date
+            ON CONFLICT (sale_date) DO UPDATE SET
+                order_count = d.order_count + EXCLUDED.order_count,
+                total_revenue = d.total_revenue + EXCLUDED.total_revenue,
+                total_profit = d.total_profit + EXCLUDED.total_profit;
+
+            -- Orders whose stock row is already gone were removed from the brand
+            -- rollup by stock_delete_brand_rollup before the stock row went away
+            INSERT INTO analytics.dashboard_brand_sales AS b
+                (brand_id, order_count, total_revenue)
+            SELECT brand_id, order_count, total_revenue
+            FROM (
+                SELECT
+                    p.brand_id,
+                    SUM(c.sign) AS order_count,
+                    SUM(c.sign * c.gross_sale) AS total_revenue
+                FROM unnest(p_changes) c
+                JOIN inventory.stock i ON i.id = c.inventory_item_id
+                JOIN catalog.product p ON p.id = i.product_id
+                WHERE c.gross_sale IS NOT NULL AND p.brand_id IS NOT NULL
+                GROUP BY p.brand_id
+            ) delta
+            WHERE order_count <> 0 OR total_revenue <> 0
+            ORDER BY brand_id
+            ON CONFLICT (brand_id) DO UPDATE SET
+                order_count = b.order_count + EXCLUDED.order_count,
+                total_revenue = b.total_revenue + EXCLUDED.total_revenue;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION analytics.order_dashboard_rollup()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                PERFORM analytics.apply_order_rollup_changes(ARRAY(
+                    SELECT ROW(n.sold_at, n.gross_sale, n.net_profit, n.inventory_item_id, 1)
+                        ::analytics.order_rollup_change
+                    FROM new_rows n
+                ));
+            ELSIF TG_OP = 'UPDATE' THEN
+                PERFORM analytics.apply_order_rollup_changes(ARRAY(
+                    SELECT ROW(o.sold_at, o.gross_sale, o.net_profit, o.inventory_item_id, -1)
+                        ::analytics.order_rollup_change
+                    FROM old_rows o
+                    UNION ALL
+                    SELECT ROW(n.sold_at, n.gross_sale, n.net_profit, n.inventory_item_id, 1)
+                        ::analytics.order_rollup_change
+                    FROM new_rows n
+                ));
+            ELSE
+                PERFORM analytics.apply_order_rollup_changes(ARRAY(
+                    SELECT ROW(o.sold_at, o.gross_sale, o.net_profit, o.inventory_item_id, -1)
+                        ::analytics.order_rollup_change
+                    FROM old_rows o
+                ));
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # Transition tables need one trigger per event and no column list; updates
+    # that leave the rolled-up columns alone produce zero deltas and are skipped
+    op.execute("""
+        CREATE TRIGGER order_dashboard_rollup_insert
+        AFTER INSERT ON sales.order
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION analytics.order_dashboard_rollup();
+    """)
+
+    op.execute("""
+        CREATE TRIGGER order_dashboard_rollup_update
+        AFTER UPDATE ON sales.order
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION analytics.order_dashboard_rollup();
+    """)
+
+    op.execute("""
+        CREATE TRIGGER order_dashboard_rollup_delete
+        AFTER DELETE ON sales.order
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION analytics.order_dashboard_rollup();
+    """)
+
+    # Deleting a stock row cascades to its orders, whose brand cannot be resolved
+    # once the stock row is gone; take them out of the brand rollup beforehand
+    op.execute("""
+        CREATE OR REPLACE FUNCTION analytics.stock_delete_brand_rollup()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE analytics.dashboard_brand_sales b
+            SET order_count = b.order_count - delta.order_count,
+                total_revenue = b.total_revenue - delta.total_revenue
+            FROM (
+                SELECT p.brand_id, COUNT(*) AS order_count, SUM(o.gross_sale) AS total_revenue
+                FROM sales.order o
+                JOIN catalog.product p ON p.id = OLD.product_id
+                WHERE o.inventory_item_id = OLD.id
+                  AND o.gross_sale IS NOT NULL
+                  AND p.brand_id IS NOT NULL
+                GROUP BY p.brand_id
+            ) delta
+            WHERE b.brand_id = delta.brand_id;
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER stock_delete_brand_rollup_trigger
+        BEFORE DELETE ON inventory.stock
+        FOR EACH ROW
+        EXECUTE FUNCTION analytics.stock_delete_brand_rollup();
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION analytics.apply_stock_status_changes(
+            p_added TEXT[],
+            p_removed TEXT[]
+        ) RETURNS VOID AS $$
+        BEGIN
+            INSERT INTO analytics.dashboard_inventory_status AS s (status, item_count)
+            SELECT status, item_count
+            FROM (
+                SELECT COALESCE(changed.status, 'unknown') AS status, SUM(changed.sign) AS item_count
+                FROM (
+                    SELECT added.status, 1 AS sign FROM unnest(p_added) AS added(status)
+                    UNION ALL
+                    SELECT removed.status, -1 FROM unnest(p_removed) AS removed(status)
+                ) changed
+                GROUP BY 1
+            ) delta
+            WHERE item_count <> 0
+            ORDER BY status
+            ON CONFLICT (status) DO UPDATE SET item_count = s.item_count + EXCLUDED.item_count;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION analytics.stock_dashboard_rollup()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                PERFORM analytics.apply_stock_status_changes(
+                    ARRAY(SELECT n.status::text FROM new_rows n), ARRAY[]::TEXT[]
+                );
+            ELSIF TG_OP = 'UPDATE' THEN
+                PERFORM analytics.apply_stock_status_changes(
+                    ARRAY(SELECT n.status::text FROM new_rows n),
+                    ARRAY(SELECT o.status::text FROM old_rows o)
+                );
+            ELSE
+                PERFORM analytics.apply_stock_status_changes(
+                    ARRAY[]::TEXT[], ARRAY(SELECT o.status::text FROM old_rows o)
+                );
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER stock_dashboard_rollup_insert
+        AFTER INSERT ON inventory.stock
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION analytics.stock_dashboard_rollup();
+    """)
+
+    op.execute("""
+        CREATE TRIGGER stock_dashboard_rollup_update
+        AFTER UPDATE ON inventory.stock
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION analytics.stock_dashboard_rollup();
+    """)
+
+    op.execute("""
+        CREATE TRIGGER stock_dashboard_rollup_delete
+        AFTER DELETE ON inventory.stock
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION analytics.stock_dashboard_rollup();
+    """)
+
+    # ========================================================================
+    # PHASE 3: Initial population
+    # ========================================================================
+
+    op.execute("""
+        INSERT INTO analytics.dashboard_sales_daily
+            (sale_date, order_count, total_revenue, total_profit)
+        SELECT
+            DATE_TRUNC('day', sold_at)::date,
+            COUNT(*),
+            SUM(gross_sale),
+            COALESCE(SUM(net_profit), 0)
+        FROM sales.order
+        WHERE gross_sale IS NOT NULL AND sold_at IS NOT NULL
+        GROUP BY 1;
+    """)
+
+    op.execute("""
+        INSERT INTO analytics.dashboard_brand_sales (brand_id, order_count, total_revenue)
+        SELECT p.brand_id, COUNT(*), SUM(o.gross_sale)
+        FROM sales.order o
+        JOIN inventory.stock i ON o.inventory_item_id = i.id
+        JOIN catalog.product p ON i.product_id = p.id
+        WHERE o.gross_sale IS NOT NULL AND p.brand_id IS NOT NULL
+        GROUP BY p.brand_id;
+    """)
+
+    op.execute("""
+        INSERT INTO analytics.dashboard_inventory_status (status, item_count)
+        SELECT COALESCE(status::text, 'unknown'), COUNT(*)
+        FROM inventory.stock
+        GROUP BY 1;
+    """)
+
+
+def downgrade():
+    """
+    Remove dashboard rollup tables and their triggers.
+    """
+
+    for trigger in (
+        "stock_dashboard_rollup_insert",
+        "stock_dashboard_rollup_update",
+        "stock_dashboard_rollup_delete",
+        "stock_delete_brand_rollup_trigger",
+    ):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger} ON inventory.stock;")
+    for trigger in (
+        "order_dashboard_rollup_insert",
+        "order_dashboard_rollup_update",
+        "order_dashboard_rollup_delete",
+    ):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger} ON sales.order;")
+    op.execute("DROP FUNCTION IF EXISTS analytics.stock_dashboard_rollup();")
+    op.execute("DROP FUNCTION IF EXISTS analytics.apply_stock_status_changes(TEXT[], TEXT[]);")
+    op.execute("DROP FUNCTION IF EXISTS analytics.stock_delete_brand_rollup();")
+    op.execute("DROP FUNCTION IF EXISTS analytics.order_dashboard_rollup();")
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "analytics.apply_order_rollup_changes(analytics.order_rollup_change[]);"
+    )
+    op.execute("DROP TYPE IF EXISTS analytics.order_rollup_change;")
+    op.execute("DROP TABLE IF EXISTS analytics.dashboard_inventory_status;")
+    op.execute("DROP TABLE IF EXISTS analytics.dashboard_brand_sales;")
+    op.execute("DROP TABLE IF EXISTS analytics.dashboard_sales_daily;")
@@ -0,0 +1,53 @@
+"""Add StockX lookup cache and enrichment job checkpoints
+
+Awin enrichment searched StockX once per Awin product, even though the same EAN
+is listed by many merchants. integration.stockx_lookup_cache keeps resolved
+EAN / style ID lookups (including misses) for a TTL so each identifier is
+searched once, and awin_enrichment_jobs.checkpoint lets an interrupted job
+resume after the last committed page.
+
+Revision ID: c41d7e9a2b58
+Revises: 94b4947eb6f7
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'c41d7e9a2b58'
+down_revision = '94b4947eb6f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Create the lookup cache table and the job checkpoint column.
+    """
+
+    op.create_table(
+        'stockx_lookup_cache',
+        # 'ean:<ean>' or 'style:<style id>'; unbounded, keys come straight from feed data
+        sa.Column('lookup_key', sa.Text(), nullable=False),
+        # Matched StockX catalog product, NULL when the lookup found nothing
+        sa.Column('stockx_product', postgresql.JSONB(), nullable=True),
+        sa.Column('resolved_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('NOW()'), nullable=False),
+        sa.Column('expires_at', sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('lookup_key'),
+        schema='integration'
+    )
+    op.create_index('idx_stockx_lookup_cache_expires', 'stockx_lookup_cache', ['expires_at'], schema='integration')
+
+    op.add_column('awin_enrichment_jobs', sa.Column('checkpoint', postgresql.JSONB(), nullable=True), schema='integration')
+
+
+def downgrade():
+    """
+    Drop the job checkpoint column and the lookup cache table.
+    """
+
+    op.drop_column('awin_enrichment_jobs', 'checkpoint', schema='integration')
+    op.drop_index('idx_stockx_lookup_cache_expires', 'stockx_lookup_cache', schema='integration')
+    op.drop_table('stockx_lookup_cache', schema='integration')
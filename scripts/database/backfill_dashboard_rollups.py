@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Backfill Dashboard Rollups
+Rebuilds the analytics.dashboard_* rollup tables from sales.order and inventory.stock
+
+Usage:
+    python scripts/database/backfill_dashboard_rollups.py
+    python scripts/database/backfill_dashboard_rollups.py --rollup sales_daily --rollup brand_sales
+"""
+
+import argparse
+import asyncio
+import sys
+
+sys.path.append(".")
+
+from domains.dashboard.services.rollup_service import (  # noqa: E402
+    ROLLUP_NAMES,
+    DashboardRollupService,
+)
+from shared.database.connection import DatabaseManager  # noqa: E402
+
+
+async def backfill_dashboard_rollups(rollups):
+    """Rebuild the selected rollups in a single transaction"""
+
+    print("SoleFlipper Dashboard Rollup Backfill")
+    print("=" * 60)
+
+    db = DatabaseManager()
+    await db.initialize()
+
+    try:
+        async with db.get_session() as session:
+            written = await DashboardRollupService(session).backfill(rollups)
+
+        for name, rows in written.items():
+            print(f"  {name:<20} {rows:>8} rows")
+        print("Backfill completed")
+    finally:
+        await db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild dashboard rollup tables")
+    parser.add_argument(
+        "--rollup",
+        action="append",
+        choices=ROLLUP_NAMES,
+        help="Rollup to rebuild (repeatable, default: all)",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(backfill_dashboard_rollups(args.rollup))
+
+
+if __name__ == "__main__":
+    main()
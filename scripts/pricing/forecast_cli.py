@@ -93,15 +93,22 @@ class ForecastCLI:
             print(f"Prediction Days: {config.prediction_days}")
 
             # Generate forecasts
-            results = await self.forecast_engine.generate_forecasts(
-                config=config, entity_ids=entity_ids, run_id=run_id
+            report = await self.forecast_engine.generate_forecasts_parallel(
+                config=config, entity_ids=entity_ids, run_id=run_id, max_workers=args.workers
             )
+            results = report.results
 
             if not results:
                 print("❌ No forecasts generated. Check data availability and configuration.")
                 return
 
             print(f"✅ Generated {len(results)} forecasts")
+            print(
+                f"   Skipped: {report.entities_skipped} | Failed: {report.entities_failed} | "
+                f"Workers: {report.workers} | "
+                f"Throughput: {report.entities_per_second:.1f} entities/s | "
+                f"Total: {report.total_seconds:.1f}s"
+            )
 
             # Display results summary
             if args.show_results:
@@ -595,6 +602,9 @@ def create_parser():
     gen_parser.add_argument(
         "--min-history-days", type=int, default=90, help="Minimum historical data required"
     )
+    gen_parser.add_argument(
+        "--workers", type=int, help="Parallel model-fitting workers (default: CPU count)"
+    )
     gen_parser.add_argument("--show-results", action="store_true", help="Display results summary")
     gen_parser.add_argument("--result-limit", type=int, help="Limit number of results to display")
     gen_parser.add_argument("--show-features", action="store_true", help="Show feature importance")
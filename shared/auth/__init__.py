@@ -3,12 +3,16 @@ Authentication and authorization module.
 """
 
 from .dependencies import get_current_user, require_admin_role, require_authenticated_user
-from .jwt_handler import JWTHandler
+from .jwt_handler import JWTHandler, get_jwt_handler
 from .models import AuthToken, User, UserRole
 from .password_hasher import PasswordHasher
+from .principal_cache import PrincipalCache, get_principal_cache
 
 __all__ = [
     "JWTHandler",
+    "get_jwt_handler",
+    "PrincipalCache",
+    "get_principal_cache",
     "PasswordHasher",
     "User",
     "UserRole",
@@ -12,8 +12,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from shared.database.connection import get_db_session
 from shared.repositories.base_repository import BaseRepository
 
-from .jwt_handler import JWTHandler
+from .jwt_handler import get_jwt_handler
 from .models import User, UserRole
+from .principal_cache import get_principal_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -61,11 +62,17 @@ async def get_current_user_from_token(
         raise AuthenticationError("No authorization header provided")
 
     token = credentials.credentials
-    jwt_handler = JWTHandler()
+    principal_cache = get_principal_cache()
+
+    # Fast path: token already authenticated within the cache TTL
+    cached_user = principal_cache.get(token)
+    if cached_user is not None:
+        return cached_user
 
     try:
         # Decode and validate token
-        token_payload = await jwt_handler.decode_token(token)
+        token_payload = await get_jwt_handler().decode_token(token)
+        ticket = principal_cache.ticket(token_payload.user_id)
 
         # Get user from database
         user_repo = BaseRepository(User, db)
@@ -79,6 +86,8 @@ async def get_current_user_from_token(
             logger.warning("User account is inactive", user_id=user.id)
             raise AuthenticationError("User account is inactive")
 
+        principal_cache.put(token, user, token_payload.exp, ticket)
+
         logger.debug("User authenticated successfully", user_id=user.id, username=user.username)
         return user
 
@@ -174,3 +174,15 @@ class JWTHandler:
             return datetime.fromtimestamp(payload.exp, tz=timezone.utc)
         except ValueError:
             return None
+
+
+# Global JWT handler instance
+_jwt_handler: Optional[JWTHandler] = None
+
+
+def get_jwt_handler() -> JWTHandler:
+    """Get the global JWT handler instance"""
+    global _jwt_handler
+    if _jwt_handler is None:
+        _jwt_handler = JWTHandler()
+    return _jwt_handler
@@ -0,0 +1,167 @@
+"""
+Authenticated principal cache.
+
+Maps a token hash to the user it authenticated, so repeat requests with the same
+bearer token skip JWT decoding, the blacklist lookup and the user query. Entries
+live for a few seconds at most and never beyond the token's own expiry; committed
+user updates and token revocations in this process invalidate them immediately.
+"""
+
+import hashlib
+import time
+from typing import Any, Dict, Optional, Tuple, Union
+from uuid import UUID
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from shared.performance.caching import InMemoryCache
+
+from .models import User
+
+logger = structlog.get_logger(__name__)
+
+# Bounds how long a change made by another worker can go unnoticed
+DEFAULT_PRINCIPAL_TTL_SECONDS = 30
+DEFAULT_MAX_PRINCIPALS = 10_000
+
+# User columns whose change must drop cached principals immediately
+_SECURITY_FIELDS = ("is_active", "role", "hashed_password", "username", "email")
+
+
+class PrincipalCache:
+    """Short-TTL, size-bounded cache of authenticated users keyed by token hash"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_PRINCIPAL_TTL_SECONDS,
+        max_size: int = DEFAULT_MAX_PRINCIPALS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._entries = InMemoryCache(max_size=max_size, default_ttl=ttl_seconds)
+        # Bumped on invalidation; entries cached under an older generation are ignored
+        self._generations: Dict[UUID, int] = {}
+        # Hashes of revoked tokens, kept until the token expires, so a request that
+        # passed the blacklist before the revocation cannot cache the token again
+        self._revoked = InMemoryCache(max_size=max_size, default_ttl=ttl_seconds)
+        self._columns = [attr.key for attr in sa_inspect(User).column_attrs]
+
+    @staticmethod
+    def _token_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def ticket(self, user_id: UUID) -> int:
+        """Current generation for a user; pass it to put() to detect concurrent invalidation"""
+        return self._generations.get(user_id, 0)
+
+    def get(self, token: str) -> Optional[User]:
+        """Get a detached copy of the user cached for token"""
+        key = self._token_key(token)
+        entry: Optional[Tuple[UUID, int, float, Dict[str, Any]]] = self._entries.get_nowait(key)
+        if entry is None:
+            return None
+
+        user_id, generation, token_exp, values = entry
+        if generation != self.ticket(user_id) or token_exp <= time.time() or key in self._revoked:
+            self._entries.delete_nowait(key)
+            return None
+
+        # A fresh instance per request, so no ORM state is shared between sessions
+        user = User(**values)
+        make_transient_to_detached(user)
+        return user
+
+    def put(self, token: str, user: User, token_exp: float, ticket: int) -> None:
+        """Cache user for token unless it was invalidated since ticket() was taken"""
+        key = self._token_key(token)
+        if ticket != self.ticket(user.id) or key in self._revoked:
+            return
+
+        ttl = min(self.ttl_seconds, token_exp - time.time())
+        if ttl <= 0:
+            return
+
+        values = {column: getattr(user, column) for column in self._columns}
+        self._entries.set_nowait(key, (user.id, ticket, token_exp, values), ttl=ttl)
+
+    def invalidate_user(self, user_id: Union[UUID, str]) -> None:
+        """Drop every cached principal of a user"""
+        user_id = UUID(str(user_id))
+        self._generations[user_id] = self.ticket(user_id) + 1
+        logger.debug("Principal cache invalidated for user", user_id=str(user_id))
+
+    def invalidate_token(self, token: str, token_exp: Optional[float] = None) -> None:
+        """Drop the cached principal for a single token and refuse to cache it again
+
+        Call this after the token has been blacklisted. The revocation mark lives
+        until token_exp, or for the principal TTL when the expiry is unknown.
+        """
+        key = self._token_key(token)
+        self._entries.delete_nowait(key)
+
+        ttl = self.ttl_seconds if token_exp is None else token_exp - time.time()
+        if ttl > 0:
+            self._revoked.set_nowait(key, True, ttl=ttl)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            **self._entries.stats(),
+            "invalidated_users": len(self._generations),
+            "revoked_tokens": len(self._revoked),
+        }
+
+
+# Global principal cache instance
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get the global principal cache instance"""
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache()
+    return _principal_cache
+
+
+# Session.info key for users whose principals are dropped once the session commits
+_PENDING_INVALIDATIONS = "principal_cache_pending_invalidations"
+
+
+def _invalidate_on_commit(target: User) -> None:
+    """Invalidate a user's principals when the change becomes visible to other sessions
+
+    Invalidating at flush would let a concurrent request take the new generation,
+    read the still-committed old row and cache it.
+    """
+    session = sa_inspect(target).session
+    if session is None:
+        get_principal_cache().invalidate_user(target.id)
+        return
+    session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(target.id)
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_updated_user(mapper, connection, target: User) -> None:
+    """Invalidate principals when security-relevant user fields change through the ORM"""
+    attrs = sa_inspect(target).attrs
+    if any(attrs[field].history.has_changes() for field in _SECURITY_FIELDS):
+        _invalidate_on_commit(target)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_deleted_user(mapper, connection, target: User) -> None:
+    _invalidate_on_commit(target)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_invalidations(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        get_principal_cache().invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
@@ -166,6 +166,8 @@ class HybridTokenBlacklist:
 
     async def blacklist_token(self, token: str, exp_timestamp: float):
         """Add token to both blacklists"""
+        from .principal_cache import get_principal_cache
+
         # Always add to memory blacklist
         await self.memory_blacklist.blacklist_token(token, exp_timestamp)
 
@@ -173,6 +175,10 @@ class HybridTokenBlacklist:
         if self.use_redis:
             await self.redis_blacklist.blacklist_token(token, exp_timestamp)
 
+        # Only once the blacklist holds the token, so a concurrent request cannot
+        # re-cache it after the eviction; revoked tokens must not keep authenticating
+        get_principal_cache().invalidate_token(token, exp_timestamp)
+
     async def is_blacklisted(self, token: str) -> bool:
         """Check both blacklists"""
         # Check memory first (fastest)
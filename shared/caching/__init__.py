@@ -6,8 +6,9 @@ Redis-based caching strategies and utilities.
 
 Exports:
 - dashboard_cache: Dashboard-specific caching implementation
+- single_flight: Request coalescing and stale-while-revalidate helpers
 """
 
-from shared.caching import dashboard_cache
+from shared.caching import dashboard_cache, single_flight
 
-__all__ = ["dashboard_cache"]
+__all__ = ["dashboard_cache", "single_flight"]
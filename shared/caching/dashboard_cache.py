@@ -3,81 +3,143 @@ Dashboard metrics caching system
 High-performance in-memory cache with TTL for dashboard data
 """
 
-import asyncio
 import json
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 import structlog
 
+from shared.caching.single_flight import SingleFlight, should_refresh_early
+
 logger = structlog.get_logger(__name__)
 
 
 class DashboardCache:
-    """In-memory cache for dashboard metrics with TTL"""
-
-    def __init__(self, default_ttl: int = 300):  # 5 minutes default
+    """In-memory cache for dashboard metrics with TTL
+
+    ``get_or_load`` protects expensive dashboard queries from stampedes: concurrent
+    misses share one load, entries past their TTL are served stale for
+    ``stale_ttl`` seconds while a single background task refreshes them, and fresh
+    entries may be refreshed early with a probability that rises near expiry.
+    """
+
+    def __init__(
+        self,
+        default_ttl: int = 300,  # 5 minutes default
+        default_stale_ttl: int = 0,
+        early_refresh_beta: float = 1.0,
+    ):
         self._cache: Dict[str, Dict[str, Any]] = {}
         self._default_ttl = default_ttl
-        self._lock = asyncio.Lock()
+        self._default_stale_ttl = default_stale_ttl
+        self._early_refresh_beta = early_refresh_beta
+        self._flight = SingleFlight()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
 
     async def get(self, key: str) -> Optional[Dict[str, Any]]:
         """Get cached data if not expired"""
-        async with self._lock:
-            if key not in self._cache:
-                return None
-
-            cache_entry = self._cache[key]
-            expires_at = cache_entry.get("expires_at")
-
-            if expires_at and datetime.utcnow() > expires_at:
-                # Cache expired, remove it
+        cache_entry = self._cache.get(key)
+        if cache_entry is None:
+            return None
+
+        now = time.monotonic()
+        if now >= cache_entry["fresh_until"]:
+            if now >= cache_entry["stale_until"]:
+                # Past the stale window as well, remove it
                 del self._cache[key]
                 logger.debug("Cache expired and removed", key=key)
-                return None
-
-            logger.debug("Cache hit", key=key)
-            return cache_entry.get("data")
-
-    async def set(self, key: str, data: Dict[str, Any], ttl: Optional[int] = None) -> None:
+            return None
+
+        logger.debug("Cache hit", key=key)
+        return cache_entry["data"]
+
+    async def set(
+        self,
+        key: str,
+        data: Dict[str, Any],
+        ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        compute_seconds: float = 0.0,
+    ) -> None:
         """Set cache data with TTL"""
-        async with self._lock:
-            ttl = ttl or self._default_ttl
-            expires_at = datetime.utcnow() + timedelta(seconds=ttl)
-
-            self._cache[key] = {
-                "data": data,
-                "expires_at": expires_at,
-                "cached_at": datetime.utcnow(),
-            }
+        ttl = ttl or self._default_ttl
+        stale_ttl = self._default_stale_ttl if stale_ttl is None else stale_ttl
+        now = time.monotonic()
+
+        self._cache[key] = {
+            "data": data,
+            "fresh_until": now + ttl,
+            "stale_until": now + ttl + stale_ttl,
+            "compute_seconds": compute_seconds,
+            "cached_at": datetime.utcnow(),
+        }
 
-            logger.debug("Data cached", key=key, ttl=ttl)
+        logger.debug("Data cached", key=key, ttl=ttl, stale_ttl=stale_ttl)
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Dict[str, Any]]],
+        ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Return cached data, loading it at most once per key across concurrent callers"""
+
+        async def load() -> Dict[str, Any]:
+            started = time.perf_counter()
+            data = await loader()
+            await self.set(key, data, ttl, stale_ttl, time.perf_counter() - started)
+            return data
+
+        cache_entry = self._cache.get(key)
+        if cache_entry is not None:
+            now = time.monotonic()
+            if now < cache_entry["fresh_until"]:
+                self.hits += 1
+                if should_refresh_early(
+                    cache_entry["fresh_until"],
+                    cache_entry["compute_seconds"],
+                    self._early_refresh_beta,
+                    now,
+                ):
+                    self._flight.refresh_in_background(key, load)
+                return cache_entry["data"]
+
+            if now < cache_entry["stale_until"]:
+                self.stale_hits += 1
+                if self._flight.refresh_in_background(key, load):
+                    logger.debug("Serving stale cache entry while refreshing", key=key)
+                return cache_entry["data"]
+
+        self.misses += 1
+        return await self._flight.do(key, load)
 
     async def invalidate(self, key: str) -> bool:
         """Manually invalidate cache entry"""
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                logger.debug("Cache invalidated", key=key)
-                return True
-            return False
+        if key in self._cache:
+            del self._cache[key]
+            logger.debug("Cache invalidated", key=key)
+            return True
+        return False
 
     async def clear(self) -> None:
         """Clear all cache entries"""
-        async with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            logger.info("Cache cleared", entries_removed=count)
+        count = len(self._cache)
+        self._cache.clear()
+        logger.info("Cache cleared", entries_removed=count)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         total_entries = len(self._cache)
         expired_entries = 0
-        now = datetime.utcnow()
+        now = time.monotonic()
 
         for entry in self._cache.values():
-            expires_at = entry.get("expires_at")
-            if expires_at and now > expires_at:
+            if now >= entry["fresh_until"]:
                 expired_entries += 1
 
         return {
@@ -85,6 +147,10 @@ class DashboardCache:
             "expired_entries": expired_entries,
             "active_entries": total_entries - expired_entries,
             "cache_size_bytes": len(json.dumps(list(self._cache.keys()), default=str)),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            **self._flight.stats(),
         }
 
 
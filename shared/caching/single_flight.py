@@ -0,0 +1,107 @@
+"""
+Cache stampede protection
+Request coalescing and stale-while-revalidate helpers shared by the caching layers
+"""
+
+import asyncio
+import math
+import random
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+def should_refresh_early(
+    fresh_until: float, compute_seconds: float, beta: float, now: float
+) -> bool:
+    """Probabilistic early expiration (XFetch).
+
+    Returns True with a probability that rises as ``now`` approaches ``fresh_until``,
+    scaled by how long the value took to compute. ``beta`` > 1 favours earlier
+    refreshes, 0 disables them.
+    """
+    if beta <= 0 or compute_seconds <= 0:
+        return False
+    # 1 - random() lies in (0, 1], so the log is always defined
+    return now - compute_seconds * beta * math.log(1.0 - random.random()) >= fresh_until
+
+
+class SingleFlight:
+    """Coalesce concurrent loads of the same key into a single in-flight task
+
+    The first caller for a key starts the loader; everyone arriving while it runs
+    awaits the same task. Waiters are shielded, so a cancelled request does not
+    abort a load other requests depend on.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.loads = 0
+        self.coalesced = 0
+        self.background_refreshes = 0
+        self.background_failures = 0
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a load for key is currently running on this event loop"""
+        return self._current_task(key) is not None
+
+    async def do(self, key: Hashable, loader: Loader) -> Any:
+        """Run loader for key, or join the load that is already running"""
+        task = self._current_task(key)
+        if task is None:
+            task = self._start(key, loader)
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def refresh_in_background(self, key: Hashable, loader: Loader) -> bool:
+        """Start a fire-and-forget refresh unless one is already running"""
+        if self._current_task(key) is not None:
+            return False
+
+        task = self._start(key, loader)
+        task.add_done_callback(lambda done: self._log_background_result(key, done))
+        self.background_refreshes += 1
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Get coalescing statistics"""
+        return {
+            "in_flight": len(self._calls),
+            "loads": self.loads,
+            "coalesced": self.coalesced,
+            "background_refreshes": self.background_refreshes,
+            "background_failures": self.background_failures,
+        }
+
+    def _current_task(self, key: Hashable) -> Optional[asyncio.Task]:
+        task = self._calls.get(key)
+        if task is None or task.done():
+            return None
+        # Tasks are bound to the loop that created them (tests run one loop per case)
+        if task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    def _start(self, key: Hashable, loader: Loader) -> asyncio.Task:
+        task = asyncio.ensure_future(loader())
+        self._calls[key] = task
+        self.loads += 1
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return task
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    def _log_background_result(self, key: Hashable, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self.background_failures += 1
+            logger.warning("Background cache refresh failed", key=str(key), error=str(error))
@@ -19,8 +19,10 @@ from .base_event import (  # Import events; Product events; Inventory events
     ProductUpdatedEvent,
 )
 from .event_bus import (
+    DispatchMode,
     EventBus,
     EventHandler,
+    EventPersistenceBuffer,
     get_event_bus,
     publish_event,
     subscribe_to_domain_events,
@@ -47,8 +49,10 @@ __all__ = [
     "InventoryUpdatedEvent",
     "LowStockAlertEvent",
     # Event bus
+    "DispatchMode",
     "EventBus",
     "EventHandler",
+    "EventPersistenceBuffer",
     "get_event_bus",
     "publish_event",
     "subscribe_to_event",
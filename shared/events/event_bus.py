@@ -4,8 +4,13 @@ Provides publish-subscribe pattern for loose coupling between domains.
 """
 
 import asyncio
+import time
 import weakref
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 from uuid import UUID
 
 import structlog
@@ -14,14 +19,85 @@ from .base_event import BaseEvent
 
 logger = structlog.get_logger(__name__)
 
+HANDLER_TIMEOUT_SECONDS = 30.0
+
+# Queued dispatch defaults
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_DISPATCH_WORKERS = 4
+DEFAULT_HANDLER_CONCURRENCY = 8
+
+# Persistence batching: flush every N events or after T seconds, whichever comes first
+DEFAULT_PERSIST_BATCH_SIZE = 200
+DEFAULT_PERSIST_FLUSH_INTERVAL = 0.5
+
+# Set while a dispatch worker runs handlers; events they publish must not wait on the queue
+_in_dispatch_worker: ContextVar[bool] = ContextVar("event_bus_in_dispatch_worker", default=False)
+
+
+class DispatchMode(str, Enum):
+    """How published events reach their handlers"""
+
+    # publish() waits until every handler has finished
+    INLINE = "inline"
+    # publish() enqueues the event; dispatch workers run the handlers
+    QUEUED = "queued"
+
+
+class _DispatchQueue(asyncio.Queue):
+    """Bounded dispatch queue that can take an item past its bound on request"""
+
+    _bypass_bound = False
+
+    def full(self) -> bool:
+        return not self._bypass_bound and super().full()
+
+    def put_unbounded(self, item: Any) -> None:
+        """Enqueue without waiting, even when the queue is full"""
+        self._bypass_bound = True
+        try:
+            self.put_nowait(item)
+        finally:
+            self._bypass_bound = False
+
 
 class EventHandler:
     """Wrapper for event handlers to support both sync and async functions"""
 
-    def __init__(self, handler: Callable, handler_name: str):
+    def __init__(self, handler: Callable, handler_name: str, max_concurrency: Optional[int] = None):
         self.handler = handler
         self.handler_name = handler_name
         self.is_async = asyncio.iscoroutinefunction(handler)
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.throttled = 0
+        self._semaphore: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the handler's ``max_concurrency`` execution slots"""
+        semaphore = self._loop_semaphore()
+        if semaphore is not None:
+            if semaphore.locked():
+                self.throttled += 1
+            await semaphore.acquire()
+
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            if semaphore is not None:
+                semaphore.release()
+
+    def _loop_semaphore(self) -> Optional[asyncio.Semaphore]:
+        if not self.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            self._semaphore = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._semaphore[1]
 
     async def handle(self, event: BaseEvent) -> Any:
         """Handle event (async wrapper for both sync and async handlers)"""
@@ -42,14 +118,226 @@ class EventHandler:
             raise
 
 
+class EventBusMetrics:
+    """Publish, dispatch and queue lag metrics for the event bus"""
+
+    def __init__(self, lag_window: int = 1000):
+        self.published = 0
+        self.dispatched = 0
+        self.handler_failures = 0
+        self.queue_full_waits = 0
+        self.overflow_enqueues = 0
+        self.max_queue_depth = 0
+        self._lag_ms: deque = deque(maxlen=lag_window)
+
+    def record_enqueued(self, queue_depth: int) -> None:
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def record_dispatched(self, lag_ms: float, queue_depth: int) -> None:
+        self.dispatched += 1
+        self._lag_ms.append(lag_ms)
+
+        from shared.monitoring.metrics import get_metrics_collector
+
+        collector = get_metrics_collector()
+        collector.record_histogram("event_queue_lag_ms", lag_ms)
+        collector.set_gauge("event_queue_depth", queue_depth)
+
+    def _percentile(self, percentile: float) -> Optional[float]:
+        if not self._lag_ms:
+            return None
+        ordered = sorted(self._lag_ms)
+        index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+        return round(ordered[index], 2)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "published": self.published,
+            "dispatched": self.dispatched,
+            "handler_failures": self.handler_failures,
+            "queue_full_waits": self.queue_full_waits,
+            "overflow_enqueues": self.overflow_enqueues,
+            "max_queue_depth": self.max_queue_depth,
+            "lag_ms": {
+                "p50": self._percentile(50),
+                "p95": self._percentile(95),
+                "max": round(max(self._lag_ms), 2) if self._lag_ms else None,
+                "samples": len(self._lag_ms),
+            },
+        }
+
+
+class EventPersistenceBuffer:
+    """
+    Buffers events for the event store and writes them with one multi-row
+    INSERT per flush. A flush happens once ``batch_size`` events are buffered
+    or ``flush_interval`` seconds after the first buffered event. A batch that
+    fails is retried row by row, so only the offending events are lost.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_PERSIST_BATCH_SIZE,
+        flush_interval: float = DEFAULT_PERSIST_FLUSH_INTERVAL,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: List[Dict[str, Any]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = None
+
+        self.persisted_total = 0
+        self.failed_total = 0
+        self.flushes = 0
+        self.last_flush_ms: Optional[float] = None
+
+    def add(self, event: BaseEvent) -> None:
+        """Buffer an event; the write happens in the background"""
+        self._pending.append(
+            {
+                "event_id": event.event_id,
+                "event_type": event.event_name,
+                "aggregate_id": event.aggregate_id,
+                "event_data": event.model_dump(mode="json"),
+                "correlation_id": event.correlation_id,
+                "causation_id": event.causation_id,
+                "timestamp": event.timestamp,
+                "version": event.version,
+            }
+        )
+
+        if len(self._pending) % self.batch_size == 0:
+            self._start_flush(full_batches_only=True)
+        elif self._timer is None:
+            self._start_timer()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _start_timer(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_later(self.flush_interval, self._start_flush)
+
+    def _start_flush(self, full_batches_only: bool = False) -> None:
+        if not full_batches_only:
+            self._cancel_timer()
+        task = asyncio.get_running_loop().create_task(self.flush(full_batches_only))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _flush_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock[0] is not loop:
+            self._lock = (loop, asyncio.Lock())
+        return self._lock[1]
+
+    async def flush(self, full_batches_only: bool = False) -> int:
+        """
+        Write buffered events in ``batch_size`` slices; returns the number persisted.
+        With ``full_batches_only`` a trailing partial batch stays buffered for the timer.
+        """
+        async with self._flush_lock():
+            count = len(self._pending)
+            if full_batches_only:
+                count -= count % self.batch_size
+            records, self._pending = self._pending[:count], self._pending[count:]
+
+            if self._pending:
+                if self._timer is None:
+                    self._start_timer()
+            else:
+                self._cancel_timer()
+
+            persisted = 0
+            for offset in range(0, len(records), self.batch_size):
+                batch = records[offset : offset + self.batch_size]
+                started = time.perf_counter()
+                try:
+                    await self._write_batch(batch)
+                    written = len(batch)
+                except Exception as e:
+                    logger.warning(
+                        "Batched event insert failed, retrying row by row",
+                        event_count=len(batch),
+                        error=str(e),
+                    )
+                    written = await self._write_rows(batch)
+
+                self.flushes += 1
+                self.persisted_total += written
+                self.last_flush_ms = (time.perf_counter() - started) * 1000
+                persisted += written
+            return persisted
+
+    async def _write_rows(self, records: List[Dict[str, Any]]) -> int:
+        """Insert records one at a time so a bad event only loses itself"""
+        written = 0
+        for record in records:
+            try:
+                await self._write_batch([record])
+                written += 1
+            except Exception as e:
+                self.failed_total += 1
+                logger.error(
+                    "Failed to persist event", event_id=str(record["event_id"]), error=str(e)
+                )
+        return written
+
+    async def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        from sqlalchemy import insert
+
+        from shared.database.connection import get_db_session
+        from shared.database.models import EventStore
+
+        async with get_db_session() as session:
+            await session.execute(insert(EventStore), records)
+            await session.commit()
+
+    async def close(self) -> None:
+        """Wait for running flushes and write what is still buffered"""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self.pending,
+            "persisted_total": self.persisted_total,
+            "failed_total": self.failed_total,
+            "flushes": self.flushes,
+            "last_flush_ms": round(self.last_flush_ms, 2) if self.last_flush_ms else None,
+        }
+
+
 class EventBus:
     """
     Central event bus for domain communication.
     Supports both in-memory and persistent event handling.
     """
 
-    def __init__(self, enable_persistence: bool = False):
+    def __init__(
+        self,
+        enable_persistence: bool = False,
+        dispatch_mode: DispatchMode = DispatchMode.INLINE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        dispatch_workers: int = DEFAULT_DISPATCH_WORKERS,
+        handler_concurrency: Optional[int] = DEFAULT_HANDLER_CONCURRENCY,
+        persist_batch_size: int = DEFAULT_PERSIST_BATCH_SIZE,
+        persist_flush_interval: float = DEFAULT_PERSIST_FLUSH_INTERVAL,
+    ):
         self.enable_persistence = enable_persistence
+        self.dispatch_mode = dispatch_mode
+        self.queue_size = queue_size
+        self.dispatch_workers = dispatch_workers
+        # Default per-handler limit on concurrent executions
+        self.handler_concurrency = handler_concurrency
         self._handlers: Dict[str, List[EventHandler]] = {}
         self._global_handlers: List[EventHandler] = []
         self._middleware: List[Callable[[BaseEvent], BaseEvent]] = []
@@ -61,11 +349,20 @@ class EventBus:
         self._event_history: List[BaseEvent] = []
         self._max_history_size = 1000
 
+        # Queued dispatch, bound to the event loop it was started on
+        self._queue: Optional[_DispatchQueue] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.metrics = EventBusMetrics()
+        self._persistence = EventPersistenceBuffer(persist_batch_size, persist_flush_interval)
+
     def subscribe(
         self,
         event_type: Union[str, Type[BaseEvent]],
         handler: Callable[[BaseEvent], Any],
         handler_name: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
     ):
         """Subscribe to specific event type"""
         if isinstance(event_type, type) and issubclass(event_type, BaseEvent):
@@ -74,7 +371,7 @@ class EventBus:
             event_type_str = str(event_type)
 
         handler_name = handler_name or f"{handler.__module__}.{handler.__name__}"
-        event_handler = EventHandler(handler, handler_name)
+        event_handler = self._create_handler(handler, handler_name, max_concurrency)
 
         if event_type_str not in self._handlers:
             self._handlers[event_type_str] = []
@@ -86,11 +383,15 @@ class EventBus:
         )
 
     def subscribe_to_domain(
-        self, domain: str, handler: Callable[[BaseEvent], Any], handler_name: Optional[str] = None
+        self,
+        domain: str,
+        handler: Callable[[BaseEvent], Any],
+        handler_name: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
     ):
         """Subscribe to all events from a specific domain"""
         handler_name = handler_name or f"{handler.__module__}.{handler.__name__}"
-        event_handler = EventHandler(handler, handler_name)
+        event_handler = self._create_handler(handler, handler_name, max_concurrency)
 
         domain_pattern = f"{domain}.*"
         if domain_pattern not in self._handlers:
@@ -101,16 +402,24 @@ class EventBus:
         logger.debug("Domain handler subscribed", domain=domain, handler_name=handler_name)
 
     def subscribe_global(
-        self, handler: Callable[[BaseEvent], Any], handler_name: Optional[str] = None
+        self,
+        handler: Callable[[BaseEvent], Any],
+        handler_name: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
     ):
         """Subscribe to all events (global handler)"""
         handler_name = handler_name or f"{handler.__module__}.{handler.__name__}"
-        event_handler = EventHandler(handler, handler_name)
+        event_handler = self._create_handler(handler, handler_name, max_concurrency)
 
         self._global_handlers.append(event_handler)
 
         logger.debug("Global handler subscribed", handler_name=handler_name)
 
+    def _create_handler(
+        self, handler: Callable, handler_name: str, max_concurrency: Optional[int]
+    ) -> EventHandler:
+        return EventHandler(handler, handler_name, max_concurrency or self.handler_concurrency)
+
     def add_middleware(self, middleware: Callable[[BaseEvent], BaseEvent]):
         """Add middleware to process events before handling"""
         self._middleware.append(middleware)
@@ -118,8 +427,19 @@ class EventBus:
             "Event middleware added", middleware=f"{middleware.__module__}.{middleware.__name__}"
         )
 
-    async def publish(self, event: BaseEvent, correlation_id: Optional[UUID] = None):
-        """Publish event to all subscribers"""
+    async def publish(
+        self,
+        event: BaseEvent,
+        correlation_id: Optional[UUID] = None,
+        wait: Optional[bool] = None,
+    ):
+        """
+        Publish event to all subscribers.
+
+        In queued dispatch mode the call returns once the event is enqueued (it
+        only waits while the queue is full); pass ``wait=True`` to run the
+        handlers inline regardless of the mode.
+        """
         # Set correlation ID if provided
         if correlation_id:
             event.correlation_id = correlation_id
@@ -138,6 +458,7 @@ class EventBus:
 
         # Store in history for debugging
         self._add_to_history(event)
+        self.metrics.published += 1
 
         logger.info(
             "Publishing event",
@@ -147,6 +468,20 @@ class EventBus:
             correlation_id=str(event.correlation_id) if event.correlation_id else None,
         )
 
+        # Persist event if enabled (buffered, written in batches)
+        if self.enable_persistence:
+            self._persistence.add(event)
+
+        if wait is None:
+            wait = self.dispatch_mode == DispatchMode.INLINE
+
+        if wait:
+            await self._dispatch(event)
+        else:
+            await self._enqueue(event)
+
+    async def _dispatch(self, event: BaseEvent):
+        """Run all handlers subscribed to the event concurrently"""
         # Collect all matching handlers
         handlers_to_execute = []
 
@@ -165,44 +500,127 @@ class EventBus:
 
         # Execute all handlers concurrently
         if handlers_to_execute:
-            handler_tasks = []
-            for handler in handlers_to_execute:
-                task = asyncio.create_task(self._execute_handler_safely(handler, event))
-                handler_tasks.append(task)
-
-            # Wait for all handlers to complete
-            results = await asyncio.gather(*handler_tasks, return_exceptions=True)
+            results = await asyncio.gather(
+                *(self._execute_handler_safely(handler, event) for handler in handlers_to_execute),
+                return_exceptions=True,
+            )
 
             # Log any handler failures
-            failed_handlers = [
-                (handler, result)
-                for handler, result in zip(handlers_to_execute, results)
-                if isinstance(result, Exception)
-            ]
-
-            if failed_handlers:
+            failed_count = sum(1 for result in results if result is False)
+            if failed_count:
+                self.metrics.handler_failures += failed_count
                 logger.error(
                     "Some event handlers failed",
                     event_id=str(event.event_id),
-                    failed_count=len(failed_handlers),
+                    failed_count=failed_count,
                     total_handlers=len(handlers_to_execute),
                 )
 
-        # Persist event if enabled
-        if self.enable_persistence:
-            await self._persist_event(event)
+    # ===== Queued dispatch =====
 
-    async def _execute_handler_safely(self, handler: EventHandler, event: BaseEvent):
-        """Execute handler with timeout and error handling"""
+    def _ensure_dispatcher(self) -> _DispatchQueue:
+        """Start the dispatch queue and workers on the running loop if needed"""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            if self._queue is not None and self._queue.qsize():
+                logger.warning(
+                    "Dropping events queued on a closed event loop", dropped=self._queue.qsize()
+                )
+            self._queue = _DispatchQueue(maxsize=self.queue_size)
+            self._loop = loop
+            self._workers = [
+                loop.create_task(self._dispatch_worker(self._queue))
+                for _ in range(max(1, self.dispatch_workers))
+            ]
+        return self._queue
+
+    async def _enqueue(self, event: BaseEvent):
+        queue = self._ensure_dispatcher()
+        item = (event, time.monotonic())
         try:
-            # Add timeout to prevent hanging handlers
-            await asyncio.wait_for(handler.handle(event), timeout=30.0)
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if _in_dispatch_worker.get():
+                # A handler re-publishing: waiting here would stall the worker that has to
+                # drain the queue, so overshoot the bound instead
+                self.metrics.overflow_enqueues += 1
+                queue.put_unbounded(item)
+            else:
+                # Bounded queue: slow handlers push back on publishers instead of growing memory
+                self.metrics.queue_full_waits += 1
+                await queue.put(item)
+        self.metrics.record_enqueued(queue.qsize())
+
+    async def _dispatch_worker(self, queue: _DispatchQueue):
+        _in_dispatch_worker.set(True)
+        while True:
+            event, enqueued_at = await queue.get()
+            try:
+                self.metrics.record_dispatched(
+                    (time.monotonic() - enqueued_at) * 1000, queue.qsize()
+                )
+                await self._dispatch(event)
+            except Exception as e:
+                logger.error("Event dispatch failed", event_id=str(event.event_id), error=str(e))
+            finally:
+                queue.task_done()
+
+    async def drain(self):
+        """Wait until every queued event was dispatched and buffered events are persisted"""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+        if self.enable_persistence:
+            await self._persistence.flush()
+
+    async def shutdown(self):
+        """Drain the queue, stop the dispatch workers and flush pending persistence"""
+        await self.drain()
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._loop = None
+        await self._persistence.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, lag, handler concurrency and persistence metrics"""
+        handlers = [*self._global_handlers]
+        for registered in self._handlers.values():
+            handlers.extend(registered)
+
+        return {
+            "dispatch_mode": self.dispatch_mode.value,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_size": self.queue_size,
+            "dispatch_workers": len(self._workers),
+            **self.metrics.snapshot(),
+            "handlers": {
+                handler.handler_name: {
+                    "in_flight": handler.in_flight,
+                    "peak_in_flight": handler.peak_in_flight,
+                    "max_concurrency": handler.max_concurrency,
+                    "throttled": handler.throttled,
+                }
+                for handler in handlers
+            },
+            "persistence": self._persistence.stats() if self.enable_persistence else None,
+        }
+
+    async def _execute_handler_safely(self, handler: EventHandler, event: BaseEvent) -> bool:
+        """Execute handler with concurrency limit, timeout and error handling"""
+        try:
+            async with handler.slot():
+                # Add timeout to prevent hanging handlers
+                await asyncio.wait_for(handler.handle(event), timeout=HANDLER_TIMEOUT_SECONDS)
+            return True
         except asyncio.TimeoutError:
             logger.error(
                 "Event handler timed out",
                 handler_name=handler.handler_name,
                 event_id=str(event.event_id),
-                timeout_seconds=30,
+                timeout_seconds=HANDLER_TIMEOUT_SECONDS,
             )
         except Exception as e:
             logger.error(
@@ -213,6 +631,7 @@ class EventBus:
                 exc_info=True,
             )
             # Don't re-raise - we want other handlers to continue
+        return False
 
     def _add_to_history(self, event: BaseEvent):
         """Add event to history with size limit"""
@@ -223,25 +642,9 @@ class EventBus:
             self._event_history = self._event_history[-self._max_history_size :]
 
     async def _persist_event(self, event: BaseEvent):
-        """Persist event to database (if enabled)"""
-        try:
-            from shared.database.connection import get_db_session
-            from shared.database.models import EventStore
-
-            async with get_db_session() as session:
-                event_record = EventStore(
-                    event_id=event.event_id,
-                    event_type=event.event_name,
-                    aggregate_id=event.aggregate_id,
-                    event_data=event.model_dump(),
-                    correlation_id=event.correlation_id,
-                    timestamp=event.timestamp,
-                )
-                session.add(event_record)
-                await session.commit()
-
-        except Exception as e:
-            logger.error("Failed to persist event", event_id=str(event.event_id), error=str(e))
+        """Persist a single event immediately (bypasses batching)"""
+        self._persistence.add(event)
+        await self._persistence.flush()
 
     def get_event_history(self, limit: int = 100) -> List[BaseEvent]:
         """Get recent event history for debugging"""
@@ -264,7 +667,8 @@ def get_event_bus() -> EventBus:
     """Get the global event bus instance"""
     global _event_bus
     if _event_bus is None:
-        _event_bus = EventBus(enable_persistence=True)
+        # Publishers (import pipelines, API handlers) should not wait on subscribers
+        _event_bus = EventBus(enable_persistence=True, dispatch_mode=DispatchMode.QUEUED)
     return _event_bus
 
 
@@ -279,10 +683,11 @@ def subscribe_to_event(
     event_type: Union[str, Type[BaseEvent]],
     handler: Callable[[BaseEvent], Any],
     handler_name: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
 ):
     """Subscribe to event using global event bus"""
     bus = get_event_bus()
-    bus.subscribe(event_type, handler, handler_name)
+    bus.subscribe(event_type, handler, handler_name, max_concurrency)
 
 
 def subscribe_to_domain_events(
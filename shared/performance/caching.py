@@ -3,16 +3,21 @@ Advanced Caching System
 Multi-layer caching with Redis, in-memory, and database-level optimizations.
 """
 
-import asyncio
+import heapq
 import json
 import pickle
+import sys
 import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
 from functools import wraps
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
 import structlog
 
+from shared.caching.single_flight import SingleFlight, should_refresh_early
+
 logger = structlog.get_logger(__name__)
 
 
@@ -32,91 +37,194 @@ class CacheKey:
         return f"{self.namespace}:*:{pattern}:*"
 
 
+class _CacheEntry:
+    """Single in-memory cache slot"""
+
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: Any, expires_at: float, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+def _estimate_size(value: Any, depth: int = 2) -> int:
+    """Approximate the memory footprint of a cached value in bytes.
+
+    Walks containers a couple of levels deep so product dicts and result lists are
+    counted by their contents rather than just their header.
+    """
+    size = sys.getsizeof(value)
+    if depth <= 0:
+        return size
+
+    if isinstance(value, dict):
+        for item_key, item_value in value.items():
+            size += _estimate_size(item_key, 0) + _estimate_size(item_value, depth - 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _estimate_size(item, depth - 1)
+
+    return size
+
+
 class InMemoryCache:
-    """High-performance in-memory cache with TTL and size limits"""
+    """High-performance in-memory cache with TTL and size limits
+
+    Entries live in an ``OrderedDict`` kept in recency order, so lookups, inserts
+    and LRU evictions are O(1). Expiry times are tracked in a min-heap that is
+    drained lazily on writes; reads check the entry's own deadline. Operations
+    never await, so they are atomic on the event loop and need no lock.
+    """
 
-    def __init__(self, max_size: int = 10000, default_ttl: int = 3600):
-        self.cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(
+        self, max_size: int = 10000, default_ttl: int = 3600, max_bytes: Optional[int] = None
+    ):
         self.max_size = max_size
+        self.max_bytes = max_bytes
         self.default_ttl = default_ttl
-        self.access_times: Dict[str, float] = {}
-        self._lock = asyncio.Lock()
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._bytes = 0
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.expires_at > time.monotonic()
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate bytes held by live entries"""
+        return self._bytes
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
-        async with self._lock:
-            if key not in self.cache:
-                return None
-
-            entry = self.cache[key]
+        return self.get_nowait(key)
 
-            # Check if expired
-            if entry["expires_at"] < time.time():
-                del self.cache[key]
-                self.access_times.pop(key, None)
-                return None
+    def get_nowait(self, key: str) -> Optional[Any]:
+        """Get value from cache without yielding to the event loop"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
 
-            # Update access time
-            self.access_times[key] = time.time()
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
 
-            logger.debug("In-memory cache hit", key=key)
-            return entry["value"]
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache"""
-        async with self._lock:
-            # Evict if cache is full
-            if len(self.cache) >= self.max_size:
-                await self._evict_lru()
+        self.set_nowait(key, value, ttl)
 
-            ttl = ttl or self.default_ttl
-            expires_at = time.time() + ttl
+    def set_nowait(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in cache without yielding to the event loop"""
+        now = time.monotonic()
+        ttl = ttl or self.default_ttl
+        expires_at = now + ttl
+        size = _estimate_size(key, 0) + _estimate_size(value)
 
-            self.cache[key] = {"value": value, "expires_at": expires_at, "created_at": time.time()}
-            self.access_times[key] = time.time()
+        if key in self._entries:
+            self._remove(key)
 
-            logger.debug("In-memory cache set", key=key, ttl=ttl)
+        self._entries[key] = _CacheEntry(value, expires_at, size)
+        self._bytes += size
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        self.sets += 1
 
-    async def delete(self, key: str) -> bool:
-        """Delete value from cache"""
-        async with self._lock:
-            if key in self.cache:
-                del self.cache[key]
-                self.access_times.pop(key, None)
-                logger.debug("In-memory cache delete", key=key)
-                return True
-            return False
+        self._purge_expired(now)
+        self._enforce_limits()
 
-    async def clear(self) -> None:
-        """Clear all cache entries"""
-        async with self._lock:
-            self.cache.clear()
-            self.access_times.clear()
-            logger.info("In-memory cache cleared")
+        logger.debug("In-memory cache set", key=key, ttl=ttl)
 
-    async def _evict_lru(self) -> None:
-        """Evict least recently used entries"""
-        if not self.access_times:
-            return
+    async def delete(self, key: str) -> bool:
+        """Delete value from cache"""
+        return self.delete_nowait(key)
 
-        # Find the least recently used key
-        lru_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
+    def delete_nowait(self, key: str) -> bool:
+        """Delete value from cache without yielding to the event loop"""
+        if self._remove(key):
+            logger.debug("In-memory cache delete", key=key)
+            return True
+        return False
 
-        del self.cache[lru_key]
-        del self.access_times[lru_key]
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching a glob pattern (same syntax as Redis SCAN MATCH)"""
+        matched = [key for key in self._entries if fnmatchcase(key, pattern)]
+        for key in matched:
+            self._remove(key)
+        return len(matched)
 
-        logger.debug("Evicted LRU entry", key=lru_key)
+    async def clear(self) -> None:
+        """Clear all cache entries"""
+        self._entries.clear()
+        self._expiry_heap.clear()
+        self._bytes = 0
+        logger.info("In-memory cache cleared")
+
+    def _remove(self, key: str) -> bool:
+        """Drop an entry; its heap slot is discarded lazily"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        return True
+
+    def _purge_expired(self, now: float) -> None:
+        """Pop due deadlines off the expiry heap, skipping ones for replaced entries"""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                self.expirations += 1
+
+        # Overwrites leave stale deadlines behind; rebuild before they dominate the heap
+        if len(heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [(entry.expires_at, key) for key, entry in self._entries.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _enforce_limits(self) -> None:
+        """Evict least recently used entries until count and byte limits hold"""
+        while self._entries and (
+            len(self._entries) > self.max_size
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            lru_key, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.evictions += 1
+            logger.debug("Evicted LRU entry", key=lru_key)
 
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        now = time.time()
-        expired_count = sum(1 for entry in self.cache.values() if entry["expires_at"] < now)
-
+        lookups = self.hits + self.misses
         return {
-            "size": len(self.cache),
+            "size": len(self._entries),
             "max_size": self.max_size,
-            "expired_entries": expired_count,
-            "hit_rate": getattr(self, "_hit_rate", 0.0),
+            "size_bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
         }
 
 
@@ -232,9 +340,12 @@ class MultiLevelCache:
         l1_max_size: int = 1000,
         l1_ttl: int = 300,  # 5 minutes
         l2_ttl: int = 3600,  # 1 hour
+        l1_max_bytes: Optional[int] = None,
     ):
         self.key_generator = CacheKey()
-        self.l1_cache = InMemoryCache(max_size=l1_max_size, default_ttl=l1_ttl)
+        self.l1_cache = InMemoryCache(
+            max_size=l1_max_size, default_ttl=l1_ttl, max_bytes=l1_max_bytes
+        )
         self.l2_cache = RedisCache(redis_url)
         self.l2_ttl = l2_ttl
 
@@ -287,8 +398,7 @@ class MultiLevelCache:
 
     async def clear_pattern(self, pattern: str) -> int:
         """Clear entries matching pattern from both layers"""
-        # L1 cache doesn't support patterns, so clear all
-        await self.l1_cache.clear()
+        await self.l1_cache.delete_pattern(pattern)
 
         # Clear pattern from L2
         return await self.l2_cache.clear_pattern(pattern)
@@ -297,8 +407,10 @@ class MultiLevelCache:
         """Get cache performance statistics"""
         total_requests = self.stats["l1_hits"] + self.stats["l2_hits"] + self.stats["misses"]
 
+        l1_stats = self.l1_cache.stats()
+
         if total_requests == 0:
-            return {**self.stats, "hit_rate": 0.0, "l1_hit_rate": 0.0}
+            return {**self.stats, "hit_rate": 0.0, "l1_hit_rate": 0.0, "l1": l1_stats}
 
         hit_rate = (self.stats["l1_hits"] + self.stats["l2_hits"]) / total_requests
         l1_hit_rate = self.stats["l1_hits"] / total_requests
@@ -308,16 +420,31 @@ class MultiLevelCache:
             "hit_rate": hit_rate,
             "l1_hit_rate": l1_hit_rate,
             "total_requests": total_requests,
+            "l1": l1_stats,
         }
 
 
 # Decorators for caching
+_RESULT_ENVELOPE = "__cached_result__"
+_result_flight = SingleFlight()
+
+
 def cache_result(
     ttl: int = 3600,
     key_prefix: Optional[str] = None,
     cache_instance: Optional[MultiLevelCache] = None,
+    stale_ttl: int = 0,
+    early_refresh_beta: float = 0.0,
 ):
-    """Decorator to cache function results"""
+    """Decorator to cache function results
+
+    Concurrent misses for the same key share a single call. With ``stale_ttl`` an
+    expired result keeps being served for that many seconds while one background
+    call refreshes it; ``early_refresh_beta`` > 0 additionally refreshes fresh
+    results probabilistically just before they expire. Only use background
+    refreshes for functions that do not depend on request-scoped resources such
+    as the caller's database session.
+    """
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -329,18 +456,40 @@ def cache_result(
             prefix = key_prefix or f"{func.__module__}.{func.__name__}"
             key = cache.key_generator.generate(prefix, *args, str(sorted(kwargs.items())))
 
-            # Try to get from cache
-            cached_result = await cache.get(key)
-            if cached_result is not None:
-                logger.debug("Cache hit", function=func.__name__, key=key)
-                return cached_result
-
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-            await cache.set(key, result, ttl)
+            async def load():
+                started = time.perf_counter()
+                result = await func(*args, **kwargs)
+                envelope = {
+                    _RESULT_ENVELOPE: True,
+                    "value": result,
+                    "fresh_until": time.time() + ttl,
+                    "compute_seconds": time.perf_counter() - started,
+                }
+                await cache.set(key, envelope, ttl + stale_ttl)
+                logger.debug("Cache miss, result cached", function=func.__name__, key=key)
+                return result
 
-            logger.debug("Cache miss, result cached", function=func.__name__, key=key)
-            return result
+            # Try to get from cache
+            cached = await cache.get(key)
+            if isinstance(cached, dict) and cached.get(_RESULT_ENVELOPE):
+                now = time.time()
+                if now < cached["fresh_until"]:
+                    if should_refresh_early(
+                        cached["fresh_until"], cached["compute_seconds"], early_refresh_beta, now
+                    ):
+                        _result_flight.refresh_in_background(key, load)
+                    logger.debug("Cache hit", function=func.__name__, key=key)
+                    return cached["value"]
+
+                if stale_ttl > 0:
+                    _result_flight.refresh_in_background(key, load)
+                    logger.debug("Stale cache hit", function=func.__name__, key=key)
+                    return cached["value"]
+            elif cached is not None:
+                # Written before results were wrapped
+                return cached
+
+            return await _result_flight.do(key, load)
 
         return wrapper
 
@@ -373,10 +522,10 @@ def invalidate_cache(pattern: str, cache_instance: Optional[MultiLevelCache] = N
 _cache: Optional[MultiLevelCache] = None
 
 
-async def initialize_cache(redis_url: Optional[str] = None):
+async def initialize_cache(redis_url: Optional[str] = None, l1_max_bytes: Optional[int] = None):
     """Initialize the global cache"""
     global _cache
-    _cache = MultiLevelCache(redis_url=redis_url)
+    _cache = MultiLevelCache(redis_url=redis_url, l1_max_bytes=l1_max_bytes)
     await _cache.initialize()
 
 
@@ -5,10 +5,11 @@ Handles high-volume data processing with chunking, queuing, and parallel executi
 
 import asyncio
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Protocol
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Protocol, Tuple
 from uuid import UUID
 
 import structlog
@@ -26,6 +27,9 @@ from shared.exceptions.domain_exceptions import BatchProcessingException
 
 logger = structlog.get_logger(__name__)
 
+# Marks the end of the source stream in the chunk queue
+_END_OF_STREAM = object()
+
 
 class ProcessingStage(str, Enum):
     """Processing pipeline stages"""
@@ -40,6 +44,24 @@ class ProcessingStage(str, Enum):
     FAILED = "failed"
 
 
+# Stages applied to every chunk, in order
+PIPELINE_STAGE_ORDER = [
+    ProcessingStage.PARSING,
+    ProcessingStage.VALIDATION,
+    ProcessingStage.TRANSFORMATION,
+    ProcessingStage.PERSISTENCE,
+]
+
+
+class ExecutionMode(str, Enum):
+    """How chunks move through the registered stages"""
+
+    # Each chunk runs through all stages inside one task
+    CHUNKED = "chunked"
+    # Each stage has its own workers, connected by bounded queues
+    STAGED = "staged"
+
+
 class ProcessingPriority(str, Enum):
     """Processing priority levels"""
 
@@ -49,6 +71,79 @@ class ProcessingPriority(str, Enum):
     CRITICAL = "critical"
 
 
+@dataclass
+class StageConfig:
+    """Worker pool settings for a stage in staged execution mode"""
+
+    workers: int = 1
+    # Chunks buffered in front of the stage before upstream stages block
+    queue_size: int = 2
+    # Run ``process_chunk_sync`` in a process pool instead of ``process_chunk`` on the loop
+    cpu_bound: bool = False
+
+
+@dataclass
+class StageStats:
+    """Throughput, latency and backpressure of a single stage in staged mode"""
+
+    workers: int
+    cpu_bound: bool = False
+    chunks_processed: int = 0
+    records_in: int = 0
+    records_out: int = 0
+    records_failed: int = 0
+    busy_seconds: float = 0.0
+    max_latency_ms: float = 0.0
+    queue_wait_seconds: float = 0.0
+    blocked_put_seconds: float = 0.0
+    peak_queue_depth: int = 0
+    first_started_at: Optional[float] = None
+    last_finished_at: Optional[float] = None
+
+    def record_chunk(
+        self, started: float, finished: float, waited: float, records_in: int, records_out: int
+    ) -> None:
+        latency_ms = (finished - started) * 1000
+        self.chunks_processed += 1
+        self.records_in += records_in
+        self.records_out += records_out
+        self.busy_seconds += finished - started
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self.queue_wait_seconds += waited
+        if self.first_started_at is None or started < self.first_started_at:
+            self.first_started_at = started
+        self.last_finished_at = max(self.last_finished_at or finished, finished)
+
+    @property
+    def avg_latency_ms(self) -> float:
+        if not self.chunks_processed:
+            return 0.0
+        return self.busy_seconds * 1000 / self.chunks_processed
+
+    @property
+    def records_per_second(self) -> float:
+        if self.first_started_at is None or self.last_finished_at is None:
+            return 0.0
+        elapsed = self.last_finished_at - self.first_started_at
+        return self.records_in / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "cpu_bound": self.cpu_bound,
+            "chunks_processed": self.chunks_processed,
+            "records_in": self.records_in,
+            "records_out": self.records_out,
+            "records_failed": self.records_failed,
+            "records_per_second": round(self.records_per_second, 2),
+            "avg_latency_ms": round(self.avg_latency_ms, 2),
+            "max_latency_ms": round(self.max_latency_ms, 2),
+            "queue_wait_seconds": round(self.queue_wait_seconds, 3),
+            "blocked_put_seconds": round(self.blocked_put_seconds, 3),
+            "peak_queue_depth": self.peak_queue_depth,
+        }
+
+
 @dataclass
 class ProcessingContext:
     """Context object passed through the pipeline stages"""
@@ -63,6 +158,19 @@ class ProcessingContext:
     metadata: Dict[str, Any] = field(default_factory=dict)
     start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
+    # Chunk executor metrics
+    max_concurrency: int = 0
+    in_flight_chunks: int = 0
+    peak_in_flight_chunks: int = 0
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+    busy_slot_seconds: float = 0.0
+    executor_started_at: Optional[float] = None
+    executor_seconds: Optional[float] = None
+
+    # Per-stage metrics, only populated in staged execution mode
+    stage_stats: Dict[str, StageStats] = field(default_factory=dict)
+
     @property
     def progress_percentage(self) -> float:
         """Calculate processing progress percentage"""
@@ -70,6 +178,18 @@ class ProcessingContext:
             return 0.0
         return (self.processed_records / self.total_records) * 100
 
+    @property
+    def slot_utilization(self) -> float:
+        """Share of executor slot time spent processing chunks (0.0 - 1.0)"""
+        if self.executor_started_at is None or self.max_concurrency == 0:
+            return 0.0
+        elapsed = self.executor_seconds
+        if elapsed is None:
+            elapsed = time.monotonic() - self.executor_started_at
+        if elapsed <= 0:
+            return 0.0
+        return min(1.0, self.busy_slot_seconds / (elapsed * self.max_concurrency))
+
 
 @dataclass
 class ChunkResult:
@@ -101,6 +221,34 @@ class ProcessingStageProtocol(Protocol):
         ...
 
 
+class CpuBoundStageProtocol(ProcessingStageProtocol, Protocol):
+    """
+    Stage whose work can be shipped to a process pool.
+
+    ``process_chunk_sync`` must be picklable together with its stage instance and
+    must not use the event loop or database sessions.
+    """
+
+    def process_chunk_sync(
+        self, chunk_data: List[Dict[str, Any]], source_type: str, chunk_index: int = 0
+    ) -> Tuple[List[Dict[str, Any]], ChunkResult]:
+        """Process a chunk, returning the output records and the chunk result"""
+        ...
+
+
+@dataclass
+class _StagedChunk:
+    """A chunk travelling between stage queues in staged mode"""
+
+    index: int
+    records: List[Dict[str, Any]]
+    input_records: int
+    started_at: float
+    enqueued_at: float = 0.0
+    failed: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
 class AsyncProcessingPipeline:
     """
     High-performance async processing pipeline for large-scale imports.
@@ -113,22 +261,36 @@ class AsyncProcessingPipeline:
         chunk_size: int = 1000,
         max_retries: int = 3,
         retry_delay: float = 2.0,
+        queue_size: Optional[int] = None,
+        execution_mode: ExecutionMode = ExecutionMode.CHUNKED,
     ):
         self.max_concurrent_chunks = max_concurrent_chunks
         self.chunk_size = chunk_size
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        # Chunks read ahead of the executor; defaults to twice the concurrency
+        self.queue_size = queue_size
+        self.execution_mode = execution_mode
 
         self.stages: Dict[ProcessingStage, ProcessingStageProtocol] = {}
+        self.stage_configs: Dict[ProcessingStage, StageConfig] = {}
         self.progress_callbacks: List[Callable[[ProcessingContext], None]] = []
 
         # Processing state
         self._active_pipelines: Dict[UUID, ProcessingContext] = {}
         self._processing_semaphore = asyncio.Semaphore(max_concurrent_chunks)
 
-    def register_stage(self, stage: ProcessingStage, processor: ProcessingStageProtocol):
-        """Register a processing stage"""
+    def register_stage(
+        self,
+        stage: ProcessingStage,
+        processor: ProcessingStageProtocol,
+        config: Optional[StageConfig] = None,
+    ):
+        """Register a processing stage, with optional worker settings for staged mode"""
+        if config is not None and config.cpu_bound and not hasattr(processor, "process_chunk_sync"):
+            raise ValueError(f"Stage {stage} is marked cpu_bound but has no process_chunk_sync")
         self.stages[stage] = processor
+        self.stage_configs[stage] = config or StageConfig()
         logger.info(f"Registered processing stage: {stage}")
 
     def add_progress_callback(self, callback: Callable[[ProcessingContext], None]):
@@ -142,6 +304,7 @@ class AsyncProcessingPipeline:
         source_type: str,
         total_records: Optional[int] = None,
         priority: ProcessingPriority = ProcessingPriority.NORMAL,
+        execution_mode: Optional[ExecutionMode] = None,
     ) -> ProcessingContext:
         """
         Process large dataset using async pipeline with chunking and parallel processing.
@@ -152,6 +315,7 @@ class AsyncProcessingPipeline:
             source_type: Type of data source (e.g., 'retailer_catalog')
             total_records: Total number of records (if known)
             priority: Processing priority level
+            execution_mode: Overrides the pipeline's execution mode for this dataset
 
         Returns:
             Final processing context with results
@@ -164,6 +328,7 @@ class AsyncProcessingPipeline:
             total_records=total_records or 0,
             chunk_size=self.chunk_size,
         )
+        execution_mode = execution_mode or self.execution_mode
 
         self._active_pipelines[batch_id] = context
 
@@ -184,6 +349,7 @@ class AsyncProcessingPipeline:
             source_type=source_type,
             total_records=total_records,
             priority=priority,
+            execution_mode=execution_mode,
         )
 
         try:
@@ -191,31 +357,12 @@ class AsyncProcessingPipeline:
             for stage, processor in self.stages.items():
                 await processor.setup(context)
 
-            # Process data in chunks with concurrency control
-            chunk_tasks = []
-            async for chunk_data in data_stream:
-                if not chunk_data:
-                    continue
-
-                # Update total records if not known initially
-                if context.total_records == 0:
-                    context.total_records += len(chunk_data)
-
-                # Create async task for chunk processing
-                task = asyncio.create_task(self._process_chunk_with_retry(chunk_data, context))
-                chunk_tasks.append(task)
-
-                # Control concurrency - process in batches
-                if len(chunk_tasks) >= self.max_concurrent_chunks:
-                    # Wait for current batch to complete
-                    chunk_results = await asyncio.gather(*chunk_tasks, return_exceptions=True)
-                    await self._handle_chunk_results(chunk_results, context)
-                    chunk_tasks.clear()
-
-            # Process remaining chunks
-            if chunk_tasks:
-                chunk_results = await asyncio.gather(*chunk_tasks, return_exceptions=True)
-                await self._handle_chunk_results(chunk_results, context)
+            if execution_mode == ExecutionMode.STAGED:
+                # Stages run concurrently on different chunks
+                await self._run_staged_executor(data_stream, context)
+            else:
+                # Process data in chunks with a sliding window of concurrent chunks
+                await self._run_chunk_executor(data_stream, context)
 
             # Cleanup all stages
             for stage, processor in self.stages.items():
@@ -244,6 +391,10 @@ class AsyncProcessingPipeline:
                 failed_records=context.failed_records,
                 progress=context.progress_percentage,
                 duration_seconds=processing_time,
+                slot_utilization=round(context.slot_utilization, 3),
+                peak_queue_depth=context.peak_queue_depth,
+                stage_stats={name: stats.to_dict() for name, stats in context.stage_stats.items()}
+                or None,
             )
 
         except Exception as e:
@@ -284,6 +435,79 @@ class AsyncProcessingPipeline:
 
         return context
 
+    async def _run_chunk_executor(
+        self,
+        data_stream: AsyncGenerator[List[Dict[str, Any]], None],
+        context: ProcessingContext,
+    ) -> None:
+        """
+        Bounded work-queue executor for the chunk stream.
+
+        A reader task pulls chunks from ``data_stream`` into a bounded queue while
+        ``max_concurrent_chunks`` workers take chunks off it, so a new chunk starts
+        as soon as any slot frees up and reading overlaps with processing. The
+        queue bound provides backpressure on the source. A source error is raised
+        after the chunks already queued have been processed.
+        """
+        workers = max(1, self.max_concurrent_chunks)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size or workers * 2)
+
+        context.max_concurrency = workers
+        context.executor_started_at = time.monotonic()
+
+        async def read_source() -> None:
+            try:
+                async for chunk_data in data_stream:
+                    if not chunk_data:
+                        continue
+
+                    # Update total records if not known initially
+                    if context.total_records == 0:
+                        context.total_records += len(chunk_data)
+
+                    await queue.put(chunk_data)
+                    context.queue_depth = queue.qsize()
+                    context.peak_queue_depth = max(context.peak_queue_depth, context.queue_depth)
+            except Exception:
+                await queue.put(_END_OF_STREAM)
+                raise
+            await queue.put(_END_OF_STREAM)
+
+        async def run_worker() -> None:
+            while True:
+                chunk_data = await queue.get()
+                context.queue_depth = queue.qsize()
+                if chunk_data is _END_OF_STREAM:
+                    # Pass the marker on to the next worker
+                    queue.put_nowait(_END_OF_STREAM)
+                    return
+
+                context.in_flight_chunks += 1
+                context.peak_in_flight_chunks = max(
+                    context.peak_in_flight_chunks, context.in_flight_chunks
+                )
+                started = time.monotonic()
+                try:
+                    result = await self._process_chunk_with_retry(chunk_data, context)
+                except Exception as e:
+                    result = e
+                finally:
+                    context.in_flight_chunks -= 1
+                    context.busy_slot_seconds += time.monotonic() - started
+
+                await self._handle_chunk_results([result], context)
+
+        reader = asyncio.create_task(read_source())
+        worker_tasks = [asyncio.create_task(run_worker()) for _ in range(workers)]
+        try:
+            await asyncio.gather(*worker_tasks)
+            await reader
+        finally:
+            for task in (reader, *worker_tasks):
+                if not task.done():
+                    task.cancel()
+            context.executor_seconds = time.monotonic() - context.executor_started_at
+
     async def _process_chunk_with_retry(
         self, chunk_data: List[Dict[str, Any]], context: ProcessingContext
     ) -> ChunkResult:
@@ -303,12 +527,7 @@ class AsyncProcessingPipeline:
                     total_failed = 0
                     all_errors = []
 
-                    for stage in [
-                        ProcessingStage.PARSING,
-                        ProcessingStage.VALIDATION,
-                        ProcessingStage.TRANSFORMATION,
-                        ProcessingStage.PERSISTENCE,
-                    ]:
+                    for stage in PIPELINE_STAGE_ORDER:
                         if stage not in self.stages:
                             continue
 
@@ -317,32 +536,7 @@ class AsyncProcessingPipeline:
                         total_failed += stage_result.records_failed
                         all_errors.extend(stage_result.errors)
 
-                        # Update progress
-                        context.processed_records += stage_result.records_processed
-                        context.failed_records += stage_result.records_failed
-
-                        # Publish progress event
-                        await publish_event(
-                            ImportBatchProgressEvent(
-                                aggregate_id=context.batch_id,
-                                batch_id=context.batch_id,
-                                processed_records=context.processed_records,
-                                failed_records=context.failed_records,
-                                progress_percentage=context.progress_percentage,
-                                current_stage=stage.value,
-                            )
-                        )
-
-                        # Notify progress callbacks
-                        for callback in self.progress_callbacks:
-                            try:
-                                (
-                                    await callback(context)
-                                    if asyncio.iscoroutinefunction(callback)
-                                    else callback(context)
-                                )
-                            except Exception as cb_error:
-                                logger.warning(f"Progress callback error: {cb_error}")
+                        await self._report_stage_progress(stage, stage_result, context)
 
                     processing_time = (time.time() - start_time) * 1000
 
@@ -398,8 +592,252 @@ class AsyncProcessingPipeline:
                         )
                         await asyncio.sleep(delay)
 
+    async def _report_stage_progress(
+        self, stage: ProcessingStage, stage_result: ChunkResult, context: ProcessingContext
+    ) -> None:
+        """Fold a stage result into the context and notify progress listeners"""
+        # Update progress
+        context.processed_records += stage_result.records_processed
+        context.failed_records += stage_result.records_failed
+
+        # Publish progress event
+        await publish_event(
+            ImportBatchProgressEvent(
+                aggregate_id=context.batch_id,
+                batch_id=context.batch_id,
+                processed_records=context.processed_records,
+                failed_records=context.failed_records,
+                progress_percentage=context.progress_percentage,
+                current_stage=stage.value,
+            )
+        )
+
+        # Notify progress callbacks
+        for callback in self.progress_callbacks:
+            try:
+                (
+                    await callback(context)
+                    if asyncio.iscoroutinefunction(callback)
+                    else callback(context)
+                )
+            except Exception as cb_error:
+                logger.warning(f"Progress callback error: {cb_error}")
+
+    # ===== Staged execution =====
+
+    async def _run_staged_executor(
+        self,
+        data_stream: AsyncGenerator[List[Dict[str, Any]], None],
+        context: ProcessingContext,
+    ) -> None:
+        """
+        Dataflow executor: one worker pool per stage, connected by bounded queues.
+
+        While persistence works on chunk k, parsing can already run on chunk k+1,
+        so CPU-heavy and I/O-heavy stages overlap. Stages marked ``cpu_bound`` run
+        ``process_chunk_sync`` in a process pool. A full queue blocks the stage in
+        front of it, which propagates backpressure up to the source reader. Chunks
+        keep their relative order only within single-worker stages.
+        """
+        stages = [stage for stage in PIPELINE_STAGE_ORDER if stage in self.stages]
+        if not stages:
+            await self._run_chunk_executor(data_stream, context)
+            return
+
+        configs = [self.stage_configs.get(stage) or StageConfig() for stage in stages]
+        queues = [asyncio.Queue(maxsize=max(1, config.queue_size)) for config in configs]
+        stats = [
+            StageStats(workers=max(1, config.workers), cpu_bound=config.cpu_bound)
+            for config in configs
+        ]
+        for stage, stage_stats in zip(stages, stats):
+            context.stage_stats[stage.value] = stage_stats
+        executors: Dict[int, Executor] = {
+            position: self._create_stage_executor(config.workers)
+            for position, config in enumerate(configs)
+            if config.cpu_bound
+        }
+
+        context.max_concurrency = sum(stage_stats.workers for stage_stats in stats)
+        context.executor_started_at = time.monotonic()
+
+        async def put(position: int, item: Any) -> None:
+            queue = queues[position]
+            blocked_from = time.monotonic()
+            if isinstance(item, _StagedChunk):
+                item.enqueued_at = blocked_from
+            await queue.put(item)
+            stats[position].blocked_put_seconds += time.monotonic() - blocked_from
+            stats[position].peak_queue_depth = max(stats[position].peak_queue_depth, queue.qsize())
+            if position == 0:
+                context.queue_depth = queue.qsize()
+                context.peak_queue_depth = max(context.peak_queue_depth, context.queue_depth)
+
+        async def read_source() -> None:
+            try:
+                async for chunk_data in data_stream:
+                    if not chunk_data:
+                        continue
+
+                    # Update total records if not known initially
+                    if context.total_records == 0:
+                        context.total_records += len(chunk_data)
+
+                    chunk = _StagedChunk(
+                        index=context.current_chunk,
+                        records=chunk_data,
+                        input_records=len(chunk_data),
+                        started_at=time.monotonic(),
+                    )
+                    context.current_chunk += 1
+                    await put(0, chunk)
+            except Exception:
+                await put(0, _END_OF_STREAM)
+                raise
+            await put(0, _END_OF_STREAM)
+
+        async def run_worker(position: int) -> None:
+            queue = queues[position]
+            while True:
+                chunk = await queue.get()
+                if position == 0:
+                    context.queue_depth = queue.qsize()
+                if chunk is _END_OF_STREAM:
+                    # Pass the marker on to the other workers of this stage
+                    queue.put_nowait(_END_OF_STREAM)
+                    return
+
+                context.in_flight_chunks += 1
+                context.peak_in_flight_chunks = max(
+                    context.peak_in_flight_chunks, context.in_flight_chunks
+                )
+                try:
+                    forward = await self._run_stage_on_chunk(
+                        stages[position], chunk, context, stats[position], executors.get(position)
+                    )
+                finally:
+                    context.in_flight_chunks -= 1
+
+                if not forward:
+                    continue
+                if position + 1 < len(stages):
+                    await put(position + 1, chunk)
+                else:
+                    await self._finish_staged_chunk(chunk, context)
+
+        async def run_stage(position: int) -> None:
+            await asyncio.gather(*(run_worker(position) for _ in range(stats[position].workers)))
+            if position + 1 < len(stages):
+                await put(position + 1, _END_OF_STREAM)
+
+        reader = asyncio.create_task(read_source())
+        stage_tasks = [asyncio.create_task(run_stage(position)) for position in range(len(stages))]
+        try:
+            await asyncio.gather(*stage_tasks)
+            await reader
+        finally:
+            for task in (reader, *stage_tasks):
+                if not task.done():
+                    task.cancel()
+            for executor in executors.values():
+                executor.shutdown(wait=False, cancel_futures=True)
+            context.executor_seconds = time.monotonic() - context.executor_started_at
+            context.busy_slot_seconds = sum(stage_stats.busy_seconds for stage_stats in stats)
+
+    async def _run_stage_on_chunk(
+        self,
+        stage: ProcessingStage,
+        chunk: _StagedChunk,
+        context: ProcessingContext,
+        stage_stats: StageStats,
+        executor: Optional[Executor],
+    ) -> bool:
+        """
+        Run one stage on a staged chunk with retries. Returns False when the chunk
+        failed or has no records left and should not be sent downstream.
+        """
+        processor = self.stages[stage]
+        waited = time.monotonic() - chunk.enqueued_at
+        records_in = len(chunk.records)
+        started = time.monotonic()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                if executor is not None:
+                    loop = asyncio.get_running_loop()
+                    records, stage_result = await loop.run_in_executor(
+                        executor,
+                        processor.process_chunk_sync,
+                        chunk.records,
+                        context.source_type,
+                        chunk.index,
+                    )
+                    chunk.records = records
+                else:
+                    stage_result = await processor.process_chunk(chunk.records, context)
+                break
+            except Exception as e:
+                if attempt == self.max_retries:
+                    stage_stats.record_chunk(started, time.monotonic(), waited, records_in, 0)
+                    stage_stats.records_failed += records_in
+                    chunk.failed += records_in
+                    chunk.errors.append(f"Processing failed at {stage.value}: {str(e)}")
+                    context.failed_records += records_in
+
+                    logger.error(
+                        "Chunk stage failed after all retries",
+                        batch_id=str(context.batch_id),
+                        chunk_index=chunk.index,
+                        stage=stage.value,
+                        attempt=attempt + 1,
+                        error=str(e),
+                    )
+                    await self._finish_staged_chunk(chunk, context)
+                    return False
+
+                delay = self.retry_delay * (2**attempt)
+                logger.warning(
+                    "Chunk stage failed, retrying",
+                    batch_id=str(context.batch_id),
+                    chunk_index=chunk.index,
+                    stage=stage.value,
+                    attempt=attempt + 1,
+                    retry_delay=delay,
+                    error=str(e),
+                )
+                await asyncio.sleep(delay)
+
+        stage_stats.record_chunk(started, time.monotonic(), waited, records_in, len(chunk.records))
+        stage_stats.records_failed += stage_result.records_failed
+        chunk.failed += stage_result.records_failed
+        chunk.errors.extend(stage_result.errors)
+
+        await self._report_stage_progress(stage, stage_result, context)
+
+        if not chunk.records:
+            # Nothing left for downstream stages
+            await self._finish_staged_chunk(chunk, context)
+            return False
+        return True
+
+    async def _finish_staged_chunk(self, chunk: _StagedChunk, context: ProcessingContext) -> None:
+        result = ChunkResult(
+            chunk_index=chunk.index,
+            records_processed=chunk.input_records - chunk.failed,
+            records_failed=chunk.failed,
+            processing_time_ms=(time.monotonic() - chunk.started_at) * 1000,
+            errors=chunk.errors,
+        )
+        await self._handle_chunk_results([result], context)
+
+    @staticmethod
+    def _create_stage_executor(workers: int) -> Executor:
+        if workers > 1:
+            return ProcessPoolExecutor(max_workers=workers)
+        return ThreadPoolExecutor(max_workers=1)
+
     async def _handle_chunk_results(self, results: List[Any], context: ProcessingContext):
-        """Handle results from a batch of processed chunks"""
+        """Handle results of processed chunks"""
         for result in results:
             if isinstance(result, Exception):
                 logger.error(f"Chunk processing exception: {result}")
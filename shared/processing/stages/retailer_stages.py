@@ -5,7 +5,7 @@ Concrete implementations of processing stages for large-scale retailer imports.
 
 import re
 from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 import structlog
@@ -50,13 +50,33 @@ class RetailerParsingStage:
     ) -> ChunkResult:
         """Parse and normalize retailer data"""
 
+        parsed_records, result = self.process_chunk_sync(
+            chunk_data, context.source_type, context.current_chunk
+        )
+
+        # Replace chunk data with parsed data
+        chunk_data.clear()
+        chunk_data.extend(parsed_records)
+
+        return result
+
+    def process_chunk_sync(
+        self, chunk_data: List[Dict[str, Any]], source_type: str, chunk_index: int = 0
+    ) -> Tuple[List[Dict[str, Any]], ChunkResult]:
+        """
+        Parse a chunk without touching the event loop or the database.
+
+        Pure CPU work on picklable input, so the staged pipeline can run it in a
+        process pool. Returns the parsed records and the chunk result.
+        """
+
         parsed_records = []
         failed_records = 0
         errors = []
 
         for i, raw_record in enumerate(chunk_data):
             try:
-                parsed_record = await self._parse_retailer_record(raw_record, context.source_type)
+                parsed_record = self._parse_record(raw_record, source_type)
                 if parsed_record:
                     parsed_records.append(parsed_record)
                 else:
@@ -70,15 +90,11 @@ class RetailerParsingStage:
                     "Failed to parse retailer record",
                     record_index=i,
                     error=str(e),
-                    batch_id=str(context.batch_id),
+                    source_type=source_type,
                 )
 
-        # Replace chunk data with parsed data
-        chunk_data.clear()
-        chunk_data.extend(parsed_records)
-
-        return ChunkResult(
-            chunk_index=context.current_chunk,
+        return parsed_records, ChunkResult(
+            chunk_index=chunk_index,
             records_processed=len(parsed_records),
             records_failed=failed_records,
             processing_time_ms=0,  # Will be calculated by pipeline
@@ -89,6 +105,12 @@ class RetailerParsingStage:
         self, raw_record: Dict[str, Any], source_type: str
     ) -> Optional[Dict[str, Any]]:
         """Parse and normalize a single retailer record"""
+        return self._parse_record(raw_record, source_type)
+
+    def _parse_record(
+        self, raw_record: Dict[str, Any], source_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """Synchronous record parser shared by the async and process-pool paths"""
 
         # Check required fields
         missing_fields = [field for field in self.required_fields if not raw_record.get(field)]
@@ -6,19 +6,55 @@ backpressure control, and parallel processing.
 
 import asyncio
 import csv
-import io
+import itertools
 from dataclasses import dataclass
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from enum import Enum
+from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional, Union
 from uuid import UUID
 
 import aiofiles
 import structlog
 
-from shared.processing.async_pipeline import ProcessingContext, get_async_pipeline
+from shared.processing.async_pipeline import ExecutionMode, ProcessingContext, get_async_pipeline
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 logger = structlog.get_logger(__name__)
 
 
+class ChunkFormat(str, Enum):
+    """Shape of the chunks yielded by the CSV stream"""
+
+    ROWS = "rows"  # List of dicts, one per record
+    COLUMNS = "columns"  # ColumnarChunk, one list per column
+    ARROW = "arrow"  # pyarrow.RecordBatch (falls back to COLUMNS without pyarrow)
+
+
+@dataclass
+class ColumnarChunk:
+    """Column-oriented chunk for vectorized stages; ``len()`` is the row count"""
+
+    columns: Dict[str, List[Optional[str]]]
+    num_rows: int
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def to_records(self) -> List[Dict[str, Optional[str]]]:
+        names = list(self.columns)
+        return [dict(zip(names, values)) for values in zip(*self.columns.values())]
+
+
+CsvChunk = Union[List[Dict[str, Any]], ColumnarChunk, "pa.RecordBatch"]
+
+
 @dataclass
 class StreamingConfig:
     """Configuration for streaming processor"""
@@ -29,6 +65,8 @@ class StreamingConfig:
     buffer_size: int = 8192  # Buffer size for file reading
     enable_backpressure: bool = True
     progress_interval: int = 1000  # Report progress every N records
+    csv_block_size: int = 1 << 20  # Bytes read per block by the CSV reader thread
+    chunk_format: ChunkFormat = ChunkFormat.ROWS  # CSV stream consumers; pipelines get rows
 
 
 class DataStreamProcessor:
@@ -54,7 +92,12 @@ class DataStreamProcessor:
         self._backpressure_active = False
 
     async def process_csv_stream(
-        self, file_path: str, batch_id: UUID, source_type: str, encoding: str = "utf-8-sig"
+        self,
+        file_path: str,
+        batch_id: UUID,
+        source_type: str,
+        encoding: str = "utf-8-sig",
+        execution_mode: Optional[ExecutionMode] = None,
     ) -> ProcessingContext:
         """
         Process a large CSV file using streaming approach.
@@ -72,8 +115,8 @@ class DataStreamProcessor:
             # Estimate total records for progress tracking
             total_records = await self._estimate_csv_records(file_path)
 
-            # Create async generator for CSV data
-            data_stream = self._create_csv_stream(file_path, encoding)
+            # Pipeline stages take lists of row dicts, whatever chunk_format is configured
+            data_stream = self._create_csv_stream(file_path, encoding, ChunkFormat.ROWS)
 
             # Process using the async pipeline
             context = await self.pipeline.process_large_dataset(
@@ -81,6 +124,7 @@ class DataStreamProcessor:
                 data_stream=data_stream,
                 source_type=source_type,
                 total_records=total_records,
+                execution_mode=execution_mode,
             )
 
             return context
@@ -96,7 +140,11 @@ class DataStreamProcessor:
             raise
 
     async def process_json_stream(
-        self, file_path: str, batch_id: UUID, source_type: str
+        self,
+        file_path: str,
+        batch_id: UUID,
+        source_type: str,
+        execution_mode: Optional[ExecutionMode] = None,
     ) -> ProcessingContext:
         """
         Process a large JSON file using streaming approach.
@@ -125,6 +173,7 @@ class DataStreamProcessor:
                 data_stream=data_stream,
                 source_type=source_type,
                 total_records=total_records,
+                execution_mode=execution_mode,
             )
 
             return context
@@ -145,6 +194,7 @@ class DataStreamProcessor:
         batch_id: UUID,
         source_type: str,
         estimated_records: Optional[int] = None,
+        execution_mode: Optional[ExecutionMode] = None,
     ) -> ProcessingContext:
         """
         Process data from an API using streaming approach.
@@ -166,6 +216,7 @@ class DataStreamProcessor:
                 data_stream=data_stream,
                 source_type=source_type,
                 total_records=estimated_records,
+                execution_mode=execution_mode,
             )
 
             return context
@@ -180,64 +231,147 @@ class DataStreamProcessor:
             raise
 
     async def _create_csv_stream(
-        self, file_path: str, encoding: str
-    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
-        """Create async generator for CSV data"""
-        current_chunk = []
-        record_count = 0
-
-        async with aiofiles.open(
-            file_path, mode="r", encoding=encoding, buffering=self.config.buffer_size
-        ) as file:
-            # Read header
-            header_line = await file.readline()
-            if not header_line:
-                return
-
-            # Parse header
-            reader = csv.DictReader(io.StringIO(header_line))
-            fieldnames = reader.fieldnames
+        self, file_path: str, encoding: str, chunk_format: Optional[ChunkFormat] = None
+    ) -> AsyncGenerator[CsvChunk, None]:
+        """
+        Create async generator for CSV data.
 
-            async for line in file:
-                if not line.strip():
-                    continue
+        One CSV reader parses the file in ``csv_block_size`` blocks in a worker
+        thread, so quoted fields may span lines and the event loop only receives
+        finished chunks. The next chunk is read while the current one is consumed.
+        """
+        chunk_format = chunk_format or self.config.chunk_format
+        if chunk_format == ChunkFormat.ARROW and not PYARROW_AVAILABLE:
+            logger.info("pyarrow not installed, streaming CSV as column lists")
+            chunk_format = ChunkFormat.COLUMNS
 
-                try:
-                    # Parse CSV row
-                    row_reader = csv.DictReader(io.StringIO(line), fieldnames=fieldnames)
-                    row_data = next(row_reader)
+        if chunk_format == ChunkFormat.ARROW:
+            chunks = self._iter_csv_arrow_batches(file_path, encoding)
+        else:
+            chunks = self._iter_csv_chunks(file_path, encoding, chunk_format)
 
-                    # Clean the data
-                    clean_data = {k: (v.strip() if v else None) for k, v in row_data.items()}
-                    current_chunk.append(clean_data)
-                    record_count += 1
-
-                    # Check if chunk is full
-                    if len(current_chunk) >= self.config.chunk_size:
-                        # Apply backpressure if needed
-                        if self.config.enable_backpressure:
-                            await self._apply_backpressure()
+        record_count = 0
+        pending = asyncio.ensure_future(asyncio.to_thread(next, chunks, None))
+        try:
+            while True:
+                chunk = await pending
+                if chunk is None:
+                    break
+                pending = asyncio.ensure_future(asyncio.to_thread(next, chunks, None))
 
-                        yield current_chunk.copy()
-                        current_chunk.clear()
+                # Apply backpressure if needed
+                if self.config.enable_backpressure:
+                    await self._apply_backpressure()
 
-                        # Report progress
-                        if record_count % self.config.progress_interval == 0:
-                            logger.debug(
-                                "CSV streaming progress",
-                                records_processed=record_count,
-                                memory_mb=self._current_memory_mb,
-                            )
+                record_count += len(chunk)
+                yield chunk
 
-                except Exception as e:
-                    logger.warning(
-                        "Failed to parse CSV row", line_number=record_count + 1, error=str(e)
+                # Report progress
+                if record_count % self.config.progress_interval < len(chunk):
+                    logger.debug(
+                        "CSV streaming progress",
+                        records_processed=record_count,
+                        memory_mb=self._current_memory_mb,
                     )
-                    continue
+        finally:
+            # The reader thread may still be inside next(); let it finish before closing
+            await asyncio.wait([pending])
+            if not pending.cancelled():
+                pending.exception()  # a read-ahead error is moot once the consumer stopped
+            chunks.close()
+
+    def _iter_csv_chunks(
+        self, file_path: str, encoding: str, chunk_format: ChunkFormat
+    ) -> Iterator[CsvChunk]:
+        """Parse the CSV file with a single reader, yielding chunk_size rows at a time"""
+        with open(
+            file_path, mode="r", encoding=encoding, newline="", buffering=self.config.csv_block_size
+        ) as file:
+            reader = csv.reader(file)
+            fieldnames = next(reader, None)
+            if not fieldnames:
+                return
+            width = len(fieldnames)
+
+            while True:
+                rows = []
+                consumed = 0
+                for row in itertools.islice(reader, self.config.chunk_size):
+                    consumed += 1
+                    if len(row) == width:
+                        rows.append(row)
+                    elif not row or (len(row) == 1 and not row[0].strip()):
+                        continue  # blank line
+                    elif len(row) < width:
+                        rows.append(row + [None] * (width - len(row)))
+                    else:
+                        logger.warning(
+                            "Failed to parse CSV row",
+                            line_number=reader.line_num,
+                            error=f"expected {width} fields, got {len(row)}",
+                        )
+
+                if rows:
+                    if chunk_format == ChunkFormat.COLUMNS:
+                        columns = {
+                            name: [v.strip() if v else None for v in values]
+                            for name, values in zip(fieldnames, zip(*rows))
+                        }
+                        yield ColumnarChunk(columns=columns, num_rows=len(rows))
+                    else:
+                        yield [
+                            {k: (v.strip() if v else None) for k, v in zip(fieldnames, row)}
+                            for row in rows
+                        ]
+
+                if consumed < self.config.chunk_size:
+                    return
+
+    def _iter_csv_arrow_batches(self, file_path: str, encoding: str) -> Iterator[CsvChunk]:
+        """Parse the CSV file with pyarrow's multithreaded reader into chunk_size batches"""
+        with open(file_path, mode="r", encoding=encoding, newline="") as file:
+            fieldnames = next(csv.reader(file), None)
+        if not fieldnames:
+            return
+
+        codec = encoding.lower().replace("_", "-")
+        reader = pa_csv.open_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(
+                block_size=self.config.csv_block_size,
+                # Arrow skips a UTF-8 BOM itself; other codecs are transcoded
+                encoding="utf8" if codec in ("utf-8", "utf8", "utf-8-sig") else encoding,
+            ),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                # Keep raw strings like the row readers; typing is up to the stages
+                column_types={name: pa.string() for name in fieldnames},
+                strings_can_be_null=True,
+            ),
+        )
 
-            # Yield remaining records
-            if current_chunk:
-                yield current_chunk
+        pending: List["pa.RecordBatch"] = []
+        pending_rows = 0
+        for batch in reader:
+            pending.append(self._clean_arrow_batch(batch))
+            pending_rows += batch.num_rows
+            while pending_rows >= self.config.chunk_size:
+                table = pa.Table.from_batches(pending)
+                head = table.slice(0, self.config.chunk_size)
+                yield head.combine_chunks().to_batches()[0]
+                pending = table.slice(self.config.chunk_size).to_batches()
+                pending_rows -= self.config.chunk_size
+
+        if pending_rows:
+            yield pa.Table.from_batches(pending).combine_chunks().to_batches()[0]
+
+    @staticmethod
+    def _clean_arrow_batch(batch: "pa.RecordBatch") -> "pa.RecordBatch":
+        """Trim whitespace in every column, matching the row readers' cleanup"""
+        return pa.RecordBatch.from_arrays(
+            [pc.utf8_trim_whitespace(column) for column in batch.columns],
+            names=batch.schema.names,
+        )
 
     async def _create_jsonl_stream(
         self, file_path: str
@@ -7,11 +7,13 @@ Security middleware and API security utilities.
 Exports:
 - middleware: Security middleware (CORS, headers, rate limiting)
 - api_security: API security utilities and helpers
+- rate_limiting: GCRA rate limiter with in-process and Redis storage
 """
 
-from shared.security import api_security, middleware
+from shared.security import api_security, middleware, rate_limiting
 
 __all__ = [
     "middleware",
     "api_security",
+    "rate_limiting",
 ]
@@ -5,82 +5,19 @@ Enhanced security measures for selling APIs
 
 import hashlib
 import time
-from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Callable, Dict, Optional, Set
 
 import structlog
 from fastapi import HTTPException, Request, Response, status
 
-logger = structlog.get_logger(__name__)
-
+from shared.security.rate_limiting import RateLimit, get_rate_limiter
 
-class RateLimiter:
-    """Memory-based rate limiter with sliding window"""
-
-    def __init__(self):
-        self.requests: Dict[str, list] = defaultdict(list)
-        self.blocked_ips: Dict[str, datetime] = {}
-
-    def is_allowed(
-        self,
-        identifier: str,
-        limit: int = 100,
-        window_seconds: int = 3600,
-        block_duration_minutes: int = 15,
-    ) -> tuple[bool, Optional[int]]:
-        """
-        Check if request is allowed under rate limit
-
-        Args:
-            identifier: IP address or user identifier
-            limit: Maximum requests per window
-            window_seconds: Time window in seconds
-            block_duration_minutes: Block duration for exceeded limits
-
-        Returns:
-            (is_allowed, retry_after_seconds)
-        """
-        now = time.time()
-        window_start = now - window_seconds
-
-        # Check if IP is currently blocked
-        if identifier in self.blocked_ips:
-            unblock_time = self.blocked_ips[identifier]
-            if datetime.utcnow() < unblock_time:
-                retry_after = int((unblock_time - datetime.utcnow()).total_seconds())
-                return False, retry_after
-            else:
-                # Unblock expired blocks
-                del self.blocked_ips[identifier]
-
-        # Clean old requests outside the window
-        self.requests[identifier] = [
-            req_time for req_time in self.requests[identifier] if req_time > window_start
-        ]
-
-        # Check current request count
-        current_requests = len(self.requests[identifier])
-
-        if current_requests >= limit:
-            # Block the IP/user
-            block_until = datetime.utcnow() + timedelta(minutes=block_duration_minutes)
-            self.blocked_ips[identifier] = block_until
-
-            logger.warning(
-                "Rate limit exceeded",
-                identifier=identifier,
-                current_requests=current_requests,
-                limit=limit,
-                blocked_until=block_until.isoformat(),
-            )
+logger = structlog.get_logger(__name__)
 
-            retry_after = block_duration_minutes * 60
-            return False, retry_after
 
-        # Add current request
-        self.requests[identifier].append(now)
-        return True, None
+# Selling endpoints: 200 requests per hour per client, usable in one burst
+SELLING_RATE_LIMIT = RateLimit(rate=200, period=3600)
 
 
 class SecurityHeaders:
@@ -211,7 +148,6 @@ class AuditLogger:
 
 
 # Global instances
-rate_limiter = RateLimiter()
 input_sanitizer = InputSanitizer()
 request_validator = RequestValidator()
 audit_logger = AuditLogger()
@@ -246,18 +182,14 @@ async def security_middleware(request: Request, call_next: Callable) -> Response
 
         # Rate limiting for selling endpoints
         if "/selling/" in str(request.url.path):
-            is_allowed, retry_after = rate_limiter.is_allowed(
-                identifier=client_ip,
-                limit=200,  # 200 requests per hour for selling operations
-                window_seconds=3600,
-            )
+            decision = await get_rate_limiter().hit(f"selling:{client_ip}", SELLING_RATE_LIMIT)
 
-            if not is_allowed:
+            if not decision.allowed:
                 audit_logger.log_security_event("rate_limit_exceeded", request)
                 raise HTTPException(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     detail="Rate limit exceeded",
-                    headers={"Retry-After": str(retry_after)} if retry_after else None,
+                    headers=decision.headers(),
                 )
 
         # Process request
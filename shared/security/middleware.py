@@ -6,8 +6,7 @@ Production-ready security middleware for FastAPI applications
 import hashlib
 import secrets
 import time
-from collections import defaultdict, deque
-from typing import Any, Callable, Dict, List, Optional
+from typing import Callable, List, Optional
 
 import structlog
 from fastapi import Request, Response
@@ -15,6 +14,8 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from shared.security.rate_limiting import RateLimit, RateLimiter, get_rate_limiter
+
 logger = structlog.get_logger(__name__)
 
 
@@ -78,7 +79,12 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware with sliding window algorithm"""
+    """Rate limiting middleware backed by the shared GCRA rate limiter
+
+    Each client gets ``requests_per_minute`` sustained with at most ``burst_size``
+    back-to-back. State lives in the global limiter's storage (Redis when
+    configured), so the limit holds across workers.
+    """
 
     def __init__(
         self,
@@ -88,7 +94,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         whitelist_ips: Optional[List[str]] = None,
         blacklist_ips: Optional[List[str]] = None,
         rate_limit_by: str = "ip",  # "ip" or "user"
-        cleanup_interval: int = 300,  # seconds
+        limiter: Optional[RateLimiter] = None,
     ):
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
@@ -96,11 +102,13 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self.whitelist_ips = set(whitelist_ips or [])
         self.blacklist_ips = set(blacklist_ips or [])
         self.rate_limit_by = rate_limit_by
-        self.cleanup_interval = cleanup_interval
+        self.rate_limit = RateLimit(rate=requests_per_minute, period=60, burst=burst_size)
+        # Resolved per request so initialize_rate_limiter() at startup takes effect
+        self._limiter = limiter
 
-        # Sliding window storage: {identifier: deque(timestamps)}
-        self.request_history: Dict[str, deque] = defaultdict(lambda: deque())
-        self.last_cleanup = time.time()
+    @property
+    def limiter(self) -> RateLimiter:
+        return self._limiter or get_rate_limiter()
 
     def _get_client_identifier(self, request: Request) -> str:
         """Get client identifier for rate limiting"""
@@ -121,55 +129,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return request.client.host if request.client else "unknown"
 
-    def _cleanup_old_entries(self):
-        """Remove old entries from request history"""
-        current_time = time.time()
-        cutoff_time = current_time - 60  # Remove entries older than 1 minute
-
-        for identifier, history in list(self.request_history.items()):
-            # Remove old timestamps
-            while history and history[0] < cutoff_time:
-                history.popleft()
-
-            # Remove empty histories
-            if not history:
-                del self.request_history[identifier]
-
-        self.last_cleanup = current_time
-
-    def _is_rate_limited(self, identifier: str) -> tuple[bool, Dict[str, Any]]:
-        """Check if client is rate limited"""
-        current_time = time.time()
-        history = self.request_history[identifier]
-
-        # Remove old entries
-        cutoff_time = current_time - 60
-        while history and history[0] < cutoff_time:
-            history.popleft()
-
-        # Check burst limit (requests in last 10 seconds)
-        burst_cutoff = current_time - 10
-        burst_count = sum(1 for ts in history if ts > burst_cutoff)
-
-        if burst_count >= self.burst_size:
-            return True, {
-                "reason": "burst_limit_exceeded",
-                "limit": self.burst_size,
-                "window": "10 seconds",
-                "current": burst_count,
-            }
-
-        # Check per-minute limit
-        if len(history) >= self.requests_per_minute:
-            return True, {
-                "reason": "rate_limit_exceeded",
-                "limit": self.requests_per_minute,
-                "window": "1 minute",
-                "current": len(history),
-            }
-
-        return False, {}
-
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         client_id = self._get_client_identifier(request)
 
@@ -182,51 +141,39 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             )
 
         # Skip rate limiting for whitelisted IPs
-        if client_id not in self.whitelist_ips:
-            # Periodic cleanup
-            if time.time() - self.last_cleanup > self.cleanup_interval:
-                self._cleanup_old_entries()
-
-            # Check rate limit
-            is_limited, limit_info = self._is_rate_limited(client_id)
-            if is_limited:
-                logger.warning(
-                    "Rate limit exceeded", client_id=client_id, path=request.url.path, **limit_info
-                )
+        if client_id in self.whitelist_ips:
+            return await call_next(request)
 
-                return JSONResponse(
-                    status_code=429,
-                    content={
-                        "error": {
-                            "code": "RATE_LIMIT_EXCEEDED",
-                            "message": "Too many requests",
-                            "details": limit_info,
-                        }
-                    },
-                    headers={
-                        "Retry-After": "60",
-                        "X-RateLimit-Limit": str(self.requests_per_minute),
-                        "X-RateLimit-Remaining": str(
-                            max(0, self.requests_per_minute - limit_info.get("current", 0))
-                        ),
-                        "X-RateLimit-Reset": str(int(time.time() + 60)),
-                    },
-                )
+        decision = await self.limiter.hit(f"http:{client_id}", self.rate_limit)
+        if not decision.allowed:
+            limit_info = {
+                "reason": "rate_limit_exceeded",
+                "limit": self.requests_per_minute,
+                "burst": self.burst_size,
+                "window": "1 minute",
+                "retry_after": round(decision.retry_after, 3),
+            }
+            logger.warning(
+                "Rate limit exceeded", client_id=client_id, path=request.url.path, **limit_info
+            )
 
-        # Record request
-        self.request_history[client_id].append(time.time())
+            return JSONResponse(
+                status_code=429,
+                content={
+                    "error": {
+                        "code": "RATE_LIMIT_EXCEEDED",
+                        "message": "Too many requests",
+                        "details": limit_info,
+                    }
+                },
+                headers=decision.headers(),
+            )
 
         # Process request
         response = await call_next(request)
 
         # Add rate limit headers to successful responses
-        if client_id not in self.whitelist_ips:
-            current_count = len(self.request_history[client_id])
-            response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
-            response.headers["X-RateLimit-Remaining"] = str(
-                max(0, self.requests_per_minute - current_count)
-            )
-            response.headers["X-RateLimit-Reset"] = str(int(time.time() + 60))
+        response.headers.update(decision.headers())
 
         return response
 
@@ -0,0 +1,270 @@
+"""
+Rate Limiting Engine
+Generic cell rate algorithm (GCRA) limiter with in-process and Redis storage
+"""
+
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# In-process storage keeps one float per client; idle clients beyond this are dropped
+DEFAULT_MAX_KEYS = 100_000
+DEFAULT_KEY_PREFIX = "soleflip:ratelimit:"
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Allow ``rate`` requests per ``period`` seconds, at most ``burst`` back-to-back"""
+
+    rate: int
+    period: float = 60.0
+    burst: Optional[int] = None  # defaults to rate
+
+    def __post_init__(self):
+        if self.rate <= 0 or self.period <= 0:
+            raise ValueError("Rate limit rate and period must be positive")
+        if self.burst is not None and self.burst <= 0:
+            raise ValueError("Rate limit burst must be positive")
+
+    @property
+    def max_burst(self) -> int:
+        return self.burst or self.rate
+
+    @property
+    def emission_interval(self) -> float:
+        """Seconds one request occupies in the bucket"""
+        return self.period / self.rate
+
+    @property
+    def burst_allowance(self) -> float:
+        """How far ahead of now the theoretical arrival time may run"""
+        return self.emission_interval * self.max_burst
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of a single rate limit check"""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float = 0.0  # seconds until the next request would be allowed
+    reset_after: float = 0.0  # seconds until the full burst is available again
+
+    def headers(self) -> Dict[str, str]:
+        """Standard rate limit response headers"""
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(int(time.time() + math.ceil(self.reset_after))),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(self.retry_after)))
+        return headers
+
+
+def gcra_update(
+    tat: Optional[float], now: float, limit: RateLimit, cost: int = 1
+) -> Tuple[RateLimitDecision, Optional[float]]:
+    """
+    Apply one GCRA step.
+
+    Args:
+        tat: Stored theoretical arrival time for the client (None if unseen)
+        now: Current time on the same clock as ``tat``
+        limit: Limit to enforce
+        cost: Number of requests this check consumes
+
+    Returns:
+        (decision, new_tat) where new_tat is None when nothing should be stored
+    """
+    interval = limit.emission_interval
+    tat = max(tat if tat is not None else now, now)
+    new_tat = tat + cost * interval
+    allow_at = new_tat - limit.burst_allowance
+
+    if now < allow_at:
+        return (
+            RateLimitDecision(
+                allowed=False,
+                limit=limit.max_burst,
+                remaining=0,
+                retry_after=allow_at - now,
+                reset_after=tat - now,
+            ),
+            None,
+        )
+
+    return (
+        RateLimitDecision(
+            allowed=True,
+            limit=limit.max_burst,
+            remaining=int((now - allow_at) / interval + 1e-9),
+            reset_after=new_tat - now,
+        ),
+        new_tat,
+    )
+
+
+class RateLimitStorage(Protocol):
+    """Storage backend holding one theoretical arrival time per key"""
+
+    async def update(self, key: str, limit: RateLimit, cost: int = 1) -> RateLimitDecision: ...
+
+    async def reset(self, key: str) -> None: ...
+
+
+class InMemoryRateLimitStorage:
+    """Per-process storage; checks never await, so they are atomic on the event loop"""
+
+    def __init__(
+        self, max_keys: int = DEFAULT_MAX_KEYS, clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    async def update(self, key: str, limit: RateLimit, cost: int = 1) -> RateLimitDecision:
+        now = self._clock()
+        decision, new_tat = gcra_update(self._tats.get(key), now, limit, cost)
+
+        if new_tat is not None:
+            self._tats[key] = new_tat
+            self._tats.move_to_end(key)
+            self._prune(now)
+
+        return decision
+
+    async def reset(self, key: str) -> None:
+        self._tats.pop(key, None)
+
+    def _prune(self, now: float) -> None:
+        """Drop least recently seen clients whose bucket has fully drained"""
+        # A couple of steps per write keeps cleanup amortised O(1)
+        for _ in range(2):
+            if not self._tats:
+                return
+            oldest_key, oldest_tat = next(iter(self._tats.items()))
+            if oldest_tat > now and len(self._tats) <= self.max_keys:
+                return
+            del self._tats[oldest_key]
+
+
+# KEYS[1] = client key; ARGV = emission interval, burst allowance, cost (seconds / count)
+# Uses the Redis server clock so every worker shares one timeline.
+GCRA_LUA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local burst_allowance = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+
+local new_tat = tat + cost * interval
+local allow_at = new_tat - burst_allowance
+
+if now < allow_at then
+    return {0, 0, tostring(allow_at - now), tostring(tat - now)}
+end
+
+local ttl_ms = math.ceil((new_tat - now) * 1000)
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', ttl_ms)
+local remaining = math.floor((now - allow_at) / interval + 1e-9)
+return {1, remaining, '0', tostring(new_tat - now)}
+"""
+
+
+class RedisRateLimitStorage:
+    """Redis storage shared by all workers; each check is one atomic script call"""
+
+    def __init__(self, redis_client: Any, key_prefix: str = DEFAULT_KEY_PREFIX):
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self._script = redis_client.register_script(GCRA_LUA_SCRIPT)
+
+    async def update(self, key: str, limit: RateLimit, cost: int = 1) -> RateLimitDecision:
+        allowed, remaining, retry_after, reset_after = await self._script(
+            keys=[self.key_prefix + key],
+            args=[repr(limit.emission_interval), repr(limit.burst_allowance), cost],
+        )
+        return RateLimitDecision(
+            allowed=bool(int(allowed)),
+            limit=limit.max_burst,
+            remaining=int(remaining),
+            retry_after=float(retry_after),
+            reset_after=float(reset_after),
+        )
+
+    async def reset(self, key: str) -> None:
+        await self.redis_client.delete(self.key_prefix + key)
+
+
+class RateLimiter:
+    """Rate limiter front-end over a pluggable storage backend"""
+
+    def __init__(self, storage: Optional[RateLimitStorage] = None, fail_open: bool = True):
+        self.storage = storage or InMemoryRateLimitStorage()
+        self.fail_open = fail_open
+
+    async def hit(self, key: str, limit: RateLimit, cost: int = 1) -> RateLimitDecision:
+        """Consume ``cost`` requests for key and report whether they are allowed"""
+        try:
+            return await self.storage.update(key, limit, cost)
+        except Exception as e:
+            if not self.fail_open:
+                raise
+            # A storage outage must not take the API down with it
+            logger.warning("Rate limit storage error, allowing request", key=key, error=str(e))
+            return RateLimitDecision(allowed=True, limit=limit.max_burst, remaining=0)
+
+    async def reset(self, key: str) -> None:
+        """Forget the client's history"""
+        await self.storage.reset(key)
+
+
+# Global rate limiter instance
+_rate_limiter: Optional[RateLimiter] = None
+
+
+async def initialize_rate_limiter(redis_url: Optional[str] = None) -> RateLimiter:
+    """Initialize the global rate limiter, sharing state through Redis when available"""
+    global _rate_limiter
+
+    storage: RateLimitStorage = InMemoryRateLimitStorage()
+    if redis_url:
+        try:
+            import redis.asyncio as redis
+
+            client = redis.from_url(redis_url, decode_responses=True)
+            await client.ping()
+            storage = RedisRateLimitStorage(client)
+            logger.info("Rate limiter using Redis storage")
+        except ImportError:
+            logger.warning("Redis not available, using in-process rate limiting")
+        except Exception as e:
+            logger.warning(f"Failed to connect rate limiter to Redis: {e}")
+
+    _rate_limiter = RateLimiter(storage)
+    return _rate_limiter
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the global rate limiter (in-process until initialize_rate_limiter runs)"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter()
+    return _rate_limiter
@@ -3,23 +3,202 @@ Streaming Response Utilities
 High-performance streaming for large datasets and file downloads
 """
 
+import csv
+import io
 import json
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
 import structlog
 from fastapi.responses import StreamingResponse
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 logger = structlog.get_logger(__name__)
 
+# Rows fetched from the server-side cursor per round trip
+DEFAULT_FETCH_SIZE = 1000
+# Encoded output is buffered and sent in chunks of at least this many bytes
+DEFAULT_FLUSH_BYTES = 64 * 1024
+
+# Values of these types are emitted as-is; everything else (UUID, Decimal, dates) as str()
+_JSON_NATIVE_TYPES = (str, int, float, bool)
+
+# Set once an export without column types has been logged
+_untyped_parquet_logged = False
+
+
+class ExportFormat(str, Enum):
+    """Output formats for query exports"""
+
+    JSON = "json"  # {"data": [...], "metadata": {...}}
+    NDJSON = "ndjson"  # One JSON object per line
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.JSON: "application/json",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+@asynccontextmanager
+async def open_query_stream(
+    db_session: AsyncSession,
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+    batch_size: int = DEFAULT_FETCH_SIZE,
+) -> AsyncIterator[Tuple[AsyncResult, List[Any]]]:
+    """
+    Open a server-side cursor for the query, closed on exit.
+
+    ``AsyncSession.stream`` keeps the result on the server (a named cursor on
+    asyncpg) and only ``batch_size`` rows are held in memory at a time. Yields
+    the result with the DB-API type codes of its columns (PostgreSQL type OIDs),
+    None where the driver reports none.
+    """
+    connection = await db_session.connection()
+    descriptions: List[Any] = []
+
+    def capture_description(conn, cursor, statement, parameters, context, executemany):
+        descriptions.append(cursor.description)
+
+    statement = text(query).execution_options(yield_per=batch_size)
+    event.listen(connection.sync_connection, "after_cursor_execute", capture_description)
+    try:
+        result = await db_session.stream(statement, params or {})
+    finally:
+        event.remove(connection.sync_connection, "after_cursor_execute", capture_description)
+
+    columns = list(result.keys())
+    description = (descriptions[-1] if descriptions else None) or []
+    type_codes = [column[1] for column in description]
+    if len(type_codes) != len(columns):
+        type_codes = [None] * len(columns)
+
+    try:
+        yield result, type_codes
+    finally:
+        await result.close()
+
+
+async def stream_query_batches(
+    db_session: AsyncSession,
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+    batch_size: int = DEFAULT_FETCH_SIZE,
+) -> AsyncGenerator[Tuple[List[str], Sequence[Sequence[Any]]], None]:
+    """Yield (column names, rows) batches from a server-side cursor"""
+    async with open_query_stream(db_session, query, params, batch_size) as (result, _):
+        columns = list(result.keys())
+        async for rows in result.partitions(batch_size):
+            yield columns, rows
+
+
+def _dumps(value: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _json_text(value: Any) -> str:
+    """JSON documents as JSON text, anything else with str()"""
+    if isinstance(value, (dict, list)):
+        return _dumps(value).decode()
+    return str(value)
+
+
+def _json_rows(columns: List[str], rows: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Rows as JSON-ready dicts, non-native values rendered with str()"""
+    return [
+        {
+            column: value if value is None or isinstance(value, _JSON_NATIVE_TYPES) else str(value)
+            for column, value in zip(columns, row)
+        }
+        for row in rows
+    ]
+
+
+class _ByteChunker:
+    """Collects encoded pieces and releases them in chunks of ``flush_bytes``"""
+
+    def __init__(self, flush_bytes: int = DEFAULT_FLUSH_BYTES):
+        self.flush_bytes = flush_bytes
+        self._parts: List[bytes] = []
+        self._size = 0
+        self.bytes_sent = 0
+
+    def add(self, data: bytes) -> Optional[bytes]:
+        self._parts.append(data)
+        self._size += len(data)
+        if self._size >= self.flush_bytes:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[bytes]:
+        if not self._parts:
+            return None
+        chunk = b"".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self.bytes_sent += len(chunk)
+        return chunk
+
+
+class _DrainableSink(io.RawIOBase):
+    """
+    Write-only file object whose buffered output can be drained while writing
+    continues. ``tell`` reports the total bytes written, which the Parquet writer
+    uses for row group offsets in the footer.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._parts: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
 
 class JSONStreamingResponse:
     """
     Efficient JSON streaming for large datasets
-    - Streams data as JSON lines (JSONL format)
+    - Streams a JSON document or JSON lines (NDJSON) from a server-side cursor
     - Memory efficient for large datasets
-    - Supports chunked processing
+    - Serializes whole fetch batches and flushes sized byte chunks
     """
 
     @staticmethod
@@ -28,49 +207,38 @@ class JSONStreamingResponse:
         query: str,
         params: Optional[Dict[str, Any]] = None,
         chunk_size: int = 100,
-    ) -> AsyncGenerator[str, None]:
-        """Stream database query results as JSON lines"""
-
-        try:
-            # Execute query with streaming cursor
-            result = await db_session.execute(text(query), params or {})
-
-            # Stream results in chunks
-            chunk_count = 0
-            total_rows = 0
+        ndjson: bool = False,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream database query results as a JSON document, or as JSON lines"""
 
-            # Yield opening bracket for JSON array
-            yield '{"data":['
-            first_item = True
+        chunker = _ByteChunker(flush_bytes)
+        chunk_count = 0
+        total_rows = 0
 
-            while True:
-                # Fetch chunk of results
-                rows = result.fetchmany(chunk_size)
-                if not rows:
-                    break
+        try:
+            if not ndjson:
+                # Yield opening bracket for JSON array
+                chunker.add(b'{"data":[')
 
+            async for columns, rows in stream_query_batches(
+                db_session, query, params, batch_size=chunk_size
+            ):
                 chunk_count += 1
-
-                for row in rows:
-                    # Convert row to dict
-                    row_dict = {
-                        column: (
-                            str(value)
-                            if hasattr(value, "__str__")
-                            and not isinstance(value, (int, float, bool, type(None)))
-                            else value
-                        )
-                        for column, value in row._mapping.items()
-                    }
-
-                    # Add comma separator except for first item
-                    if not first_item:
-                        yield ","
-                    first_item = False
-
-                    # Yield JSON-encoded row
-                    yield json.dumps(row_dict, default=str, separators=(",", ":"))
-                    total_rows += 1
+                records = _json_rows(columns, rows)
+
+                if ndjson:
+                    encoded = b"\n".join(_dumps(record) for record in records) + b"\n"
+                else:
+                    # Encode the batch as one array and splice its items into the document
+                    encoded = _dumps(records)[1:-1]
+                    if total_rows:
+                        encoded = b"," + encoded
+                total_rows += len(records)
+
+                chunk = chunker.add(encoded)
+                if chunk:
+                    yield chunk
 
                 # Log progress for large datasets
                 if chunk_count % 10 == 0:
@@ -78,14 +246,30 @@ class JSONStreamingResponse:
                         "Streaming progress", chunks_processed=chunk_count, rows_streamed=total_rows
                     )
 
-            # Yield closing bracket and metadata
-            yield f'],"metadata":{{"total_rows":{total_rows},"chunks_processed":{chunk_count}}}}}'
+            if not ndjson:
+                # Closing bracket and metadata
+                chunker.add(
+                    b'],"metadata":'
+                    + _dumps({"total_rows": total_rows, "chunks_processed": chunk_count})
+                    + b"}"
+                )
+            chunk = chunker.flush()
+            if chunk:
+                yield chunk
 
-            logger.info("Streaming completed", total_rows=total_rows, chunks_processed=chunk_count)
+            logger.info(
+                "Streaming completed",
+                total_rows=total_rows,
+                chunks_processed=chunk_count,
+                bytes_streamed=chunker.bytes_sent,
+            )
 
         except Exception as e:
             logger.error("Streaming failed", error=str(e))
-            yield f'{{"error":"Streaming failed: {str(e)}"}}'
+            chunk = chunker.flush()
+            if chunk:
+                yield chunk
+            yield _dumps({"error": f"Streaming failed: {str(e)}"})
 
         finally:
             await db_session.close()
@@ -215,6 +399,157 @@ class CSVStreamingResponse:
             raise
 
 
+class QueryExportStreamer:
+    """
+    CSV and Parquet exports straight from a server-side cursor.
+
+    Each fetch batch is encoded in one call (csv.writer.writerows, or one Parquet
+    row group) and sent in sized byte chunks, so memory stays bounded by the
+    batch size regardless of table size.
+    """
+
+    @staticmethod
+    async def stream_csv(
+        db_session: AsyncSession,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        chunk_size: int = DEFAULT_FETCH_SIZE,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream query results as CSV with a header row, also for empty results"""
+
+        chunker = _ByteChunker(flush_bytes)
+        output = io.StringIO()
+        writer = csv.writer(output)
+        total_rows = 0
+
+        try:
+            async with open_query_stream(db_session, query, params, chunk_size) as (result, _):
+                writer.writerow(result.keys())
+                async for rows in result.partitions(chunk_size):
+                    # csv.writer renders None as "" and other values with str()
+                    writer.writerows(rows)
+                    total_rows += len(rows)
+
+                    chunk = chunker.add(output.getvalue().encode())
+                    output.seek(0)
+                    output.truncate()
+                    if chunk:
+                        yield chunk
+
+            # Without rows the header is still in the buffer
+            chunk = chunker.add(output.getvalue().encode()) or chunker.flush()
+            if chunk:
+                yield chunk
+
+            logger.info(
+                "CSV streaming completed", total_rows=total_rows, bytes_streamed=chunker.bytes_sent
+            )
+
+        except Exception as e:
+            logger.error("CSV streaming failed", error=str(e))
+            raise
+
+        finally:
+            await db_session.close()
+
+    @staticmethod
+    async def stream_parquet(
+        db_session: AsyncSession,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        chunk_size: int = DEFAULT_FETCH_SIZE,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Stream query results as a Parquet file, one row group per fetch batch.
+
+        The schema comes from the column types the database reports for the query,
+        so every batch fits it however its values vary. Columns of other or
+        unreported types (e.g. on SQLite) are written as strings.
+        """
+
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("Parquet export requires pyarrow")
+
+        sink = _DrainableSink()
+        total_rows = 0
+
+        try:
+            async with open_query_stream(db_session, query, params, chunk_size) as (
+                result,
+                type_codes,
+            ):
+                QueryExportStreamer._log_untyped_columns(type_codes)
+                schema = QueryExportStreamer._parquet_schema(list(result.keys()), type_codes)
+                writer = pq.ParquetWriter(sink, schema)
+
+                async for rows in result.partitions(chunk_size):
+                    arrays = [
+                        QueryExportStreamer._parquet_array(column_values, field.type)
+                        for column_values, field in zip(zip(*rows), schema)
+                    ]
+                    writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                    total_rows += len(rows)
+
+                    # Hand out whatever the writer has produced so far
+                    chunk = sink.drain()
+                    if chunk:
+                        yield chunk
+
+            writer.close()
+            yield sink.drain()
+
+            logger.info("Parquet streaming completed", total_rows=total_rows)
+
+        except Exception as e:
+            logger.error("Parquet streaming failed", error=str(e))
+            raise
+
+        finally:
+            await db_session.close()
+
+    @staticmethod
+    def _log_untyped_columns(type_codes: List[Any]) -> None:
+        """Log once per process when the driver reports no column types at all"""
+        global _untyped_parquet_logged
+        if type_codes and all(code is None for code in type_codes) and not _untyped_parquet_logged:
+            _untyped_parquet_logged = True
+            logger.warning(
+                "No column types reported for Parquet export, writing all columns as strings"
+            )
+
+    @staticmethod
+    def _parquet_schema(columns: List[str], type_codes: List[Any]) -> "pa.Schema":
+        """Arrow schema for the result columns from their PostgreSQL type OIDs"""
+        arrow_types = {
+            16: pa.bool_(),  # bool
+            17: pa.binary(),  # bytea
+            20: pa.int64(),  # int8
+            21: pa.int16(),  # int2
+            23: pa.int32(),  # int4
+            700: pa.float32(),  # float4
+            701: pa.float64(),  # float8
+            1082: pa.date32(),  # date
+            1083: pa.time64("us"),  # time
+            1114: pa.timestamp("us"),  # timestamp
+            1184: pa.timestamp("us", tz="UTC"),  # timestamptz
+        }
+        return pa.schema(
+            pa.field(name, arrow_types.get(type_code, pa.string()))
+            for name, type_code in zip(columns, type_codes)
+        )
+
+    @staticmethod
+    def _parquet_array(values: Tuple[Any, ...], type_: "pa.DataType") -> "pa.Array":
+        if pa.types.is_string(type_):
+            # numeric, uuid, json and other types without an Arrow mapping
+            values = [
+                value if value is None or isinstance(value, str) else _json_text(value)
+                for value in values
+            ]
+        return pa.array(values, type=type_)
+
+
 def create_streaming_response(
     generator: AsyncGenerator,
     media_type: str = "application/json",
@@ -245,7 +580,7 @@ def create_streaming_response(
 async def stream_inventory_export(
     db_session: AsyncSession, export_format: str = "json", chunk_size: int = 100
 ) -> StreamingResponse:
-    """Stream inventory data export"""
+    """Stream inventory data export from a server-side cursor in constant memory"""
 
     query = """
         SELECT 
@@ -270,21 +605,24 @@ async def stream_inventory_export(
         ORDER BY i.created_at DESC
     """
 
-    if export_format.lower() == "csv":
-        # For CSV, we need to fetch all data first
-        result = await db_session.execute(text(query))
-        rows = result.fetchall()
-        data = [dict(row._mapping) for row in rows]
+    export_format = ExportFormat(export_format.lower())
+    media_type = EXPORT_MEDIA_TYPES[export_format]
+    filename = f"inventory_export.{export_format.value}"
 
-        generator = CSVStreamingResponse.stream_csv_data(data, chunk_size=chunk_size)
-        return create_streaming_response(
-            generator, media_type="text/csv", filename="inventory_export.csv"
-        )
+    if export_format == ExportFormat.CSV:
+        generator = QueryExportStreamer.stream_csv(db_session, query, chunk_size=chunk_size)
 
-    else:  # JSON format
+    elif export_format == ExportFormat.PARQUET:
+        if not PYARROW_AVAILABLE:
+            raise ValueError("Parquet export requires pyarrow")
+        generator = QueryExportStreamer.stream_parquet(db_session, query, chunk_size=chunk_size)
+
+    else:  # JSON / NDJSON
         generator = JSONStreamingResponse.stream_query_results(
-            db_session, query, chunk_size=chunk_size
-        )
-        return create_streaming_response(
-            generator, media_type="application/json", filename="inventory_export.json"
+            db_session,
+            query,
+            chunk_size=chunk_size,
+            ndjson=export_format == ExportFormat.NDJSON,
         )
+
+    return create_streaming_response(generator, media_type=media_type, filename=filename)
@@ -0,0 +1,128 @@
+"""
+Unit tests for AwinFeedImportService streaming import
+Tests chunked feed parsing, staging/merge loading and row-by-row fallback
+"""
+
+import csv
+import gzip
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from domains.integration.services.awin_feed_service import (
+    INSERT_STAGING_SQL,
+    MERGE_STAGING_SQL,
+    AwinFeedImportService,
+)
+
+# ===== FIXTURES =====
+
+
+@pytest.fixture
+def mock_db_session():
+    """Mock database session on a non-asyncpg driver (executemany path)"""
+    session = AsyncMock()
+    connection = MagicMock()
+    connection.dialect.driver = "aiosqlite"
+    session.connection = AsyncMock(return_value=connection)
+    return session
+
+
+@pytest.fixture
+def awin_service(mock_db_session, monkeypatch):
+    monkeypatch.setenv("AWIN_API_KEY", "test-key")
+    return AwinFeedImportService(mock_db_session)
+
+
+@pytest.fixture
+def feed_path(tmp_path):
+    """Gzip feed with 5 products"""
+    path = tmp_path / "feed.csv.gz"
+    with gzip.open(path, "wt", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(
+            f,
+            fieldnames=[
+                "aw_product_id",
+                "product_name",
+                "merchant_id",
+                "search_price",
+                "large_image",
+            ],
+        )
+        writer.writeheader()
+        for i in range(5):
+            writer.writerow(
+                {
+                    "aw_product_id": f"AW{i}",
+                    "product_name": f"Sneaker {i}",
+                    "merchant_id": "10597",
+                    "search_price": "99.95",
+                    "large_image": "https://img" if i == 0 else "",
+                }
+            )
+    return str(path)
+
+
+def executed_sql(session):
+    return [str(call.args[0]) for call in session.execute.call_args_list]
+
+
+# ===== TESTS =====
+
+
+def test_iter_feed_chunks_splits_feed(awin_service, feed_path):
+    chunks = list(awin_service._iter_feed_chunks(feed_path, chunk_size=2))
+
+    assert [len(products) for products, _ in chunks] == [2, 2, 1]
+    first = chunks[0][0][0]
+    assert first["awin_product_id"] == "AW0"
+    assert first["merchant_id"] == 10597
+    assert first["retail_price_cents"] == 9995
+    assert first["alternate_images"] == ["https://img"]
+
+
+@pytest.mark.asyncio
+async def test_import_feed_streaming_stages_and_merges_chunks(
+    awin_service, mock_db_session, feed_path
+):
+    mock_db_session.execute.return_value = MagicMock(rowcount=2)
+
+    stats = await awin_service.import_feed_streaming(feed_path, chunk_size=2)
+
+    statements = executed_sql(mock_db_session)
+    assert statements.count(MERGE_STAGING_SQL) == 3
+    assert statements.count(INSERT_STAGING_SQL) == 3
+    staged = [
+        call.args[1]
+        for call in mock_db_session.execute.call_args_list
+        if str(call.args[0]) == INSERT_STAGING_SQL
+    ]
+    assert staged[0][0]["alternate_images"] == '["https://img"]'
+    assert [record["row_number"] for record in staged[0]] == [0, 1]
+
+    assert mock_db_session.commit.await_count == 3
+    assert stats["rows_read"] == 5
+    assert stats["rows_invalid"] == 0
+    assert stats["chunks"] == 3
+    assert stats["rows_imported"] == 6  # mocked rowcount per merge
+    assert stats["rows_per_second"] > 0
+    assert stats["peak_rss_mb"] > 0
+
+
+@pytest.mark.asyncio
+async def test_failed_merge_falls_back_to_row_upserts(awin_service, mock_db_session):
+    products = [{"awin_product_id": "AW1"}, {"awin_product_id": "AW2"}]
+
+    async def execute(statement, params=None):
+        if str(statement) == MERGE_STAGING_SQL:
+            raise RuntimeError("value out of range")
+        return MagicMock(rowcount=1)
+
+    mock_db_session.execute.side_effect = execute
+    awin_service._upsert_product = AsyncMock()
+
+    imported = await awin_service._load_chunk(products)
+
+    assert imported == 2
+    mock_db_session.rollback.assert_awaited()
+    assert awin_service._upsert_product.await_count == 2
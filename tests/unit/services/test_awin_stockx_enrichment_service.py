@@ -0,0 +1,314 @@
+"""
+Unit tests for AwinStockXEnrichmentService
+Tests concurrent, de-duplicated and cached EAN matching with checkpointed pages
+"""
+
+import asyncio
+import json
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException
+
+from domains.integration.api.router import resume_enrichment_job
+from domains.integration.services.awin_stockx_enrichment_service import (
+    NULL_PRICE_SORT_KEY,
+    AwinStockXEnrichmentService,
+)
+from domains.integration.services.stockx_rate_limiter import TokenBucketScheduler
+
+# ===== FIXTURES =====
+
+
+def query_result(rows):
+    """Mock SQLAlchemy result returning the given rows"""
+    result = MagicMock()
+    result.fetchall.return_value = rows
+    result.fetchone.return_value = rows[0] if rows else None
+    return result
+
+
+def awin_product(ean, price, mpn=None):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        awin_product_id=f"awin-{ean}-{price}",
+        product_name="Sneaker",
+        brand_name="Nike",
+        size="42",
+        ean=ean,
+        mpn=mpn,
+        retail_price_cents=price,
+        sort_price=price if price is not None else NULL_PRICE_SORT_KEY,
+    )
+
+
+class FakeEnrichmentSession:
+    """Async session stand-in for the enrichment tables"""
+
+    def __init__(self, products, cache=None, checkpoint=None):
+        self.products = list(products)
+        self.cache = dict(cache or {})
+        self.checkpoint = checkpoint
+        self.statuses = {}
+        self.statements = []
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+
+    async def execute(self, stmt, params=None):
+        sql = str(stmt)
+        self.statements.append((sql, params))
+
+        if "SELECT checkpoint" in sql:
+            return query_result([SimpleNamespace(checkpoint=self.checkpoint)])
+
+        if "FROM integration.stockx_lookup_cache" in sql:
+            rows = [
+                SimpleNamespace(lookup_key=key, stockx_product=self.cache[key])
+                for key in params["lookup_keys"]
+                if key in self.cache
+            ]
+            return query_result(rows)
+
+        if "INSERT INTO integration.stockx_lookup_cache" in sql:
+            for row in params:
+                product = row["stockx_product"]
+                self.cache[row["lookup_key"]] = json.loads(product) if product else None
+            return query_result([])
+
+        if "LIMIT :page_size" in sql:
+            pending = sorted(
+                (p for p in self.products if p.id not in self.statuses),
+                key=lambda p: (p.sort_price, str(p.id)),
+            )
+            if "after_price" in params:
+                after = (params["after_price"], params["after_id"])
+                pending = [p for p in pending if (p.sort_price, str(p.id)) > after]
+            return query_result(pending[: params["page_size"]])
+
+        if "SET stockx_product_id" in sql:
+            for row in params:
+                self.statuses[uuid.UUID(row["awin_product_id"])] = "matched"
+        elif "SET enrichment_status = :status" in sql:
+            for product_id in params["awin_product_ids"]:
+                self.statuses[uuid.UUID(product_id)] = params["status"]
+
+        return query_result([])
+
+    def executed(self, fragment):
+        return [params for sql, params in self.statements if fragment in sql]
+
+
+class FakeCatalog:
+    """StockX catalog search returning fixed products per query"""
+
+    def __init__(self, products_by_query, failing=()):
+        self.products_by_query = products_by_query
+        self.failing = set(failing)
+        self.queries = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def search_catalog(self, query, page_number=1, page_size=10):
+        self.queries.append(query)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if query in self.failing:
+                raise RuntimeError("StockX unavailable")
+            return {"products": self.products_by_query.get(query, [])}
+        finally:
+            self.in_flight -= 1
+
+
+def stockx_product(product_id, style_id="DD1391-100"):
+    return {"productId": product_id, "urlKey": f"product-{product_id}", "styleId": style_id}
+
+
+def make_service(session, catalog, batch_size=50, concurrency=8):
+    service = AwinStockXEnrichmentService(session, batch_size=batch_size, concurrency=concurrency)
+    service.catalog_service = catalog
+    service.rate_budget = TokenBucketScheduler(rate=1000.0, burst=1000)
+    return service
+
+
+@pytest.fixture
+def job_id():
+    return uuid.uuid4()
+
+
+# ===== MATCHING TESTS =====
+
+
+class TestEnrichmentMatching:
+    """Test de-duplicated and cached lookups"""
+
+    async def test_each_ean_is_searched_once(self, job_id):
+        products = [awin_product("111", 100), awin_product("111", 200), awin_product("222", 300)]
+        session = FakeEnrichmentSession(products)
+        catalog = FakeCatalog({"111": [stockx_product(str(uuid.uuid4()))]})
+
+        stats = await make_service(session, catalog).enrich_all_products(job_id=job_id)
+
+        assert sorted(catalog.queries) == ["111", "222"]
+        assert stats["total_processed"] == 3
+        assert stats["matched"] == 2
+        assert stats["not_found"] == 1
+        assert stats["lookups"] == 2
+        # Misses are cached too
+        assert session.cache["ean:222"] is None
+        assert session.cache["ean:111"]["urlKey"].startswith("product-")
+
+    async def test_cached_lookups_skip_stockx(self, job_id):
+        cached = stockx_product(str(uuid.uuid4()))
+        session = FakeEnrichmentSession(
+            [awin_product("111", 100), awin_product("222", 200)],
+            cache={"ean:111": cached, "ean:222": None},
+        )
+        catalog = FakeCatalog({})
+
+        stats = await make_service(session, catalog).enrich_all_products(job_id=job_id)
+
+        assert catalog.queries == []
+        assert stats["cache_hits"] == 2
+        assert stats["matched"] == 1
+        assert stats["not_found"] == 1
+
+    async def test_falls_back_to_exact_style_id(self, job_id):
+        products = [awin_product("111", 100, mpn="dd1391-100"), awin_product("222", 200, mpn="X1")]
+        session = FakeEnrichmentSession(products)
+        catalog = FakeCatalog(
+            {
+                "DD1391-100": [stockx_product("abc", style_id="DD1391-100")],
+                "X1": [stockx_product("def", style_id="X1-OTHER")],
+            }
+        )
+
+        stats = await make_service(session, catalog).enrich_all_products(job_id=job_id)
+
+        assert stats["matched"] == 1
+        assert session.statuses[products[0].id] == "matched"
+        assert session.statuses[products[1].id] == "not_found"
+        assert session.cache["style:X1"] is None
+
+    async def test_failed_lookups_mark_errors_and_are_not_cached(self, job_id):
+        products = [awin_product("111", 100), awin_product("222", 200)]
+        session = FakeEnrichmentSession(products)
+        catalog = FakeCatalog({"222": [stockx_product("abc")]}, failing={"111"})
+
+        stats = await make_service(session, catalog).enrich_all_products(job_id=job_id)
+
+        assert stats["errors"] == 1
+        assert stats["matched"] == 1
+        assert session.statuses[products[0].id] == "error"
+        assert "ean:111" not in session.cache
+
+    async def test_lookups_run_concurrently_up_to_limit(self, job_id):
+        products = [awin_product(str(n), n) for n in range(20)]
+        session = FakeEnrichmentSession(products)
+        catalog = FakeCatalog({})
+
+        await make_service(session, catalog, concurrency=4).enrich_all_products(job_id=job_id)
+
+        assert len(catalog.queries) == 20
+        assert catalog.max_in_flight == 4
+
+
+# ===== WRITE AND CHECKPOINT TESTS =====
+
+
+class TestEnrichmentWritesAndCheckpoints:
+    """Test batched writes and resumable pages"""
+
+    async def test_writes_one_statement_per_outcome_per_page(self, job_id):
+        products = [awin_product(str(n), n) for n in range(6)]
+        session = FakeEnrichmentSession(products)
+        catalog = FakeCatalog({str(n): [stockx_product(str(uuid.uuid4()))] for n in range(4)})
+
+        await make_service(session, catalog, batch_size=10).enrich_all_products(job_id=job_id)
+
+        [matched] = session.executed("SET stockx_product_id")
+        assert len(matched) == 4
+        [not_found] = session.executed("SET enrichment_status = :status")
+        assert len(not_found["awin_product_ids"]) == 2
+
+    async def test_commits_checkpoint_per_page(self, job_id):
+        products = [awin_product(str(n), n) for n in range(5)]
+        session = FakeEnrichmentSession(products)
+
+        await make_service(session, FakeCatalog({}), batch_size=2).enrich_all_products(
+            job_id=job_id
+        )
+
+        progress = session.executed("checkpoint = COALESCE")
+        assert len(progress) == 3
+        checkpoints = [json.loads(params["checkpoint"]) for params in progress]
+        assert [c["stats"]["total_processed"] for c in checkpoints] == [2, 4, 5]
+        assert checkpoints[-1]["after"] == {"sort_price": 4, "id": str(products[4].id)}
+
+    async def test_resumes_after_checkpoint(self, job_id):
+        products = [awin_product(str(n), n) for n in range(4)]
+        checkpoint = {
+            "after": {"sort_price": 1, "id": str(products[1].id)},
+            "stats": {"total_processed": 2, "matched": 1, "not_found": 1, "errors": 0},
+            "limit": None,
+        }
+        session = FakeEnrichmentSession(products, checkpoint=checkpoint)
+        catalog = FakeCatalog({})
+
+        stats = await make_service(session, catalog).enrich_all_products(job_id=job_id)
+
+        assert sorted(catalog.queries) == ["2", "3"]
+        assert stats["total_processed"] == 4
+        assert stats["matched"] == 1
+        assert stats["not_found"] == 3
+        assert session.executed("SET status = 'running'")
+
+    async def test_respects_limit_across_pages(self, job_id):
+        products = [awin_product(str(n), n) for n in range(10)]
+        session = FakeEnrichmentSession(products)
+        catalog = FakeCatalog({})
+
+        stats = await make_service(session, catalog, batch_size=3).enrich_all_products(
+            job_id=job_id, limit=5
+        )
+
+        assert stats["total_processed"] == 5
+        assert len(catalog.queries) == 5
+
+
+# ===== RESUME ENDPOINT TESTS =====
+
+
+class TestResumeEndpoint:
+    """Test which jobs the resume endpoint hands to a new worker"""
+
+    @staticmethod
+    async def resume(status, force=False):
+        job = SimpleNamespace(
+            status=status, processed_products=2, total_products=4, updated_at="2024-01-01"
+        )
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=query_result([job]))
+        background_tasks = BackgroundTasks()
+
+        response = await resume_enrichment_job(
+            uuid.uuid4(), background_tasks, rate_limit=60, concurrency=4, force=force, db=db
+        )
+        return response, background_tasks
+
+    @pytest.mark.parametrize("status", ["completed", "running"])
+    async def test_rejects_completed_and_running_jobs(self, status):
+        with pytest.raises(HTTPException) as error:
+            await self.resume(status)
+
+        assert error.value.status_code == 409
+
+    @pytest.mark.parametrize("status, force", [("failed", False), ("running", True)])
+    async def test_resumes_stopped_or_forced_jobs(self, status, force):
+        response, background_tasks = await self.resume(status, force=force)
+
+        assert response["message"] == "Enrichment job resumed"
+        assert len(background_tasks.tasks) == 1
@@ -1,8 +1,10 @@
+import re
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 
+from domains.products.services.brand_matcher import AhoCorasickAutomaton, BrandMatcher
 from domains.products.services.brand_service import BrandExtractorService
 from shared.database.models import Brand, BrandPattern
 
@@ -273,3 +275,108 @@ async def test_extract_brand_unknown_pattern_type(brand_extractor_service, mock_
     # Assert
     assert brand is not None
     assert brand.name == "Adidas"  # Should match the second pattern
+
+
+# ===== Compiled matcher =====
+
+
+def _brute_force_match(patterns, name):
+    """Reference implementation: first pattern in priority order that matches."""
+    for index, (pattern_type, pattern) in enumerate(patterns):
+        if pattern_type == "regex":
+            try:
+                if re.search(pattern, name.lower(), re.IGNORECASE):
+                    return index
+            except re.error:
+                continue
+        elif pattern_type == "keyword" and pattern.lower() in name.lower():
+            return index
+    return None
+
+
+def test_compiled_matcher_matches_pattern_by_pattern_scan():
+    patterns = [
+        ("keyword", "Off-White"),
+        ("regex", r"\bjordan\s+\d+"),
+        ("keyword", "nike"),
+        ("regex", r"(Air )?Jordan"),
+        ("regex", r"[invalid"),
+        ("keyword", "dunk"),
+        ("regex", r"(yeezy|adidas)\s+(\w+)\s+\2"),  # backreference, matched standalone
+        ("keyword", "adidas"),
+        ("regex", r"new\s*balance"),
+        ("keyword", "ike air"),
+    ]
+    names = [
+        "Nike Air Jordan 1 High",
+        "Air Jordan 4 Retro",
+        "Off-White x Nike Dunk Low",
+        "adidas Yeezy Boost 350",
+        "adidas foam foam runner",
+        "New Balance 550",
+        "Newbalance 2002R",
+        "Crocs Classic Clog",
+        "NIKE AIR MAX 90",
+        "",
+    ]
+    matcher = BrandMatcher(patterns)
+
+    for name in names:
+        assert matcher.match(name) == _brute_force_match(patterns, name), name
+
+
+def test_aho_corasick_reports_lowest_index_for_overlapping_keywords():
+    automaton = AhoCorasickAutomaton([("she", 2), ("he", 1), ("hers", 0), ("his", 3)])
+
+    assert automaton.lowest_match("ushers") == 0
+    assert automaton.lowest_match("ushe") == 1
+    assert automaton.lowest_match("this") == 3
+    assert automaton.lowest_match("xyz") is None
+
+
+def test_matcher_caches_by_normalized_name():
+    matcher = BrandMatcher([("keyword", "nike")])
+
+    assert matcher.match("Nike Dunk") == 0
+    assert matcher.match("NIKE DUNK") == 0
+    assert matcher.match("Crocs") is None
+    assert matcher.match("crocs") is None
+    assert matcher.stats() == {"cached_names": 2, "hits": 2, "misses": 2}
+
+
+async def test_extract_brands_bulk_returns_brands_in_input_order(brand_extractor_service):
+    nike = Brand(id=uuid4(), name="Nike")
+    adidas = Brand(id=uuid4(), name="Adidas")
+    brand_extractor_service._patterns = [
+        BrandPattern(pattern="Nike", brand=nike, pattern_type="keyword"),
+        BrandPattern(pattern=r"adidas|yeezy", brand=adidas, pattern_type="regex"),
+    ]
+
+    brands = await brand_extractor_service.extract_brands_bulk(
+        ["Nike Dunk", "Yeezy 350", None, "Nike Dunk", "Crocs Clog"]
+    )
+
+    assert brands == [nike, adidas, None, nike, None]
+
+
+async def test_invalidate_patterns_reloads_on_next_extraction(
+    brand_extractor_service, mock_db_session
+):
+    old_brand = Brand(id=uuid4(), name="Nike")
+    brand_extractor_service._patterns = [
+        BrandPattern(pattern="Nike", brand=old_brand, pattern_type="keyword")
+    ]
+    assert await brand_extractor_service.extract_brand_from_name("Nike Dunk") is old_brand
+
+    new_brand = Brand(id=uuid4(), name="Jordan")
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [
+        BrandPattern(pattern="Dunk", brand=new_brand, pattern_type="keyword")
+    ]
+    mock_db_session.execute.return_value = mock_result
+
+    brand_extractor_service.invalidate_patterns()
+    brand = await brand_extractor_service.extract_brand_from_name("Nike Dunk")
+
+    assert brand is new_brand
+    mock_db_session.execute.assert_called_once()
@@ -0,0 +1,181 @@
+"""
+Unit tests for BulkRepricingEngine
+
+Tests the vectorized recommendation computation:
+- Items without stored market data are routed to the fresh-data path
+- Cost basis fallbacks and minimum margins
+- Market condition classification
+- Minimum price change threshold
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pandas as pd
+import pytest
+
+from domains.pricing.services.bulk_repricing_engine import BulkRepricingEngine
+from domains.pricing.services.smart_pricing_service import MarketCondition
+
+
+@pytest.fixture
+def engine():
+    """BulkRepricingEngine with a mocked session"""
+    return BulkRepricingEngine(AsyncMock())
+
+
+@pytest.fixture
+def product_id():
+    return uuid4()
+
+
+def make_items(product_id, rows):
+    return pd.DataFrame(
+        [
+            {
+                "item_id": uuid4(),
+                "product_id": product_id,
+                "purchase_price": row.get("purchase_price"),
+                "created_at": row.get("created_at", datetime.now(timezone.utc)),
+                "size_value": row.get("size_value", "10"),
+                "brand_id": row.get("brand_id"),
+                "category_id": None,
+            }
+            for row in rows
+        ]
+    )
+
+
+def make_market(product_id, size_value="10", avg_last_sale="200.00", sales_volume=50):
+    return pd.DataFrame(
+        [
+            {
+                "product_id": product_id,
+                "size_value": size_value,
+                "avg_last_sale": Decimal(avg_last_sale),
+                "min_last_sale": Decimal(avg_last_sale),
+                "avg_average_price": None,
+                "lowest_ask": None,
+                "highest_bid": None,
+                "sales_volume": sales_volume,
+                "data_points": 5,
+            }
+        ]
+    )
+
+
+def make_recent_asks(product_id, asks):
+    """Newest-first lowest asks as returned by get_recent_asks_bulk"""
+    return pd.DataFrame(
+        [
+            {
+                "product_id": product_id,
+                "lowest_ask": None if ask is None else Decimal(ask),
+                "rank": rank,
+                "observations": len(asks),
+            }
+            for rank, ask in enumerate(asks, start=1)
+        ]
+    )
+
+
+def test_items_without_market_data_need_fresh_data(engine, product_id):
+    items = make_items(product_id, [{"purchase_price": Decimal("100.00")}])
+
+    result = engine.compute_recommendations(items, pd.DataFrame(), pd.DataFrame(), {}, {}, {}, [])
+
+    assert result.items_priced == 0
+    assert result.updates == []
+    assert result.needs_fresh_data == list(items["item_id"])
+
+
+def test_stable_market_uses_market_based_price(engine, product_id):
+    items = make_items(product_id, [{"purchase_price": Decimal("100.00")}])
+
+    result = engine.compute_recommendations(
+        items, make_market(product_id), pd.DataFrame(), {}, {}, {}, []
+    )
+
+    # 200 * 0.98 = 196 -> psychological rounding to 195, no adjustments apply
+    assert result.items_priced == 1
+    assert result.needs_fresh_data == []
+    update = result.updates[0]
+    assert update["recommended_price"] == 195.0
+    assert update["confidence"] == 0.9
+    assert update["market_condition"] == MarketCondition.STABLE
+    assert result.profit_increase == Decimal("195.0")
+
+
+def test_size_level_falls_back_to_product_level(engine, product_id):
+    items = make_items(product_id, [{"purchase_price": Decimal("100.00"), "size_value": "11"}])
+
+    result = engine.compute_recommendations(
+        items, make_market(product_id, size_value="10"), pd.DataFrame(), {}, {}, {}, []
+    )
+
+    assert result.needs_fresh_data == []
+    assert result.updates[0]["recommended_price"] == 195.0
+
+
+def test_minimum_margin_rule_raises_price(engine, product_id):
+    items = make_items(product_id, [{"purchase_price": Decimal("180.00")}])
+    rule = MagicMock(minimum_margin_percent=Decimal("25.0"), brand_id=None, category_id=None)
+
+    result = engine.compute_recommendations(
+        items, make_market(product_id), pd.DataFrame(), {}, {}, {}, [rule]
+    )
+
+    # 180 / 0.75 = 240
+    assert result.updates[0]["recommended_price"] == 240.0
+    assert result.updates[0]["expected_margin"] == 25.0
+
+
+def test_bearish_market_and_old_inventory_discount(engine, product_id):
+    old = datetime.now(timezone.utc) - timedelta(days=40)
+    items = make_items(product_id, [{"purchase_price": Decimal("100.00"), "created_at": old}])
+    # Each ask about 4% below the previous one
+    recent_asks = make_recent_asks(product_id, ["173.00", "180.00", "187.50", "195.00"])
+
+    result = engine.compute_recommendations(
+        items, make_market(product_id), recent_asks, {}, {}, {}, []
+    )
+
+    update = result.updates[0]
+    assert update["market_condition"] == MarketCondition.BEARISH
+    assert update["confidence"] == 0.88
+    # competitive 200 -> 200, then -4% (bearish) -4% (40 days old)
+    assert update["recommended_price"] == 184.0
+
+
+def test_small_price_changes_are_skipped(engine, product_id):
+    items = make_items(product_id, [{"purchase_price": Decimal("100.00")}])
+    listing_prices = {items.at[0, "item_id"]: Decimal("195.50")}
+
+    result = engine.compute_recommendations(
+        items, make_market(product_id), pd.DataFrame(), {}, listing_prices, {}, []
+    )
+
+    assert result.items_priced == 1
+    assert result.updates == []
+    assert result.profit_increase == Decimal("0.0")
+
+
+@pytest.mark.parametrize(
+    "asks, condition",
+    [
+        # avg change +4% -> bullish
+        (["208.00", "200.00", "192.30"], MarketCondition.BULLISH),
+        # +20% then -16.7%: mean absolute change above 10% -> volatile
+        (["200.00", "240.00", "200.00"], MarketCondition.VOLATILE),
+        # only two usable asks -> not enough data
+        (["208.00", None, "200.00"], MarketCondition.STABLE),
+    ],
+)
+def test_market_condition_matches_per_item_rule(engine, product_id, asks, condition):
+    items = make_items(product_id, [{"purchase_price": Decimal("100.00")}])
+
+    conditions = engine._market_conditions(items, make_recent_asks(product_id, asks))
+
+    assert conditions.iloc[0] == condition
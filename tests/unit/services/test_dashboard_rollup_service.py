@@ -0,0 +1,153 @@
+"""
+Unit tests for DashboardRollupService
+Tests shaping of pre-aggregated dashboard rows and rollup backfills
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from domains.dashboard.services.rollup_service import ROLLUP_NAMES, DashboardRollupService
+
+# ===== FIXTURES =====
+
+
+def query_result(rows, rowcount=None):
+    """Mock SQLAlchemy result returning the given rows"""
+    result = MagicMock()
+    result.fetchall.return_value = rows
+    result.one.return_value = rows[0] if rows else None
+    result.rowcount = rowcount if rowcount is not None else len(rows)
+    return result
+
+
+@pytest.fixture
+def mock_db_session():
+    """Mock database session"""
+    return AsyncMock()
+
+
+@pytest.fixture
+def rollup_service(mock_db_session):
+    """DashboardRollupService instance with mocked session"""
+    return DashboardRollupService(mock_db_session)
+
+
+# ===== READ TESTS =====
+
+
+class TestDashboardReads:
+    """Test dashboard aggregates read from rollup tables"""
+
+    async def test_sales_summary_derives_average(self, rollup_service, mock_db_session):
+        mock_db_session.execute.return_value = query_result(
+            [
+                SimpleNamespace(
+                    total_orders=4,
+                    total_revenue=Decimal("1000.00"),
+                    total_profit=Decimal("250.50"),
+                    active_days=3,
+                )
+            ]
+        )
+
+        summary = await rollup_service.get_sales_summary()
+
+        assert summary == {
+            "total_orders": 4,
+            "total_revenue": 1000.0,
+            "total_profit": 250.5,
+            "avg_sale_price": 250.0,
+            "active_days": 3,
+        }
+
+    async def test_empty_sales_history(self, rollup_service, mock_db_session):
+        mock_db_session.execute.return_value = query_result(
+            [SimpleNamespace(total_orders=0, total_revenue=0, total_profit=0, active_days=0)]
+        )
+
+        summary = await rollup_service.get_sales_summary()
+
+        assert summary["avg_sale_price"] == 0.0
+
+    async def test_inventory_counts_map_statuses(self, rollup_service, mock_db_session):
+        mock_db_session.execute.return_value = query_result(
+            [
+                SimpleNamespace(status="in_stock", item_count=7),
+                SimpleNamespace(status="sold", item_count=3),
+                SimpleNamespace(status="listed_stockx", item_count=2),
+                SimpleNamespace(status="reserved", item_count=1),
+            ]
+        )
+
+        counts = await rollup_service.get_inventory_counts()
+
+        assert counts == {"total_items": 13, "in_stock": 7, "sold": 3, "listed": 2}
+
+    async def test_snapshot_shapes_brands_and_activity(self, rollup_service, mock_db_session):
+        sold_at = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+        mock_db_session.execute.side_effect = [
+            query_result(
+                [SimpleNamespace(total_orders=2, total_revenue=300, total_profit=50, active_days=1)]
+            ),
+            query_result(
+                [SimpleNamespace(brand_name="Nike", order_count=2, total_revenue=Decimal("300"))]
+            ),
+            query_result(
+                [
+                    SimpleNamespace(
+                        order_date=sold_at,
+                        sale_price=Decimal("150"),
+                        net_profit=None,
+                        product_name="Dunk Low",
+                        brand_name="Nike",
+                    )
+                ]
+            ),
+            query_result([SimpleNamespace(status="sold", item_count=2)]),
+        ]
+
+        snapshot = await rollup_service.get_snapshot()
+
+        assert snapshot["top_brands"] == [
+            {"name": "Nike", "order_count": 2, "total_revenue": 300.0, "avg_price": 150.0}
+        ]
+        assert snapshot["recent_activity"][0]["date"] == sold_at.isoformat()
+        assert snapshot["recent_activity"][0]["net_profit"] == 0.0
+        assert snapshot["inventory"]["sold"] == 2
+
+
+# ===== BACKFILL TESTS =====
+
+
+class TestBackfill:
+    """Test rollup table rebuilds"""
+
+    async def test_backfill_locks_sources_and_rebuilds_selected(
+        self, rollup_service, mock_db_session
+    ):
+        mock_db_session.execute.return_value = query_result([], rowcount=12)
+
+        written = await rollup_service.backfill(["inventory_status"])
+
+        statements = [str(call.args[0]) for call in mock_db_session.execute.call_args_list]
+        assert statements[0] == "LOCK TABLE inventory.stock IN SHARE MODE"
+        assert statements[1].startswith("DELETE FROM analytics.dashboard_inventory_status")
+        assert "INSERT INTO analytics.dashboard_inventory_status" in statements[2]
+        assert written == {"inventory_status": 12}
+
+    async def test_backfill_defaults_to_all_rollups(self, rollup_service, mock_db_session):
+        mock_db_session.execute.return_value = query_result([], rowcount=1)
+
+        written = await rollup_service.backfill()
+
+        assert tuple(written) == ROLLUP_NAMES
+
+    async def test_unknown_rollup_rejected(self, rollup_service, mock_db_session):
+        with pytest.raises(ValueError, match="Unknown dashboard rollups: weekly"):
+            await rollup_service.backfill(["weekly"])
+
+        mock_db_session.execute.assert_not_called()
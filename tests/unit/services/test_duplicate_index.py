@@ -0,0 +1,75 @@
+"""
+Unit tests for the inventory DuplicateIndex
+Verifies blocking, exact/near-match detection and greedy grouping
+"""
+
+from itertools import combinations
+
+import pytest
+
+from domains.inventory.services.duplicate_index import DuplicateIndex, jaccard, tokenize_name
+
+
+@pytest.mark.unit
+class TestDuplicateIndex:
+    """Test suite for DuplicateIndex"""
+
+    def test_exact_name_match_within_block(self):
+        index = DuplicateIndex()
+        a = index.add(1, "Nike Dunk Low Panda", "Nike", "9")
+        b = index.add(2, "nike dunk low panda", "NIKE", "9")
+
+        assert [dup.id for dup in index.find_duplicates(a)] == [2]
+        assert [dup.id for dup in index.find_duplicates(b)] == [1]
+
+    def test_different_size_or_brand_never_match(self):
+        index = DuplicateIndex()
+        a = index.add(1, "Nike Dunk Low Panda", "Nike", "9")
+        index.add(2, "Nike Dunk Low Panda", "Nike", "10")
+        index.add(3, "Nike Dunk Low Panda", "Adidas", "9")
+
+        assert index.find_duplicates(a) == []
+
+    def test_similarity_threshold_is_strict(self):
+        index = DuplicateIndex()
+        # 10 shared tokens vs 11 -> Jaccard 10/11 > 0.9
+        base = " ".join(f"t{i}" for i in range(10))
+        a = index.add(1, base, "Nike", "9")
+        index.add(2, base + " extra", "Nike", "9")
+        # 4 shared tokens vs 5 -> Jaccard 0.8, below threshold
+        index.add(3, "t0 t1 t2 t3 other", "Nike", "9")
+
+        assert [dup.id for dup in index.find_duplicates(a)] == [2]
+
+    def test_stop_words_are_ignored(self):
+        assert tokenize_name("Air Jordan 1 of the Year") == frozenset(
+            {"air", "jordan", "1", "year"}
+        )
+
+    def test_iter_groups_matches_pairwise_scan(self):
+        names = [
+            "Jordan 1 Retro High OG Chicago",
+            "jordan 1 retro high og chicago",
+            "Jordan 1 Retro High OG Bred",
+            "Yeezy Boost 350 V2 Zebra",
+            "Yeezy Boost 350 V2 Zebra",
+            "New Balance 550 White Green",
+        ]
+        index = DuplicateIndex()
+        for i, name in enumerate(names):
+            index.add(i, name, "Brand", "10")
+
+        expected_pairs = {
+            (i, j)
+            for i, j in combinations(range(len(names)), 2)
+            if names[i].lower() == names[j].lower()
+            or jaccard(tokenize_name(names[i]), tokenize_name(names[j])) > 0.9
+        }
+        grouped_pairs = {
+            tuple(sorted((primary.id, dup.id)))
+            for primary, dups in index.iter_groups()
+            for dup in dups
+        }
+
+        assert grouped_pairs == expected_pairs
+        assert [primary.id for primary, _ in index.iter_groups()] == [0, 3]
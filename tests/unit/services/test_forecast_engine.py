@@ -143,6 +143,59 @@ async def test_generate_forecasts_handles_failures(
     assert len(results) == 2
 
 
+@pytest.mark.asyncio
+async def test_generate_forecasts_parallel_prefetches_and_reports(
+    forecast_engine, sample_config, sample_historical_data, mock_repository
+):
+    """Test parallel forecast run uses one bulk query and reports throughput"""
+    entity_ids = [uuid.uuid4(), uuid.uuid4(), uuid.uuid4()]
+    mock_repository.get_historical_sales_data_bulk = AsyncMock(
+        return_value={
+            str(entity_ids[0]): sample_historical_data,
+            str(entity_ids[1]): sample_historical_data,
+            # Third entity has no sales history
+        }
+    )
+    progress = []
+
+    report = await forecast_engine.generate_forecasts_parallel(
+        config=sample_config,
+        entity_ids=entity_ids,
+        max_workers=1,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    mock_repository.get_historical_sales_data_bulk.assert_called_once()
+    mock_repository.get_historical_sales_data.assert_not_called()
+    assert report.entities_requested == 3
+    assert report.entities_forecasted == 2
+    assert report.entities_skipped == 1
+    assert report.entities_failed == 0
+    assert {r.entity_id for r in report.results} == set(entity_ids[:2])
+    assert progress[-1] == (3, 3)
+    assert report.to_dict()["entities_forecasted"] == 2
+    mock_repository.create_forecast_batch.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_generate_forecasts_parallel_process_pool(
+    forecast_engine, sample_config, sample_historical_data, mock_repository
+):
+    """Test model fitting in a multi-process pool returns picklable results"""
+    entity_ids = [uuid.uuid4(), uuid.uuid4()]
+    mock_repository.get_historical_sales_data_bulk = AsyncMock(
+        return_value={str(entity_id): sample_historical_data for entity_id in entity_ids}
+    )
+
+    report = await forecast_engine.generate_forecasts_parallel(
+        config=sample_config, entity_ids=entity_ids, max_workers=2
+    )
+
+    assert report.workers == 2
+    assert report.entities_forecasted == 2
+    assert all(len(r.predictions) == sample_config.prediction_days for r in report.results)
+
+
 @pytest.mark.asyncio
 async def test_forecast_single_entity_insufficient_data(
     forecast_engine, sample_config, mock_repository
@@ -500,6 +553,51 @@ def test_prepare_training_data_outlier_removal(forecast_engine, sample_config):
     assert df["units_sold"].max() < 10000
 
 
+@pytest.mark.asyncio
+async def test_random_forest_model_recursive_horizon(forecast_engine):
+    """Test batched recursive forecast matches step-by-step recursion"""
+    try:
+        from sklearn.ensemble import RandomForestRegressor  # noqa: F401
+    except ImportError:
+        pytest.skip("sklearn not available")
+
+    config = ForecastConfig(
+        model=ForecastModel.RANDOM_FOREST,
+        horizon=ForecastHorizon.DAILY,
+        level=ForecastLevel.PRODUCT,
+        prediction_days=30,
+    )
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(
+        {
+            "period_date": pd.date_range(start="2024-01-01", periods=120, freq="D"),
+            "units_sold": rng.poisson(5 + 3 * np.sin(np.arange(120) * 2 * np.pi / 7)),
+            "total_revenue": 0.0,
+        }
+    )
+
+    predictions, intervals, _, _ = await forecast_engine._random_forest_model(df, config)
+
+    def step_by_step(model, X_future, target_features, history):
+        history = np.asarray(history, dtype=float)
+        preds = np.zeros(len(X_future))
+        for step in range(len(X_future)):
+            forecast_engine._fill_target_features(
+                X_future, target_features, np.concatenate((history, preds)), len(history)
+            )
+            preds[step] = max(model.predict(X_future[step : step + 1])[0], 0)
+        return preds
+
+    with patch.object(forecast_engine, "_recursive_horizon_predict", side_effect=step_by_step):
+        expected, expected_intervals, _, _ = await forecast_engine._random_forest_model(df, config)
+
+    assert np.allclose(predictions, expected)
+    assert np.allclose(intervals, expected_intervals)
+    # Intervals are computed per horizon step, not copied from the last observation
+    assert len(set(intervals)) > 1
+    assert all(lower <= upper for lower, upper in intervals)
+
+
 # =====================================================
 # FEATURE ENGINEERING TESTS
 # =====================================================
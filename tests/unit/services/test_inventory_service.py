@@ -310,3 +310,32 @@ async def test_sync_no_variants_from_stockx(inventory_service, mock_stockx_servi
 
     assert stats == {"created": 0, "updated": 0, "skipped": 0}
     inventory_service.db_session.commit.assert_not_called()
+
+
+async def test_sync_all_stockx_listings_streams_pages(inventory_service, mock_stockx_service):
+    """
+    Tests that listings are processed page by page and only ACTIVE/PENDING ones are synced.
+    """
+    pages_consumed = []
+
+    async def listing_pages():
+        for page in (
+            [{"listingId": "L1", "status": "ACTIVE"}, {"listingId": "L2", "status": "INACTIVE"}],
+            [{"listingId": "L3", "status": "PENDING"}, {"status": "ACTIVE"}],
+        ):
+            pages_consumed.append(page)
+            yield page
+
+    mock_stockx_service.iter_listing_pages = MagicMock(return_value=listing_pages())
+    inventory_service._get_default_category = AsyncMock()
+    inventory_service._get_default_brand = AsyncMock()
+    inventory_service._get_or_create_stockx_platform = AsyncMock()
+    inventory_service._simple_listing_check = AsyncMock(side_effect=[MagicMock(), None])
+    inventory_service._create_simple_inventory_item = AsyncMock()
+    inventory_service._create_or_update_marketplace_data = AsyncMock()
+
+    stats = await inventory_service.sync_all_stockx_listings_to_inventory()
+
+    assert stats == {"created": 1, "updated": 0, "skipped": 1, "matched": 1}
+    assert len(pages_consumed) == 2
+    inventory_service.db_session.commit.assert_awaited_once()
@@ -0,0 +1,139 @@
+"""
+Unit tests for the import value normalizers
+Tests format sniffing, memoization and column normalization
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from domains.integration.services.normalizers import CurrencyNormalizer, DateNormalizer
+
+# ===== FIXTURES =====
+
+
+@pytest.fixture
+def dates():
+    return DateNormalizer()
+
+
+@pytest.fixture
+def currencies():
+    return CurrencyNormalizer()
+
+
+def column(fmt, count=50):
+    start = datetime(2024, 1, 1, 8, 30)
+    return [(start + timedelta(days=n, minutes=n)).strftime(fmt) for n in range(count)]
+
+
+# ===== DATE TESTS =====
+
+
+class TestDateNormalizer:
+    """Test format-sniffing date normalization"""
+
+    @pytest.mark.parametrize(
+        "fmt, detected",
+        [
+            ("%Y-%m-%d %H:%M:%S +00", ("%Y-%m-%d %H:%M:%S %z",)),
+            ("%Y-%m-%dT%H:%M:%SZ", ("%Y-%m-%dT%H:%M:%S%z",)),
+            ("%m/%d/%Y %H:%M:%S", ("%m/%d/%Y %H:%M:%S", "%d/%m/%Y %H:%M:%S")),
+            ("%d.%m.%Y", ("%m.%d.%Y", "%d.%m.%Y")),
+        ],
+    )
+    def test_detects_column_format(self, dates, fmt, detected):
+        assert dates.detect_format(column(fmt)) == detected
+
+    def test_mixed_column_has_no_format(self, dates):
+        sample = column("%Y-%m-%d", 5) + column("%d. %B %Y", 5)
+
+        assert dates.detect_format(sample) is None
+
+    def test_column_matches_single_values(self, dates):
+        values = column("%d.%m.%Y") + ["01.02.2024", "", None, "not a date"]
+
+        outcomes = dates.normalize_many(values)
+
+        reference = DateNormalizer()
+        for value, (normalized, error) in zip(values, outcomes):
+            if error:
+                with pytest.raises(ValueError, match="Invalid date format"):
+                    reference.normalize(value)
+            else:
+                assert normalized == reference.normalize(value)
+        # Ambiguous day/month dates are read month first, like the shared parser
+        assert outcomes[-4] == (datetime(2024, 1, 2, tzinfo=timezone.utc), None)
+        assert outcomes[-3:] == [
+            (None, None),
+            (None, None),
+            (None, "Invalid date format: not a date"),
+        ]
+
+    def test_normalizes_stockx_and_german_dates(self, dates):
+        stockx = dates.normalize("2022-07-07 21:40:06 +00")
+        german = dates.normalize("15. März 2024", ["%d. %B %Y"])
+
+        assert stockx == datetime(2022, 7, 7, 21, 40, 6, tzinfo=timezone.utc)
+        assert german == datetime(2024, 3, 15, tzinfo=timezone.utc)
+
+    def test_falls_back_to_caller_formats(self, dates):
+        # Not readable by the shared parser
+        assert dates.normalize("2024|01|15", ["%Y|%m|%d"]) == datetime(2024, 1, 15)
+        with pytest.raises(ValueError):
+            dates.normalize("2024|01|15")
+
+    def test_memoizes_repeated_values(self, dates):
+        dates.normalize_many(["2024-01-15"] * 10)
+        dates.normalize("2024-01-15")
+
+        assert dates.misses == 1
+        assert dates.hits == 1
+
+    def test_cache_is_bounded(self):
+        dates = DateNormalizer(cache_size=5)
+
+        dates.normalize_many(column("%Y-%m-%d", 20))
+
+        assert len(dates._cache) == 5
+
+
+# ===== CURRENCY TESTS =====
+
+
+class TestCurrencyNormalizer:
+    """Test memoized currency normalization"""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("180.00", Decimal("180.00")),
+            (" -5 ", Decimal("-5")),
+            ("€180,50", Decimal("180.50")),
+            ("1.234,56", Decimal("1234.56")),
+            ("$1,234.56", Decimal("1234.56")),
+            (12, Decimal("12")),
+            ("", None),
+            ("N/A", None),
+            (float("inf"), None),
+        ],
+    )
+    def test_normalizes_values(self, currencies, value, expected):
+        assert currencies.normalize(value) == expected
+
+    def test_rejects_invalid_values(self, currencies):
+        with pytest.raises(ValueError, match="Invalid currency format: abc"):
+            currencies.normalize("abc")
+
+    def test_normalizes_columns(self, currencies):
+        outcomes = currencies.normalize_many(["10.00", "abc", "10.00", None, 1])
+
+        assert outcomes == [
+            (Decimal("10.00"), None),
+            (None, "Invalid currency format: abc"),
+            (Decimal("10.00"), None),
+            (None, None),
+            (Decimal("1"), None),
+        ]
+        assert currencies.misses == 2
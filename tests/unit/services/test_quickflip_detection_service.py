@@ -0,0 +1,125 @@
+"""
+Unit tests for QuickFlipDetectionService
+Tests SQL-side profit filtering, top-K ordering and keyset pagination
+"""
+
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from domains.integration.services.quickflip_detection_service import QuickFlipDetectionService
+from shared.database.models import Brand, Product, SourcePrice
+
+# ===== FIXTURES =====
+
+
+@pytest.fixture
+async def seeded_session(legacy_db_session):
+    """Session with one product resold at 200 and source prices at various buy prices"""
+    brand = Brand(id=uuid.uuid4(), name="Nike", slug="nike")
+    product = Product(
+        id=uuid.uuid4(),
+        sku="DD1391-100",
+        name="Nike Dunk Low Panda",
+        brand_id=brand.id,
+        category_id=uuid.uuid4(),
+        avg_resale_price=Decimal("200.00"),
+    )
+    unpriced = Product(
+        id=uuid.uuid4(), sku="NO-RESALE", name="No Resale Data", category_id=uuid.uuid4()
+    )
+    legacy_db_session.add_all([brand, product, unpriced])
+
+    buy_prices = {
+        "awin": ["100.00", "150.00", "190.00"],
+        "webgains": ["120.00", "160.00"],
+    }
+    for source, prices in buy_prices.items():
+        for price in prices:
+            legacy_db_session.add(
+                SourcePrice(
+                    product_id=product.id,
+                    source=source,
+                    supplier_name=f"{source} supplier",
+                    buy_price=Decimal(price),
+                )
+            )
+    legacy_db_session.add(
+        SourcePrice(
+            product_id=unpriced.id,
+            source="awin",
+            supplier_name="awin supplier",
+            buy_price=Decimal("10.00"),
+        )
+    )
+    await legacy_db_session.flush()
+    return legacy_db_session
+
+
+@pytest.fixture
+def quickflip_service(seeded_session):
+    return QuickFlipDetectionService(seeded_session)
+
+
+# ===== TESTS =====
+
+
+@pytest.mark.asyncio
+async def test_find_opportunities_filters_and_orders_in_sql(quickflip_service):
+    opportunities = await quickflip_service.find_opportunities(
+        min_profit_margin=10.0, min_gross_profit=Decimal("20.00")
+    )
+
+    # 190 (5.3%) is below the margin threshold, the unpriced product is excluded
+    assert [float(o.buy_price) for o in opportunities] == [100.0, 120.0, 150.0, 160.0]
+    best = opportunities[0]
+    assert best.profit_margin == pytest.approx(100.0)
+    assert best.roi == pytest.approx(100.0)
+    assert float(best.gross_profit) == pytest.approx(100.0)
+    assert best.brand_name == "Nike"
+    assert best.product_sku == "DD1391-100"
+
+
+@pytest.mark.asyncio
+async def test_find_opportunities_respects_limit_and_sources(quickflip_service):
+    opportunities = await quickflip_service.find_opportunities(sources=["webgains"], limit=1)
+
+    assert len(opportunities) == 1
+    assert opportunities[0].buy_source == "webgains"
+    assert float(opportunities[0].buy_price) == 120.0
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_walks_all_results(quickflip_service):
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = await quickflip_service.find_opportunities_page(
+            min_profit_margin=0, min_gross_profit=Decimal("0"), limit=2, cursor=cursor
+        )
+        seen.extend(float(o.buy_price) for o in page)
+        if cursor is None:
+            break
+
+    assert seen == [100.0, 120.0, 150.0, 160.0, 190.0]
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_raises_value_error(quickflip_service):
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        await quickflip_service.find_opportunities_page(cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_opportunities_summary_aggregates_in_sql(quickflip_service):
+    summary = await quickflip_service.get_opportunities_summary()
+
+    assert summary["total_opportunities"] == 5
+    assert summary["sources_breakdown"]["awin"]["count"] == 3
+    assert summary["sources_breakdown"]["awin"]["best_margin"] == pytest.approx(100.0)
+    assert summary["sources_breakdown"]["webgains"]["avg_profit_margin"] == pytest.approx(
+        round((200 / 3 + 25.0) / 2, 2)
+    )
+    assert summary["avg_gross_profit"] == pytest.approx(56.0)
+    assert summary["best_opportunity"]["buy_price"] == 100.0
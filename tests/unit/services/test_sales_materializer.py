@@ -0,0 +1,302 @@
+"""
+Unit tests for SalesBatchMaterializer
+Tests set-based order and transaction creation from import batches
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from domains.sales.services.order_processor import OrderProcessor
+from domains.sales.services.transaction_processor import TransactionProcessor
+
+# ===== FIXTURES =====
+
+
+def query_result(rows):
+    """Mock SQLAlchemy result returning the given rows"""
+    result = MagicMock()
+    result.fetchall.return_value = rows
+    result.scalars.return_value.all.return_value = rows
+    result.scalars.return_value.first.return_value = rows[0] if rows else None
+    return result
+
+
+def statement_rows(stmt):
+    """Rows of a (multi-)VALUES insert keyed by column name"""
+    if stmt._multi_values:
+        return [
+            {column.key: value for column, value in row.items()} for row in stmt._multi_values[0]
+        ]
+    return [{column.key: bind.value for column, bind in stmt._values.items()}]
+
+
+class FakeSalesDatabase:
+    """Async session stand-in holding the tables the materializer touches"""
+
+    def __init__(self, records=(), platforms=(), products=(), sizes=(), existing_ids=()):
+        self.records = list(records)
+        self.platforms = list(platforms)
+        self.products = list(products)
+        self.sizes = list(sizes)
+        self.existing_ids = list(existing_ids)
+        self.categories = []
+        self.inserted = {}
+        self.updates = []
+        self.deleted = []
+        self.statements = 0
+
+    async def execute(self, stmt, params=None):
+        self.statements += 1
+
+        if stmt.is_select:
+            table = stmt.get_final_froms()[0].name
+            rows = {
+                "import_records": self.records,
+                "marketplace": self.platforms,
+                "product": self.products,
+                "sizes": self.sizes,
+                "category": [category.id for category in self.categories],
+            }.get(table, self.existing_ids)
+            return query_result(rows)
+
+        if stmt.is_insert:
+            return self._insert(stmt.table.name, statement_rows(stmt))
+
+        if stmt.is_update:
+            self.updates.extend(params)
+        elif stmt.is_delete:
+            self.deleted.extend(stmt.whereclause.right.value)
+        return query_result([])
+
+    def _insert(self, table, rows):
+        self.inserted.setdefault(table, []).extend(rows)
+
+        if table == "marketplace":
+            self.platforms.extend(SimpleNamespace(**row) for row in rows)
+        elif table == "category":
+            self.categories.extend(SimpleNamespace(**row) for row in rows)
+        elif table == "product":
+            taken = {product.sku for product in self.products}
+            new = [row for row in rows if row["sku"] not in taken]
+            self.products.extend(SimpleNamespace(**row) for row in new)
+            return query_result([row["id"] for row in new])
+        elif table == "order":
+            # stockx_order_number is unique; colliding rows are skipped by ON CONFLICT
+            taken = set()
+            new = []
+            for row in rows:
+                number = row["stockx_order_number"]
+                if number is None or number not in taken:
+                    taken.add(number)
+                    new.append(row["inventory_item_id"])
+            return query_result(new)
+        elif table == "transaction":
+            return query_result([row["inventory_id"] for row in rows])
+
+        return query_result([])
+
+
+def import_record(batch_id, **data):
+    return SimpleNamespace(id=uuid.uuid4(), batch_id=batch_id, processed_data=data)
+
+
+def stockx_sale(batch_id, order_number, **overrides):
+    data = {
+        "source_platform": "StockX",
+        "order_number": order_number,
+        "product_name": "Nike Dunk Low Panda",
+        "sku": "DD1391-100",
+        "size": "10",
+        "sale_price": "150.00",
+        "seller_fee": "14.25",
+        "total_payout": "135.75",
+        "sale_date": "2024-03-01T12:00:00+00:00",
+    }
+    data.update(overrides)
+    return import_record(batch_id, **data)
+
+
+@pytest.fixture
+def batch_id():
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def stockx_platform():
+    return SimpleNamespace(id=uuid.uuid4(), name="StockX", slug="stockx")
+
+
+@pytest.fixture
+def dunk_product():
+    return SimpleNamespace(id=uuid.uuid4(), name="Nike Dunk Low Panda", sku="DD1391-100")
+
+
+@pytest.fixture
+def size_ten():
+    return SimpleNamespace(id=uuid.uuid4(), value="10")
+
+
+# ===== ORDER TESTS =====
+
+
+class TestOrderMaterialization:
+    """Test bulk order creation from import batches"""
+
+    async def test_creates_orders_against_existing_dimensions(
+        self, batch_id, stockx_platform, dunk_product, size_ten
+    ):
+        db = FakeSalesDatabase(
+            records=[stockx_sale(batch_id, f"01-{n:04d}") for n in range(50)],
+            platforms=[stockx_platform],
+            products=[dunk_product],
+            sizes=[size_ten],
+        )
+
+        stats = await OrderProcessor(db).create_orders_from_batch(str(batch_id))
+
+        assert stats["orders_created"] == 50
+        assert stats["skipped"] == 0
+        assert stats["errors"] == []
+        # No dimension rows created, one insert for stock and one for orders
+        assert set(db.inserted) == {"stock", "order"}
+        assert len(db.inserted["stock"]) == 50
+        order = db.inserted["order"][0]
+        assert order["platform_id"] == stockx_platform.id
+        assert order["external_id"] == "stockx_01-0000"
+        assert order["stockx_order_number"] == "01-0000"
+        assert str(order["gross_sale"]) == "150.00"
+        assert str(order["net_profit"]) == "135.75"
+        assert {row["product_id"] for row in db.inserted["stock"]} == {dunk_product.id}
+        assert {row["size_id"] for row in db.inserted["stock"]} == {size_ten.id}
+
+    async def test_statement_count_does_not_grow_with_batch_size(
+        self, batch_id, stockx_platform, dunk_product, size_ten
+    ):
+        counts = []
+        for batch_size in (10, 500):
+            db = FakeSalesDatabase(
+                records=[stockx_sale(batch_id, f"01-{n:04d}") for n in range(batch_size)],
+                platforms=[stockx_platform],
+                products=[dunk_product],
+                sizes=[size_ten],
+            )
+            await OrderProcessor(db).create_orders_from_batch(str(batch_id))
+            counts.append(db.statements)
+
+        assert counts[0] == counts[1]
+        assert counts[0] < 10
+
+    async def test_creates_missing_dimensions_once_per_batch(self, batch_id):
+        db = FakeSalesDatabase(
+            records=[
+                import_record(
+                    batch_id,
+                    platform="alias",
+                    order_number=f"A-{n}",
+                    item_name="Jordan 4 Bred",
+                    sku="N/A",
+                    size="9.5",
+                )
+                for n in range(3)
+            ]
+        )
+
+        stats = await OrderProcessor(db).create_orders_from_batch(str(batch_id))
+
+        assert stats["orders_created"] == 3
+        [platform] = db.inserted["marketplace"]
+        assert platform["slug"] == "alias"
+        assert platform["supports_fees"] is False
+        [category] = db.inserted["category"]
+        assert category["name"] == "Footwear"
+        [product] = db.inserted["product"]
+        assert product["sku"].startswith("AUTO_JORDAN_4_BRED_")
+        assert product["category_id"] == category["id"]
+        [size] = db.inserted["sizes"]
+        assert size["value"] == "9.5"
+        assert {row["stockx_order_number"] for row in db.inserted["order"]} == {None}
+
+    async def test_skips_existing_duplicate_and_incomplete_records(
+        self, batch_id, stockx_platform, dunk_product, size_ten
+    ):
+        db = FakeSalesDatabase(
+            records=[
+                stockx_sale(batch_id, "01-0001"),
+                stockx_sale(batch_id, "01-0002"),
+                stockx_sale(batch_id, "01-0002"),  # duplicated within the batch
+                stockx_sale(batch_id, "01-0003", external_transaction_id="ext-3"),
+                stockx_sale(batch_id, None),
+                stockx_sale(batch_id, "01-0004", product_name=""),
+                import_record(batch_id),
+            ],
+            platforms=[stockx_platform],
+            products=[dunk_product],
+            sizes=[size_ten],
+            existing_ids=["stockx_01-0001", "ext-3"],
+        )
+
+        stats = await OrderProcessor(db).create_orders_from_batch(str(batch_id))
+
+        assert stats["orders_created"] == 1
+        assert stats["skipped"] == 6
+        assert [row["external_id"] for row in db.inserted["order"]] == ["stockx_01-0002"]
+        assert db.deleted == []
+
+    async def test_conflicting_orders_release_their_inventory_items(
+        self, batch_id, stockx_platform, dunk_product, size_ten
+    ):
+        db = FakeSalesDatabase(
+            records=[
+                stockx_sale(batch_id, "01-0001", external_transaction_id="a"),
+                stockx_sale(batch_id, "01-0001", external_transaction_id="b"),
+            ],
+            platforms=[stockx_platform],
+            products=[dunk_product],
+            sizes=[size_ten],
+        )
+
+        stats = await OrderProcessor(db).create_orders_from_batch(str(batch_id))
+
+        assert stats["orders_created"] == 1
+        assert stats["skipped"] == 1
+        assert db.deleted == [db.inserted["stock"][1]["id"]]
+
+    async def test_name_matched_product_receives_sku(self, batch_id, stockx_platform, size_ten):
+        product = SimpleNamespace(id=uuid.uuid4(), name="Nike Dunk Low Panda", sku="")
+        db = FakeSalesDatabase(
+            records=[stockx_sale(batch_id, "01-0001")],
+            platforms=[stockx_platform],
+            products=[product],
+            sizes=[size_ten],
+        )
+
+        await OrderProcessor(db).create_orders_from_batch(str(batch_id))
+
+        assert db.updates == [{"id": product.id, "sku": "DD1391-100"}]
+        assert "product" not in db.inserted
+        assert db.inserted["stock"][0]["product_id"] == product.id
+
+
+# ===== TRANSACTION TESTS =====
+
+
+class TestTransactionMaterialization:
+    """Test bulk transaction creation from import batches"""
+
+    async def test_creates_transactions(self, batch_id, stockx_platform, dunk_product, size_ten):
+        db = FakeSalesDatabase(
+            records=[stockx_sale(batch_id, "01-0001"), stockx_sale(batch_id, "01-0002")],
+            platforms=[stockx_platform],
+            products=[dunk_product],
+            sizes=[size_ten],
+        )
+
+        stats = await TransactionProcessor(db).create_transactions_from_batch(str(batch_id))
+
+        assert stats["transactions_created"] == 2
+        stock_ids = [row["id"] for row in db.inserted["stock"]]
+        assert [row["inventory_id"] for row in db.inserted["transaction"]] == stock_ids
+        assert str(db.inserted["transaction"][0]["sale_price"]) == "150.00"
@@ -186,6 +186,22 @@ async def test_optimize_inventory_pricing_batch_processing(
     assert result["successful_optimizations"] == 25
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("bulk", [False, True])
+async def test_optimize_inventory_pricing_rejects_unsupported_strategy(
+    smart_pricing_service, sample_inventory_item, bulk
+):
+    """Test both pricing paths refuse strategies they cannot honor"""
+    with pytest.raises(ValueError, match="market_competitive"):
+        await smart_pricing_service.optimize_inventory_pricing(
+            inventory_items=[sample_inventory_item],
+            repricing_strategy="market_competitive",
+            bulk=bulk,
+        )
+
+    smart_pricing_service.db_session.execute.assert_not_called()
+
+
 # =====================================================
 # DYNAMIC PRICE RECOMMENDATION TESTS
 # =====================================================
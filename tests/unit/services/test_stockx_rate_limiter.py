@@ -0,0 +1,107 @@
+"""
+Unit tests for the StockX token-bucket scheduler
+Tests priority lanes, Retry-After handling and adaptive rate control
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from domains.integration.services.stockx_rate_limiter import (
+    RequestPriority,
+    TokenBucketScheduler,
+    current_request_priority,
+    parse_retry_after,
+    stockx_request_priority,
+)
+
+# ===== TESTS =====
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+
+def test_priority_context_is_scoped():
+    assert current_request_priority() == RequestPriority.INTERACTIVE
+    with stockx_request_priority(RequestPriority.CATALOG_ENRICHMENT):
+        assert current_request_priority() == RequestPriority.CATALOG_ENRICHMENT
+    assert current_request_priority() == RequestPriority.INTERACTIVE
+
+
+@pytest.mark.asyncio
+async def test_queued_requests_are_served_by_priority():
+    scheduler = TokenBucketScheduler(rate=50.0, burst=1)
+    await scheduler.acquire()  # drain the bucket
+    served = []
+
+    async def request(priority):
+        await scheduler.acquire(priority)
+        served.append(priority)
+
+    tasks = []
+    for priority in (
+        RequestPriority.CATALOG_ENRICHMENT,
+        RequestPriority.LISTING_SYNC,
+        RequestPriority.INTERACTIVE,
+    ):
+        tasks.append(asyncio.create_task(request(priority)))
+        await asyncio.sleep(0)
+
+    assert scheduler.queue_depth == 3
+    await asyncio.gather(*tasks)
+
+    assert served == [
+        RequestPriority.INTERACTIVE,
+        RequestPriority.LISTING_SYNC,
+        RequestPriority.CATALOG_ENRICHMENT,
+    ]
+    assert scheduler.stats()["granted"]["catalog_enrichment"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_all_lanes_and_halves_rate():
+    scheduler = TokenBucketScheduler(rate=100.0, burst=10)
+
+    pause = scheduler.on_response(429, "0.2")
+
+    assert pause == pytest.approx(0.2)
+    assert scheduler.rate == pytest.approx(50.0)
+    started = time.monotonic()
+    await scheduler.acquire(RequestPriority.INTERACTIVE)
+    assert time.monotonic() - started >= 0.15
+    assert scheduler.stats()["throttled_total"] == 1
+
+
+def test_successful_responses_recover_rate_up_to_ceiling():
+    scheduler = TokenBucketScheduler(rate=1.0, burst=1, min_rate=0.2)
+    for _ in range(5):
+        scheduler.on_response(429, "0")
+    assert scheduler.rate == pytest.approx(0.2)
+
+    for _ in range(100):
+        scheduler.on_response(200)
+    assert scheduler.rate == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_consume_a_slot():
+    scheduler = TokenBucketScheduler(rate=20.0, burst=1)
+    await scheduler.acquire()
+
+    waiter = asyncio.create_task(scheduler.acquire(RequestPriority.INTERACTIVE))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    await asyncio.wait_for(scheduler.acquire(RequestPriority.CATALOG_ENRICHMENT), timeout=1)
+    assert scheduler.stats()["granted"]["interactive"] == 1
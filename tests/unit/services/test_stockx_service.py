@@ -1,8 +1,16 @@
+import asyncio
+import threading
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
+from domains.integration.services import stockx_http_client
+from domains.integration.services.stockx_http_client import (
+    get_stockx_client_state,
+    reset_stockx_client_state,
+)
 from domains.integration.services.stockx_service import StockXCredentials, StockXService
 from shared.database.models import SystemConfig
 
@@ -10,6 +18,14 @@ from shared.database.models import SystemConfig
 pytestmark = pytest.mark.asyncio
 
 
+@pytest.fixture(autouse=True)
+def fresh_client_state():
+    """Credentials, token and pool are process-wide; isolate each test."""
+    state = reset_stockx_client_state()
+    yield state
+    reset_stockx_client_state()
+
+
 @pytest.fixture
 def mock_db_session():
     """Creates a mock of an async SQLAlchemy session."""
@@ -143,7 +159,7 @@ async def test_get_valid_access_token_refreshes_expired_token(stockx_service):
         stockx_service, "_refresh_access_token", new_callable=AsyncMock
     ) as mock_refresh:
         # We need to set the token inside the mock, because the original is expired
-        async def side_effect():
+        async def side_effect(credentials=None):
             stockx_service._access_token = "refreshed_token"
 
         mock_refresh.side_effect = side_effect
@@ -364,3 +380,257 @@ async def test_get_shipping_document_not_found(stockx_service):
         mock_get_binary.assert_called_once_with(
             f"/selling/orders/{order_number}/shipping-document/{shipping_id}"
         )
+
+
+# ===== Shared client / token cache =====
+
+
+def _install_transport(monkeypatch, handler):
+    """Routes the pooled client through an httpx.MockTransport calling ``handler``."""
+    transport = httpx.MockTransport(handler)
+    real_client = httpx.AsyncClient
+
+    def client_factory(**kwargs):
+        kwargs.pop("http2", None)
+        return real_client(transport=transport, **kwargs)
+
+    monkeypatch.setattr(stockx_http_client.httpx, "AsyncClient", client_factory)
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+    """Mock transport replaying queued responses and recording requests."""
+    requests = []
+    responses = []
+
+    def handler(request):
+        requests.append(request)
+        return responses.pop(0) if responses else httpx.Response(200, json={"ok": True})
+
+    _install_transport(monkeypatch, handler)
+    return requests, responses
+
+
+@pytest.fixture
+def paged_listings(monkeypatch):
+    """Mock /selling/listings with 250 listings in pages of 100; records page numbers."""
+    pages_requested = []
+    total = 250
+
+    def handler(request):
+        page = int(request.url.params["pageNumber"])
+        pages_requested.append(page)
+        start = (page - 1) * 100
+        listings = [{"listingId": str(i)} for i in range(start, min(start + 100, total))]
+        return httpx.Response(
+            200,
+            json={"count": total, "hasNextPage": start + 100 < total, "listings": listings},
+        )
+
+    _install_transport(monkeypatch, handler)
+    return pages_requested
+
+
+def _seed_shared_token(token="shared_token"):
+    state = get_stockx_client_state()
+    state.store_credentials(StockXCredentials("id", "secret", "refresh", "api_key"))
+    state.access_token = token
+    state.token_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+    return state
+
+
+async def test_token_and_credentials_shared_across_instances(mock_db_session):
+    session, _ = mock_db_session
+    first, second = StockXService(session), StockXService(session)
+
+    first._access_token = "shared_token"
+    first._token_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    assert await second._get_valid_access_token() == "shared_token"
+
+
+async def test_concurrent_token_refresh_is_single_flight(mock_db_session):
+    session, _ = mock_db_session
+    services = [StockXService(session) for _ in range(5)]
+
+    async def slow_refresh(credentials=None):
+        await asyncio.sleep(0.01)
+        get_stockx_client_state().access_token = "fresh_token"
+        get_stockx_client_state().token_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    refresh = AsyncMock(side_effect=slow_refresh)
+    for service in services:
+        service._refresh_access_token = refresh
+
+    tokens = await asyncio.gather(*(s._get_valid_access_token() for s in services))
+
+    assert tokens == ["fresh_token"] * 5
+    assert refresh.await_count == 1
+    assert get_stockx_client_state().metrics.token_refresh_waits >= 1
+
+
+async def test_requests_reuse_pooled_client_and_record_metrics(stockx_service, mock_transport):
+    requests, _ = mock_transport
+    state = _seed_shared_token()
+
+    await stockx_service._make_get_request("/catalog/products/1")
+    await stockx_service._make_get_request("/catalog/products/2")
+
+    assert [r.url.path for r in requests] == ["/v2/catalog/products/1", "/v2/catalog/products/2"]
+    assert requests[0].headers["Authorization"] == "Bearer shared_token"
+    assert requests[0].headers["x-api-key"] == "api_key"
+    stats = state.stats()
+    assert stats["clients_created"] == 1
+    assert stats["requests_total"] == 2
+    assert stats["status_counts"] == {200: 2}
+    assert stats["latency_ms"]["samples"] == 2
+    assert stats["in_flight"] == 0
+
+
+async def test_client_from_another_running_loop_is_closed_on_that_loop():
+    state = get_stockx_client_state()
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+    try:
+
+        async def create_client():
+            return state.get_client()
+
+        old_client = asyncio.run_coroutine_threadsafe(create_client(), other_loop).result()
+        new_client = state.get_client()
+
+        for _ in range(100):
+            if old_client.is_closed:
+                break
+            await asyncio.sleep(0.01)
+
+        assert old_client.is_closed
+        assert new_client is not old_client and not new_client.is_closed
+        assert state.metrics.clients_created == 2
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+        await state.close()
+
+
+async def test_client_from_a_closed_loop_is_replaced():
+    state = get_stockx_client_state()
+    closed_loop = asyncio.new_event_loop()
+    closed_loop.close()
+    old_client = httpx.AsyncClient()
+    state._client, state._client_loop = old_client, closed_loop
+
+    new_client = state.get_client()
+
+    assert new_client is not old_client
+    assert state.metrics.clients_created == 1
+    await state.close()
+
+
+async def test_401_invalidates_token_and_retries_once(stockx_service, mock_transport):
+    requests, responses = mock_transport
+    _seed_shared_token("stale_token")
+    responses.extend([httpx.Response(401), httpx.Response(200, json={"id": "1"})])
+
+    async def refresh(credentials=None):
+        stockx_service._access_token = "fresh_token"
+        stockx_service._token_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    stockx_service._refresh_access_token = AsyncMock(side_effect=refresh)
+
+    result = await stockx_service._make_post_request("/selling/batch", json={"items": []})
+
+    assert result == {"id": "1"}
+    stockx_service._refresh_access_token.assert_awaited_once()
+    assert [r.headers["Authorization"] for r in requests] == [
+        "Bearer stale_token",
+        "Bearer fresh_token",
+    ]
+
+
+async def test_429_honors_retry_after_through_shared_scheduler(stockx_service, mock_transport):
+    requests, responses = mock_transport
+    state = _seed_shared_token()
+    responses.extend(
+        [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, json={"id": "1"})]
+    )
+
+    with patch.object(state.scheduler, "pause", wraps=state.scheduler.pause) as pause:
+        result = await stockx_service._make_get_request("/catalog/products/1")
+
+    assert result == {"id": "1"}
+    assert len(requests) == 2
+    pause.assert_called_once_with(0.0)
+    assert state.stats()["scheduler"]["throttled_total"] == 1
+
+
+# ===== Streaming pagination =====
+
+
+async def test_iter_listing_pages_prefetches_within_count(stockx_service, paged_listings):
+    _seed_shared_token()
+
+    pages = [page async for page in stockx_service.iter_listing_pages(prefetch=5)]
+
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert pages[2][-1]["listingId"] == "249"
+    # count bounds the prefetch window: no speculative requests past page 3
+    assert sorted(paged_listings) == [1, 2, 3]
+
+
+async def test_iter_listing_pages_cancels_prefetch_when_caller_stops(
+    stockx_service, paged_listings
+):
+    _seed_shared_token()
+
+    pages = stockx_service.iter_listing_pages(prefetch=1)
+    first = await pages.__anext__()
+    await pages.aclose()
+
+    assert len(first) == 100
+    assert set(paged_listings) <= {1, 2}
+    assert get_stockx_client_state().metrics.in_flight == 0
+
+
+async def test_prefetch_never_reloads_credentials_from_session(
+    stockx_service, mock_db_session, monkeypatch
+):
+    session, _ = mock_db_session
+    state = _seed_shared_token("stale_token")
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            # Credential cache expires while the page request waits out a 429
+            state.credentials_loaded_at = -1e9
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        if request.headers["Authorization"] == "Bearer stale_token":
+            return httpx.Response(401)
+        return httpx.Response(200, json={"hasNextPage": False, "listings": [{"listingId": "1"}]})
+
+    _install_transport(monkeypatch, handler)
+
+    async def refresh(credentials=None):
+        assert credentials is not None
+        stockx_service._access_token = "fresh_token"
+        stockx_service._token_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    stockx_service._refresh_access_token = AsyncMock(side_effect=refresh)
+
+    pages = [page async for page in stockx_service.iter_listing_pages()]
+
+    assert pages == [[{"listingId": "1"}]]
+    assert [r.headers["x-api-key"] for r in requests] == ["api_key"] * 3
+    stockx_service._refresh_access_token.assert_awaited_once()
+    session.execute.assert_not_called()
+
+
+async def test_get_all_listings_collects_streamed_pages(stockx_service, paged_listings):
+    _seed_shared_token()
+
+    listings = await stockx_service.get_all_listings()
+
+    assert [listing["listingId"] for listing in listings] == [str(i) for i in range(250)]
@@ -0,0 +1,223 @@
+"""
+Unit tests for DataTransformer
+Tests compiled field mappings and the row and column transformation paths
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from domains.integration.services.transformers import (
+    AliasTransformer,
+    DataTransformer,
+    FieldMapping,
+    FieldType,
+    StockXTransformer,
+)
+
+# ===== FIXTURES =====
+
+
+def stockx_rows(count):
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    return [
+        {
+            "item_name": f"Nike Dunk Low {n % 7}",
+            "sku": "DD1391-100",
+            "size": str(8 + n % 5),
+            "order_number": f"01-{n:05d}",
+            "sale_date": [
+                (start + timedelta(days=n % 30)).strftime("%Y-%m-%d %H:%M:%S"),
+                (start + timedelta(days=n % 30)).strftime("%m/%d/%Y"),
+                "2022-07-07 21:40:06 +0200",
+                "not a date",
+                "",
+            ][n % 5],
+            "listing_price": ["150.00", "1,250.50", "abc", 99][n % 4],
+            "seller_fee": "14.25",
+            "total_payout": None,
+            "buyer_destination_country": "DE",
+        }
+        for n in range(count)
+    ]
+
+
+@pytest.fixture
+def mixed_mappings():
+    return [
+        FieldMapping("code", "code", FieldType.STRING, validation_pattern=r"[A-Z]{2}\d+$"),
+        FieldMapping("amount", "amount", FieldType.CURRENCY, required=True),
+        FieldMapping("day", "day", FieldType.DATE),
+        FieldMapping("count", "count", FieldType.INTEGER, default_value=0),
+        FieldMapping("flag", "flag", FieldType.BOOLEAN),
+        FieldMapping("label", "label", FieldType.STRING, transform_func=lambda v: f"#{v}"),
+    ]
+
+
+def strip_timestamp(result):
+    return [
+        {key: value for key, value in record.items() if key != "_transformed_at"}
+        for record in result.transformed_data
+    ]
+
+
+# ===== COMPILED MAPPING TESTS =====
+
+
+class TestCompiledMappings:
+    """Test that compiled mappings reproduce per-field semantics"""
+
+    def test_converts_and_validates_fields(self, mixed_mappings):
+        compiled = DataTransformer().compile_mappings(mixed_mappings)
+
+        transformed, errors = compiled.transform_row(
+            {"code": "AB12", "amount": "€1,299.99", "day": "07.07.2022", "flag": "yes", "label": 5}
+        )
+
+        assert errors == []
+        assert transformed == {
+            "code": "AB12",
+            "amount": Decimal("1299.99"),
+            "day": date(2022, 7, 7),
+            "count": 0,
+            "flag": True,
+            "label": "#5",
+        }
+
+    def test_reports_field_errors(self, mixed_mappings):
+        compiled = DataTransformer().compile_mappings(mixed_mappings)
+
+        _, errors = compiled.transform_row({"code": "ab12", "amount": " ", "day": "07-07-22"})
+
+        assert errors == [
+            "Field 'code': Value doesn't match validation pattern",
+            "Required field 'amount' is missing or empty",
+            "Field 'day': Type transformation failed: Cannot convert '07-07-22' to date: "
+            "Could not parse date: 07-07-22",
+        ]
+
+    def test_accepts_compiled_mappings(self, mixed_mappings):
+        transformer = DataTransformer()
+        compiled = transformer.compile_mappings(mixed_mappings)
+        data = [{"code": "AB1", "amount": "10"}, {"code": "x", "amount": "10"}]
+
+        result = transformer.transform(data, compiled)
+
+        assert result.records_transformed == 1
+        assert result.errors == ["Row 2: Field 'code': Value doesn't match validation pattern"]
+
+    def test_per_record_helpers_reuse_compiled_mappings(self, mixed_mappings, monkeypatch):
+        transformer = DataTransformer()
+        compiled = []
+        compile_mappings = transformer.compile_mappings
+        monkeypatch.setattr(
+            transformer,
+            "compile_mappings",
+            lambda mappings: compiled.append(mappings) or compile_mappings(mappings),
+        )
+
+        for idx in range(3):
+            transformer._transform_record({"code": "AB1", "amount": "10"}, mixed_mappings, idx)
+            transformer._extract_field_value({"amount": "$5"}, mixed_mappings[1], idx)
+
+        assert len(compiled) == 2
+
+    def test_standard_mappings_are_compiled_per_instance(self):
+        stockx, alias = StockXTransformer(), AliasTransformer()
+
+        assert stockx.compiled_mappings is stockx.compiled_mappings
+        assert stockx.compiled_mappings is not StockXTransformer().compiled_mappings
+        assert [m.source_field for m in alias.compiled_mappings.field_mappings] == [
+            m.source_field for m in AliasTransformer.get_field_mappings()
+        ]
+        assert DataTransformer().compiled_mappings.fields == ()
+
+
+# ===== COLUMNAR TESTS =====
+
+
+class TestColumnarTransform:
+    """Test that the column path matches the row path"""
+
+    def test_matches_row_path(self):
+        transformer = StockXTransformer()
+        data = stockx_rows(200)
+
+        by_row = transformer.transform(data, transformer.compiled_mappings, columnar=False)
+        by_column = transformer.transform(data, transformer.compiled_mappings, columnar=True)
+
+        assert by_row.errors
+        assert by_column.errors == by_row.errors
+        assert strip_timestamp(by_column) == strip_timestamp(by_row)
+        for a, b in zip(strip_timestamp(by_column), strip_timestamp(by_row)):
+            assert type(a["sale_date"]) is type(b["sale_date"])
+            assert a["sale_date"].tzinfo == b["sale_date"].tzinfo
+
+    def test_mixed_value_types_are_not_shared(self, mixed_mappings):
+        transformer = DataTransformer()
+        data = [
+            {"code": "AB1", "amount": 1, "flag": True, "count": True},
+            {"code": "AB1", "amount": 1.5, "flag": 1, "count": 1.0},
+            {"code": "AB1", "amount": "1", "flag": "1", "count": "1,000"},
+            {"code": "AB1", "amount": "1", "day": datetime(2024, 1, 1), "label": ["x"]},
+        ]
+
+        by_row = transformer.transform(data, mixed_mappings, columnar=False)
+        by_column = transformer.transform(data, mixed_mappings, columnar=True)
+
+        assert by_column.errors == by_row.errors
+        assert strip_timestamp(by_column) == strip_timestamp(by_row)
+
+    def test_large_batches_default_to_columnar(self):
+        transformer = StockXTransformer()
+        data = stockx_rows(1000)
+
+        result = transformer.transform_stockx_data(data)
+
+        assert result.records_transformed == 450
+        # The "+0200" dates fall back to the scalar parser and keep their offset
+        offsets = {record["sale_date"].utcoffset() for record in result.transformed_data}
+        assert offsets == {timedelta(0), timedelta(hours=2)}
+
+
+# ===== SOURCE TRANSFORMER TESTS =====
+
+
+class TestSourceTransformers:
+    """Test StockX and Alias transformers on compiled mappings"""
+
+    def test_stamps_one_timestamp_per_batch(self):
+        result = StockXTransformer().transform_stockx_data(stockx_rows(20))
+
+        stamps = {record["_transformed_at"] for record in result.transformed_data}
+        assert len(stamps) == 1
+        assert stamps.pop().tzinfo == timezone.utc
+
+    def test_stockx_records(self):
+        result = StockXTransformer().transform_stockx_data(stockx_rows(1))
+
+        [record] = result.transformed_data
+        assert record["sale_date"] == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        assert record["listing_price"] == Decimal("150.00")
+        assert record["source_platform"] == "stockx"
+        assert record["_source_row"] == 1
+        assert "total_payout" not in record
+
+    def test_alias_records(self):
+        data = [
+            {
+                "item_name": "Jordan 4 Bred",
+                "order_number": "A-1",
+                "sale_date": "2024-03-01T10:00:00Z",
+                "sale_price": "210",
+            },
+            {"item_name": "Jordan 4 Bred", "order_number": "A-2", "sale_date": "2024-03-01"},
+        ]
+
+        result = AliasTransformer().transform_alias_data(data)
+
+        [record] = result.transformed_data
+        assert record["sale_date"] == datetime(2024, 3, 1, 10, tzinfo=timezone.utc)
+        assert record["external_transaction_id"] == "alias_A-1"
+        assert result.errors == ["Row 2: Required field 'sale_price' is missing or empty"]
@@ -0,0 +1,223 @@
+"""
+Unit tests for ViewRefreshScheduler
+Tests dependency tracking, debounced coalescing and parallel refreshes
+"""
+
+import asyncio
+import re
+from datetime import datetime
+
+import pytest
+
+from domains.integration.metabase.config.materialized_views import MetabaseViewConfig
+from domains.integration.metabase.schemas.metabase_models import RefreshJobStatus
+from domains.integration.metabase.services import refresh_scheduler
+from domains.integration.metabase.services.refresh_scheduler import (
+    ViewRefreshScheduler,
+    shutdown_refresh_scheduler,
+)
+from domains.integration.metabase.services.sync_service import MetabaseSyncService
+
+# ===== FIXTURES =====
+
+
+class FakeViewManager:
+    """Records refreshes and how many ran at once"""
+
+    def __init__(self, delay=0.01, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.refreshed = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def refresh_view(self, view_name):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            self.refreshed.append(view_name)
+            if view_name in self.failing:
+                return RefreshJobStatus(view_name=view_name, status="failed", error_message="boom")
+            return RefreshJobStatus(
+                view_name=view_name, status="completed", started_at=datetime.utcnow()
+            )
+        finally:
+            self.in_flight -= 1
+
+
+def make_scheduler(manager, views=None, debounce_seconds=0.05, max_parallel=3):
+    return ViewRefreshScheduler(
+        view_manager=manager,
+        views=views,
+        debounce_seconds=debounce_seconds,
+        max_parallel=max_parallel,
+    )
+
+
+@pytest.fixture
+def manager():
+    return FakeViewManager()
+
+
+# ===== DEPENDENCY TESTS =====
+
+
+class TestViewDependencies:
+    """Test base table dependency tracking"""
+
+    def test_config_declares_every_table_its_sql_reads(self):
+        for view in MetabaseViewConfig.get_all_views():
+            tables = set(re.findall(r"(?:FROM|JOIN)\s+([a-z_]+\.[a-z_]+)", view["sql"]))
+            assert set(view["depends_on"]) == tables, view["name"]
+
+    def test_views_for_tables(self, manager):
+        scheduler = make_scheduler(manager)
+
+        assert scheduler.views_for_tables(["core.platforms"]) == {
+            "metabase_executive_metrics",
+            "metabase_platform_performance",
+            "metabase_customer_geography",
+        }
+        assert scheduler.views_for_tables(["core.unknown"]) == set()
+
+    def test_views_reading_views_are_dirtied_and_refreshed_after_them(self, manager):
+        views = [
+            {"name": "daily", "depends_on": ["transactions.orders"]},
+            {"name": "rollup", "depends_on": ["analytics.daily"]},
+            {"name": "stock", "depends_on": ["inventory.stock"]},
+        ]
+        scheduler = make_scheduler(manager, views)
+
+        assert scheduler.views_for_tables(["transactions.orders"]) == {"daily", "rollup"}
+        assert scheduler._refresh_waves(["rollup", "daily", "stock"]) == [
+            ["daily", "stock"],
+            ["rollup"],
+        ]
+
+    def test_rejects_cyclic_dependencies(self, manager):
+        views = [
+            {"name": "a", "depends_on": ["analytics.b"]},
+            {"name": "b", "depends_on": ["analytics.a"]},
+        ]
+
+        with pytest.raises(ValueError, match="cycle"):
+            make_scheduler(manager, views)
+
+
+# ===== SCHEDULING TESTS =====
+
+
+class TestDebouncedRefresh:
+    """Test coalescing and parallel refreshes"""
+
+    async def test_burst_refreshes_each_dirty_view_once(self, manager):
+        scheduler = make_scheduler(manager)
+
+        for _ in range(10):
+            scheduler.notify("transactions.orders")
+            scheduler.notify("inventory.stock")
+        assert manager.refreshed == []
+
+        await asyncio.sleep(0.2)
+
+        assert sorted(manager.refreshed) == sorted(scheduler.view_names)
+        assert scheduler.dirty_views == []
+        status = scheduler.get_status()
+        assert status["flushes"] == 1
+        assert status["notifications"] == 20
+
+    async def test_refreshes_in_parallel_up_to_limit(self, manager):
+        scheduler = make_scheduler(manager, max_parallel=2)
+
+        results = await scheduler.refresh_now(scheduler.view_names)
+
+        assert len(results) == 7
+        assert manager.max_in_flight == 2
+
+    async def test_changes_during_refresh_open_a_new_window(self, manager):
+        manager.delay = 0.1
+        scheduler = make_scheduler(manager, debounce_seconds=0.01)
+
+        scheduler.notify("core.suppliers")
+        await asyncio.sleep(0.05)  # refresh in progress
+        scheduler.notify("core.suppliers")
+        await asyncio.sleep(0.4)
+
+        assert sorted(manager.refreshed) == sorted(
+            ["metabase_inventory_status", "metabase_supplier_performance"] * 2
+        )
+
+    async def test_failed_views_stay_dirty(self):
+        manager = FakeViewManager(failing={"metabase_platform_performance"})
+        scheduler = make_scheduler(manager)
+
+        scheduler.notify("core.platforms")
+        results = await scheduler.flush()
+
+        assert {status.view_name: status.status for status in results} == {
+            "metabase_executive_metrics": "completed",
+            "metabase_platform_performance": "failed",
+            "metabase_customer_geography": "completed",
+        }
+        assert scheduler.dirty_views == ["metabase_platform_performance"]
+        assert scheduler.get_status()["views"]["metabase_platform_performance"]["failures"] == 1
+        await scheduler.shutdown(flush=False)
+
+    async def test_records_duration_and_staleness(self, manager):
+        scheduler = make_scheduler(manager)
+
+        scheduler.notify("core.suppliers")
+        await asyncio.sleep(0.2)
+
+        view = scheduler.get_status()["views"]["metabase_supplier_performance"]
+        assert view["refreshes"] == 1
+        assert view["last_duration_seconds"] >= 0.01
+        # Staleness covers the debounce window and the refresh itself
+        assert view["last_staleness_seconds"] >= 0.06
+
+    async def test_shutdown_flushes_dirty_views(self, manager):
+        scheduler = make_scheduler(manager, debounce_seconds=60)
+
+        scheduler.notify("core.platforms")
+        await scheduler.shutdown()
+
+        assert len(manager.refreshed) == 3
+        assert scheduler.dirty_views == []
+
+    async def test_app_shutdown_runs_pending_refreshes(self, manager, monkeypatch):
+        monkeypatch.setattr(refresh_scheduler, "_refresh_scheduler", None)
+        await shutdown_refresh_scheduler()  # nothing scheduled yet
+
+        scheduler = make_scheduler(manager, debounce_seconds=60)
+        monkeypatch.setattr(refresh_scheduler, "_refresh_scheduler", scheduler)
+        scheduler.notify("core.suppliers")
+
+        await shutdown_refresh_scheduler()
+
+        assert sorted(manager.refreshed) == [
+            "metabase_inventory_status",
+            "metabase_supplier_performance",
+        ]
+
+
+# ===== SYNC SERVICE TESTS =====
+
+
+class TestSyncServiceEvents:
+    """Test that event hooks go through the scheduler"""
+
+    async def test_order_event_schedules_dependent_views(self, manager):
+        scheduler = make_scheduler(manager, debounce_seconds=60)
+        service = MetabaseSyncService(scheduler=scheduler)
+
+        first = await service.sync_on_order_event()
+        await service.sync_on_inventory_event()
+
+        assert {status.status for status in first} == {"pending"}
+        assert {status.view_name for status in first} == set(scheduler.view_names)
+        assert manager.refreshed == []
+        assert scheduler.get_status()["coalesced"] == 5
+
+        await scheduler.shutdown()
+        assert sorted(manager.refreshed) == sorted(scheduler.view_names)
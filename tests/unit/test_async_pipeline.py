@@ -0,0 +1,244 @@
+"""
+Unit tests for AsyncProcessingPipeline
+Testing the sliding-window chunk executor, staged execution and their metrics
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from shared.exceptions.domain_exceptions import BatchProcessingException
+from shared.processing.async_pipeline import (
+    AsyncProcessingPipeline,
+    ChunkResult,
+    ExecutionMode,
+    ProcessingStage,
+    StageConfig,
+)
+
+
+class RecordingStage:
+    """Persistence stage that sleeps per chunk and records start/finish order"""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.started = []
+        self.finished = []
+
+    async def setup(self, context):
+        pass
+
+    async def cleanup(self, context):
+        pass
+
+    async def process_chunk(self, chunk_data, context):
+        chunk_id = chunk_data[0]["chunk"]
+        self.started.append(chunk_id)
+        await asyncio.sleep(self.delays.get(chunk_id, 0.01))
+        self.finished.append(chunk_id)
+        return ChunkResult(
+            chunk_index=chunk_id,
+            records_processed=len(chunk_data),
+            records_failed=0,
+            processing_time_ms=0,
+        )
+
+
+async def chunk_stream(count, size=2, read_log=None, fail_after=None):
+    for chunk_id in range(count):
+        if fail_after is not None and chunk_id == fail_after:
+            raise IOError("source truncated")
+        if read_log is not None:
+            read_log.append(chunk_id)
+        yield [{"chunk": chunk_id} for _ in range(size)]
+
+
+@pytest.fixture
+def pipeline():
+    pipeline = AsyncProcessingPipeline(max_concurrent_chunks=3, max_retries=0, queue_size=2)
+    pipeline._update_batch_status = AsyncMock()
+    with patch("shared.processing.async_pipeline.publish_event", new=AsyncMock()):
+        yield pipeline
+
+
+class TestSlidingWindowExecutor:
+    """Test bounded work-queue chunk scheduling"""
+
+    async def test_slow_chunk_does_not_block_other_slots(self, pipeline):
+        stage = RecordingStage({0: 0.2})
+        pipeline.register_stage(ProcessingStage.PERSISTENCE, stage)
+
+        context = await pipeline.process_large_dataset(uuid4(), chunk_stream(12), "test")
+
+        # Remaining slots kept working through the stream while chunk 0 was in flight
+        assert stage.finished[-1] == 0
+        assert sorted(stage.finished) == list(range(12))
+        assert context.processed_records == 24
+        assert context.max_concurrency == 3
+        assert context.peak_in_flight_chunks == 3
+        assert context.in_flight_chunks == 0
+        assert 0 < context.slot_utilization <= 1
+
+    async def test_source_reading_is_bounded_by_queue(self, pipeline):
+        stage = RecordingStage({chunk: 0.05 for chunk in range(10)})
+        pipeline.register_stage(ProcessingStage.PERSISTENCE, stage)
+        read_log = []
+        max_read_ahead = []
+
+        original = stage.process_chunk
+
+        async def tracking_process_chunk(chunk_data, context):
+            max_read_ahead.append(len(read_log) - len(stage.finished))
+            return await original(chunk_data, context)
+
+        stage.process_chunk = tracking_process_chunk
+
+        context = await pipeline.process_large_dataset(
+            uuid4(), chunk_stream(10, read_log=read_log), "test"
+        )
+
+        # At most: chunks in flight + queued + the one the reader is holding
+        assert max(max_read_ahead) <= 3 + 2 + 1
+        assert context.peak_queue_depth == 2
+        assert context.queue_depth == 0
+
+    async def test_source_error_fails_batch_after_queued_chunks(self, pipeline):
+        stage = RecordingStage({})
+        pipeline.register_stage(ProcessingStage.PERSISTENCE, stage)
+
+        with pytest.raises(BatchProcessingException, match="source truncated"):
+            await pipeline.process_large_dataset(uuid4(), chunk_stream(5, fail_after=4), "test")
+
+        assert sorted(stage.finished) == [0, 1, 2, 3]
+
+
+class TimelineStage:
+    """Stage that sleeps per chunk and appends (event, stage, chunk) to a shared timeline"""
+
+    def __init__(self, name, timeline, delay=0.02, drop_chunk=None, fail_chunk=None):
+        self.name = name
+        self.timeline = timeline
+        self.delay = delay
+        self.drop_chunk = drop_chunk
+        self.fail_chunk = fail_chunk
+
+    async def setup(self, context):
+        pass
+
+    async def cleanup(self, context):
+        pass
+
+    async def process_chunk(self, chunk_data, context):
+        chunk_id = chunk_data[0]["chunk"]
+        if chunk_id == self.fail_chunk:
+            raise RuntimeError("stage exploded")
+        self.timeline.append(("start", self.name, chunk_id))
+        await asyncio.sleep(self.delay)
+        self.timeline.append(("end", self.name, chunk_id))
+        failed = 0
+        if chunk_id == self.drop_chunk:
+            failed = len(chunk_data)
+            chunk_data.clear()
+        return ChunkResult(
+            chunk_index=chunk_id,
+            records_processed=len(chunk_data),
+            records_failed=failed,
+            processing_time_ms=0,
+        )
+
+
+class UppercaseStage:
+    """CPU-bound stage with a picklable synchronous implementation"""
+
+    async def setup(self, context):
+        pass
+
+    async def cleanup(self, context):
+        pass
+
+    async def process_chunk(self, chunk_data, context):
+        raise AssertionError("cpu_bound stages must run process_chunk_sync")
+
+    def process_chunk_sync(self, chunk_data, source_type, chunk_index=0):
+        records = [dict(record, name=record["name"].upper()) for record in chunk_data]
+        return records, ChunkResult(
+            chunk_index=chunk_index,
+            records_processed=len(records),
+            records_failed=0,
+            processing_time_ms=0,
+        )
+
+
+class TestStagedExecutor:
+    """Test the per-stage worker pools of staged execution mode"""
+
+    async def test_parsing_next_chunk_overlaps_persisting_previous(self, pipeline):
+        timeline = []
+        pipeline.register_stage(ProcessingStage.PARSING, TimelineStage("parse", timeline))
+        pipeline.register_stage(
+            ProcessingStage.PERSISTENCE, TimelineStage("persist", timeline, delay=0.05)
+        )
+
+        context = await pipeline.process_large_dataset(
+            uuid4(), chunk_stream(4), "test", execution_mode=ExecutionMode.STAGED
+        )
+
+        # Chunk 1 was parsed while chunk 0 was still being persisted
+        assert timeline.index(("start", "parse", 1)) < timeline.index(("end", "persist", 0))
+        assert context.processed_records == 16
+        assert set(context.stage_stats) == {"parsing", "persistence"}
+        persist_stats = context.stage_stats["persistence"].to_dict()
+        assert persist_stats["chunks_processed"] == 4
+        assert persist_stats["records_in"] == 8
+        assert persist_stats["avg_latency_ms"] >= 50
+        # Slow persistence pushed back on parsing
+        assert context.stage_stats["persistence"].blocked_put_seconds > 0
+
+    async def test_cpu_bound_stage_runs_sync_implementation(self, pipeline):
+        persisted = []
+
+        class CollectingStage(TimelineStage):
+            async def process_chunk(self, chunk_data, context):
+                persisted.extend(record["name"] for record in chunk_data)
+                return await super().process_chunk(chunk_data, context)
+
+        pipeline.register_stage(
+            ProcessingStage.PARSING, UppercaseStage(), StageConfig(workers=1, cpu_bound=True)
+        )
+        pipeline.register_stage(ProcessingStage.PERSISTENCE, CollectingStage("persist", []))
+
+        async def named_chunks():
+            for chunk_id in range(3):
+                yield [{"chunk": chunk_id, "name": f"item-{chunk_id}"}]
+
+        context = await pipeline.process_large_dataset(
+            uuid4(), named_chunks(), "test", execution_mode=ExecutionMode.STAGED
+        )
+
+        assert sorted(persisted) == ["ITEM-0", "ITEM-1", "ITEM-2"]
+        assert context.stage_stats["parsing"].cpu_bound is True
+        assert context.stage_stats["parsing"].records_out == 3
+
+    async def test_failed_or_emptied_chunks_are_not_sent_downstream(self, pipeline):
+        timeline = []
+        pipeline.register_stage(
+            ProcessingStage.PARSING, TimelineStage("parse", timeline, drop_chunk=1, fail_chunk=2)
+        )
+        pipeline.register_stage(ProcessingStage.PERSISTENCE, TimelineStage("persist", timeline))
+
+        context = await pipeline.process_large_dataset(
+            uuid4(), chunk_stream(4), "test", execution_mode=ExecutionMode.STAGED
+        )
+
+        persisted = {chunk for event, stage, chunk in timeline if stage == "persist"}
+        assert persisted == {0, 3}
+        assert context.failed_records == 4
+        assert context.stage_stats["parsing"].records_failed == 4
+
+    def test_cpu_bound_stage_requires_sync_implementation(self, pipeline):
+        with pytest.raises(ValueError, match="process_chunk_sync"):
+            pipeline.register_stage(
+                ProcessingStage.PARSING, TimelineStage("parse", []), StageConfig(cpu_bound=True)
+            )
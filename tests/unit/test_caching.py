@@ -0,0 +1,235 @@
+"""
+Unit tests for the in-memory cache engine
+Testing O(1) LRU ordering, heap-driven TTL expiry, byte accounting and counters,
+plus stampede protection in cache_result and DashboardCache
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from shared.caching.dashboard_cache import DashboardCache
+from shared.caching.single_flight import should_refresh_early
+from shared.performance.caching import InMemoryCache, MultiLevelCache, cache_result
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch("shared.performance.caching.time.monotonic", new=clock):
+        yield clock
+
+
+class TestInMemoryCache:
+    """Test the LRU/TTL engine"""
+
+    async def test_evicts_least_recently_used(self, clock):
+        cache = InMemoryCache(max_size=3)
+        for key in ("a", "b", "c"):
+            await cache.set(key, key.upper())
+
+        # Touch "a" so "b" becomes the oldest entry
+        assert await cache.get("a") == "A"
+        await cache.set("d", "D")
+
+        assert await cache.get("b") is None
+        assert [await cache.get(key) for key in ("a", "c", "d")] == ["A", "C", "D"]
+        assert cache.stats()["evictions"] == 1
+
+    async def test_entries_expire_on_read_and_write(self, clock):
+        cache = InMemoryCache(default_ttl=10)
+        await cache.set("short", 1, ttl=5)
+        await cache.set("long", 2)
+
+        clock.now += 6
+        assert await cache.get("short") is None
+        assert "long" in cache
+
+        clock.now += 5
+        # Writing drains due deadlines from the heap without touching "long" directly
+        await cache.set("fresh", 3)
+        assert len(cache) == 1
+        assert cache.stats()["expirations"] == 2
+
+    async def test_overwrite_keeps_new_deadline(self, clock):
+        cache = InMemoryCache(default_ttl=10)
+        await cache.set("key", "old", ttl=5)
+        await cache.set("key", "new", ttl=20)
+
+        clock.now += 6
+        await cache.set("other", 1)
+
+        assert await cache.get("key") == "new"
+
+    async def test_byte_limit_evicts_and_accounting_balances(self, clock):
+        cache = InMemoryCache(max_bytes=4096)
+        for index in range(20):
+            await cache.set(f"key-{index}", "x" * 500)
+
+        stats = cache.stats()
+        assert 0 < stats["size_bytes"] <= 4096
+        assert stats["evictions"] > 0
+        assert await cache.get("key-19") is not None
+
+        for key in list(cache._entries):
+            await cache.delete(key)
+        assert cache.size_bytes == 0
+
+    async def test_counters_and_hit_rate(self, clock):
+        cache = InMemoryCache()
+        await cache.set("key", {"price": 100})
+        await cache.get("key")
+        await cache.get("key")
+        await cache.get("missing")
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["sets"]) == (2, 1, 1)
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    async def test_delete_pattern(self, clock):
+        cache = InMemoryCache()
+        await cache.set("soleflip:v1:product:1", 1)
+        await cache.set("soleflip:v1:product:2", 2)
+        await cache.set("soleflip:v1:import_batch:1", 3)
+
+        assert await cache.delete_pattern("soleflip:*:product:*") == 2
+        assert len(cache) == 1
+
+
+class TestCacheLayers:
+    """Test MultiLevelCache and cache_result on top of the engine"""
+
+    async def test_cache_result_uses_l1_without_redis(self, clock):
+        cache = MultiLevelCache(l1_max_size=10)
+        calls = []
+
+        @cache_result(ttl=60, cache_instance=cache)
+        async def lookup(product_id):
+            calls.append(product_id)
+            return {"id": product_id}
+
+        assert await lookup(1) == {"id": 1}
+        assert await lookup(1) == {"id": 1}
+
+        assert calls == [1]
+        stats = cache.get_stats()
+        assert stats["l1_hits"] == 1
+        assert stats["l1"]["size"] == 1
+
+    async def test_clear_pattern_keeps_unrelated_l1_entries(self, clock):
+        cache = MultiLevelCache()
+        await cache.set("soleflip:v1:product:1:brand:nike", 1)
+        await cache.set("soleflip:v1:import_batch:1", 2)
+
+        await cache.clear_pattern(cache.key_generator.pattern("product"))
+
+        assert await cache.get("soleflip:v1:product:1:brand:nike") is None
+        assert await cache.get("soleflip:v1:import_batch:1") == 2
+
+
+class CountingLoader:
+    """Async loader that counts calls and can be held open until released"""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return {"version": self.calls}
+
+
+class TestStampedeProtection:
+    """Test request coalescing and stale-while-revalidate"""
+
+    async def test_concurrent_misses_share_one_load(self):
+        cache = DashboardCache()
+        loader = CountingLoader()
+        loader.release.clear()
+
+        waiters = [asyncio.create_task(cache.get_or_load("metrics", loader)) for _ in range(20)]
+        await asyncio.sleep(0)
+        loader.release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert loader.calls == 1
+        assert all(result == {"version": 1} for result in results)
+        assert cache.get_stats()["coalesced"] == 19
+
+    async def test_expired_entry_served_stale_while_one_refresh_runs(self):
+        cache = DashboardCache(early_refresh_beta=0)
+        loader = CountingLoader()
+        await cache.get_or_load("metrics", loader, ttl=60, stale_ttl=300)
+        cache._cache["metrics"]["fresh_until"] = 0
+
+        loader.release.clear()
+        results = [await cache.get_or_load("metrics", loader) for _ in range(5)]
+
+        # Every caller got the old value immediately; only one refresh was started
+        assert results == [{"version": 1}] * 5
+        await asyncio.sleep(0)
+        assert loader.calls == 2
+        assert await cache.get("metrics") is None
+
+        loader.release.set()
+        await asyncio.sleep(0.01)
+        assert await cache.get("metrics") == {"version": 2}
+        assert cache.get_stats()["stale_hits"] == 5
+
+    async def test_failed_load_is_not_cached(self):
+        cache = DashboardCache()
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("db down")
+            return {"ok": True}
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("metrics", flaky)
+        assert await cache.get_or_load("metrics", flaky) == {"ok": True}
+
+    async def test_cache_result_coalesces_and_refreshes_stale_results(self):
+        cache = MultiLevelCache()
+        calls = []
+        release = asyncio.Event()
+
+        @cache_result(ttl=60, stale_ttl=300, cache_instance=cache)
+        async def expensive(day):
+            calls.append(day)
+            await release.wait()
+            return {"day": day, "call": len(calls)}
+
+        waiters = [asyncio.create_task(expensive("mon")) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+        assert {result["call"] for result in await asyncio.gather(*waiters)} == {1}
+
+        # Age the envelope past its fresh window
+        key = next(iter(cache.l1_cache._entries))
+        cache.l1_cache._entries[key].value["fresh_until"] = 0
+
+        release.clear()
+        assert (await expensive("mon"))["call"] == 1
+        release.set()
+        await asyncio.sleep(0.01)
+        assert (await expensive("mon"))["call"] == 2
+        assert calls == ["mon", "mon"]
+
+    def test_early_refresh_probability(self):
+        assert should_refresh_early(100.0, 1.0, 0, now=99.9) is False
+        # Far from expiry the chance is negligible, past expiry it is certain
+        assert not any(should_refresh_early(1000.0, 0.1, 1.0, now=0.0) for _ in range(100))
+        assert should_refresh_early(100.0, 0.1, 1.0, now=100.0)
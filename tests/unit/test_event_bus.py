@@ -0,0 +1,228 @@
+"""
+Unit tests for EventBus
+Testing queued dispatch, per-handler concurrency and batched persistence
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from shared.events import DispatchMode, EventBus, ImportBatchProgressEvent
+
+
+def progress_event(processed=0):
+    batch_id = uuid4()
+    return ImportBatchProgressEvent(
+        aggregate_id=batch_id,
+        batch_id=batch_id,
+        processed_records=processed,
+        failed_records=0,
+        progress_percentage=0.0,
+        current_stage="parsing",
+    )
+
+
+@pytest.fixture
+async def queued_bus():
+    bus = EventBus(dispatch_mode=DispatchMode.QUEUED, dispatch_workers=4)
+    yield bus
+    await bus.shutdown()
+
+
+class TestQueuedDispatch:
+    """Test fire-and-forget publishing through the dispatch queue"""
+
+    async def test_publish_does_not_wait_for_handlers(self, queued_bus):
+        release = asyncio.Event()
+        handled = []
+
+        async def slow_handler(event):
+            await release.wait()
+            handled.append(event.processed_records)
+
+        queued_bus.subscribe(ImportBatchProgressEvent, slow_handler, "slow")
+
+        await asyncio.wait_for(queued_bus.publish(progress_event(1)), timeout=0.5)
+        assert handled == []
+
+        release.set()
+        await queued_bus.drain()
+
+        assert handled == [1]
+        stats = queued_bus.stats()
+        assert stats["published"] == stats["dispatched"] == 1
+        assert stats["lag_ms"]["samples"] == 1
+        assert stats["queue_depth"] == 0
+
+    async def test_wait_true_dispatches_inline(self, queued_bus):
+        handled = []
+        queued_bus.subscribe(ImportBatchProgressEvent, lambda event: handled.append(event), "sync")
+
+        await queued_bus.publish(progress_event(), wait=True)
+
+        assert len(handled) == 1
+
+    async def test_handler_concurrency_is_limited(self, queued_bus):
+        running = 0
+        peak = 0
+
+        async def handler(event):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        queued_bus.subscribe(ImportBatchProgressEvent, handler, "limited", max_concurrency=2)
+
+        for i in range(6):
+            await queued_bus.publish(progress_event(i))
+        await queued_bus.drain()
+
+        handler_stats = queued_bus.stats()["handlers"]["limited"]
+        assert peak == 2
+        assert handler_stats["peak_in_flight"] == 2
+        assert handler_stats["throttled"] > 0
+
+    async def test_full_queue_blocks_publisher(self):
+        bus = EventBus(dispatch_mode=DispatchMode.QUEUED, queue_size=1, dispatch_workers=1)
+        release = asyncio.Event()
+
+        async def blocking_handler(event):
+            await release.wait()
+
+        bus.subscribe(ImportBatchProgressEvent, blocking_handler, "blocking")
+
+        await bus.publish(progress_event())  # taken by the worker
+        await asyncio.sleep(0)
+        await bus.publish(progress_event())  # fills the queue
+        blocked = asyncio.create_task(bus.publish(progress_event()))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await bus.shutdown()
+
+        assert bus.metrics.queue_full_waits == 1
+        assert bus.metrics.dispatched == 3
+
+    async def test_handler_republishing_into_full_queue_does_not_deadlock(self):
+        bus = EventBus(dispatch_mode=DispatchMode.QUEUED, queue_size=1, dispatch_workers=1)
+        release = asyncio.Event()
+        handled = []
+
+        async def republishing_handler(event):
+            handled.append(event.processed_records)
+            if event.processed_records == 0:
+                await release.wait()
+                await bus.publish(progress_event(2))  # the queue is full at this point
+
+        bus.subscribe(ImportBatchProgressEvent, republishing_handler, "republishing")
+
+        await bus.publish(progress_event(0))  # taken by the only worker
+        await asyncio.sleep(0)
+        await bus.publish(progress_event(1))  # fills the queue
+
+        release.set()
+        await asyncio.wait_for(bus.drain(), timeout=1)
+        await bus.shutdown()
+
+        assert handled == [0, 1, 2]
+        assert bus.metrics.overflow_enqueues == 1
+        assert bus.metrics.queue_full_waits == 0
+
+    async def test_handler_failures_are_counted(self, queued_bus):
+        async def failing_handler(event):
+            raise RuntimeError("boom")
+
+        queued_bus.subscribe(ImportBatchProgressEvent, failing_handler, "failing")
+
+        await queued_bus.publish(progress_event())
+        await queued_bus.drain()
+
+        assert queued_bus.metrics.handler_failures == 1
+
+
+class TestBatchedPersistence:
+    """Test that persisted events are written in multi-row batches"""
+
+    @pytest.fixture
+    def written(self, monkeypatch):
+        batches = []
+
+        async def fake_write(self, records):
+            batches.append(records)
+
+        monkeypatch.setattr(
+            "shared.events.event_bus.EventPersistenceBuffer._write_batch", fake_write
+        )
+        return batches
+
+    async def test_flushes_every_batch_size_events(self, written):
+        bus = EventBus(enable_persistence=True, persist_batch_size=3, persist_flush_interval=60)
+
+        for i in range(7):
+            await bus.publish(progress_event(i))
+        await asyncio.sleep(0)
+
+        assert [len(batch) for batch in written] == [3, 3]
+
+        await bus.shutdown()
+        assert [len(batch) for batch in written] == [3, 3, 1]
+        assert written[0][0]["event_type"] == "integration.batch_progress"
+        assert written[0][0]["event_data"]["processed_records"] == 0
+        assert bus.stats()["persistence"]["persisted_total"] == 7
+
+    async def test_flushes_after_interval(self, written):
+        bus = EventBus(enable_persistence=True, persist_batch_size=100, persist_flush_interval=0.02)
+
+        await bus.publish(progress_event())
+        await bus.publish(progress_event())
+        assert written == []
+
+        await asyncio.sleep(0.05)
+
+        assert [len(batch) for batch in written] == [2]
+        await bus.shutdown()
+
+    async def test_failed_flush_is_counted(self, monkeypatch):
+        async def failing_write(self, records):
+            raise ConnectionError("database down")
+
+        monkeypatch.setattr(
+            "shared.events.event_bus.EventPersistenceBuffer._write_batch", failing_write
+        )
+        bus = EventBus(enable_persistence=True, persist_batch_size=2, persist_flush_interval=60)
+
+        await bus.publish(progress_event())
+        await bus.publish(progress_event())
+        await bus.shutdown()
+
+        assert bus.stats()["persistence"]["failed_total"] == 2
+
+    async def test_bad_event_does_not_drop_its_batch(self, monkeypatch):
+        written = []
+        bad = progress_event(13)
+
+        async def write_rejecting_bad_event(self, records):
+            if any(record["event_id"] == bad.event_id for record in records):
+                raise ValueError("duplicate key value violates unique constraint")
+            written.extend(record["event_id"] for record in records)
+
+        monkeypatch.setattr(
+            "shared.events.event_bus.EventPersistenceBuffer._write_batch",
+            write_rejecting_bad_event,
+        )
+        bus = EventBus(enable_persistence=True, persist_batch_size=3, persist_flush_interval=60)
+        neighbours = [progress_event(1), progress_event(2)]
+
+        for event in [neighbours[0], bad, neighbours[1]]:
+            await bus.publish(event)
+        await bus.shutdown()
+
+        persistence = bus.stats()["persistence"]
+        assert written == [event.event_id for event in neighbours]
+        assert persistence["persisted_total"] == 2
+        assert persistence["failed_total"] == 1
@@ -0,0 +1,190 @@
+"""
+Unit tests for the authenticated principal cache
+Testing the get_current_user_from_token fast path and its invalidation
+"""
+
+import time
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from shared.auth.dependencies import AuthenticationError, get_current_user_from_token
+from shared.auth.jwt_handler import get_jwt_handler
+from shared.auth.models import User, UserRole
+from shared.auth.principal_cache import PrincipalCache
+
+
+def make_user(**overrides):
+    values = dict(
+        id=uuid4(),
+        email="ops@soleflip.test",
+        username="ops",
+        hashed_password="hashed",
+        role=UserRole.USER,
+        is_active=True,
+    )
+    values.update(overrides)
+    return User(**values)
+
+
+@pytest.fixture
+def principal_cache():
+    cache = PrincipalCache(ttl_seconds=30)
+    with patch("shared.auth.dependencies.get_principal_cache", return_value=cache):
+        yield cache
+
+
+@pytest.fixture
+def user_lookup():
+    """Patch the user repository and count database lookups"""
+    with patch("shared.auth.dependencies.BaseRepository") as repository:
+        repository.return_value.get_by_id = AsyncMock()
+        yield repository.return_value.get_by_id
+
+
+def bearer(user):
+    token = get_jwt_handler().create_access_token(user.id, user.username, user.role)
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestPrincipalCache:
+    """Test caching and invalidation of authenticated users"""
+
+    def test_get_returns_detached_copy(self, principal_cache):
+        user = make_user()
+        principal_cache.put("token", user, time.time() + 600, principal_cache.ticket(user.id))
+
+        first, second = principal_cache.get("token"), principal_cache.get("token")
+
+        assert first is not second and first is not user
+        assert (first.id, first.role, first.is_active) == (user.id, UserRole.USER, True)
+
+    def test_invalidate_user_and_token(self, principal_cache):
+        user = make_user()
+        principal_cache.put("a", user, time.time() + 600, 0)
+        principal_cache.put("b", user, time.time() + 600, 0)
+
+        principal_cache.invalidate_token("a", time.time() + 600)
+        assert principal_cache.get("a") is None
+        assert principal_cache.get("b") is not None
+
+        principal_cache.invalidate_user(str(user.id))
+        assert principal_cache.get("b") is None
+
+    def test_put_after_concurrent_invalidation_is_ignored(self, principal_cache):
+        user = make_user()
+        ticket = principal_cache.ticket(user.id)
+        principal_cache.invalidate_user(user.id)
+
+        principal_cache.put("token", user, time.time() + 600, ticket)
+
+        assert principal_cache.get("token") is None
+
+    def test_put_after_token_revocation_is_ignored(self, principal_cache):
+        user = make_user()
+        ticket = principal_cache.ticket(user.id)
+        principal_cache.invalidate_token("token", time.time() + 600)
+
+        principal_cache.put("token", user, time.time() + 600, ticket)
+
+        assert principal_cache.get("token") is None
+
+    def test_entries_never_outlive_the_token(self, principal_cache):
+        user = make_user()
+        principal_cache.put("expired", user, time.time() - 1, 0)
+
+        assert principal_cache.get("expired") is None
+
+
+class TestCommitInvalidation:
+    """Test that ORM user changes invalidate principals once committed"""
+
+    @pytest.fixture
+    def session(self, principal_cache):
+        engine = create_engine("sqlite://")
+        User.__table__.create(engine)
+        with patch("shared.auth.principal_cache.get_principal_cache", return_value=principal_cache):
+            with Session(engine) as session:
+                yield session
+        engine.dispose()
+
+    def test_deactivation_invalidates_after_commit_not_flush(self, session, principal_cache):
+        user = make_user()
+        session.add(user)
+        session.commit()
+
+        user.is_active = False
+        session.flush()
+        assert principal_cache.ticket(user.id) == 0
+
+        session.commit()
+        assert principal_cache.ticket(user.id) == 1
+
+    def test_rolled_back_change_does_not_invalidate(self, session, principal_cache):
+        user = make_user()
+        session.add(user)
+        session.commit()
+
+        user.role = UserRole.ADMIN
+        session.flush()
+        session.rollback()
+        session.commit()
+
+        assert principal_cache.ticket(user.id) == 0
+
+
+class TestAuthFastPath:
+    """Test get_current_user_from_token with the principal cache"""
+
+    async def test_repeat_requests_skip_database(self, principal_cache, user_lookup):
+        user = make_user()
+        user_lookup.return_value = user
+        credentials = bearer(user)
+
+        for _ in range(3):
+            authenticated = await get_current_user_from_token(credentials, db=AsyncMock())
+            assert authenticated.id == user.id
+
+        assert user_lookup.await_count == 1
+
+    async def test_deactivated_user_is_rejected_after_invalidation(
+        self, principal_cache, user_lookup
+    ):
+        user = make_user()
+        user_lookup.return_value = user
+        credentials = bearer(user)
+        await get_current_user_from_token(credentials, db=AsyncMock())
+
+        user_lookup.return_value = make_user(id=user.id, is_active=False)
+        principal_cache.invalidate_user(user.id)
+
+        with pytest.raises(AuthenticationError):
+            await get_current_user_from_token(credentials, db=AsyncMock())
+
+    async def test_token_revoked_during_lookup_is_not_cached(self, principal_cache, user_lookup):
+        user = make_user()
+        credentials = bearer(user)
+
+        async def logout_while_loading(user_id):
+            # Logout lands after the blacklist check but before the principal is cached
+            principal_cache.invalidate_token(credentials.credentials, time.time() + 600)
+            return user
+
+        user_lookup.side_effect = logout_while_loading
+        await get_current_user_from_token(credentials, db=AsyncMock())
+
+        assert principal_cache.get(credentials.credentials) is None
+
+    async def test_inactive_users_are_not_cached(self, principal_cache, user_lookup):
+        user_lookup.return_value = make_user(is_active=False)
+        credentials = bearer(user_lookup.return_value)
+
+        for _ in range(2):
+            with pytest.raises(AuthenticationError):
+                await get_current_user_from_token(credentials, db=AsyncMock())
+
+        assert user_lookup.await_count == 2
@@ -0,0 +1,184 @@
+"""
+Unit tests for the rate limiting engine
+Testing GCRA decisions, bounded in-process storage, Redis storage and RateLimitMiddleware
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from shared.security.middleware import RateLimitMiddleware
+from shared.security.rate_limiting import (
+    InMemoryRateLimitStorage,
+    RateLimit,
+    RateLimiter,
+    RedisRateLimitStorage,
+    gcra_update,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.asyncio.Redis running the GCRA script's logic"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.values = {}
+        self.calls = []
+
+    def register_script(self, script):
+        assert "redis.call('TIME')" in script
+
+        async def run(keys, args):
+            self.calls.append((keys, args))
+            interval, burst_allowance, cost = float(args[0]), float(args[1]), int(args[2])
+            limit = RateLimit(rate=1, period=interval, burst=round(burst_allowance / interval))
+            stored = self.values.get(keys[0])
+            decision, new_tat = gcra_update(
+                float(stored) if stored else None, self.clock(), limit, cost
+            )
+            if new_tat is None:
+                return [0, 0, str(decision.retry_after), str(decision.reset_after)]
+            self.values[keys[0]] = str(new_tat)
+            return [1, decision.remaining, "0", str(decision.reset_after)]
+
+        return run
+
+    async def delete(self, key):
+        return 1 if self.values.pop(key, None) is not None else 0
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestGCRA:
+    """Test the cell rate algorithm"""
+
+    def test_allows_burst_then_spaces_requests(self):
+        limit = RateLimit(rate=60, period=60, burst=3)
+        tat, now = None, 0.0
+
+        remaining = []
+        for _ in range(3):
+            decision, tat = gcra_update(tat, now, limit)
+            remaining.append(decision.remaining)
+        assert remaining == [2, 1, 0]
+
+        denied, new_tat = gcra_update(tat, now, limit)
+        assert not denied.allowed
+        assert new_tat is None
+        assert denied.retry_after == pytest.approx(1.0)
+
+        # One emission interval later exactly one more request fits
+        decision, tat = gcra_update(tat, now + 1.0, limit)
+        assert decision.allowed and decision.remaining == 0
+
+    def test_idle_client_recovers_full_burst(self):
+        limit = RateLimit(rate=10, period=10, burst=5)
+        tat = None
+        for _ in range(5):
+            _, tat = gcra_update(tat, 0.0, limit)
+
+        decision, _ = gcra_update(tat, 60.0, limit)
+        assert decision.remaining == 4
+
+    def test_invalid_limits_rejected(self):
+        with pytest.raises(ValueError):
+            RateLimit(rate=0)
+        with pytest.raises(ValueError):
+            RateLimit(rate=10, burst=0)
+
+
+class TestStorage:
+    """Test storage backends"""
+
+    async def test_in_memory_storage_is_bounded(self, clock):
+        storage = InMemoryRateLimitStorage(max_keys=100, clock=clock)
+        limit = RateLimit(rate=60, period=60)
+
+        for client in range(1000):
+            await storage.update(f"client-{client}", limit)
+
+        assert len(storage) <= 101
+
+    async def test_in_memory_storage_drops_drained_clients(self, clock):
+        storage = InMemoryRateLimitStorage(clock=clock)
+        limit = RateLimit(rate=60, period=60, burst=1)
+        await storage.update("idle", limit)
+
+        clock.now += 5
+        await storage.update("active", limit)
+
+        assert len(storage) == 1
+
+    async def test_redis_storage_shares_state_between_limiters(self, clock):
+        redis = FakeRedis(clock)
+        limit = RateLimit(rate=2, period=60)
+        worker_a = RateLimiter(RedisRateLimitStorage(redis))
+        worker_b = RateLimiter(RedisRateLimitStorage(redis))
+
+        assert (await worker_a.hit("ip", limit)).allowed
+        assert (await worker_b.hit("ip", limit)).allowed
+        denied = await worker_a.hit("ip", limit)
+
+        assert not denied.allowed
+        assert denied.retry_after == pytest.approx(30.0)
+        assert redis.calls[0][0] == ["soleflip:ratelimit:ip"]
+
+        await worker_b.reset("ip")
+        assert (await worker_a.hit("ip", limit)).allowed
+
+    async def test_storage_errors_fail_open(self):
+        class BrokenStorage:
+            async def update(self, key, limit, cost=1):
+                raise ConnectionError("redis down")
+
+        limit = RateLimit(rate=1)
+        assert (await RateLimiter(BrokenStorage()).hit("ip", limit)).allowed
+        with pytest.raises(ConnectionError):
+            await RateLimiter(BrokenStorage(), fail_open=False).hit("ip", limit)
+
+
+class TestRateLimitMiddleware:
+    """Test HTTP rate limiting"""
+
+    def build_client(self, **kwargs):
+        app = FastAPI()
+
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        limiter = RateLimiter(InMemoryRateLimitStorage())
+        app.add_middleware(RateLimitMiddleware, limiter=limiter, **kwargs)
+        return TestClient(app)
+
+    def test_burst_exceeded_returns_429(self):
+        client = self.build_client(requests_per_minute=60, burst_size=2)
+
+        first = client.get("/ping")
+        assert first.status_code == 200
+        assert first.headers["X-RateLimit-Remaining"] == "1"
+        assert client.get("/ping").status_code == 200
+
+        limited = client.get("/ping")
+        assert limited.status_code == 429
+        assert limited.headers["Retry-After"] == "1"
+        assert limited.json()["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+
+        # Other clients are unaffected
+        assert client.get("/ping", headers={"X-Forwarded-For": "10.0.0.2"}).status_code == 200
+
+    def test_whitelisted_client_skips_limit(self):
+        client = self.build_client(burst_size=1, whitelist_ips=["testclient"])
+
+        assert [client.get("/ping").status_code for _ in range(3)] == [200, 200, 200]
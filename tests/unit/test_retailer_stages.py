@@ -0,0 +1,49 @@
+"""
+Unit tests for the retailer processing stages
+"""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from uuid import uuid4
+
+from shared.processing.async_pipeline import ProcessingContext
+from shared.processing.stages import RetailerParsingStage
+
+RAW_RECORDS = [
+    {"name": "  Air  Max 90 ", "sku": "dz-1234!", "brand": "Nike", "price": "1.299,00"},
+    {"name": "Samba", "sku": "B75806", "brand": "adidas", "price": "99,95", "size": "medium"},
+    {"name": "Missing price", "sku": "X1", "brand": "Nike"},
+]
+
+
+class TestRetailerParsingStage:
+    """Test the synchronous, process-pool friendly parsing path"""
+
+    async def test_async_and_sync_paths_agree(self):
+        stage = RetailerParsingStage()
+        context = ProcessingContext(batch_id=uuid4(), source_type="retailer_test", total_records=3)
+        chunk = [dict(record) for record in RAW_RECORDS]
+
+        result = await stage.process_chunk(chunk, context)
+        sync_records, sync_result = stage.process_chunk_sync(RAW_RECORDS, "retailer_test")
+
+        assert chunk == sync_records
+        assert result.records_processed == sync_result.records_processed == 2
+        assert result.records_failed == sync_result.records_failed == 1
+        assert sync_records[0]["name"] == "Air Max 90"
+        assert sync_records[0]["sku"] == "DZ-1234"
+        assert sync_records[1]["price"] == Decimal("99.95")
+        assert sync_records[1]["size"] == "M"
+
+    def test_runs_in_process_pool(self):
+        stage = RetailerParsingStage()
+        pickle.dumps(stage)
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            records, result = executor.submit(
+                stage.process_chunk_sync, RAW_RECORDS, "retailer_test", 7
+            ).result()
+
+        assert result.chunk_index == 7
+        assert [record["sku"] for record in records] == ["DZ-1234", "B75806"]
@@ -0,0 +1,128 @@
+"""
+Unit tests for DataStreamProcessor
+Testing the threaded CSV reader and its row/column chunk formats
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from shared.processing import streaming_processor
+from shared.processing.async_pipeline import ExecutionMode
+from shared.processing.streaming_processor import (
+    ChunkFormat,
+    ColumnarChunk,
+    DataStreamProcessor,
+    StreamingConfig,
+)
+
+CSV_CONTENT = (
+    "\ufeffname,sku,price\n"
+    '" Air Max 90 ",DZ-1,129.99\n'
+    '"Samba\nOG",B75806,\n'
+    "\n"
+    "Short row,X1\n"
+    "Too,many,fields,here\n"
+    "Gazelle,BB5476,99.95\n"
+)
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "feed.csv"
+    path.write_text(CSV_CONTENT, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def processor():
+    return DataStreamProcessor(StreamingConfig(chunk_size=2, enable_backpressure=False))
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class RecordingPipeline:
+    """Stands in for the shared pipeline and records what it was asked to process"""
+
+    def __init__(self):
+        self.execution_mode = ExecutionMode.CHUNKED
+        self.calls = []
+
+    async def process_large_dataset(self, batch_id, data_stream, source_type, **kwargs):
+        self.calls.append({"chunks": await collect(data_stream), **kwargs})
+        return kwargs
+
+
+class TestCsvStream:
+    """Test CSV parsing in the reader thread"""
+
+    async def test_row_chunks_handle_quoted_newlines_and_ragged_rows(self, processor, csv_file):
+        chunks = await collect(processor._create_csv_stream(csv_file, "utf-8-sig"))
+
+        records = [record for chunk in chunks for record in chunk]
+        assert all(len(chunk) <= 2 for chunk in chunks)
+        assert records == [
+            {"name": "Air Max 90", "sku": "DZ-1", "price": "129.99"},
+            {"name": "Samba\nOG", "sku": "B75806", "price": None},
+            {"name": "Short row", "sku": "X1", "price": None},
+            {"name": "Gazelle", "sku": "BB5476", "price": "99.95"},
+        ]
+
+    async def test_column_chunks_match_row_chunks(self, processor, csv_file):
+        rows = await collect(processor._create_csv_stream(csv_file, "utf-8-sig"))
+        columns = await collect(
+            processor._create_csv_stream(csv_file, "utf-8-sig", ChunkFormat.COLUMNS)
+        )
+
+        assert all(isinstance(chunk, ColumnarChunk) for chunk in columns)
+        assert [len(chunk) for chunk in columns] == [len(chunk) for chunk in rows]
+        assert [chunk.to_records() for chunk in columns] == rows
+        assert columns[0].columns["sku"] == ["DZ-1", "B75806"]
+
+    async def test_arrow_format_falls_back_without_pyarrow(self, processor, csv_file, monkeypatch):
+        monkeypatch.setattr(streaming_processor, "PYARROW_AVAILABLE", False)
+
+        chunks = await collect(
+            processor._create_csv_stream(csv_file, "utf-8-sig", ChunkFormat.ARROW)
+        )
+
+        assert all(isinstance(chunk, ColumnarChunk) for chunk in chunks)
+        assert sum(len(chunk) for chunk in chunks) == 4
+
+    async def test_early_close_stops_reader(self, processor, csv_file):
+        stream = processor._create_csv_stream(csv_file, "utf-8-sig")
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert len(first) == 2
+
+
+class TestPipelineHandOff:
+    """Test what process_csv_stream hands to the pipeline"""
+
+    async def test_execution_mode_is_per_call(self, processor, csv_file):
+        pipeline = processor.pipeline = RecordingPipeline()
+
+        await processor.process_csv_stream(
+            csv_file, uuid4(), "retailer_test", execution_mode=ExecutionMode.STAGED
+        )
+        await processor.process_csv_stream(csv_file, uuid4(), "retailer_test")
+
+        assert [call["execution_mode"] for call in pipeline.calls] == [ExecutionMode.STAGED, None]
+        assert pipeline.execution_mode == ExecutionMode.CHUNKED
+
+    async def test_pipeline_gets_rows_whatever_the_chunk_format(self, csv_file):
+        processor = DataStreamProcessor(
+            StreamingConfig(
+                chunk_size=2, enable_backpressure=False, chunk_format=ChunkFormat.COLUMNS
+            )
+        )
+        pipeline = processor.pipeline = RecordingPipeline()
+
+        await processor.process_csv_stream(csv_file, uuid4(), "retailer_test")
+
+        [call] = pipeline.calls
+        assert all(isinstance(chunk, list) for chunk in call["chunks"])
+        assert call["chunks"][0][0] == {"name": "Air Max 90", "sku": "DZ-1", "price": "129.99"}
@@ -0,0 +1,212 @@
+"""
+Unit tests for streaming response helpers
+Testing cursor-backed JSON, NDJSON, CSV and Parquet exports
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from shared.streaming import response
+from shared.streaming.response import (
+    PYARROW_AVAILABLE,
+    JSONStreamingResponse,
+    QueryExportStreamer,
+    _json_rows,
+    open_query_stream,
+    stream_inventory_export,
+    stream_query_batches,
+)
+
+if PYARROW_AVAILABLE:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+QUERY = "SELECT id, name, price, notes FROM stock ORDER BY id"
+ROW_COUNT = 250
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE stock (id INTEGER, name TEXT, price NUMERIC, notes)"))
+        await conn.execute(
+            text("INSERT INTO stock VALUES (:id, :name, :price, :notes)"),
+            [
+                {"id": i, "name": f"Item, {i}", "price": 10 + i, "notes": None if i % 2 else "ok"}
+                for i in range(ROW_COUNT)
+            ],
+        )
+    async with async_sessionmaker(engine)() as session:
+        yield session
+    await engine.dispose()
+
+
+async def collect(generator):
+    return [chunk async for chunk in generator]
+
+
+class TestQueryStreaming:
+    """Test server-side cursor streaming and byte chunking"""
+
+    async def test_batches_come_from_session_stream(self, session, monkeypatch):
+        async def no_execute(*args, **kwargs):
+            raise AssertionError("exports must not buffer results via execute()")
+
+        monkeypatch.setattr(session, "execute", no_execute)
+
+        batches = await collect(stream_query_batches(session, QUERY, batch_size=100))
+
+        assert [len(rows) for _, rows in batches] == [100, 100, 50]
+        assert batches[0][0] == ["id", "name", "price", "notes"]
+
+    async def test_type_codes_come_from_the_cursor_description(self, session):
+        async with open_query_stream(session, QUERY) as (result, type_codes):
+            # SQLite reports a description without type codes
+            assert type_codes == [None] * len(result.keys())
+
+    async def test_json_document_matches_rows(self, session):
+        chunks = await collect(
+            JSONStreamingResponse.stream_query_results(
+                session, QUERY, chunk_size=100, flush_bytes=1024
+            )
+        )
+
+        document = json.loads(b"".join(chunks))
+        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        assert len(chunks) > 3
+        assert all(len(chunk) >= 1024 for chunk in chunks[:-1])
+        assert len(document["data"]) == ROW_COUNT
+        assert document["data"][1] == {"id": 1, "name": "Item, 1", "price": 11, "notes": None}
+        assert document["metadata"] == {"total_rows": ROW_COUNT, "chunks_processed": 3}
+
+    async def test_ndjson_lines(self, session):
+        chunks = await collect(
+            JSONStreamingResponse.stream_query_results(session, QUERY, chunk_size=100, ndjson=True)
+        )
+
+        lines = b"".join(chunks).decode().splitlines()
+        assert len(lines) == ROW_COUNT
+        assert json.loads(lines[-1])["id"] == ROW_COUNT - 1
+
+    async def test_csv_export(self, session):
+        chunks = await collect(QueryExportStreamer.stream_csv(session, QUERY, chunk_size=100))
+
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+        assert rows[0] == ["id", "name", "price", "notes"]
+        assert rows[1] == ["0", "Item, 0", "10", "ok"]
+        assert rows[2] == ["1", "Item, 1", "11", ""]
+        assert len(rows) == ROW_COUNT + 1
+
+    async def test_csv_export_of_empty_result_has_header(self, session):
+        chunks = await collect(
+            QueryExportStreamer.stream_csv(session, QUERY.replace("ORDER", "WHERE id < 0 ORDER"))
+        )
+
+        assert b"".join(chunks).decode().splitlines() == ["id,name,price,notes"]
+
+    def test_non_native_values_are_rendered_as_strings(self):
+        product_id = uuid4()
+        records = _json_rows(
+            ["id", "price", "active", "product_id"], [(1, Decimal("12.50"), True, product_id)]
+        )
+
+        assert records == [
+            {"id": 1, "price": "12.50", "active": True, "product_id": str(product_id)}
+        ]
+
+    async def test_inventory_export_media_types(self, session):
+        response = await stream_inventory_export(session, export_format="ndjson")
+        assert response.media_type == "application/x-ndjson"
+        assert 'filename="inventory_export.ndjson"' in response.headers["content-disposition"]
+
+        with pytest.raises(ValueError):
+            await stream_inventory_export(session, export_format="xml")
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="Parquet export requires pyarrow")
+class TestParquetExport:
+    """Test that the Parquet schema comes from the query's column types"""
+
+    def test_schema_from_postgres_type_codes(self):
+        schema = QueryExportStreamer._parquet_schema(
+            ["id", "price", "sold", "created_at", "notes"], [20, 1700, 16, 1184, None]
+        )
+
+        assert schema.types == [
+            pa.int64(),
+            pa.string(),
+            pa.bool_(),
+            pa.timestamp("us", tz="UTC"),
+            pa.string(),
+        ]
+
+    def test_batches_fit_schema_whatever_their_values(self):
+        schema = QueryExportStreamer._parquet_schema(["id", "price", "meta"], [20, 1700, 3802])
+
+        # First batch all-NULL, later batch with wider values
+        batches = [[(1, None, None)], [(2**40, Decimal("123456789.125"), {"size": "42"})]]
+        tables = [
+            pa.Table.from_arrays(
+                [
+                    QueryExportStreamer._parquet_array(values, field.type)
+                    for values, field in zip(zip(*rows), schema)
+                ],
+                schema=schema,
+            )
+            for rows in batches
+        ]
+
+        assert pa.concat_tables(tables).to_pylist()[1] == {
+            "id": 2**40,
+            "price": "123456789.125",
+            "meta": '{"size":"42"}',
+        }
+
+    async def test_parquet_export(self, session):
+        chunks = await collect(QueryExportStreamer.stream_parquet(session, QUERY, chunk_size=100))
+
+        table = pq.read_table(io.BytesIO(b"".join(chunks)))
+        assert table.num_rows == ROW_COUNT
+        assert table.num_columns == 4
+        # SQLite reports no column types, so every column is written as strings
+        assert table.slice(1, 1).to_pylist() == [
+            {"id": "1", "name": "Item, 1", "price": "11", "notes": None}
+        ]
+
+    async def test_untyped_schema_is_logged_once(self, session, monkeypatch):
+        warnings = []
+        monkeypatch.setattr(response, "_untyped_parquet_logged", False)
+        monkeypatch.setattr(response.logger, "warning", lambda *args, **kw: warnings.append(args))
+
+        for _ in range(2):
+            await collect(QueryExportStreamer.stream_parquet(session, QUERY, chunk_size=100))
+
+        assert len(warnings) == 1
+
+    async def test_parquet_export_of_empty_result_is_a_valid_file(self, session):
+        chunks = await collect(
+            QueryExportStreamer.stream_parquet(
+                session, QUERY.replace("ORDER", "WHERE id < 0 ORDER")
+            )
+        )
+
+        table = pq.read_table(io.BytesIO(b"".join(chunks)))
+        assert table.num_rows == 0
+        assert table.column_names == ["id", "name", "price", "notes"]
+
+    def test_timestamps_keep_their_instant(self):
+        schema = QueryExportStreamer._parquet_schema(["at"], [1184])
+        moment = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+
+        array = QueryExportStreamer._parquet_array((moment,), schema.field("at").type)
+
+        assert array.to_pylist() == [moment]
@@ -103,6 +103,26 @@ class TestStockXValidator:
         assert len(result.normalized_data) == 3  # All records included
         assert result.normalized_data[2]["_validation_error"] is True
 
+    async def test_validate_batch_normalizes_columns(self, validator, valid_stockx_record):
+        """Test that batch validation normalizes date and currency columns once"""
+        data = [
+            {**valid_stockx_record, "Order Number": f"SX-{n}", "Sale Date": f"01/{n:02d}/2024"}
+            for n in range(1, 21)
+        ]
+        data.append({**valid_stockx_record, "Seller Fee": "abc"})
+
+        result = await validator.validate_batch(data)
+
+        assert result.errors == ["Row 21: Invalid currency format: abc"]
+        assert [record["sale_date"].day for record in result.normalized_data[:20]] == list(
+            range(1, 21)
+        )
+        assert result.normalized_data[0]["total_payout"] == Decimal("143.55")
+        # 21 sale dates; one value per currency column
+        assert validator.date_normalizer.misses == 21
+        assert validator.currency_normalizer.misses == 6
+        assert validator._normalized_columns == {}
+
     def test_normalize_size(self, validator):
         """Test size normalization"""
         assert validator._normalize_size("9") == "US 9"